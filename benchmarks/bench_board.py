@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Board analysis benchmarks: cross-checks and anchors recomputed from
+scratch vs updated per play, and served from the board cache
+
+The boards are the synthesized games from bench_endpoints.py.
+
+Usage:
+    python3 benchmarks/bench_board.py
+    python3 benchmarks/bench_board.py --compare
+    python3 benchmarks/bench_board.py --save-baseline
+"""
+
+import os
+import sys
+
+import benchlib
+
+benchlib.add_cgi_path()
+
+import bench_endpoints
+
+BASELINE_PATH = os.path.join(benchlib.BENCH_DIR, 'baseline_board.json')
+
+
+def state(analysis):
+    return analysis.cells, analysis.across, analysis.down, analysis.anchors
+
+
+def build_benchmarks():
+    from rogueletters import board, hooks
+
+    hooks.hook_index()
+    bench_endpoints.load_candidate_words()
+    games = [bench_endpoints.synthesize_game(seed) for seed in bench_endpoints.SEEDS]
+    plays = [play for game in games for play in game['plays']]
+    after = []
+    for play in plays:
+        grid = [row[:] for row in play['board']]
+        for tile in play['placed_tiles']:
+            grid[tile['row']][tile['col']] = tile['letter']
+        after.append(grid)
+    before = [board.BoardAnalysis(play['board']) for play in plays]
+
+    # Both paths must agree before their timings mean anything
+    for analysis, play, grid in zip(before, plays, after):
+        analysis.place(play['placed_tiles'])
+        assert state(analysis) == state(board.BoardAnalysis(grid))
+        analysis.undo()
+        assert state(analysis) == state(board.BoardAnalysis(play['board']))
+
+    def run_full():
+        for grid in after:
+            board.BoardAnalysis(grid)
+
+    def run_incremental():
+        for analysis, play in zip(before, plays):
+            analysis.place(play['placed_tiles'])
+            analysis.undo()
+
+    def run_replay_cold():
+        # Every turn of every game, as the first player of the day sees it
+        board.clear_cache()
+        for play in plays:
+            board.analyze(play['board'], play['placed_tiles'])
+
+    def run_replay_warm():
+        for play in plays:
+            board.analyze(play['board'], play['placed_tiles'])
+
+    return [
+        ('analysis.full[after play]', run_full, len(plays)),
+        ('analysis.incremental[place+undo]', run_incremental, len(plays)),
+        ('analyze[cold cache]', run_replay_cold, len(plays)),
+        ('analyze[cache hit]', run_replay_warm, len(plays)),
+    ]
+
+
+if __name__ == "__main__":
+    sys.exit(benchlib.main_for('board', 'Board analysis benchmarks', build_benchmarks, BASELINE_PATH))
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+DAWG benchmarks against the word set the endpoints used before
+(VALID_WORDS in validate_word.py): build, load and query latency, plus
+artifact size and retained memory, which are printed alongside
+
+Usage:
+    python3 benchmarks/bench_dawg.py
+    python3 benchmarks/bench_dawg.py --compare
+    python3 benchmarks/bench_dawg.py --save-baseline
+"""
+
+import atexit
+import os
+import random
+import shutil
+import sys
+import tempfile
+import tracemalloc
+
+import benchlib
+
+benchlib.add_cgi_path()
+
+BASELINE_PATH = os.path.join(benchlib.BENCH_DIR, 'baseline_dawg.json')
+
+LOOKUPS = 1000
+
+
+def retained_kb(build):
+    """Python heap retained by the object build() returns"""
+    tracemalloc.start()
+    obj = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del obj
+    return size / 1024
+
+
+def build_benchmarks():
+    from rogueletters import dawg, data_path, dictionary
+
+    enable_path = data_path(dictionary.DICTIONARY_FILE)
+    words = dictionary.words()
+    graph = dawg.Dawg.from_words(words)
+
+    scratch = tempfile.mkdtemp()
+    atexit.register(shutil.rmtree, scratch, True)
+    dawg_path = os.path.join(scratch, dawg.DAWG_FILE)
+    graph.save(dawg_path)
+
+    rng = random.Random(7)
+    sample = rng.sample(sorted(words), LOOKUPS // 2)
+    # Half misses: one letter changed, as a typo or a bad cross-word would be
+    misses = [w[:-1] + ('Q' if w[-1] != 'Q' else 'Z') for w in sample]
+    queries = sample + misses
+    prefixes = [w[:max(1, len(w) - 2)] for w in sample]
+    assert all((q in graph) == (q in words) for q in queries)
+
+    print(f"  enable.txt {os.path.getsize(enable_path) / 1024:.0f} KB, "
+          f"{dawg.DAWG_FILE} {os.path.getsize(dawg_path) / 1024:.0f} KB")
+    print(f"  retained heap: set {retained_kb(lambda: dictionary.load_words(enable_path)) / 1024:.1f} MB, "
+          f"DAWG {retained_kb(lambda: dawg.Dawg.load(dawg_path)) / 1024:.1f} MB")
+
+    def set_lookups():
+        for query in queries:
+            query in words
+
+    def dawg_lookups():
+        for query in queries:
+            query in graph
+
+    def dawg_prefixes():
+        for prefix in prefixes:
+            graph.is_prefix(prefix)
+
+    def dawg_next_letters():
+        for prefix in prefixes:
+            graph.next_letters(prefix)
+
+    return [
+        ('build.set[enable.txt]', lambda: dictionary.load_words(enable_path), 1),
+        ('build.dawg[word set]', lambda: dawg.Dawg.from_words(words), 1),
+        ('load.dawg[file]', lambda: dawg.Dawg.load(dawg_path), 1),
+        ('lookup.set[50% hits]', set_lookups, len(queries)),
+        ('lookup.dawg[50% hits]', dawg_lookups, len(queries)),
+        ('prefix.dawg', dawg_prefixes, len(prefixes)),
+        ('next_letters.dawg', dawg_next_letters, len(prefixes)),
+    ]
+
+
+if __name__ == "__main__":
+    sys.exit(benchlib.main_for('dawg', 'DAWG dictionary benchmarks', build_benchmarks, BASELINE_PATH))
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+In-process benchmarks for the CGI endpoints and the core game functions
+
+Fixtures are synthesized from real seeds: each game places the starting
+word, draws the real deck and greedily plays a valid word every turn, so
+validate/score benchmarks see realistic boards and placements.
+
+Usage:
+    python3 benchmarks/bench_endpoints.py                  # run and print
+    python3 benchmarks/bench_endpoints.py --compare        # fail on regressions vs baseline
+    python3 benchmarks/bench_endpoints.py --save-baseline  # refresh benchmarks/baseline.json
+    python3 benchmarks/bench_endpoints.py score -o out.json
+"""
+
+import io
+import json
+import os
+import sys
+from collections import Counter
+from contextlib import redirect_stdout
+
+import benchlib
+
+benchlib.add_cgi_path()
+
+import letters
+import validate_word
+import check_word
+import calculate_scores
+import get_rack
+import get_high_score
+from rogueletters import dictionary
+
+BASELINE_PATH = os.path.join(benchlib.BENCH_DIR, 'baseline.json')
+
+SEEDS = ['20251005', '20251112', '20260101', '20260214', '1737158400123']
+
+
+def call_endpoint(module, query='', body=None):
+    """Serve one CGI request through module.main() and return the response text"""
+    payload = json.dumps(body) if body is not None else ''
+    os.environ['REQUEST_METHOD'] = 'POST' if payload else 'GET'
+    os.environ['QUERY_STRING'] = query
+    os.environ['CONTENT_LENGTH'] = str(len(payload))
+    os.environ['CONTENT_TYPE'] = 'application/json'
+    sys.stdin = io.StringIO(payload)
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        module.main()
+    return buffer.getvalue()
+
+
+def starting_board(starting_word):
+    """Empty 9x9 board with the starting word centred on row 4"""
+    board = [['' for _ in range(9)] for _ in range(9)]
+    start_col = 4 - len(starting_word) // 2
+    for i, letter in enumerate(starting_word):
+        board[4][start_col + i] = letter
+    return board
+
+
+def _candidate_words(rack, max_len=7):
+    """Dictionary words buildable from the rack plus one board letter"""
+    rack_counts = Counter(rack)
+    blanks = rack_counts.pop('_', 0)
+    candidates = []
+    for word in WORDS_BY_LENGTH:
+        if len(word) > max_len:
+            continue
+        missing = sum(max(0, n - rack_counts.get(letter, 0)) for letter, n in Counter(word).items())
+        if missing <= blanks + 1:
+            candidates.append(word)
+    return candidates
+
+
+def find_move(board, rack, limit=200):
+    """Greedy move search: best-scoring valid play among the first candidates found"""
+    candidates = _candidate_words(rack)
+    best = None
+    checked = 0
+    for row in range(9):
+        for col in range(9):
+            anchor = board[row][col]
+            if not anchor:
+                continue
+            for word in candidates:
+                for index, letter in enumerate(word):
+                    if letter != anchor:
+                        continue
+                    for d_row, d_col in ((1, 0), (0, 1)):
+                        placed = _place(board, rack, word, row - d_row * index, col - d_col * index, d_row, d_col)
+                        if not placed:
+                            continue
+                        is_valid, _, words_formed = validate_word.validate_placement(board, placed)
+                        if not is_valid:
+                            continue
+                        score = validate_word.calculate_score(board, placed, words_formed)
+                        if best is None or score > best[0]:
+                            best = (score, placed, words_formed)
+                        checked += 1
+                        if checked >= limit:
+                            return best
+    return best
+
+
+def _place(board, rack, word, row, col, d_row, d_col):
+    """Tiles needed to lay word from (row, col), or None if it does not fit the rack"""
+    end_row, end_col = row + d_row * (len(word) - 1), col + d_col * (len(word) - 1)
+    if row < 0 or col < 0 or end_row > 8 or end_col > 8:
+        return None
+
+    available = list(rack)
+    placed = []
+    for i, letter in enumerate(word):
+        r, c = row + d_row * i, col + d_col * i
+        if board[r][c]:
+            if board[r][c] != letter:
+                return None
+            continue
+        if letter in available:
+            available.remove(letter)
+            placed.append({'row': r, 'col': c, 'letter': letter})
+        elif '_' in available:
+            available.remove('_')
+            placed.append({'row': r, 'col': c, 'letter': letter, 'isBlank': True})
+        else:
+            return None
+    return placed or None
+
+
+def synthesize_game(seed, turns=5):
+    """Play a greedy 5-turn game and record every turn's inputs"""
+    starting_word = letters.get_starting_word(seed)
+    board = starting_board(starting_word)
+    deck = letters.get_all_tiles_for_day(seed, starting_word)
+    rack = deck[:7]
+    drawn = 7
+    game = {'seed': seed, 'starting_word': starting_word, 'plays': [], 'history': []}
+
+    for turn in range(1, turns + 1):
+        move = find_move(board, rack)
+        if move is None:
+            break
+        score, placed, words_formed = move
+        game['plays'].append({
+            'turn': turn,
+            'board': [row[:] for row in board],
+            'placed_tiles': placed,
+            'words_formed': words_formed,
+            'rack': rack[:],
+            'tiles_drawn': drawn,
+        })
+        played = []
+        for tile in placed:
+            board[tile['row']][tile['col']] = tile['letter']
+            played.append('_' if tile.get('isBlank') else tile['letter'])
+            rack.remove(played[-1])
+        game['history'].append(played)
+        refill = deck[drawn:drawn + 7 - len(rack)]
+        rack.extend(refill)
+        drawn += len(refill)
+
+    game['tiles'] = [dict(tile, turn=play['turn']) for play in game['plays'] for tile in play['placed_tiles']]
+    return game
+
+
+def load_candidate_words():
+    """Index the dictionary for find_move (shortest words first)"""
+    global WORDS_BY_LENGTH
+    WORDS_BY_LENGTH = sorted((w for w in dictionary.words() if 2 <= len(w) <= 7), key=len)
+
+
+def build_benchmarks():
+    load_candidate_words()
+
+    games = [synthesize_game(seed) for seed in SEEDS]
+    plays = [play for game in games for play in game['plays']]
+    starting_words = {game['seed']: game['starting_word'] for game in games}
+
+    def run_validate_placement():
+        for play in plays:
+            validate_word.validate_placement(play['board'], play['placed_tiles'])
+
+    def run_extract_words():
+        for play in plays:
+            validate_word.extract_words_formed(play['board'], play['placed_tiles'])
+
+    def run_calculate_score():
+        for play in plays:
+            validate_word.calculate_score(play['board'], play['placed_tiles'], play['words_formed'])
+
+    def run_deck_cold():
+        for seed in SEEDS:
+            letters._DECK_CACHE.clear()
+            letters.get_all_tiles_for_day(seed, starting_words[seed])
+
+    def run_deck_warm():
+        for seed in SEEDS:
+            letters.get_all_tiles_for_day(seed, starting_words[seed])
+
+    def run_starting_word():
+        for seed in SEEDS:
+            letters.get_starting_word(seed)
+
+    def run_exchange_sequence():
+        # Three successive exchanges of the first three rack tiles
+        for game in games:
+            letters._DECK_CACHE.clear()
+            rack = game['plays'][0]['rack'] if game['plays'] else []
+            drawn = 7
+            for exchange_count in range(3):
+                result = letters.exchange_tiles(game['seed'], game['starting_word'], rack[:3], rack,
+                                                drawn, exchange_count)
+                rack, drawn = result['updated_rack'], result['tiles_drawn']
+
+    def run_reconstruct():
+        for game in games:
+            calculate_scores.reconstruct_board_and_calculate_scores(game['tiles'], game['seed'])
+
+    def run_letters_draw():
+        for seed in SEEDS:
+            letters._DECK_CACHE.clear()
+            call_endpoint(letters, f'seed={seed}&turn=1')
+
+    def run_letters_exchange():
+        for game in games:
+            letters._DECK_CACHE.clear()
+            rack = json.dumps(game['plays'][0]['rack'] if game['plays'] else [])
+            exchange = json.dumps(json.loads(rack)[:2])
+            call_endpoint(letters, f'seed={game["seed"]}&turn=2&action=exchange&rack_tiles={rack}'
+                                   f'&tiles_drawn=7&tiles_to_exchange={exchange}&exchange_count=0')
+
+    def run_validate_endpoint():
+        for play in plays:
+            call_endpoint(validate_word, body={'board': play['board'], 'placed_tiles': play['placed_tiles']})
+
+    def run_check_word_endpoint():
+        for play in plays:
+            words = json.dumps([w['word'] for w in play['words_formed']] + ['QZXV'])
+            call_endpoint(check_word, f'words={words}')
+
+    def run_calculate_scores_endpoint():
+        for game in games:
+            call_endpoint(calculate_scores, body={'seed': game['seed'], 'tiles': game['tiles']})
+
+    def run_get_rack_endpoint():
+        for game in games:
+            letters._DECK_CACHE.clear()
+            call_endpoint(get_rack, f'seed={game["seed"]}&turn=5&history={json.dumps(game["history"])}')
+
+    def run_get_high_score_endpoint():
+        for seed in SEEDS[:4]:
+            call_endpoint(get_high_score, f'date={seed}')
+
+    return [
+        ('core.validate_placement', run_validate_placement, len(plays)),
+        ('core.extract_words_formed', run_extract_words, len(plays)),
+        ('core.calculate_score', run_calculate_score, len(plays)),
+        ('core.get_all_tiles_for_day[cold]', run_deck_cold, len(SEEDS)),
+        ('core.get_all_tiles_for_day[warm]', run_deck_warm, len(SEEDS)),
+        ('core.get_starting_word', run_starting_word, len(SEEDS)),
+        ('core.exchange_tiles[3 exchanges]', run_exchange_sequence, len(games)),
+        ('core.reconstruct_board_and_calculate_scores', run_reconstruct, len(games)),
+        ('endpoint.letters[draw]', run_letters_draw, len(SEEDS)),
+        ('endpoint.letters[exchange]', run_letters_exchange, len(games)),
+        ('endpoint.validate_word', run_validate_endpoint, len(plays)),
+        ('endpoint.check_word', run_check_word_endpoint, len(plays)),
+        ('endpoint.calculate_scores', run_calculate_scores_endpoint, len(games)),
+        ('endpoint.get_rack', run_get_rack_endpoint, len(games)),
+        ('endpoint.get_high_score', run_get_high_score_endpoint, 4),
+    ]
+
+
+WORDS_BY_LENGTH = []
+
+if __name__ == "__main__":
+    sys.exit(benchlib.main_for('endpoints', 'Endpoint and core function benchmarks',
+                               build_benchmarks, BASELINE_PATH))
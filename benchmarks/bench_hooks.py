@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Hook index benchmarks: cross-check sets and playability from the
+precomputed masks vs probing the word set letter by letter
+
+Usage:
+    python3 benchmarks/bench_hooks.py
+    python3 benchmarks/bench_hooks.py --compare
+    python3 benchmarks/bench_hooks.py --save-baseline
+"""
+
+import os
+import random
+import sys
+
+import benchlib
+
+benchlib.add_cgi_path()
+
+BASELINE_PATH = os.path.join(benchlib.BENCH_DIR, 'baseline_hooks.json')
+
+SAMPLE_SIZE = 500
+ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+
+def probe_cross_check(words, before, after):
+    """Reference: try all 26 letters in the square"""
+    mask = 0
+    for i, letter in enumerate(ALPHABET):
+        if before + letter + after in words:
+            mask |= 1 << i
+    return mask
+
+
+def probe_playability(words, word):
+    """Reference: probe every hook and insertion"""
+    front = sum(1 for letter in ALPHABET if letter + word in words)
+    back = sum(1 for letter in ALPHABET if word + letter in words)
+    inserted = {word[:i] + letter + word[i:] for i in range(len(word) + 1) for letter in ALPHABET}
+    return {'front_hooks': front, 'back_hooks': back, 'insertions': len(inserted & words)}
+
+
+def build_benchmarks():
+    from rogueletters import dictionary, hooks
+
+    words = dictionary.words()
+    index = hooks.hook_index()
+
+    rng = random.Random(3)
+    sample = rng.sample(sorted(w for w in words if 2 <= len(w) <= 8), SAMPLE_SIZE)
+    # Squares next to a word on the board: after it, before it, or inside a gap
+    squares = [(w, '') for w in sample[:200]] + [('', w) for w in sample[200:400]] + \
+              [(w[:len(w) // 2], w[len(w) // 2:]) for w in sample[400:]]
+
+    # Both paths must agree before their timings mean anything
+    assert all(index.cross_check(b, a) == probe_cross_check(words, b, a) for b, a in squares)
+    assert all(index.playability(w) == probe_playability(words, w) for w in sample[:100])
+
+    return [
+        ('build.hooks[full dictionary]', lambda: hooks.HookIndex(words), 1),
+        ('cross_check.probe', lambda: [probe_cross_check(words, b, a) for b, a in squares], len(squares)),
+        ('cross_check.index', lambda: [index.cross_check(b, a) for b, a in squares], len(squares)),
+        ('playability.probe', lambda: [probe_playability(words, w) for w in sample], len(sample)),
+        ('playability.index', lambda: [index.playability(w) for w in sample], len(sample)),
+    ]
+
+
+if __name__ == "__main__":
+    sys.exit(benchlib.main_for('hooks', 'Hook index benchmarks', build_benchmarks, BASELINE_PATH))
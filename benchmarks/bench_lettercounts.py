@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Letter-count feasibility benchmarks: per-word Counter loops vs the
+vectorized LetterMatrix, over the full ENABLE word list
+
+Usage:
+    python3 benchmarks/bench_lettercounts.py
+    python3 benchmarks/bench_lettercounts.py --compare
+    python3 benchmarks/bench_lettercounts.py --save-baseline
+"""
+
+import os
+import sys
+from collections import Counter
+
+import benchlib
+
+benchlib.add_cgi_path()
+
+BASELINE_PATH = os.path.join(benchlib.BENCH_DIR, 'baseline_lettercounts.json')
+
+# A 7-tile rack with a blank, plus letters already on the board
+RACK = 'AERST_N'
+BOARD_LETTERS = 'GDO'
+# Tiles the shop has removed from the bag for the rest of the run
+REMOVED_TILES = 'EEEEAAAIIOSSZQ'
+
+
+def counter_fits(word, available, blanks=0):
+    """Reference check: letters missing from available must be covered by blanks"""
+    shortfall = sum(max(0, count - available.get(letter, 0)) for letter, count in Counter(word).items())
+    return shortfall <= blanks
+
+
+def build_benchmarks():
+    from rogueletters import TILE_DISTRIBUTION, LETTER_DISTRIBUTION, dictionary, is_word_possible, lettercounts
+
+    if not lettercounts.HAS_NUMPY:
+        sys.exit("bench_lettercounts needs numpy (pip install numpy)")
+
+    words = sorted(dictionary.words())
+    matrix = lettercounts.LetterMatrix(words)
+
+    rack_counts = Counter(RACK.replace('_', '') + BOARD_LETTERS)
+    rack_blanks = RACK.count('_')
+    rack_vector = lettercounts.count_vector(RACK, BOARD_LETTERS)
+
+    shop_counts = Counter(LETTER_DISTRIBUTION)
+    shop_counts.subtract(Counter(REMOVED_TILES))
+    shop_blanks = TILE_DISTRIBUTION['_']
+    shop_vector = lettercounts.count_vector(TILE_DISTRIBUTION) - lettercounts.count_vector(REMOVED_TILES)
+    distribution_vector = lettercounts.count_vector(LETTER_DISTRIBUTION)
+
+    # Both paths must agree before their timings mean anything
+    assert matrix.words_fitting(distribution_vector) == [w for w in words if is_word_possible(w)]
+    assert matrix.words_fitting(rack_vector) == [w for w in words if counter_fits(w, rack_counts, rack_blanks)]
+    assert matrix.words_fitting(shop_vector) == [w for w in words if counter_fits(w, shop_counts, shop_blanks)]
+
+    return [
+        ('build.matrix[full dictionary]', lambda: lettercounts.LetterMatrix(words), 1),
+        ('tileset.counter[full dictionary]', lambda: [w for w in words if is_word_possible(w)], 1),
+        ('tileset.matrix[full dictionary]', lambda: matrix.words_fitting(distribution_vector), 1),
+        ('rack.counter[rack+board, 1 blank]',
+         lambda: [w for w in words if counter_fits(w, rack_counts, rack_blanks)], 1),
+        ('rack.matrix[rack+board, 1 blank]', lambda: matrix.words_fitting(rack_vector), 1),
+        ('shop.counter[removed tiles, 2 blanks]',
+         lambda: [w for w in words if counter_fits(w, shop_counts, shop_blanks)], 1),
+        ('shop.matrix[removed tiles, 2 blanks]', lambda: matrix.words_fitting(shop_vector), 1),
+    ]
+
+
+if __name__ == "__main__":
+    sys.exit(benchlib.main_for('lettercounts', 'Letter-count feasibility benchmarks', build_benchmarks,
+                               BASELINE_PATH))
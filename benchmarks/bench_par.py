@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Par score benchmarks: move generation on synthesized positions and the
+greedy and beam searches over a whole day
+
+Usage:
+    python3 benchmarks/bench_par.py
+    python3 benchmarks/bench_par.py --compare
+    python3 benchmarks/bench_par.py --save-baseline
+"""
+
+import os
+import sys
+
+import benchlib
+
+benchlib.add_cgi_path()
+
+import bench_endpoints
+import letters
+import validate_word
+
+BASELINE_PATH = os.path.join(benchlib.BENCH_DIR, 'baseline_par.json')
+
+
+def build_benchmarks():
+    from rogueletters import board, dawg, hooks, moves, par
+
+    lexicon = dawg.dictionary_dawg()
+    hooks.hook_index()
+    bench_endpoints.load_candidate_words()
+    games = [bench_endpoints.synthesize_game(seed) for seed in bench_endpoints.SEEDS]
+    plays = [play for game in games for play in game['plays']]
+    positions = [(board.BoardAnalysis(play['board']), play['rack']) for play in plays]
+
+    # Every generated play must pass the endpoint's validation with the same score
+    for play, (analysis, rack) in zip(plays, positions):
+        for move in moves.find_moves(analysis, rack, lexicon)[:50]:
+            valid, _, words_formed = validate_word.validate_placement(play['board'], move.placed_tiles())
+            assert valid and validate_word.calculate_score(play['board'], move.placed_tiles(),
+                                                           words_formed) == move.score
+
+    seed = bench_endpoints.SEEDS[0]
+    starting_word = letters.get_starting_word(seed)
+    deck = letters.get_all_tiles_for_day(seed, starting_word)
+
+    return [
+        ('find_moves[synthesized position]',
+         lambda: [moves.find_moves(analysis, rack, lexicon) for analysis, rack in positions], len(positions)),
+        ('greedy[one day]', lambda: par.greedy(starting_word, deck, lexicon), 1),
+        ('beam_search[one day, 8x12]', lambda: par.beam_search(starting_word, deck, lexicon=lexicon), 1),
+    ]
+
+
+if __name__ == "__main__":
+    sys.exit(benchlib.main_for('par', 'Par score benchmarks', build_benchmarks, BASELINE_PATH))
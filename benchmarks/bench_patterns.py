@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Pattern query benchmarks: positional bitsets vs a regex scan of the
+same length bucket, including worst cases such as all-wildcard 7-letter
+patterns with blanks on the rack
+
+Usage:
+    python3 benchmarks/bench_patterns.py
+    python3 benchmarks/bench_patterns.py --compare
+    python3 benchmarks/bench_patterns.py --save-baseline
+"""
+
+import os
+import re
+import sys
+from collections import Counter
+
+import benchlib
+
+benchlib.add_cgi_path()
+
+BASELINE_PATH = os.path.join(benchlib.BENCH_DIR, 'baseline_patterns.json')
+
+# (label, pattern, rack)
+QUERIES = [
+    ('?A??E', '?A??E', None),
+    ('?A??E rack', '?A??E', 'RTSLNOI'),
+    ('7 wildcards', '???????', None),
+    ('7 wildcards rack', '???????', 'AERSTLN'),
+    ('7 wildcards 1 blank', '???????', 'AERST_N'),
+    ('7 wildcards 2 blanks', '???????', 'AERST__'),
+    ('8 wildcards 2 blanks', '????????', 'RETAIN__'),
+    ('Q????', 'Q????', 'UIEAS'),
+]
+
+
+def scan(words_by_length, pattern, rack):
+    """Reference: regex over the length bucket, then the rack count check"""
+    regex = re.compile(pattern.replace('?', '.') + '$')
+    open_positions = [i for i, c in enumerate(pattern) if c == '?']
+    rack_counts = Counter(rack or '')
+    blanks = rack_counts.pop('_', 0)
+    result = []
+    for word in words_by_length.get(len(pattern), ()):
+        if not regex.match(word):
+            continue
+        if rack is not None:
+            needed = Counter(word[i] for i in open_positions)
+            if sum(max(0, n - rack_counts[letter]) for letter, n in needed.items()) > blanks:
+                continue
+        result.append(word)
+    return result
+
+
+def build_benchmarks():
+    from rogueletters import dictionary, patterns
+
+    words_by_length = dictionary.by_length()
+    index = patterns.PatternIndex(words_by_length)
+
+    benchmarks = [('build.bitsets[7 letters]', lambda: patterns.LengthBucket(words_by_length[7]), 1)]
+    for label, pattern, rack in QUERIES:
+        # Both paths must agree before their timings mean anything
+        assert index.match(pattern, rack) == scan(words_by_length, pattern, rack), label
+        benchmarks += [
+            (f'scan[{label}]', lambda p=pattern, r=rack: scan(words_by_length, p, r), 1),
+            (f'bitsets[{label}]', lambda p=pattern, r=rack: index.match(p, r), 1),
+        ]
+    return benchmarks
+
+
+if __name__ == "__main__":
+    sys.exit(benchlib.main_for('patterns', 'Pattern query benchmarks', build_benchmarks, BASELINE_PATH))
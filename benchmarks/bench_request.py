@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Request parsing benchmarks: cgi.FieldStorage vs the shared request module
+
+Every CGI process imports its parser afresh, so cold import time counts
+per request. Imports are measured by unloading the modules a fresh
+endpoint process would load for that import, then importing again.
+
+Usage:
+    python3 benchmarks/bench_request.py
+    python3 benchmarks/bench_request.py --compare
+    python3 benchmarks/bench_request.py --save-baseline
+"""
+
+import importlib
+import importlib.util
+import io
+import json
+import os
+import subprocess
+import sys
+import warnings
+
+import benchlib
+
+benchlib.add_cgi_path()
+
+BASELINE_PATH = os.path.join(benchlib.BENCH_DIR, 'baseline_request.json')
+
+# A turn-3 draw from letters.py and a check_word lookup
+LETTERS_QUERY = ('seed=20251005&turn=3&rack_size=7&rack_tiles=%5B%22A%22%2C%22E%22%2C%22R%22%5D'
+                 '&tiles_drawn=11&purchased_tiles=%5B%5D&removed_tiles=%5B%5D')
+LETTERS_PARAMS = ('seed', 'action', 'turn', 'retry', 'rack_size', 'rack_tiles', 'tiles_drawn',
+                  'purchased_tiles', 'removed_tiles')
+CHECK_WORD_QUERY = 'words=%5B%22CAT%22%2C%22GARDENS%22%2C%22QZX%22%5D'
+VALIDATE_BODY = json.dumps({
+    'board': [['' for _ in range(9)] for _ in range(9)],
+    'placed_tiles': [{'row': 4, 'col': c, 'letter': 'A'} for c in range(2, 7)],
+})
+
+# cgi was removed in Python 3.13
+HAS_CGI = importlib.util.find_spec('cgi') is not None
+
+# Modules every endpoint has loaded before it parses a request
+ENDPOINT_PRELUDE = 'import sys, os, json'
+
+
+def owned_modules(name):
+    """Modules a fresh endpoint process loads only because it imports name"""
+    code = (f"{ENDPOINT_PRELUDE}; import warnings; warnings.simplefilter('ignore'); "
+            f"before = set(sys.modules); import {name}; print(json.dumps(sorted(set(sys.modules) - before)))")
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                            cwd=benchlib.CGI_DIR).stdout
+    return json.loads(output)
+
+
+def cold_import(name):
+    """Benchmark function: import name as a fresh CGI process would"""
+    owned = owned_modules(name)
+
+    def run():
+        for module in owned:
+            sys.modules.pop(module, None)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', DeprecationWarning)
+            importlib.import_module(name)
+
+    return run
+
+
+def set_request(query='', body=''):
+    os.environ['REQUEST_METHOD'] = 'POST' if body else 'GET'
+    os.environ['QUERY_STRING'] = query
+    os.environ['CONTENT_LENGTH'] = str(len(body))
+    os.environ['CONTENT_TYPE'] = 'application/json'
+    sys.stdin = io.StringIO(body)
+
+
+def build_benchmarks():
+    import request
+    if HAS_CGI:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', DeprecationWarning)
+            import cgi
+
+    def fieldstorage_letters():
+        set_request(LETTERS_QUERY)
+        form = cgi.FieldStorage()
+        for name in LETTERS_PARAMS:
+            form.getvalue(name, '')
+
+    def request_letters():
+        set_request(LETTERS_QUERY)
+        req = request.Request()
+        for name in LETTERS_PARAMS:
+            req.get(name, '')
+
+    def fieldstorage_check_word():
+        set_request(CHECK_WORD_QUERY)
+        json.loads(cgi.FieldStorage().getvalue('words', ''))
+
+    def request_check_word():
+        set_request(CHECK_WORD_QUERY)
+        json.loads(request.Request().get('words', ''))
+
+    def manual_json_body():
+        set_request(body=VALIDATE_BODY)
+        json.loads(sys.stdin.read(int(os.environ.get('CONTENT_LENGTH', 0))))
+
+    def request_json_body():
+        set_request(body=VALIDATE_BODY)
+        request.Request().json()
+
+    benchmarks = [
+        ('import.request[cold]', cold_import('request'), 1),
+        ('parse.request[letters query]', request_letters, 1),
+        ('parse.request[check_word query]', request_check_word, 1),
+        ('parse.manual[json body]', manual_json_body, 1),
+        ('parse.request[json body]', request_json_body, 1),
+    ]
+    if HAS_CGI:
+        benchmarks[1:1] = [('import.cgi[cold]', cold_import('cgi'), 1)]
+        benchmarks += [
+            ('parse.FieldStorage[letters query]', fieldstorage_letters, 1),
+            ('parse.FieldStorage[check_word query]', fieldstorage_check_word, 1),
+        ]
+    return benchmarks
+
+
+if __name__ == "__main__":
+    sys.exit(benchlib.main_for('request', 'Request parsing benchmarks', build_benchmarks, BASELINE_PATH))
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the benchmark scripts: timing, JSON results and
+baseline comparison. Every bench_*.py script in this directory uses the
+same result format so any of them can be checked against a stored baseline.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import timeit
+from datetime import datetime, timezone
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+CGI_DIR = os.path.join(ROOT_DIR, 'cgi-bin')
+
+DEFAULT_THRESHOLD = 0.25  # Flag anything 25% slower than baseline
+
+
+def add_cgi_path():
+    """Make the CGI modules importable"""
+    if CGI_DIR not in sys.path:
+        sys.path.insert(0, CGI_DIR)
+
+
+def time_call(func, cases=1, repeat=5, min_time=0.2):
+    """Time func() and return per-case statistics in microseconds
+
+    func may process several cases per call (e.g. every synthesized play);
+    pass cases so results are reported per case.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    # autorange targets 0.2s per run; scale to the requested run length
+    number = max(1, int(number * min_time / 0.2))
+    runs = [t / number / cases * 1e6 for t in timer.repeat(repeat=repeat, number=number)]
+    return {
+        'median_us': statistics.median(runs),
+        'min_us': min(runs),
+        'max_us': max(runs),
+        'runs': repeat,
+        'loops': number,
+        'cases': cases,
+    }
+
+
+def run_suite(benchmarks, selected=None, repeat=5, min_time=0.2, verbose=True):
+    """Run (name, func, cases) benchmarks and return {name: stats}"""
+    results = {}
+    for name, func, cases in benchmarks:
+        if selected and not any(pattern in name for pattern in selected):
+            continue
+        stats = time_call(func, cases=cases, repeat=repeat, min_time=min_time)
+        results[name] = stats
+        if verbose:
+            print(f"  {name:<48} {format_us(stats['median_us']):>12}  (min {format_us(stats['min_us'])})")
+    return results
+
+
+def format_us(value):
+    if value >= 1e6:
+        return f"{value / 1e6:.2f} s"
+    if value >= 1e3:
+        return f"{value / 1e3:.2f} ms"
+    return f"{value:.1f} µs"
+
+
+def environment_info():
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'system': platform.system(),
+        'timestamp': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+    }
+
+
+def save_results(path, results, suite):
+    payload = {'suite': suite, 'environment': environment_info(), 'results': results}
+    with open(path, 'w') as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def load_results(path):
+    with open(path, 'r') as f:
+        return json.load(f)['results']
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Compare medians against a baseline
+
+    Returns a list of rows (name, baseline_us, current_us, ratio, status)
+    where status is 'regression', 'improvement', 'ok' or 'new'.
+    """
+    rows = []
+    for name, stats in results.items():
+        if name not in baseline:
+            rows.append((name, None, stats['median_us'], None, 'new'))
+            continue
+        base = baseline[name]['median_us']
+        ratio = stats['median_us'] / base if base else float('inf')
+        if ratio > 1 + threshold:
+            status = 'regression'
+        elif ratio < 1 / (1 + threshold):
+            status = 'improvement'
+        else:
+            status = 'ok'
+        rows.append((name, base, stats['median_us'], ratio, status))
+    return rows
+
+
+def print_comparison(rows, threshold):
+    icons = {'regression': '❌', 'improvement': '🚀', 'ok': '  ', 'new': '🆕'}
+    print(f"\nComparison against baseline (threshold {threshold:.0%}):")
+    for name, base, current, ratio, status in rows:
+        if base is None:
+            print(f"{icons[status]} {name:<48} {'-':>12} → {format_us(current):>12}")
+        else:
+            print(f"{icons[status]} {name:<48} {format_us(base):>12} → {format_us(current):>12}  ×{ratio:.2f}")
+
+
+def make_parser(description, default_baseline):
+    """Argument parser shared by the bench scripts"""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('filter', nargs='*', help='Only run benchmarks whose name contains one of these')
+    parser.add_argument('-o', '--output', help='Write results JSON here')
+    parser.add_argument('--baseline', default=default_baseline, help='Baseline JSON to compare against')
+    parser.add_argument('--compare', action='store_true', help='Compare with the baseline and fail on regressions')
+    parser.add_argument('--save-baseline', action='store_true', help='Overwrite the baseline with these results')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Allowed slowdown before flagging a regression (0.25 = 25%%)')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing runs per benchmark')
+    parser.add_argument('--quick', action='store_true', help='Shorter runs (noisier)')
+    return parser
+
+
+def main_for(suite, description, build_benchmarks, default_baseline):
+    """Standard command line entry point for a bench script"""
+    args = make_parser(description, default_baseline).parse_args()
+    min_time = 0.05 if args.quick else 0.2
+    repeat = 3 if args.quick else args.repeat
+
+    print(f"Preparing {suite} benchmarks...")
+    started = time.perf_counter()
+    benchmarks = build_benchmarks()
+    print(f"  fixtures ready in {time.perf_counter() - started:.1f}s\n")
+
+    results = run_suite(benchmarks, selected=args.filter, repeat=repeat, min_time=min_time)
+
+    if args.output:
+        save_results(args.output, results, suite)
+    if args.save_baseline:
+        save_results(args.baseline, results, suite)
+        print(f"\nBaseline written to {args.baseline}")
+
+    if args.compare:
+        if not os.path.exists(args.baseline):
+            print(f"\nNo baseline at {args.baseline} (run with --save-baseline first)")
+            return 1
+        rows = compare(results, load_results(args.baseline), args.threshold)
+        print_comparison(rows, args.threshold)
+        regressions = [row for row in rows if row[4] == 'regression']
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}")
+            return 1
+        print("\n✅ No regressions")
+    return 0
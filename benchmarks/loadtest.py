@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Load test simulating a day of player sessions against the real CGI scripts
+
+Each virtual player runs one session after another:
+    letters.py turn 1
+    per turn: several check_word.py calls (potential-words sidebar),
+              validate_word.py (sometimes after a rejected attempt),
+              occasionally an exchange, then letters.py for the next draw
+    get_high_score.py, and for some players submit_high_score.py
+
+By default a local stand-in server (http.server's CGI handler) is started
+on a scratch copy of cgi-bin/ and data/, so high score and rate limit
+writes never touch the repository. Use --url to target the Docker image
+instead (writes then land in that container's data directory).
+
+Usage:
+    python3 benchmarks/loadtest.py                          # 8 players, 30s
+    python3 benchmarks/loadtest.py -c 32 -d 60              # midnight rollover burst
+    python3 benchmarks/loadtest.py --url http://localhost:8086 -c 16 --sessions 200
+    python3 benchmarks/loadtest.py --json results.json
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import defaultdict
+from datetime import datetime
+
+import benchlib
+import bench_endpoints
+
+
+class Stats:
+    """Thread-safe latency and outcome collection per endpoint"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.outcomes = defaultdict(lambda: defaultdict(int))
+
+    def record(self, endpoint, seconds, outcome):
+        with self.lock:
+            self.latencies[endpoint].append(seconds)
+            self.outcomes[endpoint][outcome] += 1
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+class Client:
+    """Minimal HTTP client that classifies each CGI response"""
+
+    def __init__(self, base_url, stats, timeout):
+        self.base_url = base_url.rstrip('/')
+        self.stats = stats
+        self.timeout = timeout
+
+    def request(self, label, script, params=None, body=None):
+        url = f"{self.base_url}/cgi-bin/{script}"
+        if params:
+            url += '?' + urllib.parse.urlencode(params)
+        data = json.dumps(body).encode() if body is not None else None
+        headers = {'Content-Type': 'application/json'} if data else {}
+
+        start = time.perf_counter()
+        try:
+            req = urllib.request.Request(url, data=data, headers=headers)
+            with urllib.request.urlopen(req, timeout=self.timeout) as response:
+                payload = response.read()
+            outcome = classify(payload)
+        except urllib.error.HTTPError as e:
+            payload, outcome = b'', f'http_{e.code}'
+        except (urllib.error.URLError, socket.timeout, ConnectionError) as e:
+            payload, outcome = b'', 'connection_error'
+        self.stats.record(label, time.perf_counter() - start, outcome)
+
+        try:
+            return json.loads(payload)
+        except ValueError:
+            return None
+
+
+def classify(payload):
+    """ok / error / rate_limited from a JSON response body"""
+    try:
+        data = json.loads(payload)
+    except ValueError:
+        return 'invalid_json'
+    if isinstance(data, dict):
+        error = data.get('error')
+        if error and 'Rate limit' in str(error):
+            return 'rate_limited'
+        if error or data.get('success') is False:
+            return 'error'
+    return 'ok'
+
+
+def play_session(client, game, rng, options):
+    """One player's full day: draw, validate, exchange, finish"""
+    seed = game['seed']
+    client.request('letters[draw]', 'letters.py', {'seed': seed, 'turn': 1})
+
+    all_words = [w['word'] for play in game['plays'] for w in play['words_formed']] or ['CAT']
+    for play in game['plays']:
+        turn = play['turn']
+        if options.think_ms:
+            time.sleep(rng.uniform(0.5, 1.5) * options.think_ms / 1000)
+
+        for _ in range(options.check_words):
+            words = rng.sample(all_words, min(3, len(all_words))) + ['ZQXJ']
+            client.request('check_word', 'check_word.py', {'words': json.dumps(words)})
+
+        if rng.random() < options.invalid_ratio:
+            # A rejected attempt: same tiles dropped one square off the line
+            bad = [dict(t) for t in play['placed_tiles']]
+            bad[0]['row'] = (bad[0]['row'] + 2) % 9
+            client.request('validate_word', 'validate_word.py',
+                           body={'board': play['board'], 'placed_tiles': bad})
+        client.request('validate_word', 'validate_word.py',
+                       body={'board': play['board'], 'placed_tiles': play['placed_tiles']})
+
+        remaining = list(play['rack'])
+        for tile in play['placed_tiles']:
+            letter = '_' if tile.get('isBlank') else tile['letter']
+            if letter in remaining:
+                remaining.remove(letter)
+
+        if turn < 5 and rng.random() < options.exchange_ratio and remaining:
+            client.request('letters[exchange]', 'letters.py', {
+                'seed': seed, 'turn': turn + 1, 'action': 'exchange',
+                'rack_tiles': json.dumps(remaining), 'tiles_drawn': play['tiles_drawn'],
+                'tiles_to_exchange': json.dumps(remaining[:2]), 'exchange_count': 0,
+            })
+
+        if turn < 5:
+            client.request('letters[draw]', 'letters.py', {
+                'seed': seed, 'turn': turn + 1,
+                'rack_tiles': json.dumps(remaining), 'tiles_drawn': play['tiles_drawn'],
+            })
+
+    client.request('get_high_score', 'get_high_score.py', {'date': seed})
+    if rng.random() < options.submit_ratio:
+        client.request('submit_high_score', 'submit_high_score.py', body={
+            'date': seed,
+            'score': rng.randint(60, 250),
+            'board_url': 'TEST_loadtest_' + str(rng.randrange(10 ** 9)),
+        })
+
+
+def start_stand_in(port):
+    """Serve a scratch copy of cgi-bin/ and data/ through http.server --cgi"""
+    workdir = tempfile.mkdtemp(prefix='rogueletters-loadtest-')
+    shutil.copytree(benchlib.CGI_DIR, os.path.join(workdir, 'cgi-bin'),
+                    ignore=shutil.ignore_patterns('__pycache__'))
+    shutil.copytree(os.path.join(benchlib.ROOT_DIR, 'data'), os.path.join(workdir, 'data'),
+                    ignore=shutil.ignore_patterns('metrics.bin', 'rate_limits.json', 'profiles'))
+
+    # http.server runs CGI scripts as 'nobody' when started as root, so the
+    # scratch tree must be readable and data/ writable by everyone
+    os.chmod(workdir, 0o755)
+    for dirpath, dirnames, filenames in os.walk(os.path.join(workdir, 'data')):
+        os.chmod(dirpath, 0o777)
+        for name in filenames:
+            os.chmod(os.path.join(dirpath, name), 0o666)
+
+    env = dict(os.environ, PYTHONWARNINGS='ignore')
+    env.pop('ROGUELETTERS_METRICS_FILE', None)
+    server = subprocess.Popen(
+        [sys.executable, '-W', 'ignore', '-m', 'http.server', '--cgi', '--bind', '127.0.0.1',
+         '--directory', workdir, str(port)],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=env,
+    )
+
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.5):
+                return server, workdir
+        except OSError:
+            time.sleep(0.1)
+    server.terminate()
+    raise RuntimeError('Stand-in server did not start')
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def run_load(base_url, games, options):
+    stats = Stats()
+    deadline = time.perf_counter() + options.duration
+    sessions_started = [0]
+    counter_lock = threading.Lock()
+
+    def worker(worker_id):
+        rng = random.Random(options.rng_seed * 1000 + worker_id)
+        client = Client(base_url, stats, options.timeout)
+        while time.perf_counter() < deadline:
+            with counter_lock:
+                if options.sessions and sessions_started[0] >= options.sessions:
+                    return
+                sessions_started[0] += 1
+            play_session(client, rng.choice(games), rng, options)
+
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(options.concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return stats, time.perf_counter() - started, sessions_started[0]
+
+
+def summarize(stats, elapsed, sessions):
+    endpoints = {}
+    for endpoint, latencies in sorted(stats.latencies.items()):
+        ordered = sorted(latencies)
+        endpoints[endpoint] = {
+            'requests': len(ordered),
+            'throughput_rps': len(ordered) / elapsed,
+            'p50_ms': percentile(ordered, 0.50) * 1000,
+            'p95_ms': percentile(ordered, 0.95) * 1000,
+            'p99_ms': percentile(ordered, 0.99) * 1000,
+            'max_ms': ordered[-1] * 1000,
+            'outcomes': dict(stats.outcomes[endpoint]),
+        }
+    total = sum(e['requests'] for e in endpoints.values())
+    return {
+        'elapsed_s': elapsed,
+        'sessions': sessions,
+        'requests': total,
+        'throughput_rps': total / elapsed if elapsed else 0.0,
+        'endpoints': endpoints,
+    }
+
+
+def print_summary(summary, options):
+    print(f"\n{summary['sessions']} sessions, {summary['requests']} requests in {summary['elapsed_s']:.1f}s "
+          f"→ {summary['throughput_rps']:.1f} req/s at concurrency {options.concurrency}\n")
+    print(f"{'endpoint':<20} {'reqs':>7} {'req/s':>8} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}  outcomes")
+    for endpoint, e in summary['endpoints'].items():
+        outcomes = ', '.join(f"{k}={v}" for k, v in sorted(e['outcomes'].items()))
+        print(f"{endpoint:<20} {e['requests']:>7} {e['throughput_rps']:>8.1f} {e['p50_ms']:>7.1f}ms "
+              f"{e['p95_ms']:>7.1f}ms {e['p99_ms']:>7.1f}ms {e['max_ms']:>7.1f}ms  {outcomes}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Simulate a day of player sessions against the CGI endpoints')
+    parser.add_argument('--url', help='Target server (default: start a local stand-in)')
+    parser.add_argument('-c', '--concurrency', type=int, default=8, help='Concurrent players')
+    parser.add_argument('-d', '--duration', type=float, default=30, help='Seconds to run')
+    parser.add_argument('--sessions', type=int, default=0, help='Stop after this many sessions (0 = no limit)')
+    parser.add_argument('--seeds', nargs='+', default=[datetime.now().strftime('%Y%m%d')],
+                        help='Seeds players are on (default: today, i.e. the midnight rollover case)')
+    parser.add_argument('--check-words', type=int, default=3, help='check_word.py calls per turn')
+    parser.add_argument('--invalid-ratio', type=float, default=0.3, help='Chance of a rejected validate per turn')
+    parser.add_argument('--exchange-ratio', type=float, default=0.1, help='Chance of an exchange per turn')
+    parser.add_argument('--submit-ratio', type=float, default=0.2, help='Chance a session submits a high score')
+    parser.add_argument('--think-ms', type=float, default=0, help='Average pause between turns')
+    parser.add_argument('--timeout', type=float, default=30, help='Per-request timeout in seconds')
+    parser.add_argument('--rng-seed', type=int, default=1, help='Seed for the player behaviour RNG')
+    parser.add_argument('--json', metavar='PATH', help='Also write the summary as JSON')
+    options = parser.parse_args()
+
+    print(f"Synthesizing games for seeds {', '.join(options.seeds)}...")
+    bench_endpoints.load_candidate_words()
+    games = [bench_endpoints.synthesize_game(seed) for seed in options.seeds]
+
+    server = workdir = None
+    base_url = options.url
+    if not base_url:
+        port = free_port()
+        server, workdir = start_stand_in(port)
+        base_url = f'http://127.0.0.1:{port}'
+        print(f"Stand-in CGI server on {base_url} (scratch copy in {workdir})")
+
+    try:
+        print(f"Running {options.concurrency} players for up to {options.duration:.0f}s...")
+        stats, elapsed, sessions = run_load(base_url, games, options)
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    summary = summarize(stats, elapsed, sessions)
+    summary['options'] = vars(options)
+    summary['environment'] = benchlib.environment_info()
+    print_summary(summary, options)
+
+    if options.json:
+        with open(options.json, 'w') as f:
+            json.dump(summary, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Build turn-1 opening books for upcoming daily seeds
+
+Each book lists every legal first play for a seed's opening rack at each
+rack size, best first (see cgi-bin/rogueletters/openings.py). hint.py
+answers turn-1 hints from it instead of searching. Run it nightly so
+tomorrow's book exists before midnight:
+
+    # crontab: 23:30 every day, tomorrow plus a day of slack
+    30 23 * * * cd /path/to/rogueletters && ROGUELETTERS_DATA_DIR=/usr/local/apache2/data \\
+        python3 build_opening_books.py --days 2 >> /var/log/opening_books.log 2>&1
+
+Usage:
+    python3 build_opening_books.py                  # tomorrow's seed
+    python3 build_opening_books.py 20251005 20251112
+    python3 build_opening_books.py --days 7 --keep-days 3
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cgi-bin'))
+
+import letters
+from rogueletters import data_path, dawg, openings
+
+
+def build(seed, lexicon):
+    starting_word = letters.get_starting_word(seed)
+    deck = letters.get_all_tiles_for_day(seed, starting_word, rack_size=max(openings.RACK_SIZES))
+    book = openings.OpeningBook.build(starting_word, deck, lexicon=lexicon)
+    path = openings.book_path(seed)
+    book.save(path)
+    return book, path
+
+
+def prune(keep_days, keep=()):
+    """Remove books for dates more than keep_days in the past, except seeds in keep"""
+    directory = data_path(openings.BOOK_DIR)
+    cutoff = (date.today() - timedelta(days=keep_days)).strftime('%Y%m%d')
+    removed = 0
+    for name in os.listdir(directory) if os.path.isdir(directory) else []:
+        seed = name[:-len('.book')]
+        if name.endswith('.book') and len(seed) == 8 and seed.isdigit() and seed < cutoff and seed not in keep:
+            os.remove(os.path.join(directory, name))
+            removed += 1
+    return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build turn-1 opening books')
+    parser.add_argument('seeds', nargs='*', help='seeds to build (default: starting tomorrow)')
+    parser.add_argument('--days', type=int, default=1, help='consecutive days from tomorrow when no seeds are given')
+    parser.add_argument('--keep-days', type=int, default=7, help='delete books for dates older than this')
+    args = parser.parse_args()
+
+    tomorrow = date.today() + timedelta(days=1)
+    seeds = args.seeds or [(tomorrow + timedelta(days=i)).strftime('%Y%m%d') for i in range(args.days)]
+    lexicon = dawg.dictionary_dawg()
+
+    for seed in seeds:
+        started = time.perf_counter()
+        book, path = build(seed, lexicon)
+        counts = ', '.join(f"{size}: {count}" for size, (_, count, _) in sorted(book.sections.items()))
+        print(f"{seed} {book.starting_word:<10} moves by rack size {{{counts}}} -> {path} "
+              f"({os.path.getsize(path) / 1024:.0f} KB, {time.perf_counter() - started:.1f}s)")
+
+    removed = prune(args.keep_days, seeds)
+    if removed:
+        print(f"Removed {removed} books older than {args.keep_days} days")
+
+
+if __name__ == "__main__":
+    main()
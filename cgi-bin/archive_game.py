@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Archive a completed game
+Takes the game's V4 share payload, checks it is a game of its day
+(its letters dealt from the day's racks, its words placed legally and
+in the dictionary), scores it again from the tiles and appends it to
+the month's archive (see rogueletters/archive.py). The archived score
+is the server's.
+Each board is archived once, and each IP may archive
+MAX_ARCHIVES_PER_DAY games a day.
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+import request
+import telemetry
+import validate_word
+from calculate_scores import reconstruct_board_and_calculate_scores
+from letters import get_starting_word
+from rogueletters import archive, shareurl
+from submit_high_score import check_rate_limit
+
+MAX_REQUEST_SIZE = 1024
+MAX_PAYLOAD_LENGTH = 128  # base64url characters; a full 35-tile game is 95
+MAX_ARCHIVES_PER_DAY = 50  # Per IP address
+RATE_LIMIT_FILE = 'archive_rate_limits.json'
+
+
+def respond(payload):
+    print("Content-Type: application/json")
+    print("Access-Control-Allow-Origin: *")
+    print()
+    print(json.dumps(payload))
+
+
+def check_play(game, tiles):
+    """Error message for a game that could not have been played, or None
+
+    Only normal daily games are archived: no shop tiles, blanks or
+    exchanges, so the racks replay exactly as get_rack.py deals them.
+    """
+    if any(tile['isBlank'] for tile in tiles):
+        return "Invalid game: daily games have no blanks"
+    try:
+        shareurl.v3_game(game)
+    except ValueError as e:
+        return f"Invalid game: {str(e)}"
+
+    board = [['' for _ in range(9)] for _ in range(9)]
+    start_col = 4 - len(game.starting_word) // 2
+    for i, letter in enumerate(game.starting_word):
+        board[4][start_col + i] = letter
+    for turn in sorted({tile['turn'] for tile in tiles}):
+        placed_tiles = [tile for tile in tiles if tile['turn'] == turn]
+        if any(board[tile['row']][tile['col']] for tile in placed_tiles):
+            return f"Invalid game: turn {turn} covers a played square"
+        is_valid, message, _ = validate_word.validate_placement(board, placed_tiles)
+        if not is_valid:
+            return f"Invalid game: turn {turn}: {message}"
+        for tile in placed_tiles:
+            board[tile['row']][tile['col']] = tile['letter']
+    return None
+
+
+def main():
+    ip = os.environ.get('REMOTE_ADDR', 'unknown')
+    if not check_rate_limit(ip, RATE_LIMIT_FILE, MAX_ARCHIVES_PER_DAY):
+        respond({"error": "Rate limit exceeded. Please try again tomorrow."})
+        return
+
+    try:
+        data = request.Request(max_body=MAX_REQUEST_SIZE).json()
+    except Exception as e:
+        respond({"error": f"Error reading request: {str(e)}"})
+        return
+    if not isinstance(data, dict):
+        respond({"error": "POST request required", "usage": "POST with JSON: {game: <V4 share payload>, score}"})
+        return
+
+    encoded = data.get('game')
+    if not isinstance(encoded, str) or not encoded or len(encoded) > MAX_PAYLOAD_LENGTH:
+        respond({"error": "Missing or invalid game parameter"})
+        return
+    try:
+        game = shareurl.decode_v4(shareurl.b64url_decode(encoded))
+    except ValueError as e:
+        respond({"error": f"Invalid game: {str(e)}"})
+        return
+
+    # Games are for today or earlier (a day of slack for time zones)
+    tomorrow = (datetime.now() + timedelta(days=1)).strftime('%Y%m%d')
+    if game.date > tomorrow or game.starting_word != get_starting_word(game.date):
+        respond({"error": "Game does not match its date"})
+        return
+    if len({(row, col) for row, col, *_ in game.tiles}) != len(game.tiles):
+        respond({"error": "Invalid game: two tiles on one square"})
+        return
+
+    tiles = [{'row': row, 'col': col, 'letter': letter.upper(), 'turn': turn, 'isBlank': is_blank}
+             for row, col, letter, turn, is_blank in game.tiles]
+    if validate_word.VALID_WORDS is None:
+        respond({"error": "Dictionary not available"})
+        return
+    error = check_play(game, tiles)
+    if error:
+        respond({"error": error})
+        return
+    score = reconstruct_board_and_calculate_scores(tiles, game.date)['total']
+
+    try:
+        month, index = archive.append(shareurl.encode_v4(*game), score)
+    except archive.DuplicateGame:
+        respond({"error": "Game already archived"})
+        return
+    except (OSError, ValueError) as e:
+        respond({"error": f"Could not archive game: {str(e)}"})
+        return
+
+    response = {"success": True, "month": month, "index": index, "score": score}
+    if 'score' in data and data['score'] != score:
+        response["score_mismatch"] = True
+    respond(response)
+
+if __name__ == "__main__":
+    telemetry.instrument('archive_game', main)
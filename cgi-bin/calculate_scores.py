@@ -4,7 +4,6 @@ Calculate Scores Endpoint - Returns scores for each turn given game data
 Used for 45-char URL decoding (no scores stored in URL)
 """
 
-import cgi
 import json
 import sys
 import os
@@ -15,12 +14,14 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 # Import scoring functions from validate_word.py
 from validate_word import TILE_SCORES, get_multiplier, extract_words_formed, calculate_score
 from letters import get_starting_word
+import request
+import telemetry
 
 def reconstruct_board_and_calculate_scores(tiles, seed):
     """
     Reconstruct board state for each turn and calculate scores
 
-    tiles: list of {row, col, letter, turn}
+    tiles: list of {row, col, letter, turn, isBlank}
     seed: date seed (YYYYMMDD) to get starting word
     Returns: {"scores": [turn1, turn2, turn3, turn4, turn5], "total": total_score}
     """
@@ -44,6 +45,7 @@ def reconstruct_board_and_calculate_scores(tiles, seed):
 
     # Calculate score for each turn
     turn_scores = []
+    blank_positions = []  # Blanks from earlier turns still score 0
 
     for turn in range(1, 6):  # Turns 1-5
         if turn not in tiles_by_turn:
@@ -57,12 +59,14 @@ def reconstruct_board_and_calculate_scores(tiles, seed):
         words_formed = extract_words_formed(board, placed_tiles)
 
         # Calculate score for this turn
-        score = calculate_score(board, placed_tiles, words_formed)
+        score = calculate_score(board, placed_tiles, words_formed, blank_positions)
         turn_scores.append(score)
 
         # Update board with placed tiles for next turn
         for tile in placed_tiles:
             board[tile['row']][tile['col']] = tile['letter']
+            if tile.get('isBlank'):
+                blank_positions.append({'row': tile['row'], 'col': tile['col']})
 
     total_score = sum(turn_scores)
 
@@ -74,11 +78,8 @@ def reconstruct_board_and_calculate_scores(tiles, seed):
 def main():
     # Read POST data
     try:
-        content_length = int(os.environ.get('CONTENT_LENGTH', 0))
-        if content_length > 0:
-            post_data = sys.stdin.read(content_length)
-            data = json.loads(post_data)
-        else:
+        data = request.Request().json()
+        if data is None:
             # GET request - return test response
             print("Content-Type: application/json")
             print("Access-Control-Allow-Origin: *")
@@ -145,4 +146,4 @@ def main():
         print(json.dumps({"error": str(e)}))
 
 if __name__ == "__main__":
-    main()
+    telemetry.instrument('calculate_scores', main)
@@ -3,15 +3,16 @@
 Check if player has already played today
 """
 
-import cgi
 import json
+import request
+import telemetry
 
 
 def main():
     # Parse request parameters
-    form = cgi.FieldStorage()
-    seed = form.getvalue('seed', '')
-    player_id = form.getvalue('player', '')
+    req = request.Request()
+    seed = req.get('seed', '')
+    player_id = req.get('player', '')
 
     # For now, always return that player hasn't played
     response = {
@@ -25,4 +26,4 @@ def main():
     print(json.dumps(response))
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    telemetry.instrument('check_play', main)
\ No newline at end of file
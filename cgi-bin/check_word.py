@@ -3,30 +3,23 @@
 Check if a word is valid in the ENABLE dictionary
 """
 
-import cgi
 import json
 import sys
-import os
+import request
+import telemetry
+from rogueletters import dawg
 
 # Load ENABLE dictionary
-VALID_WORDS = set()
-dict_path = "/usr/local/apache2/data/enable.txt"
-
-# Fallback for local development
-if not os.path.exists(dict_path):
-    dict_path = os.path.join(os.path.dirname(__file__), "../data/enable.txt")
-
 try:
-    with open(dict_path, 'r') as f:
-        VALID_WORDS = {word.strip().upper() for word in f}
-except:
+    VALID_WORDS = dawg.lookup()
+except OSError:
     # If dictionary not found, accept all words (for testing)
     VALID_WORDS = None
 
 def main():
     # Parse request parameters
-    form = cgi.FieldStorage()
-    words_param = form.getvalue('words', '')
+    req = request.Request()
+    words_param = req.get('words', '')
 
     if not words_param:
         print("Content-Type: application/json")
@@ -46,6 +39,7 @@ def main():
         return
 
     # Check each word
+    telemetry.cache_use('dictionary')
     results = {}
     for word in words:
         word_upper = word.upper().replace(' ', '')
@@ -62,4 +56,4 @@ def main():
     print(json.dumps({"results": results}))
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    telemetry.instrument('check_word', main)
\ No newline at end of file
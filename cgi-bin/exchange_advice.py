@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Which tiles to exchange, if any
+Simulates draws from the tiles left in the day's deck (see
+rogueletters/exchange.py) and compares each exchange's expected best
+play next turn with the best play on the rack as it is
+"""
+
+import json
+from contextlib import ExitStack
+import letters
+import request
+import storage
+import telemetry
+from hint import valid_board
+from rogueletters import exchange
+from rogueletters.anagrams import BLANK, MAX_RACK_SIZE
+from rogueletters.paths import data_path
+
+DEFAULT_LIMIT = 5
+MAX_LIMIT = 20
+BUDGET = 1.0  # seconds of simulation on exchange.WORKERS processes, set here and not by the caller
+LOCK_FILE = 'exchange_advice'  # data/exchange_advice.<slot>.lock
+SLOTS = 2  # advisors running at once, each with its own process pool
+
+
+def respond(payload):
+    print("Content-Type: application/json")
+    print("Access-Control-Allow-Origin: *")
+    print()
+    print(json.dumps(payload))
+
+
+def acquire_slot(stack):
+    """Take a free advisor slot for the life of stack; False if all are busy"""
+    for slot in range(SLOTS):
+        try:
+            stack.enter_context(storage.locked(data_path(f'{LOCK_FILE}.{slot}'), blocking=False))
+            return True
+        except BlockingIOError:
+            continue
+    return False
+
+
+def valid_tiles(tiles):
+    return isinstance(tiles, list) and all(
+        isinstance(tile, str) and len(tile) == 1 and (tile == BLANK or 'A' <= tile <= 'Z') for tile in tiles)
+
+
+def main():
+    try:
+        data = request.Request().json()
+    except Exception as e:
+        respond({"error": f"Error reading request: {str(e)}"})
+        return
+    if not isinstance(data, dict):
+        respond({
+            "error": "POST request required",
+            "usage": "POST with JSON: {seed, rack: [...], board: [[...]], blank_positions, tiles_drawn, "
+                     "purchased_tiles, removed_tiles, limit}"
+        })
+        return
+
+    seed = str(data.get('seed', ''))
+    rack = data.get('rack', [])
+    cells = data.get('board')
+    purchased_tiles = data.get('purchased_tiles', [])
+    removed_tiles = data.get('removed_tiles', [])
+
+    if not seed:
+        respond({"error": "Missing seed parameter"})
+        return
+    if not valid_tiles(rack) or not rack or len(rack) > MAX_RACK_SIZE:
+        respond({"error": f"Rack must be 1-{MAX_RACK_SIZE} tiles of A-Z or _"})
+        return
+    if not valid_tiles(purchased_tiles) or not valid_tiles(removed_tiles):
+        respond({"error": "Invalid shop tiles"})
+        return
+    if not valid_board(cells):
+        respond({"error": "Invalid board"})
+        return
+
+    try:
+        tiles_drawn = int(data.get('tiles_drawn', len(rack)))
+        limit = max(1, min(int(data.get('limit', DEFAULT_LIMIT)), MAX_LIMIT))
+        blanks = [(b['row'], b['col']) for b in data.get('blank_positions', [])]
+    except (TypeError, ValueError, KeyError):
+        respond({"error": "Invalid tiles_drawn, limit or blank_positions"})
+        return
+    if tiles_drawn < 0:
+        respond({"error": "Invalid tiles_drawn"})
+        return
+
+    # The tiles an exchange would draw from, as letters.exchange_tiles sees them
+    starting_word = letters.get_starting_word(seed)
+    bag = letters.get_all_tiles_for_day(seed, starting_word, purchased_tiles, removed_tiles)[tiles_drawn:]
+    cells = [[(cell or '').upper() for cell in row] for row in cells]
+
+    with ExitStack() as stack:
+        if not acquire_slot(stack):
+            print("Status: 503 Service Unavailable")
+            print("Retry-After: 1")
+            respond({"error": "Exchange advisor busy, try again shortly"})
+            return
+        try:
+            advice = exchange.advise(cells, rack, bag, blanks, budget=BUDGET, seed=seed)
+        except OSError:
+            respond({"error": "Dictionary not available"})
+            return
+
+    best = advice['candidates'][0] if advice['candidates'] else None
+    respond({
+        "keep_score": advice['keep_score'],
+        "recommend": best['exchange'] if best and best['expected'] > advice['keep_score'] else [],
+        "bag_size": len(bag),
+        "simulations": advice['simulations'],
+        "candidates": advice['candidates'][:limit],
+    })
+
+if __name__ == "__main__":
+    telemetry.instrument('exchange_advice', main)
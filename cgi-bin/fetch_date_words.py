@@ -8,7 +8,8 @@ import re
 import hashlib
 import urllib.request
 from datetime import datetime
-import os
+
+from rogueletters import dictionary
 
 try:
     from bs4 import BeautifulSoup
@@ -21,11 +22,9 @@ ENABLE_WORDS = set()
 def load_enable_dictionary():
     """Load the ENABLE dictionary for word validation"""
     global ENABLE_WORDS
-    enable_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'enable.txt')
     try:
-        with open(enable_path, 'r') as f:
-            ENABLE_WORDS = set(word.strip().upper() for word in f.readlines())
-    except Exception as e:
+        ENABLE_WORDS = dictionary.words()
+    except OSError:
         # If we can't load the dictionary, use a minimal set of known valid words
         ENABLE_WORDS = {
             'WORLD', 'PEACE', 'MUSIC', 'DANCE', 'SPACE', 'TRAIN', 'OCEAN',
@@ -12,43 +12,20 @@ import random
 from collections import Counter
 import requests
 from bs4 import BeautifulSoup
+import storage
+from rogueletters import data_path, lettercounts
 
-# Scrabble tile distribution
-TILE_DISTRIBUTION = {
-    'A': 9, 'B': 2, 'C': 2, 'D': 4, 'E': 12, 'F': 2, 'G': 3, 'H': 2,
-    'I': 9, 'J': 1, 'K': 1, 'L': 4, 'M': 2, 'N': 6, 'O': 8, 'P': 2,
-    'Q': 1, 'R': 6, 'S': 4, 'T': 6, 'U': 4, 'V': 2, 'W': 2, 'X': 1,
-    'Y': 2, 'Z': 1
-}
-
-# Load ENABLE word list
-ENABLE_WORDS = set()
-enable_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'enable.txt')
+# Load ENABLE words that can be spelled from the tile set
 try:
-    with open(enable_path, 'r') as f:
-        for line in f:
-            word = line.strip().upper()
-            if word and 6 <= len(word) <= 7:
-                ENABLE_WORDS.add(word)
+    ENABLE_WORDS = lettercounts.feasible_words(6, 7)
     print(f"Loaded {len(ENABLE_WORDS)} valid 6-7 letter words from ENABLE")
-except Exception as e:
+except OSError as e:
     print(f"Error loading ENABLE dictionary: {e}")
     exit(1)
 
-def is_word_possible(word):
-    """Check if a word is possible with available Scrabble tiles"""
-    letter_counts = Counter(word.upper())
-    for letter, count in letter_counts.items():
-        if letter not in TILE_DISTRIBUTION:
-            return False
-        if count > TILE_DISTRIBUTION[letter]:
-            return False
-    return True
-
 def is_valid_word(word):
     """Check if word is valid (in ENABLE and possible with tiles)"""
-    word_upper = word.upper()
-    return word_upper in ENABLE_WORDS and is_word_possible(word_upper)
+    return word.upper() in ENABLE_WORDS
 
 def fetch_words_from_wikipedia(month, day):
     """Fetch valid words from a Wikipedia date page"""
@@ -95,7 +72,7 @@ def generate_wikipedia_words():
     """Generate unique word lists from Wikipedia for all 366 days"""
 
     # Try to load existing progress
-    progress_file = os.path.join(os.path.dirname(__file__), '..', 'data', 'wikipedia_words_progress.json')
+    progress_file = data_path('wikipedia_words_progress.json')
     if os.path.exists(progress_file):
         with open(progress_file, 'r') as f:
             daily_words = json.load(f)
@@ -175,8 +152,7 @@ def generate_wikipedia_words():
 
             # Save progress every 10 days
             if len(daily_words) % 10 == 0:
-                with open(progress_file, 'w') as f:
-                    json.dump(daily_words, f, indent=2, sort_keys=True)
+                storage.write_json_atomic(progress_file, daily_words, indent=2, sort_keys=True)
                 print(f"  Saved progress: {len(daily_words)} days completed")
 
             # Be nice to Wikipedia's servers
@@ -192,9 +168,8 @@ def main():
     daily_words = generate_wikipedia_words()
 
     # Save final result
-    output_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'daily_words_wikipedia.json')
-    with open(output_path, 'w') as f:
-        json.dump(daily_words, f, indent=2, sort_keys=True)
+    output_path = data_path('daily_words_wikipedia.json')
+    storage.write_json_atomic(output_path, daily_words, indent=2, sort_keys=True)
 
     print(f"\nSaved to {output_path}")
     print(f"Total days: {len(daily_words)}")
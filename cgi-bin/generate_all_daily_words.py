@@ -5,45 +5,19 @@ Uses a combination of thematic words and fallbacks
 """
 
 import json
-import os
-from collections import Counter
-
-# Scrabble tile distribution
-TILE_DISTRIBUTION = {
-    'A': 9, 'B': 2, 'C': 2, 'D': 4, 'E': 12, 'F': 2, 'G': 3, 'H': 2,
-    'I': 9, 'J': 1, 'K': 1, 'L': 4, 'M': 2, 'N': 6, 'O': 8, 'P': 2,
-    'Q': 1, 'R': 6, 'S': 4, 'T': 6, 'U': 4, 'V': 2, 'W': 2, 'X': 1,
-    'Y': 2, 'Z': 1
-}
+from rogueletters import data_path, difficulty, hooks, lettercounts
 
-# Load ENABLE word list
-ENABLE_WORDS = set()
-enable_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'enable.txt')
+# Load ENABLE words that can be spelled from the tile set
 try:
-    with open(enable_path, 'r') as f:
-        for line in f:
-            word = line.strip().upper()
-            if word and 6 <= len(word) <= 7:
-                ENABLE_WORDS.add(word)
+    ENABLE_WORDS = lettercounts.feasible_words(6, 7)
     print(f"Loaded {len(ENABLE_WORDS)} valid 6-7 letter words from ENABLE")
-except Exception as e:
+except OSError as e:
     print(f"Error loading ENABLE dictionary: {e}")
     exit(1)
 
-def is_word_possible(word):
-    """Check if a word is possible with available Scrabble tiles"""
-    letter_counts = Counter(word.upper())
-    for letter, count in letter_counts.items():
-        if letter not in TILE_DISTRIBUTION:
-            return False
-        if count > TILE_DISTRIBUTION[letter]:
-            return False
-    return True
-
 def is_valid_word(word):
     """Check if word is valid (in ENABLE and possible with tiles)"""
-    word_upper = word.upper()
-    return word_upper in ENABLE_WORDS and is_word_possible(word_upper)
+    return word.upper() in ENABLE_WORDS
 
 # Large pool of valid words organized by theme
 WORD_POOLS = {
@@ -207,12 +181,12 @@ def main():
     daily_words = generate_all_daily_words()
 
     # Save to JSON file
-    output_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'daily_words.json')
+    output_path = data_path('daily_words.json')
     with open(output_path, 'w') as f:
         json.dump(daily_words, f, indent=2, sort_keys=True)
 
     # Also save as .txt for production
-    output_txt = os.path.join(os.path.dirname(__file__), '..', 'data', 'daily_words.txt')
+    output_txt = data_path('daily_words.txt')
     with open(output_txt, 'w') as f:
         json.dump(daily_words, f, indent=2, sort_keys=True)
 
@@ -227,5 +201,28 @@ def main():
             words = daily_words[date_key]
             print(f"  {date_key}: {', '.join(words[:3])}...")
 
+    # Starting words with few hooks or insertions leave little to build on
+    index = hooks.hook_index()
+    days_by_word = {}
+    for date_key, words in daily_words.items():
+        for word in words:
+            days_by_word.setdefault(word, []).append(date_key)
+    # Insertions include the front and back hooks, so they alone count every extension
+    ranked = sorted((index.playability(word)['insertions'], word) for word in days_by_word)
+    print("\nLeast playable starting words (words made by adding one letter anywhere):")
+    for score, word in ranked[:10]:
+        print(f"  {word} ({score}) on {len(days_by_word[word])} day(s)")
+
+    # Slots profiled by profile_difficulty.py whose games score lowest
+    table = difficulty.load_table()
+    hardest = [(date_key, index, record) for _, date_key, index, record in difficulty.hardest(table)
+               if daily_words.get(date_key, [])[index:index + 1] == [record['word']]]
+    if hardest:
+        print(f"\nHardest slots ({table['games']} {table['bot']} games each, re-run profile_difficulty.py "
+              f"after changing words):")
+        for date_key, index, record in hardest:
+            print(f"  {date_key} #{index} {record['word']} (mean {record['mean']}, "
+                  f"dead racks {record['dead_rack_rate']:.0%})")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -6,50 +6,24 @@ Words are selected from Wikipedia date pages and validated
 """
 
 import json
-import os
 import re
 import time
 from datetime import datetime
-from collections import Counter
 import requests
 from bs4 import BeautifulSoup
+from rogueletters import data_path, lettercounts
 
-# Scrabble tile distribution (no blanks)
-TILE_DISTRIBUTION = {
-    'A': 9, 'B': 2, 'C': 2, 'D': 4, 'E': 12, 'F': 2, 'G': 3, 'H': 2,
-    'I': 9, 'J': 1, 'K': 1, 'L': 4, 'M': 2, 'N': 6, 'O': 8, 'P': 2,
-    'Q': 1, 'R': 6, 'S': 4, 'T': 6, 'U': 4, 'V': 2, 'W': 2, 'X': 1,
-    'Y': 2, 'Z': 1
-}
-
-# Load ENABLE word list
-ENABLE_WORDS = set()
-enable_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'enable.txt')
+# Load ENABLE words that can be spelled from the tile set
 try:
-    with open(enable_path, 'r') as f:
-        for line in f:
-            word = line.strip().upper()
-            if word and 6 <= len(word) <= 7:  # Only 6-7 letter words
-                ENABLE_WORDS.add(word)
+    ENABLE_WORDS = lettercounts.feasible_words(6, 7)
     print(f"Loaded {len(ENABLE_WORDS)} valid 6-7 letter words from ENABLE")
-except Exception as e:
+except OSError as e:
     print(f"Error loading ENABLE dictionary: {e}")
     exit(1)
 
-def is_word_possible(word):
-    """Check if a word is possible with available Scrabble tiles"""
-    letter_counts = Counter(word.upper())
-    for letter, count in letter_counts.items():
-        if letter not in TILE_DISTRIBUTION:
-            return False
-        if count > TILE_DISTRIBUTION[letter]:
-            return False
-    return True
-
 def is_valid_word(word):
     """Check if word is valid (in ENABLE and possible with tiles)"""
-    word_upper = word.upper()
-    return word_upper in ENABLE_WORDS and is_word_possible(word_upper)
+    return word.upper() in ENABLE_WORDS
 
 def extract_words_from_wikipedia(month, day):
     """Extract valid words from a Wikipedia date page"""
@@ -173,7 +147,7 @@ def main():
     daily_words = generate_daily_words()
 
     # Save to JSON file
-    output_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'daily_words.json')
+    output_path = data_path('daily_words.json')
     with open(output_path, 'w') as f:
         json.dump(daily_words, f, indent=2, sort_keys=True)
 
@@ -17,12 +17,10 @@ import json
 import os
 from collections import defaultdict
 
-# Get the script directory and project root
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
-DATA_DIR = os.path.join(PROJECT_ROOT, 'data')
-ENABLE_PATH = os.path.join(DATA_DIR, 'enable.txt')
-OUTPUT_PATH = os.path.join(DATA_DIR, 'test-wordlist.json')
+from rogueletters import data_path, dictionary
+
+ENABLE_PATH = data_path(dictionary.DICTIONARY_FILE)
+OUTPUT_PATH = data_path('test-wordlist.json')
 
 # Word frequency approximation based on letter distribution
 # Common letters (higher frequency) vs rare letters (lower frequency)
@@ -46,7 +44,7 @@ def calculate_word_score(word):
 
 
 def load_enable_words():
-    """Load all words from enable.txt."""
+    """Load all words from enable.txt, in file order (ties keep that order)."""
     words = []
     with open(ENABLE_PATH, 'r') as f:
         for line in f:
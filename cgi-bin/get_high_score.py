@@ -6,13 +6,15 @@ Returns the single highest score and board URL for that date
 
 import json
 import os
-import cgi
+import request
+import telemetry
+from rogueletters import data_path
 
 def main():
     try:
         # Parse query string
-        form = cgi.FieldStorage()
-        date = form.getvalue('date', '')
+        req = request.Request()
+        date = req.get('date', '')
 
         # Validate date format (YYYYMMDD)
         if not date or len(date) != 8 or not date.isdigit():
@@ -38,11 +40,7 @@ def main():
             return
 
         # Determine high scores directory
-        scores_dir = '/usr/local/apache2/data/high_scores'
-
-        # Fallback for local development
-        if not os.path.exists('/usr/local/apache2/data'):
-            scores_dir = os.path.join(os.path.dirname(__file__), '../data/high_scores')
+        scores_dir = data_path('high_scores')
 
         # Read high score file for this date
         score_file = os.path.join(scores_dir, f'{date}.json')
@@ -85,4 +83,4 @@ def main():
         }))
 
 if __name__ == "__main__":
-    main()
+    telemetry.instrument('get_high_score', main)
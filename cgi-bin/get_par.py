@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Get par and best-known scores for a specific date
+Reads the table written offline by compute_par_scores.py; the words of
+the best line are left out so the response is not a spoiler
+"""
+
+import json
+import request
+import telemetry
+from rogueletters import par
+
+
+def respond(payload):
+    print("Content-Type: application/json")
+    print("Access-Control-Allow-Origin: *")
+    print()
+    print(json.dumps(payload))
+
+
+def main():
+    try:
+        date = request.Request().get('date', '')
+
+        # Validate date format (YYYYMMDD)
+        if not date or len(date) != 8 or not date.isdigit():
+            respond({'success': False, 'error': 'Invalid date format (expected YYYYMMDD)'})
+            return
+
+        record = par.lookup(date) or {}
+        respond({
+            'success': True,
+            'date': date,
+            'par': record.get('par'),
+            'best': record.get('best'),
+        })
+
+    except Exception:
+        respond({'success': False, 'error': 'Internal server error'})
+
+if __name__ == "__main__":
+    telemetry.instrument('get_par', main)
@@ -4,7 +4,6 @@ Get Rack Endpoint - Returns rack contents for a specific turn
 Used for 45-char URL decoding (rack index format)
 """
 
-import cgi
 import json
 import sys
 import os
@@ -14,16 +13,18 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Import from letters.py
 from letters import get_starting_word, get_all_tiles_for_day
+import request
+import telemetry
 
 def main():
-    form = cgi.FieldStorage()
-    seed = form.getvalue('seed', '')
-    turn = int(form.getvalue('turn', 1))
+    req = request.Request()
+    seed = req.get('seed', '')
+    turn = int(req.get('turn', 1))
 
     # Get history of previous turns as JSON
     # Format: [[tiles_played_turn1], [tiles_played_turn2], ...]
     # e.g., history=[["O","P"],["A"]] means turn 1 played O,P and turn 2 played A
-    history_str = form.getvalue('history', '')
+    history_str = req.get('history', '')
 
     # Validate seed
     if not seed:
@@ -93,4 +94,4 @@ def main():
         print(json.dumps({"error": str(e)}))
 
 if __name__ == "__main__":
-    main()
+    telemetry.instrument('get_rack', main)
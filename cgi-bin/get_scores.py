@@ -6,29 +6,18 @@ Get high scores for a specific date
 import json
 import os
 from datetime import datetime
+import request
+import telemetry
+from rogueletters import data_path
 
 
 def main():
     try:
-        # Parse query string
-        query_string = os.environ.get('QUERY_STRING', '')
-        params = {}
-        if query_string:
-            for param in query_string.split('&'):
-                if '=' in param:
-                    key, value = param.split('=', 1)
-                    params[key] = value
-
         # Get date parameter or use today
-        date = params.get('date', datetime.now().strftime('%Y-%m-%d'))
+        date = request.Request().get('date', datetime.now().strftime('%Y-%m-%d'))
 
         # Load scores for the date
-        # Use Apache data directory (same as enable.txt location)
-        scores_dir = '/usr/local/apache2/data/highscores'
-
-        # Fallback for local development
-        if not os.path.exists('/usr/local/apache2/data'):
-            scores_dir = os.path.join(os.path.dirname(__file__), '../data/highscores')
+        scores_dir = data_path('highscores')
 
         score_file = os.path.join(scores_dir, f'{date}.json')
 
@@ -56,4 +45,4 @@ def main():
         print(json.dumps({'error': str(e), 'success': False}))
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    telemetry.instrument('get_scores', main)
\ No newline at end of file
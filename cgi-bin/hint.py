@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Best plays for a rack
+Turn 1 is answered from the seed's opening book when the rack is the one
+dealt; other turns, other racks and seeds without a book are searched
+live on the posted board (unless book_only is set)
+"""
+
+import json
+import request
+import telemetry
+from rogueletters import board, moves, openings
+from rogueletters.anagrams import BLANK, MAX_RACK_SIZE
+
+DEFAULT_LIMIT = 1
+MAX_LIMIT = 100
+
+
+def respond(payload):
+    print("Content-Type: application/json")
+    print("Access-Control-Allow-Origin: *")
+    print()
+    print(json.dumps(payload))
+
+
+def describe(move, cells):
+    """A play in the shape the frontend's word finder uses"""
+    after = [row[:] for row in cells]
+    for row, col, letter, _ in move.tiles:
+        after[row][col] = letter
+    return {
+        'word': move.word(after),
+        'score': move.score,
+        'direction': 'horizontal' if move.direction == board.ACROSS else 'vertical',
+        'placements': move.placed_tiles(),
+    }
+
+
+def valid_board(cells):
+    return (isinstance(cells, list) and len(cells) == board.SIZE and
+            all(isinstance(row, list) and len(row) == board.SIZE for row in cells) and
+            all(not cell or (isinstance(cell, str) and len(cell) == 1 and 'A' <= cell.upper() <= 'Z')
+                for row in cells for cell in row))
+
+
+def main():
+    try:
+        data = request.Request().json()
+    except Exception as e:
+        respond({"error": f"Error reading request: {str(e)}"})
+        return
+    if not isinstance(data, dict):
+        respond({
+            "error": "POST request required",
+            "usage": "POST with JSON: {seed, turn, rack: [...], board: [[...]], blank_positions, limit, book_only}"
+        })
+        return
+
+    seed = str(data.get('seed', ''))
+    rack = data.get('rack', [])
+    cells = data.get('board')
+
+    if not isinstance(rack, list) or not rack or len(rack) > MAX_RACK_SIZE or \
+            not all(isinstance(tile, str) and (tile == BLANK or 'A' <= tile.upper() <= 'Z') and len(tile) == 1
+                    for tile in rack):
+        respond({"error": f"Rack must be 1-{MAX_RACK_SIZE} tiles of A-Z or _"})
+        return
+    rack = [tile.upper() for tile in rack]
+
+    if cells is not None and not valid_board(cells):
+        respond({"error": "Invalid board"})
+        return
+
+    try:
+        turn = int(data.get('turn', 1))
+        limit = max(1, min(int(data.get('limit', DEFAULT_LIMIT)), MAX_LIMIT))
+    except (TypeError, ValueError):
+        respond({"error": "Invalid turn or limit"})
+        return
+
+    found = None
+    source = None
+    if turn == 1 and seed:
+        book = openings.load(seed)
+        if book is not None and (cells is None or book.matches(cells)):
+            found = book.moves(rack, limit)
+        telemetry.cache_event('opening_book', found is not None)
+        if found is not None:
+            source = 'book'
+            cells = book.cells
+
+    if found is None and cells is not None and not data.get('book_only'):
+        try:
+            analysis = board.BoardAnalysis(cells)
+            blanks = [(b['row'], b['col']) for b in data.get('blank_positions', [])]
+            found = moves.find_moves(analysis, rack, blanks=blanks)[:limit]
+            source = 'search'
+        except OSError:
+            respond({"error": "Dictionary not available"})
+            return
+
+    found = found or []
+    respond({
+        "source": source,
+        "count": len(found),
+        "moves": [describe(move, cells) for move in found],
+    })
+
+if __name__ == "__main__":
+    telemetry.instrument('hint', main)
@@ -4,7 +4,6 @@ Daily Letters - Main CGI endpoint
 Returns starting word and tiles for the game
 """
 
-import cgi
 import json
 import random
 import hashlib
@@ -15,27 +14,10 @@ import os
 # Add current directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+import request
+import telemetry
+from rogueletters import TILE_DISTRIBUTION, data_path, dictionary, is_word_possible
 
-# Standard tile distribution (including 2 blank tiles)
-TILE_DISTRIBUTION = {
-    'A': 9, 'B': 2, 'C': 2, 'D': 4, 'E': 12, 'F': 2, 'G': 3, 'H': 2,
-    'I': 9, 'J': 1, 'K': 1, 'L': 4, 'M': 2, 'N': 6, 'O': 8, 'P': 2,
-    'Q': 1, 'R': 6, 'S': 4, 'T': 6, 'U': 4, 'V': 2, 'W': 2, 'X': 1,
-    'Y': 2, 'Z': 1, '_': 2  # Blank tiles
-}
-
-def is_word_possible(word):
-    """Check if a word is possible with available tiles"""
-    from collections import Counter
-    letter_counts = Counter(word.upper())
-
-    for letter, count in letter_counts.items():
-        if letter not in TILE_DISTRIBUTION:
-            return False  # Invalid letter
-        if count > TILE_DISTRIBUTION[letter]:
-            return False  # Not enough tiles of this letter
-
-    return True
 
 def is_valid_word(word):
     """Check if word is both possible with tiles AND in ENABLE dictionary"""
@@ -43,41 +25,20 @@ def is_valid_word(word):
         return False
 
     # Check if word is in ENABLE dictionary
-    # First try to use the loaded dictionary from fetch_date_words
     try:
-        from fetch_date_words import ENABLE_WORDS
-        if ENABLE_WORDS:
-            return word.upper() in ENABLE_WORDS
-    except:
-        pass
-
-    # Fallback: check enable.txt directly
-    try:
-        enable_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'enable.txt')
-        with open(enable_path, 'r') as f:
-            # Check line by line to avoid loading entire file into memory
-            word_upper = word.upper()
-            for line in f:
-                if line.strip().upper() == word_upper:
-                    return True
-        return False
-    except:
+        valid_words = dictionary.words()
+    except OSError:
         # If we can't check, assume it's valid (Wikipedia already filtered it)
         return True
+    telemetry.cache_use('dictionary')
+    return word.upper() in valid_words
 
 # Load starting words from file if available
 def load_starting_words():
     """Load starting words from data file"""
-    import os
     words = []
-    data_path = "/usr/local/apache2/data/starter_words.txt"
-
-    # Fallback for local development
-    if not os.path.exists(data_path):
-        data_path = os.path.join(os.path.dirname(__file__), "../data/starter_words.txt")
-
     try:
-        with open(data_path, 'r') as f:
+        with open(data_path('starter_words.txt'), 'r') as f:
             for line in f:
                 line = line.strip()
                 if line and not line.startswith('#'):
@@ -115,9 +76,9 @@ def get_starting_word(seed):
     # Load the daily words file
     try:
         # Try .txt first (for production), then .json (for local dev)
-        daily_words_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'daily_words.txt')
+        daily_words_path = data_path('daily_words.txt')
         if not os.path.exists(daily_words_path):
-            daily_words_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'daily_words.json')
+            daily_words_path = data_path('daily_words.json')
 
         with open(daily_words_path, 'r') as f:
             daily_words = json.load(f)
@@ -172,6 +133,10 @@ def get_starting_word(seed):
     # Fallback if something goes wrong
     return "SAILING"
 
+# Shuffled bags keyed by (seed, starting word, purchased, removed), oldest evicted first
+_DECK_CACHE = {}
+DECK_CACHE_SIZE = 64
+
 def get_all_tiles_for_day(seed, starting_word, purchased_tiles=None, removed_tiles=None, rack_size=7):
     """Pre-generate all tiles for the entire day in order
 
@@ -187,34 +152,46 @@ def get_all_tiles_for_day(seed, starting_word, purchased_tiles=None, removed_til
         removed_tiles: List of tile letters to remove from the pool
         rack_size: Number of tiles in rack (default 7, can be 8 with Big Pockets boost)
     """
-    # Create deterministic random based on seed only
-    random.seed(get_seed_hash(seed))
-
-    # Create tile bag (100 tiles total)
-    bag = create_tile_bag()
-
-    # Add purchased tiles to the bag (pool expansion)
-    if purchased_tiles:
-        bag.extend(purchased_tiles)
-
-    # Remove tiles that were replaced via shop (pool shrinking)
-    if removed_tiles:
-        for letter in removed_tiles:
+    # The shuffled bag only depends on seed, starting word and shop changes,
+    # so a long-lived process can reuse it for every player on the same seed
+    cache_key = (seed, starting_word, tuple(purchased_tiles or ()), tuple(removed_tiles or ()))
+    bag = _DECK_CACHE.get(cache_key)
+    telemetry.cache_event('deck', bag is not None)
+
+    if bag is None:
+        # Create deterministic random based on seed only
+        random.seed(get_seed_hash(seed))
+
+        # Create tile bag (100 tiles total)
+        bag = create_tile_bag()
+
+        # Add purchased tiles to the bag (pool expansion)
+        if purchased_tiles:
+            bag.extend(purchased_tiles)
+
+        # Remove tiles that were replaced via shop (pool shrinking)
+        if removed_tiles:
+            for letter in removed_tiles:
+                if letter in bag:
+                    bag.remove(letter)
+
+        # Remove starting word tiles from bag
+        for letter in starting_word:
             if letter in bag:
                 bag.remove(letter)
 
-    # Remove starting word tiles from bag
-    for letter in starting_word:
-        if letter in bag:
-            bag.remove(letter)
+        # Shuffle the entire bag once for the day
+        random.shuffle(bag)
 
-    # Shuffle the entire bag once for the day
-    random.shuffle(bag)
+        bag = tuple(bag)
+        if len(_DECK_CACHE) >= DECK_CACHE_SIZE:
+            _DECK_CACHE.pop(next(iter(_DECK_CACHE)))
+        _DECK_CACHE[cache_key] = bag
 
     # Return enough tiles for max turns (6 with Overtime boost)
     # With rack_size=8: Turn 1: 8 tiles, Turns 2-6: up to 8 each = 48 tiles max
     max_tiles_needed = rack_size * 6  # 6 turns max with Overtime
-    return bag[:max_tiles_needed]
+    return list(bag[:max_tiles_needed])
 
 def get_tiles_for_turn(seed, turn, starting_word=None, rack_tiles=None, tiles_drawn_so_far=0, purchased_tiles=None, removed_tiles=None, rack_size=7):
     """Get tiles for a given turn
@@ -333,14 +310,14 @@ def exchange_tiles(seed, starting_word, tiles_to_exchange, rack_tiles, tiles_dra
 
 def main():
     # Parse request parameters
-    form = cgi.FieldStorage()
-    seed = form.getvalue('seed', '')
-    action = form.getvalue('action', 'draw')  # 'draw' (default) or 'exchange'
-    turn = int(form.getvalue('turn', 1))
-    is_retry = form.getvalue('retry', 'false').lower() == 'true'
+    req = request.Request()
+    seed = req.get('seed', '')
+    action = req.get('action', 'draw')  # 'draw' (default) or 'exchange'
+    turn = int(req.get('turn', 1))
+    is_retry = req.get('retry', 'false').lower() == 'true'
 
     # Parse rack_size (default 7, can be 8+ with rogues like Big Pockets, Heavy Backpack)
-    rack_size = int(form.getvalue('rack_size', 7))
+    rack_size = int(req.get('rack_size', 7))
     if rack_size < 7 or rack_size > 10:
         rack_size = 7  # Clamp to valid range (7-10)
 
@@ -355,16 +332,16 @@ def main():
 
     # Get tiles for the requested turn
     # Parse rack tiles and tiles drawn from request
-    rack_tiles_str = form.getvalue('rack_tiles', '')
+    rack_tiles_str = req.get('rack_tiles', '')
     rack_tiles = json.loads(rack_tiles_str) if rack_tiles_str else []
-    tiles_drawn = int(form.getvalue('tiles_drawn', 0))
+    tiles_drawn = int(req.get('tiles_drawn', 0))
 
     # Parse purchased tiles (shop purchases that expand the tile pool)
-    purchased_tiles_str = form.getvalue('purchased_tiles', '')
+    purchased_tiles_str = req.get('purchased_tiles', '')
     purchased_tiles = json.loads(purchased_tiles_str) if purchased_tiles_str else []
 
     # Parse removed tiles (shop replacements that shrink the tile pool)
-    removed_tiles_str = form.getvalue('removed_tiles', '')
+    removed_tiles_str = req.get('removed_tiles', '')
     removed_tiles = json.loads(removed_tiles_str) if removed_tiles_str else []
 
     # Validate purchased tiles are valid letters or blanks
@@ -385,9 +362,9 @@ def main():
     # Handle exchange action
     if action == 'exchange':
         # Parse exchange-specific parameters
-        tiles_to_exchange_str = form.getvalue('tiles_to_exchange', '[]')
+        tiles_to_exchange_str = req.get('tiles_to_exchange', '[]')
         tiles_to_exchange = json.loads(tiles_to_exchange_str)
-        exchange_count = int(form.getvalue('exchange_count', 0))
+        exchange_count = int(req.get('exchange_count', 0))
 
         # Validate tiles to exchange
         if not tiles_to_exchange or len(tiles_to_exchange) == 0:
@@ -467,4 +444,4 @@ def main():
     print(json.dumps(response))
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    telemetry.instrument('letters', main)
\ No newline at end of file
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Metrics endpoint - Prometheus text format
+Exposes request counts, error counts, latency histograms, cache hit
+rates and high score write conflicts aggregated across CGI processes
+"""
+
+import sys
+import os
+
+# Add current directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import telemetry
+
+
+def main():
+    try:
+        body = telemetry.render_prometheus(telemetry.snapshot())
+    except Exception as e:
+        print("Status: 500 Internal Server Error")
+        print("Content-Type: text/plain")
+        print()
+        print(f"# metrics unavailable: {e}")
+        return
+
+    print("Content-Type: text/plain; version=0.0.4")
+    print()
+    sys.stdout.write(body)
+
+if __name__ == "__main__":
+    main()
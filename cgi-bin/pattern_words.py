@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Words matching a positional pattern
+?A??E matches five-letter words with A second and E last; with a rack,
+the wildcard squares must be filled from its tiles ('_' for blanks)
+"""
+
+import json
+import request
+import telemetry
+from rogueletters import patterns
+
+MAX_PATTERN_LENGTH = 9  # Board width
+DEFAULT_LIMIT = 500
+MAX_LIMIT = 5000
+
+
+def respond(payload):
+    print("Content-Type: application/json")
+    print("Access-Control-Allow-Origin: *")
+    print()
+    print(json.dumps(payload))
+
+
+def main():
+    req = request.Request()
+    pattern = req.get('pattern', '').upper()
+    rack = req.get('rack')
+
+    if not pattern or len(pattern) > MAX_PATTERN_LENGTH:
+        respond({"error": f"Pattern must be 1-{MAX_PATTERN_LENGTH} characters"})
+        return
+
+    try:
+        limit = min(max(req.get_int('limit', DEFAULT_LIMIT), 0), MAX_LIMIT)
+    except ValueError:
+        respond({"error": "Invalid limit"})
+        return
+
+    try:
+        index = patterns.index()
+    except OSError:
+        respond({"error": "Dictionary not available"})
+        return
+
+    try:
+        words = index.match(pattern, rack)
+    except ValueError as e:
+        respond({"error": str(e)})
+        return
+
+    telemetry.cache_use('pattern_index')
+    respond({
+        "pattern": pattern,
+        "count": len(words),
+        "words": words[:limit],
+        "truncated": len(words) > limit,
+    })
+
+if __name__ == "__main__":
+    telemetry.instrument('pattern_words', main)
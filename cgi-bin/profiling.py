@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Opt-in cProfile capture for live endpoints
+Profiles are written as .pstats files into a spool directory, one
+sub-directory per endpoint, and merged offline by profile_report.py.
+
+Enable with environment variables (Apache: SetEnv in httpd.conf):
+    ROGUELETTERS_PROFILE=1                  profile every request
+    ROGUELETTERS_PROFILE=validate_word,...  profile only these endpoints
+    ROGUELETTERS_PROFILE_SAMPLE=100         profile 1 in 100 requests
+    ROGUELETTERS_PROFILE_DIR=/path          spool directory override
+"""
+
+import cProfile
+import os
+import random
+import sys
+import time
+
+from rogueletters import data_path
+
+
+def get_spool_dir():
+    """Resolve the profile spool directory"""
+    path = os.environ.get('ROGUELETTERS_PROFILE_DIR')
+    if path:
+        return path
+
+    return data_path('profiles')
+
+
+def should_profile(endpoint):
+    """Decide whether this request is profiled"""
+    selected = os.environ.get('ROGUELETTERS_PROFILE', '').strip()
+    if selected:
+        if selected.lower() in ('1', 'true', 'all'):
+            return True
+        if endpoint in {name.strip() for name in selected.split(',')}:
+            return True
+
+    try:
+        sample = int(os.environ.get('ROGUELETTERS_PROFILE_SAMPLE', 0))
+    except ValueError:
+        sample = 0
+    return sample > 0 and random.randrange(sample) == 0
+
+
+def save_profile(profiler, endpoint):
+    """Dump a finished profile into the spool (temp file + rename)"""
+    directory = os.path.join(get_spool_dir(), endpoint)
+    os.makedirs(directory, exist_ok=True)
+
+    name = f"{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}-{time.perf_counter_ns() % 1000000}.pstats"
+    path = os.path.join(directory, name)
+    tmp_path = os.path.join(directory, '.tmp_' + name)
+    profiler.dump_stats(tmp_path)
+    os.replace(tmp_path, path)
+    return path
+
+
+def run(endpoint, func):
+    """Call func(), under cProfile if this request was selected"""
+    if not should_profile(endpoint):
+        return func()
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        return func()
+    finally:
+        profiler.disable()
+        try:
+            save_profile(profiler, endpoint)
+        except OSError as e:
+            # Profiling must never take an endpoint down
+            print(f"Profile capture failed: {e}", file=sys.stderr)
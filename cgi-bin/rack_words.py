@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Words a rack can make
+Returns every dictionary word spelled from a subset of the rack tiles,
+with blanks ('_') standing in for any letter
+"""
+
+import json
+import request
+import telemetry
+from rogueletters import anagrams
+
+
+def respond(payload):
+    print("Content-Type: application/json")
+    print("Access-Control-Allow-Origin: *")
+    print()
+    print(json.dumps(payload))
+
+
+def main():
+    req = request.Request()
+    rack = req.get('rack', '').upper()
+
+    if not rack:
+        respond({"error": "No rack provided"})
+        return
+
+    if len(rack) > anagrams.MAX_RACK_SIZE or not all(tile == anagrams.BLANK or 'A' <= tile <= 'Z' for tile in rack):
+        respond({"error": f"Rack must be 1-{anagrams.MAX_RACK_SIZE} tiles of A-Z or _"})
+        return
+
+    try:
+        min_length = req.get_int('min_length', 2)
+        max_length = req.get_int('max_length', len(rack))
+    except ValueError:
+        respond({"error": "Invalid length"})
+        return
+
+    try:
+        index = anagrams.index()
+    except OSError:
+        respond({"error": "Dictionary not available"})
+        return
+
+    telemetry.cache_use('anagram_index')
+    matches = index.rack_words(rack, min_length, max_length)
+
+    respond({
+        "rack": rack,
+        "count": len(matches),
+        "words": [word for word, _ in matches],
+        "blanks": {word: letters for word, letters in matches if letters},
+    })
+
+if __name__ == "__main__":
+    telemetry.instrument('rack_words', main)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Readiness check - reports which data artifacts can be loaded and their versions
+Returns 503 if the dictionary, daily words or starter words are unavailable.
+Lookups built from the dictionary are listed under "built"; one that is
+missing or older than enable.txt is rebuilt in memory by every request,
+which still works but is slow, so it sets "degraded" rather than a 503.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+
+from rogueletters import data_path
+
+
+def resolve_data_file(*names):
+    """Return the first of names that exists in the data directory"""
+    for name in names:
+        path = data_path(name)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def describe_artifact(path, count_entries):
+    """Load an artifact and report entry count plus a content version"""
+    if not path:
+        return {'loaded': False, 'error': 'File not found'}
+
+    try:
+        with open(path, 'rb') as f:
+            content = f.read()
+        entries = count_entries(content.decode('utf-8'))
+    except Exception as e:
+        return {'loaded': False, 'path': path, 'error': str(e)}
+
+    modified = datetime.fromtimestamp(os.path.getmtime(path), timezone.utc)
+    return {
+        'loaded': entries > 0,
+        'path': path,
+        'entries': entries,
+        'version': hashlib.sha256(content).hexdigest()[:12],
+        'modified': modified.strftime('%Y-%m-%dT%H:%M:%SZ')
+    }
+
+
+def describe_built(path, source):
+    """Report whether a file built from source exists and is at least as new"""
+    try:
+        modified = os.path.getmtime(path)
+    except OSError:
+        return {'current': False, 'path': path, 'error': 'File not found'}
+    try:
+        current = modified >= os.path.getmtime(source)
+    except OSError:
+        current = False
+    return {
+        'current': current,
+        'path': path,
+        'size': os.path.getsize(path),
+        'modified': datetime.fromtimestamp(modified, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    }
+
+
+def count_lines(text):
+    return sum(1 for line in text.splitlines() if line.strip() and not line.startswith('#'))
+
+
+def count_json_keys(text):
+    return len(json.loads(text))
+
+
+def main():
+    artifacts = {
+        'dictionary': describe_artifact(resolve_data_file('enable.txt'), count_lines),
+        'daily_words': describe_artifact(resolve_data_file('daily_words.txt', 'daily_words.json'), count_json_keys),
+        'starter_words': describe_artifact(resolve_data_file('starter_words.txt'), count_lines),
+    }
+    ready = all(a['loaded'] for a in artifacts.values())
+    built = {
+        'anagram_index': describe_built(data_path('anagram_index.bin'), data_path('enable.txt')),
+        'dictionary_dawg': describe_built(data_path('dictionary.dawg'), data_path('enable.txt')),
+    }
+    degraded = [name for name, artifact in built.items() if not artifact['current']]
+
+    if not ready:
+        print("Status: 503 Service Unavailable")
+    print("Content-Type: application/json")
+    print("Access-Control-Allow-Origin: *")
+    print()
+    print(json.dumps({'ready': ready, 'artifacts': artifacts, 'built': built, 'degraded': degraded}))
+
+if __name__ == "__main__":
+    main()
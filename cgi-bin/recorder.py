@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Opt-in traffic recorder for golden-output replay
+Request/response pairs are appended to an NDJSON corpus, one record per
+line, and fed back through the current code by replay_traffic.py.
+
+Only deterministic, read-only endpoints are recorded. Records hold the
+method, query string, body, response and main() duration. IP addresses,
+headers and cookies are never stored.
+
+Enable with environment variables (Apache: SetEnv in httpd.conf):
+    ROGUELETTERS_RECORD=1                   record every request
+    ROGUELETTERS_RECORD=letters,...         record only these endpoints
+    ROGUELETTERS_RECORD_SAMPLE=100          record 1 in 100 requests
+    ROGUELETTERS_RECORD_FILE=/path.ndjson   corpus file override
+"""
+
+import fcntl
+import io
+import json
+import os
+import random
+import sys
+import time
+
+from rogueletters import data_path
+
+RECORD_VERSION = 1
+
+# Endpoints whose output depends only on the request (safe to replay)
+REPLAYABLE_ENDPOINTS = {'letters', 'validate_word', 'check_word', 'calculate_scores', 'get_rack', 'rack_words',
+                        'pattern_words'}
+
+# Requests with larger bodies are not recorded
+MAX_BODY_BYTES = 64 * 1024
+
+
+def get_corpus_path():
+    """Resolve the NDJSON corpus location"""
+    path = os.environ.get('ROGUELETTERS_RECORD_FILE')
+    if path:
+        return path
+
+    return data_path('recordings', 'traffic.ndjson')
+
+
+def should_record(endpoint):
+    """Decide whether this request is recorded"""
+    if endpoint not in REPLAYABLE_ENDPOINTS:
+        return False
+
+    selected = os.environ.get('ROGUELETTERS_RECORD', '').strip()
+    if selected:
+        if selected.lower() in ('1', 'true', 'all'):
+            return True
+        if endpoint in {name.strip() for name in selected.split(',')}:
+            return True
+
+    try:
+        sample = int(os.environ.get('ROGUELETTERS_RECORD_SAMPLE', 0))
+    except ValueError:
+        sample = 0
+    return sample > 0 and random.randrange(sample) == 0
+
+
+def capture_request(endpoint):
+    """Snapshot the incoming request if it is to be recorded, else None
+
+    The POST body is read up front and stdin replaced with a copy, so
+    main() still sees the full body.
+    """
+    if not should_record(endpoint):
+        return None
+
+    try:
+        content_length = int(os.environ.get('CONTENT_LENGTH') or 0)
+    except ValueError:
+        content_length = 0
+    if content_length > MAX_BODY_BYTES:
+        return None
+
+    body = sys.stdin.read(content_length) if content_length > 0 else ''
+    sys.stdin = io.StringIO(body)
+
+    return {
+        'v': RECORD_VERSION,
+        'endpoint': endpoint,
+        'method': os.environ.get('REQUEST_METHOD', 'GET'),
+        'query': os.environ.get('QUERY_STRING', ''),
+        'body': body,
+    }
+
+
+def save(record, response, elapsed):
+    """Append a finished request to the corpus under an exclusive lock"""
+    record = dict(record, ts=int(time.time()), duration_us=int(elapsed * 1e6), response=response)
+    line = json.dumps(record, separators=(',', ':')) + '\n'
+
+    try:
+        path = get_corpus_path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'a') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.write(line)
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+    except OSError as e:
+        # Recording must never take an endpoint down
+        print(f"Traffic recording failed: {e}", file=sys.stderr)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Lightweight request parsing for the endpoints
+Replaces cgi.FieldStorage (slow to import, removed in Python 3.13). The
+query string and JSON body are parsed lazily on first access, and size
+limits are checked before anything is read.
+
+Works from a CGI environment by default; a persistent server can pass
+its own environ mapping and body stream instead.
+"""
+
+import json
+import os
+import sys
+from urllib.parse import parse_qs
+
+MAX_QUERY_BYTES = 8192  # Apache's default request line limit
+MAX_BODY_BYTES = 102400  # 100KB
+
+
+class RequestTooLarge(ValueError):
+    """Query string or body exceeds the configured limit"""
+
+
+class Request:
+    """One incoming request: query parameters and optional JSON body"""
+
+    def __init__(self, environ=None, stdin=None, max_body=MAX_BODY_BYTES, max_query=MAX_QUERY_BYTES):
+        self.environ = os.environ if environ is None else environ
+        self.stdin = stdin
+        self.max_body = max_body
+        self.method = self.environ.get('REQUEST_METHOD', 'GET').upper()
+
+        self.query_string = self.environ.get('QUERY_STRING', '')
+        if len(self.query_string) > max_query:
+            raise RequestTooLarge('Query string too large')
+
+        self._params = None
+        self._body = None
+
+    @property
+    def params(self):
+        """Query parameters as {name: [values]}; blank values are dropped like FieldStorage"""
+        if self._params is None:
+            self._params = parse_qs(self.query_string) if self.query_string else {}
+        return self._params
+
+    def get(self, name, default=None):
+        """First value of a query parameter"""
+        values = self.params.get(name)
+        return values[0] if values else default
+
+    def get_int(self, name, default=0):
+        """Query parameter as int; raises ValueError if it is not a number"""
+        value = self.get(name)
+        return default if value is None else int(value)
+
+    @property
+    def content_length(self):
+        try:
+            return max(0, int(self.environ.get('CONTENT_LENGTH') or 0))
+        except ValueError:
+            return 0
+
+    @property
+    def body(self):
+        """Raw request body ('' if none); raises RequestTooLarge over max_body"""
+        if self._body is None:
+            length = self.content_length
+            if length > self.max_body:
+                raise RequestTooLarge('Request too large')
+            stream = self.stdin if self.stdin is not None else sys.stdin
+            self._body = stream.read(length) if length else ''
+        return self._body
+
+    def json(self, default=None):
+        """Decoded JSON body, or default if the body is empty"""
+        body = self.body
+        return json.loads(body) if body else default
@@ -0,0 +1,16 @@
+"""
+Shared game core for the CGI endpoints and offline tools
+
+    tiles       tile distribution, tile scores, word feasibility
+    dictionary  lazily loaded, cached views of the ENABLE word list
+    paths       data directory resolution (probed once per process)
+"""
+
+from .tiles import TILE_DISTRIBUTION, LETTER_DISTRIBUTION, TILE_SCORES, is_word_possible
+from .paths import data_dir, data_path
+from . import dictionary
+
+__all__ = [
+    'TILE_DISTRIBUTION', 'LETTER_DISTRIBUTION', 'TILE_SCORES', 'is_word_possible',
+    'data_dir', 'data_path', 'dictionary',
+]
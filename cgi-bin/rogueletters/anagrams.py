@@ -0,0 +1,240 @@
+"""
+Anagram and sub-anagram index for rack lookups
+
+Words are grouped by signature (their letters, sorted) and the signatures
+form a trie. Finding every word a rack can make is a walk down that trie
+that spends one rack tile per edge, or a blank when the rack has no tile
+for that letter. Only prefixes the rack can still afford are visited, so
+a 10-tile rack with blanks takes milliseconds.
+
+The trie is stored flat in data/anagram_index.bin and loads without
+rebuilding:
+
+    header   <4sHHIII  magic, version, reserved, nodes, edges, word bytes
+    uint32   edge_start[nodes + 1]   edges of node n: edge_start[n]..edge_start[n+1]
+    uint32   word_start[nodes + 1]   words of node n: word_start[n]..word_start[n+1]
+    uint8    edge_letter[edges]      0-25 for A-Z
+    uint32   edge_target[edges]
+    bytes    words, newline separated, in node order
+
+Build it with `python3 -m rogueletters.anagrams` from cgi-bin/.
+"""
+
+import os
+import struct
+import sys
+import tempfile
+from array import array
+
+from . import dictionary
+from .paths import data_path
+
+INDEX_FILE = 'anagram_index.bin'
+MAGIC = b'RLAI'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIII')
+
+BLANK = '_'
+MAX_RACK_SIZE = 10  # Big Pockets plus Heavy Backpack
+
+_index = None
+
+
+def signature(word):
+    """Canonical multiset key: the word's letters, sorted"""
+    return ''.join(sorted(word.upper()))
+
+
+def _uint32(values=()):
+    result = array('I', values)
+    if result.itemsize != 4:
+        result = array('L', values)
+    return result
+
+
+class AnagramIndex:
+    """Flattened trie of word signatures"""
+
+    def __init__(self, edge_start, word_start, edge_letter, edge_target, words):
+        self.edge_start = edge_start
+        self.word_start = word_start
+        self.edge_letter = edge_letter
+        self.edge_target = edge_target
+        self.words = words
+
+    @classmethod
+    def from_words(cls, words):
+        """Build the index from an iterable of words"""
+        groups = {}
+        for word in words:
+            groups.setdefault(signature(word), []).append(word.upper())
+
+        # Signatures arrive sorted, so each one shares a prefix with the path
+        # left by the previous one; nodes are numbered in depth-first order
+        children = [[]]
+        node_words = [()]
+        path = [0]
+        previous = ''
+        for key in sorted(groups):
+            common = 0
+            while common < min(len(previous), len(key)) and previous[common] == key[common]:
+                common += 1
+            del path[common + 1:]
+            for letter in key[common:]:
+                node = len(children)
+                children.append([])
+                node_words.append(())
+                children[path[-1]].append((ord(letter) - 65, node))
+                path.append(node)
+            node_words[path[-1]] = sorted(groups[key])
+            previous = key
+
+        edge_start, word_start = _uint32(), _uint32()
+        edge_letter, edge_target = array('B'), _uint32()
+        flat_words = []
+        for edges, group in zip(children, node_words):
+            edge_start.append(len(edge_letter))
+            word_start.append(len(flat_words))
+            for letter, target in edges:
+                edge_letter.append(letter)
+                edge_target.append(target)
+            flat_words.extend(group)
+        edge_start.append(len(edge_letter))
+        word_start.append(len(flat_words))
+        return cls(edge_start, word_start, edge_letter, edge_target, flat_words)
+
+    @classmethod
+    def load(cls, path):
+        """Read a saved index; raises ValueError if it is not one"""
+        with open(path, 'rb') as f:
+            magic, version, _, nodes, edges, word_bytes = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a version {VERSION} anagram index")
+
+            def read(values, count):
+                values.frombytes(f.read(count * values.itemsize))
+                if sys.byteorder != 'little':
+                    values.byteswap()
+                return values
+
+            edge_start = read(_uint32(), nodes + 1)
+            word_start = read(_uint32(), nodes + 1)
+            edge_letter = read(array('B'), edges)
+            edge_target = read(_uint32(), edges)
+            blob = f.read(word_bytes)
+        words = blob.decode('ascii').split('\n') if blob else []
+        return cls(edge_start, word_start, edge_letter, edge_target, words)
+
+    def save(self, path):
+        """Write the index, replacing path atomically"""
+        directory = os.path.dirname(path) or '.'
+        blob = '\n'.join(self.words).encode('ascii')
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp_')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(HEADER.pack(MAGIC, VERSION, 0, len(self.edge_start) - 1, len(self.edge_letter), len(blob)))
+                for values in (self.edge_start, self.word_start, self.edge_letter, self.edge_target):
+                    if sys.byteorder != 'little':
+                        values = array(values.typecode, values)
+                        values.byteswap()
+                    f.write(values.tobytes())
+                f.write(blob)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def __len__(self):
+        return len(self.words)
+
+    def rack_words(self, rack, min_length=2, max_length=None):
+        """Words spelled from any subset of the rack tiles
+
+        Blanks ('_') stand in for any letter. Returns (word, blank_letters)
+        pairs, longest first; blank_letters lists the letters the blanks
+        played, so a caller can score the word.
+        """
+        counts = [0] * 26
+        blanks = 0
+        for tile in rack.upper():
+            if tile == BLANK:
+                blanks += 1
+            elif 'A' <= tile <= 'Z':
+                counts[ord(tile) - 65] += 1
+            else:
+                raise ValueError(f"Not a tile: {tile!r}")
+        if max_length is None or max_length > len(rack):
+            max_length = len(rack)
+
+        edge_start, word_start = self.edge_start, self.word_start
+        edge_letter, edge_target, words = self.edge_letter, self.edge_target, self.words
+        found = []
+        blank_letters = []
+
+        def visit(node, depth, blanks):
+            if depth >= min_length:
+                for i in range(word_start[node], word_start[node + 1]):
+                    found.append((words[i], ''.join(blank_letters)))
+            if depth == max_length:
+                return
+            for edge in range(edge_start[node], edge_start[node + 1]):
+                letter = edge_letter[edge]
+                # Spending a real tile is never worse than spending a blank
+                if counts[letter]:
+                    counts[letter] -= 1
+                    visit(edge_target[edge], depth + 1, blanks)
+                    counts[letter] += 1
+                elif blanks:
+                    blank_letters.append(chr(65 + letter))
+                    visit(edge_target[edge], depth + 1, blanks - 1)
+                    blank_letters.pop()
+
+        visit(0, 0, blanks)
+        found.sort(key=lambda match: (-len(match[0]), match[0]))
+        return found
+
+    def anagrams(self, letters):
+        """Words using every one of the given tiles (blanks allowed)"""
+        return [word for word, _ in self.rack_words(letters, min_length=len(letters))]
+
+
+def index():
+    """The dictionary's anagram index (cached)
+
+    Loads data/anagram_index.bin, or builds the index in memory when the
+    file is missing or older than enable.txt. Raises OSError if the
+    dictionary itself is missing.
+    """
+    global _index
+    if _index is None:
+        path = data_path(INDEX_FILE)
+        try:
+            if os.path.getmtime(path) >= os.path.getmtime(data_path(dictionary.DICTIONARY_FILE)):
+                _index = AnagramIndex.load(path)
+        except (OSError, ValueError, struct.error):
+            pass
+        if _index is None:
+            # Ends up in the Apache error log; /ready reports the same
+            print(f"{path} missing or older than the dictionary; building the anagram index in memory "
+                  f"(run python3 -m rogueletters.anagrams)", file=sys.stderr)
+            _index = AnagramIndex.from_words(dictionary.words())
+    return _index
+
+
+def rack_words(rack, min_length=2, max_length=None):
+    """Dictionary words the rack can make; see AnagramIndex.rack_words"""
+    return index().rack_words(rack, min_length, max_length)
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else data_path(INDEX_FILE)
+    built = AnagramIndex.from_words(dictionary.words())
+    built.save(path)
+    print(f"Wrote {len(built)} words, {len(built.edge_start) - 1} nodes to {path} "
+          f"({os.path.getsize(path) / 1024:.0f} KB)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,221 @@
+"""
+Append-only archive of completed games, one pair of files per month
+
+data/archive/YYYYMM.games holds the month's games back to back after an
+8-byte header (MAGIC, VERSION). A record is
+
+    score       uint16 little-endian
+    timestamp   uint32 little-endian, seconds since the Unix epoch
+    payload     the game's V4 share-URL bytes (see shareurl.py)
+
+which is about 50 bytes for a 20-tile game. YYYYMM.index holds one
+uint32 offset per record, so record i is found without scanning. A game
+is filed under the month of its date, not of the time it was played.
+
+append() writes the record first and its offset second, both under the
+month's lock. A record whose offset never made it to the index is just
+skipped bytes, and readers only see games that are in the index. A
+board is archived once: YYYYMMDD.seen holds an 8-byte hash of every
+payload archived for that date, and append() raises DuplicateGame for
+a payload already in it.
+
+MonthArchive maps both files read-only. Records come back as memoryview
+slices of the map, without copying. headers() reads only the fixed
+fields (score, timestamp, date), and __iter__ decodes whole games.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import time
+from collections import namedtuple
+
+from . import shareurl
+from .paths import data_path
+
+ARCHIVE_DIR = 'archive'
+MAGIC = b'RLGA'
+VERSION = 1
+FILE_HEADER = struct.Struct('<4sI')
+RECORD_HEADER = struct.Struct('<HI')
+DATE_FIELD = struct.Struct('>H')   # first 16 bits of the payload; the date is the top 14
+OFFSET = struct.Struct('<I')
+DIGEST_SIZE = 8
+MAX_SCORE = 0xFFFF
+MAX_MONTH_BYTES = 256 * 1024 * 1024
+
+# tiles as shareurl.Game.tiles
+Game = namedtuple('Game', 'index date starting_word tiles score timestamp')
+
+
+class DuplicateGame(ValueError):
+    """The board was already archived"""
+
+
+def month_paths(month, directory=None):
+    """(records, index) paths for a YYYYMM month"""
+    directory = directory or data_path(ARCHIVE_DIR)
+    return os.path.join(directory, f'{month}.games'), os.path.join(directory, f'{month}.index')
+
+
+def months(directory=None):
+    """Archived YYYYMM months, oldest first"""
+    try:
+        names = os.listdir(directory or data_path(ARCHIVE_DIR))
+    except OSError:
+        return []
+    return sorted(name[:-len('.index')] for name in names if name.endswith('.index'))
+
+
+def append(payload, score, timestamp=None, directory=None):
+    """Archive one game from its V4 payload; returns (month, index)
+
+    Raises DuplicateGame if the same board was archived before, and
+    ValueError if the payload does not decode or the month's archive is
+    full.
+    """
+    game = shareurl.decode_v4(payload)
+    if not 0 <= score <= MAX_SCORE:
+        raise ValueError(f"Score out of range ({score})")
+    payload = shareurl.encode_v4(game.date, game.starting_word, game.tiles)
+    record = RECORD_HEADER.pack(score, int(time.time() if timestamp is None else timestamp)) + payload
+
+    # Lazy import: storage lives next to the CGI scripts, like letters.py for runs.py
+    import storage
+    month = game.date[:6]
+    games_path, index_path = month_paths(month, directory)
+    seen_path = os.path.join(os.path.dirname(games_path), f'{game.date}.seen')
+    digest = hashlib.blake2b(payload, digest_size=DIGEST_SIZE).digest()
+    with storage.locked(games_path):
+        if _seen(seen_path, digest):
+            raise DuplicateGame(f"Game already archived for {game.date}")
+        with open(games_path, 'ab') as games:
+            offset = games.tell()
+            if offset == 0:
+                games.write(FILE_HEADER.pack(MAGIC, VERSION))
+                offset = FILE_HEADER.size
+            if offset + len(record) > MAX_MONTH_BYTES:
+                raise ValueError(f"Archive for {month} is full")
+            games.write(record)
+        with open(index_path, 'ab') as index:
+            # Drop a torn offset left by an interrupted append
+            size = index.tell()
+            if size % OFFSET.size:
+                index.truncate(size - size % OFFSET.size)
+                index.seek(0, os.SEEK_END)
+            index.write(OFFSET.pack(offset))
+            count = index.tell() // OFFSET.size
+        with open(seen_path, 'ab') as seen:
+            size = seen.tell()
+            if size % DIGEST_SIZE:
+                seen.truncate(size - size % DIGEST_SIZE)
+                seen.seek(0, os.SEEK_END)
+            seen.write(digest)
+    return month, count - 1
+
+
+def _seen(path, digest):
+    """True if digest is one of the hashes in a .seen file"""
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return False
+    # Only matches on a hash boundary count
+    position = data.find(digest)
+    while position != -1 and position % DIGEST_SIZE:
+        position = data.find(digest, position + 1)
+    return position != -1
+
+
+class MonthArchive:
+    """Read-only, memory-mapped view of one month's games
+
+    Use as a context manager, or call close().
+    """
+
+    def __init__(self, month, directory=None):
+        self.month = month
+        games_path, index_path = month_paths(month, directory)
+        self._games = self._index = None
+        self._games = self._map(games_path)
+        self._index = self._map(index_path)
+        if self._games is not None and FILE_HEADER.unpack_from(self._games)[0] != MAGIC:
+            self.close()
+            raise ValueError(f"{games_path} is not a game archive")
+        # Offsets appended after the records were mapped are left for the next open
+        count = len(self._index) // OFFSET.size if self._index is not None else 0
+        while count and OFFSET.unpack_from(self._index, (count - 1) * OFFSET.size)[0] >= self._size():
+            count -= 1
+        self._count = count
+
+    @staticmethod
+    def _map(path):
+        try:
+            with open(path, 'rb') as f:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None   # missing or empty
+
+    def _size(self):
+        return len(self._games) if self._games is not None else 0
+
+    def close(self):
+        for mapped in (self._games, self._index):
+            if mapped is not None:
+                mapped.close()
+        self._games = self._index = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def offsets(self):
+        """Record offsets, in order"""
+        if not self._count:
+            return []
+        return [offset for offset, in OFFSET.iter_unpack(self._index[:self._count * OFFSET.size])]
+
+    def record(self, index):
+        """Record index as a memoryview of the map (header and payload)"""
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        start = OFFSET.unpack_from(self._index, index * OFFSET.size)[0]
+        end = OFFSET.unpack_from(self._index, (index + 1) * OFFSET.size)[0] \
+            if index + 1 < self._count else self._size()
+        return memoryview(self._games)[start:end]
+
+    def headers(self):
+        """(index, score, timestamp, date) for every game, without decoding tiles"""
+        games = self._games
+        for index, offset in enumerate(self.offsets()):
+            score, timestamp = RECORD_HEADER.unpack_from(games, offset)
+            days = DATE_FIELD.unpack_from(games, offset + RECORD_HEADER.size)[0] >> 2
+            yield index, score, timestamp, shareurl.days_to_date(days)
+
+    def __getitem__(self, index):
+        record = self.record(index)
+        score, timestamp = RECORD_HEADER.unpack_from(record)
+        game = shareurl.decode_v4(record[RECORD_HEADER.size:])
+        return Game(index, game.date, game.starting_word, game.tiles, score, timestamp)
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self[index]
+
+
+def games(start=None, end=None, directory=None):
+    """Every archived game with a date in [start, end] (YYYYMMDD, inclusive)"""
+    for month in months(directory):
+        if (start and month < start[:6]) or (end and month > end[:6]):
+            continue
+        with MonthArchive(month, directory) as archive:
+            for index, _, _, date in archive.headers():
+                if (not start or date >= start) and (not end or date <= end):
+                    yield archive[index]
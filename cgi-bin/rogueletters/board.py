@@ -0,0 +1,246 @@
+"""
+Cross-check sets and anchor squares for a board position
+
+For every empty square the analysis keeps two 26-bit letter masks (see
+hooks.py): 'across' is the set of letters a horizontal play may put there
+without breaking the vertical run through it, and 'down' is the same for
+a vertical play and the horizontal run. Anchors are the empty squares next
+to a tile, one of which every play must cover (the centre square on an
+empty board).
+
+Placing tiles only changes the squares at the ends of the runs through
+them, so place() recomputes those few squares and undo() restores them
+from a stack instead of rescanning all 81.
+
+Everyone playing a seed starts from the same board, so analyze() keeps a
+bounded LRU of analyses keyed by the board's canonical string.
+"""
+
+import hashlib
+from collections import OrderedDict
+
+from .hooks import ALL_LETTERS, hook_index
+
+SIZE = 9
+CENTER = (SIZE // 2, SIZE // 2)
+ACROSS = 'across'
+DOWN = 'down'
+MAX_CACHED_BOARDS = 256
+EMPTY_CELL = '.'
+
+# Premium squares
+DOUBLE_LETTER = [
+    (3,3), (3,5), (5,3), (5,5)
+]
+
+TRIPLE_LETTER = [
+    (0,4), (2,2), (2,6), (4,0), (4,8), (6,2), (6,6), (8,4)
+]
+
+DOUBLE_WORD = [
+    (1,1), (1,7), (7,1), (7,7)
+]
+
+TRIPLE_WORD = [
+    (0,0), (0,8), (8,0), (8,8)
+]
+
+# (letter multiplier, word multiplier) for every square; the centre star is a DW
+MULTIPLIERS = [[(1, 1)] * SIZE for _ in range(SIZE)]
+for _squares, _multiplier in ((DOUBLE_LETTER, (2, 1)), (TRIPLE_LETTER, (3, 1)),
+                              (DOUBLE_WORD + [CENTER], (1, 2)), (TRIPLE_WORD, (1, 3))):
+    for _row, _col in _squares:
+        MULTIPLIERS[_row][_col] = _multiplier
+
+_cache = OrderedDict()
+_stats = {'hits': 0, 'misses': 0}
+
+
+def board_key(board):
+    """Canonical 81-character string for a board: letters row by row, '.' for empty"""
+    return ''.join((cell or EMPTY_CELL).upper() for row in board for cell in row)
+
+
+def starting_board(starting_word):
+    """Empty board with the day's starting word centred on the middle row"""
+    board = [['' for _ in range(SIZE)] for _ in range(SIZE)]
+    start_col = CENTER[1] - len(starting_word) // 2
+    for i, letter in enumerate(starting_word):
+        board[CENTER[0]][start_col + i] = letter
+    return board
+
+
+def board_hash(board):
+    """Short stable digest of board_key, for logs and file names"""
+    return hashlib.blake2b(board_key(board).encode('ascii'), digest_size=8).hexdigest()
+
+
+class BoardAnalysis:
+    """Per-square cross-check masks and anchors, updated as tiles are placed"""
+
+    def __init__(self, board, index=None):
+        self.index = index or hook_index()
+        self.cells = [[(cell or '').upper() for cell in row] for row in board]
+        self.across = [[0] * SIZE for _ in range(SIZE)]
+        self.down = [[0] * SIZE for _ in range(SIZE)]
+        self.adjacent = set()
+        self.tile_count = sum(1 for row in self.cells for cell in row if cell)
+        self._history = []
+
+        for row in range(SIZE):
+            for col in range(SIZE):
+                if not self.cells[row][col]:
+                    self._update(row, col)
+
+    def copy(self):
+        """Independent analysis of the same board, with an empty undo stack"""
+        clone = BoardAnalysis.__new__(BoardAnalysis)
+        clone.index = self.index
+        clone.cells = [row[:] for row in self.cells]
+        clone.across = [row[:] for row in self.across]
+        clone.down = [row[:] for row in self.down]
+        clone.adjacent = set(self.adjacent)
+        clone.tile_count = self.tile_count
+        clone._history = []
+        return clone
+
+    @property
+    def key(self):
+        return board_key(self.cells)
+
+    @property
+    def anchors(self):
+        """Squares every play must cover one of: the centre on an empty board"""
+        return self.adjacent if self.tile_count else {CENTER}
+
+    def cross_check(self, row, col, direction=ACROSS):
+        """Mask of letters a play in direction may put on (row, col); 0 if occupied"""
+        return (self.across if direction == ACROSS else self.down)[row][col]
+
+    def allows(self, row, col, letter, direction=ACROSS):
+        return bool(self.cross_check(row, col, direction) >> (ord(letter.upper()) - 65) & 1)
+
+    def _run(self, row, col, d_row, d_col):
+        """Letters from the square after (row, col) in the given step until a gap"""
+        letters = []
+        row, col = row + d_row, col + d_col
+        while 0 <= row < SIZE and 0 <= col < SIZE and self.cells[row][col]:
+            letters.append(self.cells[row][col])
+            row, col = row + d_row, col + d_col
+        return ''.join(letters)
+
+    def _update(self, row, col, across=True, down=True):
+        """Recompute one square's masks (or just one of them) and anchor flag"""
+        cells = self.cells
+        if cells[row][col]:
+            self.across[row][col] = self.down[row][col] = 0
+            self.adjacent.discard((row, col))
+            return
+
+        if across:
+            above, below = self._run(row, col, -1, 0)[::-1], self._run(row, col, 1, 0)
+            self.across[row][col] = self.index.cross_check(above, below) if above or below else ALL_LETTERS
+        if down:
+            left, right = self._run(row, col, 0, -1)[::-1], self._run(row, col, 0, 1)
+            self.down[row][col] = self.index.cross_check(left, right) if left or right else ALL_LETTERS
+        if ((row > 0 and cells[row - 1][col]) or (row < SIZE - 1 and cells[row + 1][col])
+                or (col > 0 and cells[row][col - 1]) or (col < SIZE - 1 and cells[row][col + 1])):
+            self.adjacent.add((row, col))
+        else:
+            self.adjacent.discard((row, col))
+
+    def _run_ends(self, squares, steps):
+        """Empty squares ending the runs through the given squares along steps"""
+        ends = set()
+        for row, col in squares:
+            for d_row, d_col in steps:
+                r, c = row + d_row, col + d_col
+                while 0 <= r < SIZE and 0 <= c < SIZE and self.cells[r][c]:
+                    r, c = r + d_row, c + d_col
+                if 0 <= r < SIZE and 0 <= c < SIZE:
+                    ends.add((r, c))
+        return ends
+
+    def place(self, placed_tiles):
+        """Commit placed tiles ({'row', 'col', 'letter'} dicts) and update the squares they touch"""
+        squares = [(tile['row'], tile['col']) for tile in placed_tiles]
+        for row, col in squares:
+            if not (0 <= row < SIZE and 0 <= col < SIZE) or self.cells[row][col]:
+                raise ValueError(f"Cannot place a tile on ({row}, {col})")
+        if len(set(squares)) != len(squares):
+            raise ValueError("Two tiles placed on the same square")
+
+        for tile in placed_tiles:
+            self.cells[tile['row']][tile['col']] = tile['letter'].upper()
+        self.tile_count += len(squares)
+
+        # Only the squares ending a run through a new tile can change: the
+        # vertical run's ends lose 'across' letters, the horizontal run's 'down'
+        vertical = self._run_ends(squares, ((-1, 0), (1, 0)))
+        horizontal = self._run_ends(squares, ((0, -1), (0, 1)))
+        self._history.append((squares, [
+            (row, col, self.across[row][col], self.down[row][col], (row, col) in self.adjacent)
+            for row, col in vertical | horizontal | set(squares)
+        ]))
+        for row, col in squares:
+            self._update(row, col)
+        for row, col in vertical | horizontal:
+            self._update(row, col, (row, col) in vertical, (row, col) in horizontal)
+
+    def undo(self):
+        """Take back the most recent place()"""
+        if not self._history:
+            raise IndexError("Nothing to undo")
+        squares, snapshot = self._history.pop()
+        for row, col in squares:
+            self.cells[row][col] = ''
+        self.tile_count -= len(squares)
+        for row, col, across, down, adjacent in snapshot:
+            self.across[row][col] = across
+            self.down[row][col] = down
+            if adjacent:
+                self.adjacent.add((row, col))
+            else:
+                self.adjacent.discard((row, col))
+
+
+def analyze(board, placed_tiles=None):
+    """Shared analysis of board (after placed_tiles, if given), from the LRU cache
+
+    The result is shared between callers: copy() it before placing tiles.
+    """
+    if placed_tiles:
+        after = [row[:] for row in board]
+        for tile in placed_tiles:
+            after[tile['row']][tile['col']] = tile['letter']
+        key = board_key(after)
+    else:
+        key = board_key(board)
+
+    analysis = _cache.get(key)
+    if analysis is not None:
+        _stats['hits'] += 1
+        _cache.move_to_end(key)
+        return analysis
+
+    _stats['misses'] += 1
+    if placed_tiles:
+        # Derive it from the cached position before the play
+        analysis = analyze(board).copy()
+        analysis.place(placed_tiles)
+        analysis._history.clear()
+    else:
+        analysis = BoardAnalysis(board)
+    _cache[key] = analysis
+    while len(_cache) > MAX_CACHED_BOARDS:
+        _cache.popitem(last=False)
+    return analysis
+
+
+def cache_info():
+    return dict(_stats, size=len(_cache), max_size=MAX_CACHED_BOARDS)
+
+
+def clear_cache():
+    _cache.clear()
+    _stats['hits'] = _stats['misses'] = 0
@@ -0,0 +1,276 @@
+"""
+Dictionary as a minimized DAWG in a flat integer array
+
+Words share both prefixes and suffixes, so the ENABLE list packs into a
+few hundred KB that loads with one read. Besides membership it answers
+"is this a valid prefix" and "which letters can extend it", which a set
+of strings cannot.
+
+Each edge is one uint32; a node is the run of its outgoing edges:
+
+    bits 8-31  index of the child's first edge (0: no children)
+    bits 2-6   letter, 0-25 for A-Z
+    bit 1      the path ending with this edge spells a word
+    bit 0      last edge of the node
+
+Index 0 is unused, so the root's edges start at 1. The file
+data/dictionary.dawg is a <4sHHII header (magic, version, reserved,
+edge count, word count) followed by the edges, little-endian. Build it with
+`python3 -m rogueletters.dawg` from cgi-bin/.
+"""
+
+import os
+import struct
+import sys
+import tempfile
+from array import array
+
+from . import dictionary
+from .paths import data_path
+
+DAWG_FILE = 'dictionary.dawg'
+MAGIC = b'RLDW'
+VERSION = 1
+HEADER = struct.Struct('<4sHHII')
+
+ROOT = 1
+LAST = 1
+TERMINAL = 2
+
+_dawg = None
+_fallback = False     # the saved DAWG was missing or stale; reported once per process
+
+
+def _uint32(values=()):
+    result = array('I', values)
+    if result.itemsize != 4:
+        result = array('L', values)
+    return result
+
+
+class _Node:
+    __slots__ = ('terminal', 'edges')
+
+    def __init__(self):
+        self.terminal = False
+        self.edges = {}
+
+
+def _build_graph(words):
+    """Minimized DAWG of a set of uppercase words (Daciuk et al.)"""
+    root = _Node()
+    register = {}
+    unchecked = []  # (parent, letter, child) along the previous word
+
+    def minimize(down_to):
+        while len(unchecked) > down_to:
+            parent, letter, child = unchecked.pop()
+            key = (child.terminal, tuple((l, id(c)) for l, c in child.edges.items()))
+            existing = register.get(key)
+            if existing is None:
+                register[key] = child
+            else:
+                parent.edges[letter] = existing
+
+    previous = ''
+    for word in sorted(words):
+        common = 0
+        limit = min(len(word), len(previous))
+        while common < limit and word[common] == previous[common]:
+            common += 1
+        minimize(common)
+
+        node = unchecked[-1][2] if unchecked else root
+        for letter in word[common:]:
+            child = _Node()
+            node.edges[letter] = child
+            unchecked.append((node, letter, child))
+            node = child
+        node.terminal = True
+        previous = word
+    minimize(0)
+    return root
+
+
+class Dawg:
+    """Membership, prefix and next-letter queries over a flat edge array"""
+
+    def __init__(self, edges, word_count):
+        self.edges = edges
+        self.word_count = word_count
+
+    @classmethod
+    def from_words(cls, words):
+        words = set(word.upper() for word in words)
+        root = _build_graph(words)
+
+        # Lay out each node's edges as a contiguous run, breadth first
+        starts = {id(root): ROOT}
+        order = [root]
+        size = ROOT + len(root.edges)
+        for node in order:
+            for child in node.edges.values():
+                if child.edges and id(child) not in starts:
+                    starts[id(child)] = size
+                    size += len(child.edges)
+                    order.append(child)
+
+        edges = _uint32(bytes(4 * size))
+        for node in order:
+            index = starts[id(node)]
+            items = sorted(node.edges.items())
+            for offset, (letter, child) in enumerate(items):
+                value = (starts.get(id(child), 0) << 8) | ((ord(letter) - 65) << 2)
+                if child.terminal:
+                    value |= TERMINAL
+                if offset == len(items) - 1:
+                    value |= LAST
+                edges[index + offset] = value
+        return cls(edges, len(words))
+
+    @classmethod
+    def load(cls, path):
+        """Read a saved DAWG; raises ValueError if it is not one"""
+        with open(path, 'rb') as f:
+            magic, version, _, count, word_count = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a version {VERSION} DAWG")
+            edges = _uint32()
+            edges.frombytes(f.read(count * edges.itemsize))
+        if len(edges) != count:
+            raise ValueError(f"{path} is truncated")
+        if sys.byteorder != 'little':
+            edges.byteswap()
+        return cls(edges, word_count)
+
+    def save(self, path):
+        """Write the DAWG, replacing path atomically"""
+        edges = self.edges
+        if sys.byteorder != 'little':
+            edges = array(edges.typecode, edges)
+            edges.byteswap()
+        directory = os.path.dirname(path) or '.'
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp_')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(HEADER.pack(MAGIC, VERSION, 0, len(edges), self.word_count))
+                f.write(edges.tobytes())
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _edge(self, prefix):
+        """Edge value reached by spelling prefix, or None (0 for the empty prefix)"""
+        edges = self.edges
+        index = ROOT
+        value = 0
+        for char in prefix.upper():
+            code = ord(char) - 65
+            if not 0 <= code < 26 or not index:
+                return None
+            while True:
+                value = edges[index]
+                if (value >> 2) & 31 == code:
+                    break
+                if value & LAST:
+                    return None
+                index += 1
+            index = value >> 8
+        return value
+
+    def __contains__(self, word):
+        value = self._edge(word)
+        return bool(value and value & TERMINAL)
+
+    def is_prefix(self, prefix):
+        """True if some word starts with prefix (including the word itself)"""
+        return self._edge(prefix) is not None
+
+    def next_letters(self, prefix, complete=False):
+        """Letters that can follow prefix, as a sorted string
+
+        With complete=True, only letters that finish a word.
+        """
+        value = self._edge(prefix)
+        if value is None:
+            return ''
+        index = value >> 8 if prefix else ROOT
+        letters = []
+        while index:
+            edge = self.edges[index]
+            if not complete or edge & TERMINAL:
+                letters.append(chr(65 + ((edge >> 2) & 31)))
+            if edge & LAST:
+                break
+            index += 1
+        return ''.join(letters)
+
+    def __iter__(self):
+        """All words, in alphabetical order"""
+        edges = self.edges
+
+        def walk(index, prefix):
+            while index:
+                edge = edges[index]
+                word = prefix + chr(65 + ((edge >> 2) & 31))
+                if edge & TERMINAL:
+                    yield word
+                yield from walk(edge >> 8, word)
+                if edge & LAST:
+                    break
+                index += 1
+
+        return walk(ROOT, '')
+
+    def __len__(self):
+        return self.word_count
+
+
+def dictionary_dawg():
+    """The dictionary's DAWG (cached)
+
+    Loads data/dictionary.dawg, or builds it in memory when the file is
+    missing or older than enable.txt. Raises OSError if the dictionary
+    itself is missing.
+    """
+    global _dawg
+    if not isinstance(lookup(), Dawg):
+        _dawg = Dawg.from_words(dictionary.words())
+    return _dawg
+
+
+def lookup():
+    """Membership container for the endpoints (cached)
+
+    The saved DAWG when it is current; otherwise the word set, which is
+    quicker to load than building a DAWG in a CGI process. Raises OSError
+    if the dictionary is missing.
+    """
+    global _dawg, _fallback
+    if _dawg is None and not _fallback:
+        path = data_path(DAWG_FILE)
+        try:
+            if os.path.getmtime(path) >= os.path.getmtime(data_path(dictionary.DICTIONARY_FILE)):
+                _dawg = Dawg.load(path)
+        except (OSError, ValueError, struct.error):
+            pass
+        if _dawg is None:
+            _fallback = True
+            # Ends up in the Apache error log; /ready reports the same
+            print(f"{path} missing or older than the dictionary; using the word set "
+                  f"(run python3 -m rogueletters.dawg)", file=sys.stderr)
+    return _dawg if _dawg is not None else dictionary.words()
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else data_path(DAWG_FILE)
+    built = Dawg.from_words(dictionary.words())
+    built.save(path)
+    print(f"Wrote {len(built.edges) - ROOT} edges to {path} ({os.path.getsize(path) / 1024:.0f} KB)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+ENABLE dictionary, loaded once per process
+
+Every view is built on first use and cached, so an endpoint that never
+looks a word up never reads enable.txt. Words are uppercase.
+"""
+
+from collections import defaultdict
+
+from .paths import data_path
+
+DICTIONARY_FILE = 'enable.txt'
+
+_words = None
+_by_length = None
+_by_letters = None
+
+
+def load_words(path=None):
+    """Read a word list into a frozenset; raises OSError if it is missing"""
+    with open(path or data_path(DICTIONARY_FILE), 'r') as f:
+        return frozenset(filter(None, (line.strip().upper() for line in f)))
+
+
+def words():
+    """All dictionary words; raises OSError if enable.txt is missing"""
+    global _words
+    if _words is None:
+        _words = load_words()
+    return _words
+
+
+def is_word(word):
+    return word.upper() in words()
+
+
+def by_length():
+    """{length: sorted list of words}"""
+    global _by_length
+    if _by_length is None:
+        groups = defaultdict(list)
+        for word in words():
+            groups[len(word)].append(word)
+        _by_length = {length: sorted(group) for length, group in groups.items()}
+    return _by_length
+
+
+def words_between(min_length, max_length):
+    """Sorted words with min_length <= len(word) <= max_length"""
+    groups = by_length()
+    return sorted(word for length in range(min_length, max_length + 1) for word in groups.get(length, ()))
+
+
+def letters_key(word):
+    """Canonical multiset key: the word's letters, sorted"""
+    return ''.join(sorted(word.upper()))
+
+
+def by_letters():
+    """{letters_key: sorted list of words spelled from exactly those letters}"""
+    global _by_letters
+    if _by_letters is None:
+        groups = defaultdict(list)
+        for word in words():
+            groups[letters_key(word)].append(word)
+        _by_letters = {key: sorted(group) for key, group in groups.items()}
+    return _by_letters
+
+
+def anagrams(word):
+    """Dictionary words using exactly the letters of word"""
+    return by_letters().get(letters_key(word), [])
+
+
+def reset():
+    """Drop cached views (tests and long-running tools that swap data dirs)"""
+    global _words, _by_length, _by_letters
+    _words = _by_length = _by_letters = None
@@ -0,0 +1,95 @@
+"""
+How hard each daily starting word makes the game
+
+A date key's word list in daily_words.txt is indexed by year % 10
+(letters.get_starting_word), so each (date key, index) slot is one word
+played in every tenth year. A slot is profiled by playing that word with
+the real deck of each of those years, starting at FIRST_YEAR, using a
+par.py bot: greedy by default, or the beam search. Per slot it records
+the score distribution, the share of games with at least one bingo and
+the share of turns where the bot had no legal play (a dead rack).
+
+profile_difficulty.py runs the slots on a process pool and writes
+data/difficulty.json. rank() adds each slot's difficulty there: the
+share of slots whose mean score is higher, from 0 (easiest) to 1
+(hardest).
+"""
+
+import bisect
+import json
+import statistics
+
+from . import moves, par
+from .paths import data_path
+
+DIFFICULTY_FILE = 'difficulty.json'
+FIRST_YEAR = 2020
+GAMES = 10
+BOTS = ('greedy', 'beam')
+
+
+def slot_seeds(date_key, index, games=GAMES):
+    """YYYYMMDD seeds whose starting word is slot (date_key, index)"""
+    month, day = date_key.split('-')
+    first = FIRST_YEAR + (index - FIRST_YEAR) % 10
+    return [f'{first + 10 * game}{month}{day}' for game in range(games)]
+
+
+def play(starting_word, deck, bot='greedy', lexicon=None):
+    """One game's summary (see par._Line.summary) with the given bot"""
+    if bot == 'beam':
+        return par.beam_search(starting_word, deck, lexicon=lexicon)
+    return par.greedy(starting_word, deck, lexicon)
+
+
+def summarize(games):
+    """Statistics for a list of game summaries"""
+    scores = sorted(game['score'] for game in games)
+    turns = [tiles for game in games for tiles in game['tiles']]
+    deciles = statistics.quantiles(scores, n=10, method='inclusive') if len(scores) > 1 else scores * 9
+    return {
+        'games': len(games),
+        'mean': round(statistics.fmean(scores), 1),
+        'median': statistics.median(scores),
+        'stdev': round(statistics.pstdev(scores), 1),
+        'p10': deciles[0],
+        'p90': deciles[-1],
+        'min': scores[0],
+        'max': scores[-1],
+        'bingo_rate': round(sum(moves.BINGO_TILES in game['tiles'] for game in games) / len(games), 3),
+        'dead_rack_rate': round(turns.count(0) / len(turns), 3) if turns else 0.0,
+    }
+
+
+def rank(slots):
+    """Set each slot's difficulty from its mean score among all slots
+
+    slots maps date key to a list of per-index records (or None for slots
+    not profiled).
+    """
+    means = sorted(record['mean'] for records in slots.values() for record in records if record)
+    if not means:
+        return
+    for records in slots.values():
+        for record in records:
+            if record:
+                higher = len(means) - bisect.bisect_right(means, record['mean'])
+                record['difficulty'] = round(higher / max(1, len(means) - 1), 3)
+
+
+def load_table(path=None):
+    """Contents of data/difficulty.json, or an empty table"""
+    try:
+        with open(path or data_path(DIFFICULTY_FILE)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'slots': {}}
+
+
+def hardest(table, count=10):
+    """The count hardest slots as (difficulty, date key, index, record)"""
+    ranked = [(record.get('difficulty', 0), date_key, index, record)
+              for date_key, records in table.get('slots', {}).items()
+              for index, record in enumerate(records) if record]
+    ranked.sort(key=lambda item: (-item[0], item[1], item[2]))
+    return ranked[:count]
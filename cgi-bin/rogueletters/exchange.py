@@ -0,0 +1,180 @@
+"""
+Monte Carlo exchange advice
+
+An exchange puts tiles back and draws replacements from what is left of
+the day's deck. The server knows which tiles those are. It does not
+share their order: each simulated draw shuffles the remaining tiles, so
+the advice is what a player who had counted every tile could work out.
+A candidate exchange is scored by the best play (moves.find_moves) its
+new rack has on the current board, averaged over draws. Keeping the rack
+is scored exactly.
+
+Every distinct set of rack tiles is a candidate, which is up to 127 sets
+for 7 tiles. They are narrowed by successive halving: each round gives
+every surviving candidate more draws, then drops the worse half. Draws
+run on a process pool until the time budget is spent. Draw i is the same
+shuffle for every candidate (common random numbers), so candidates are
+compared on the same luck.
+"""
+
+import os
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import combinations
+
+from . import board, moves
+
+TIME_BUDGET = 2.0     # seconds
+WORKERS = min(4, os.cpu_count() or 1)
+MAX_SAMPLES = 64      # draws per candidate
+FIRST_ROUND = 2       # draws per candidate in the first round, doubled each round
+CHUNK = 2             # draws per task, so stopping at the deadline wastes little
+
+_state = None
+
+
+class _Simulation:
+    """Everything a worker needs to score exchanges on one position"""
+
+    def __init__(self, cells, rack, bag, blanks=(), seed=0, lexicon=None):
+        self.analysis = board.BoardAnalysis(cells)
+        self.rack = list(rack)
+        self.bag = sorted(bag)
+        self.blanks = tuple(blanks)
+        self.seed = seed
+        self.lexicon = lexicon
+
+    def best_score(self, rack):
+        found = moves.find_moves(self.analysis, rack, self.lexicon, self.blanks)
+        return found[0].score if found else 0
+
+    def draw(self, index, count):
+        """The first count tiles of shuffle number index"""
+        bag = list(self.bag)
+        random.Random(f'{self.seed}:{index}').shuffle(bag)
+        return bag[:count]
+
+    def run(self, exchange, start, count):
+        """Best next-turn scores for draws start..start+count after exchanging tiles"""
+        kept = list(self.rack)
+        for tile in exchange:
+            kept.remove(tile)
+        return [self.best_score(kept + self.draw(index, len(exchange))) for index in range(start, start + count)]
+
+
+def _init(cells, rack, bag, blanks, seed, lexicon):
+    global _state
+    _state = _Simulation(cells, rack, bag, blanks, seed, lexicon)
+
+
+def _run(exchange, start, count):
+    return _state.run(exchange, start, count)
+
+
+def candidates(rack):
+    """Every distinct non-empty set of rack tiles, smallest first"""
+    tiles = sorted(rack)
+    found = set()
+    for size in range(1, len(tiles) + 1):
+        found.update(combinations(tiles, size))
+    return sorted(found, key=lambda exchange: (len(exchange), exchange))
+
+
+def advise(cells, rack, bag, blanks=(), budget=TIME_BUDGET, workers=WORKERS,
+           max_samples=MAX_SAMPLES, seed=0, lexicon=None):
+    """Expected next-turn score of each exchange, best first
+
+    cells is the board, rack the player's tiles ('_' for blanks) and bag
+    the tiles that can still be drawn, in any order. Returns keep_score
+    (the best play with the rack as it is), the number of simulated draws,
+    and one entry per candidate that was simulated:
+    {exchange, keep, expected, samples}. Candidates dropped in an early
+    round have fewer samples. With workers <= 1 the draws run in this
+    process.
+    """
+    deadline = time.monotonic() + budget
+    simulation = _Simulation(cells, rack, bag, blanks, seed, lexicon)
+    keep_score = simulation.best_score(list(rack))
+    scores = {exchange: [] for exchange in (candidates(rack) if bag else [])}
+
+    pool = None
+    if workers > 1 and scores:
+        # Built after the simulation above, so forked workers inherit the loaded dictionary
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init,
+                                   initargs=(cells, rack, bag, blanks, seed, lexicon))
+    try:
+        alive = list(scores)
+        per_round = FIRST_ROUND
+        while alive and time.monotonic() < deadline:
+            # Draw-major order, so a round cut off by the deadline leaves every candidate about even
+            done = len(scores[alive[0]])
+            target = min(max_samples, done + per_round)
+            tasks = [(exchange, start, min(CHUNK, target - start))
+                     for start in range(done, target, CHUNK) for exchange in alive]
+            if not tasks:
+                break
+            _run_tasks(simulation, pool, tasks, scores, deadline)
+
+            alive = [exchange for exchange in alive if len(scores[exchange]) < max_samples]
+            if len(alive) <= 1:
+                break
+            alive.sort(key=lambda exchange: -_mean(scores[exchange]))
+            alive = alive[:(len(alive) + 1) // 2]
+            per_round *= 2
+    finally:
+        if pool is not None:
+            # Queued draws are dropped; the running ones are at most CHUNK draws
+            # each, and waiting for them means no worker outlives the call
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    results = []
+    for exchange, samples in scores.items():
+        if samples:
+            kept = list(rack)
+            for tile in exchange:
+                kept.remove(tile)
+            results.append({
+                'exchange': list(exchange),
+                'keep': kept,
+                'expected': _mean(samples),
+                'samples': len(samples),
+            })
+    results.sort(key=lambda result: (-result['expected'], -result['samples'], result['exchange']))
+    return {
+        'keep_score': keep_score,
+        'simulations': sum(len(samples) for samples in scores.values()),
+        'candidates': results,
+    }
+
+
+def _mean(samples):
+    return sum(samples) / len(samples) if samples else 0.0
+
+
+def _run_tasks(simulation, pool, tasks, scores, deadline):
+    """Run (exchange, start, count) tasks until they finish or the deadline passes"""
+    if pool is None:
+        for exchange, start, count in tasks:
+            if time.monotonic() >= deadline:
+                return
+            scores[exchange].extend(simulation.run(exchange, start, count))
+        return
+
+    # Keep results in draw order per candidate, so a cut-off round leaves a prefix
+    pending = {pool.submit(_run, *task): task for task in tasks}
+    finished = {}
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        for future in done:
+            exchange, start, _ = pending.pop(future)
+            finished[(exchange, start)] = future.result()
+    for future in pending:
+        future.cancel()
+    for exchange, start, _ in tasks:
+        result = finished.get((exchange, start))
+        if result is not None and start == len(scores[exchange]):
+            scores[exchange].extend(result)
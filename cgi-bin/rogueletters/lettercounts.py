@@ -0,0 +1,112 @@
+"""
+Dictionary as a letter-count matrix for vectorized feasibility queries
+
+Each word is a row of 27 uint8 counts (A-Z plus a blanks column), so
+"which words can be spelled from these tiles" is one comparison over the
+whole word list instead of a Counter per word:
+
+    matrix = dictionary_matrix(2, 7)
+    matrix.words_fitting(count_vector(rack, board_letters))
+    matrix.words_fitting(count_vector(TILE_DISTRIBUTION) - count_vector(removed_tiles))
+
+Available tiles may include blanks ('_'); each blank covers one missing
+letter. NumPy is imported here only, so endpoints that never build a
+matrix do not pay for it.
+"""
+
+from collections import Counter
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+from . import dictionary
+from .tiles import LETTER_DISTRIBUTION, is_word_possible
+
+COLUMNS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ_'
+BLANK_COLUMN = 26
+
+# Byte value -> column, for encoding a whole word list at once
+_CODES = bytes(COLUMNS.index(chr(b)) if chr(b) in COLUMNS else 255 for b in range(256))
+
+_matrices = {}
+
+
+def count_vector(*sources):
+    """Sum tile counts from strings, letter lists or {letter: count} dicts
+
+    Returns an int16 vector of length 27, so subtracting removed tiles
+    cannot wrap around.
+    """
+    vector = np.zeros(len(COLUMNS), dtype=np.int16)
+    for source in sources:
+        counts = source if isinstance(source, dict) else Counter(source)
+        for letter, count in counts.items():
+            column = COLUMNS.find(letter.upper())
+            if column < 0 or len(letter) != 1:
+                raise ValueError(f"Not a tile: {letter!r}")
+            vector[column] += count
+    return vector
+
+
+class LetterMatrix:
+    """Words and their letter counts, row for row"""
+
+    def __init__(self, words):
+        self.words = list(words)
+        lengths = np.fromiter((len(word) for word in self.words), dtype=np.int64, count=len(self.words))
+        codes = np.frombuffer(''.join(self.words).upper().encode('latin-1').translate(_CODES), dtype=np.uint8)
+        if codes.size and codes.max() == 255:
+            raise ValueError("Words may only contain A-Z and '_'")
+
+        rows = np.repeat(np.arange(len(self.words)), lengths)
+        flat = np.bincount(rows * len(COLUMNS) + codes, minlength=len(self.words) * len(COLUMNS))
+        self.counts = flat.reshape(len(self.words), len(COLUMNS)).astype(np.uint8)
+        self.lengths = lengths.astype(np.uint8)
+
+    def __len__(self):
+        return len(self.words)
+
+    def fits(self, available):
+        """Boolean mask of words that can be spelled from the available tiles"""
+        available = np.clip(np.asarray(available, dtype=np.int16), 0, 255)
+        letters = self.counts[:, :BLANK_COLUMN]
+        blanks = int(available[BLANK_COLUMN])
+        if blanks == 0:
+            return (letters <= available[:BLANK_COLUMN].astype(np.uint8)).all(axis=1)
+
+        shortfall = letters.astype(np.int16) - available[:BLANK_COLUMN]
+        return np.clip(shortfall, 0, None).sum(axis=1) <= blanks
+
+    def words_fitting(self, available, min_length=None, max_length=None):
+        """Words (in matrix order) that can be spelled from the available tiles"""
+        mask = self.fits(available)
+        if min_length is not None:
+            mask &= self.lengths >= min_length
+        if max_length is not None:
+            mask &= self.lengths <= max_length
+        return [self.words[i] for i in np.flatnonzero(mask)]
+
+
+def dictionary_matrix(min_length=1, max_length=None):
+    """Letter-count matrix of the dictionary words in a length range (cached)"""
+    if max_length is None:
+        max_length = max(dictionary.by_length())
+    key = (min_length, max_length)
+    if key not in _matrices:
+        _matrices[key] = LetterMatrix(dictionary.words_between(min_length, max_length))
+    return _matrices[key]
+
+
+def feasible_words(min_length, max_length, distribution=LETTER_DISTRIBUTION):
+    """Dictionary words in a length range that the tile distribution can spell
+
+    Falls back to a per-word Counter check when NumPy is not installed.
+    """
+    if not HAS_NUMPY:
+        return frozenset(word for word in dictionary.words_between(min_length, max_length)
+                         if is_word_possible(word, distribution))
+    matrix = dictionary_matrix(min_length, max_length)
+    return frozenset(matrix.words_fitting(count_vector(distribution)))
@@ -0,0 +1,288 @@
+"""
+Every legal play for a rack on a board, with its score
+
+The generator walks the DAWG outward from each anchor square (Appel and
+Jacobson): a left part is spelled from the rack on the free squares
+before the anchor, or read from the tiles already there, and the word is
+then extended to the right through empty squares whose cross-check mask
+(board.py) allows the letter. Only prefixes of real words are ever
+visited, and every play it finds is valid, so nothing needs checking
+against the dictionary afterwards.
+
+Scores follow validate_word.calculate_score: premium squares count only
+under new tiles, blanks score 0, and playing all 7 tiles adds 50. The
+generator scores a play as it records it, from per-line sums of the
+tiles already down and of each square's cross word, so it never re-reads
+the board; score_tiles() is the plain version.
+"""
+
+from .board import ACROSS, DOWN, MULTIPLIERS, SIZE
+from .dawg import LAST, ROOT, TERMINAL, dictionary_dawg
+from .tiles import TILE_SCORES
+
+BLANK = '_'
+BINGO_TILES = 7
+BINGO_BONUS = 50
+
+LETTER_SCORES = [TILE_SCORES[chr(65 + i)] for i in range(26)]
+
+
+class Move:
+    """One play: its tiles as (row, col, letter, is_blank) and its score"""
+
+    __slots__ = ('tiles', 'score', 'direction')
+
+    def __init__(self, tiles, score, direction):
+        self.tiles = tiles
+        self.score = score
+        self.direction = direction
+
+    def placed_tiles(self):
+        """The tiles in the placed_tiles format the endpoints take"""
+        placed = []
+        for row, col, letter, is_blank in self.tiles:
+            tile = {'row': row, 'col': col, 'letter': letter}
+            if is_blank:
+                tile['isBlank'] = True
+            placed.append(tile)
+        return placed
+
+    def rack_tiles(self):
+        """Rack tiles the play uses, with '_' for blanks"""
+        return [BLANK if is_blank else letter for _, _, letter, is_blank in self.tiles]
+
+    def word(self, cells):
+        """The main word, read from cells with the play on them"""
+        row, col = self.tiles[0][0], self.tiles[0][1]
+        d_row, d_col = (0, 1) if self.direction == ACROSS else (1, 0)
+        while row - d_row >= 0 and col - d_col >= 0 and cells[row - d_row][col - d_col]:
+            row, col = row - d_row, col - d_col
+        letters = []
+        while row < SIZE and col < SIZE and cells[row][col]:
+            letters.append(cells[row][col])
+            row, col = row + d_row, col + d_col
+        return ''.join(letters)
+
+    def __repr__(self):
+        return f"Move({self.score}, {self.direction}, {self.tiles})"
+
+
+def _line_score(cells, blanks, new, squares):
+    """Score of the word on squares (row, col), with new mapping square to (code, is_blank)"""
+    total = 0
+    word_multiplier = 1
+    for row, col in squares:
+        placed = new.get((row, col))
+        if placed is None:
+            if (row, col) not in blanks:
+                total += TILE_SCORES.get(cells[row][col], 0)
+            continue
+        code, is_blank = placed
+        letter_multiplier, multiplier = MULTIPLIERS[row][col]
+        if not is_blank:
+            total += LETTER_SCORES[code] * letter_multiplier
+        word_multiplier *= multiplier
+    return total * word_multiplier
+
+
+def score_tiles(cells, tiles, direction, blanks=()):
+    """Score of placing tiles (row, col, letter, is_blank) along direction"""
+    new = {(row, col): (ord(letter) - 65, is_blank) for row, col, letter, is_blank in tiles}
+    d_row, d_col = (0, 1) if direction == ACROSS else (1, 0)
+
+    def run(row, col, d_row, d_col):
+        while 0 <= row - d_row < SIZE and 0 <= col - d_col < SIZE and \
+                (cells[row - d_row][col - d_col] or (row - d_row, col - d_col) in new):
+            row, col = row - d_row, col - d_col
+        squares = []
+        while 0 <= row < SIZE and 0 <= col < SIZE and (cells[row][col] or (row, col) in new):
+            squares.append((row, col))
+            row, col = row + d_row, col + d_col
+        return squares
+
+    row, col = tiles[0][0], tiles[0][1]
+    main = run(row, col, d_row, d_col)
+    total = _line_score(cells, blanks, new, main) if len(main) > 1 else 0
+    for row, col, _, _ in tiles:
+        cross = run(row, col, d_col, d_row)
+        if len(cross) > 1:
+            total += _line_score(cells, blanks, new, cross)
+    if len(tiles) == BINGO_TILES:
+        total += BINGO_BONUS
+    return total
+
+
+def find_moves(analysis, rack, lexicon=None, blanks=()):
+    """Every legal play of rack tiles on the analysed board, best first
+
+    blanks holds the (row, col) of blanks already on the board, which
+    score 0 in the words they are part of.
+    """
+    lexicon = lexicon or dictionary_dawg()
+    edges = lexicon.edges
+    blanks = set(blanks)
+    counts = [0] * 26
+    blank_count = 0
+    for tile in rack:
+        if tile == BLANK:
+            blank_count += 1
+        else:
+            counts[ord(tile) - 65] += 1
+
+    moves = {}
+    cells = analysis.cells
+    values = [[0 if not letter or (row, col) in blanks else TILE_SCORES.get(letter, 0)
+               for col, letter in enumerate(line)] for row, line in enumerate(cells)]
+
+    for direction in (ACROSS, DOWN):
+        if direction == ACROSS:
+            grid, masks, multipliers = cells, analysis.across, MULTIPLIERS
+            anchors = sorted(analysis.anchors)
+            line_values = values
+            cross_values = [list(column) for column in zip(*values)]
+        else:
+            grid = [list(column) for column in zip(*cells)]
+            masks = [list(column) for column in zip(*analysis.down)]
+            multipliers = [list(column) for column in zip(*MULTIPLIERS)]
+            anchors = sorted((col, row) for row, col in analysis.anchors)
+            line_values = [list(column) for column in zip(*values)]
+            cross_values = values
+        cross = _cross_sums(grid, cross_values)
+
+        anchor_set = set(anchors)
+        for line, anchor in anchors:
+            row_cells, row_masks = grid[line], masks[line]
+            row_multipliers, row_cross = multipliers[line], cross[line]
+            prefix = [0]
+            for value in line_values[line]:
+                prefix.append(prefix[-1] + value)
+            left = []     # (code, is_blank) spelled from the rack before the anchor
+            right = []    # (pos, code, is_blank) from the anchor on
+            word_start = anchor
+
+            def record(end):
+                start = anchor - len(left) if left else word_start
+                placed = [(start + i, code, is_blank) for i, (code, is_blank) in enumerate(left)] + right
+                if direction == ACROSS:
+                    tiles = tuple((line, pos, chr(65 + code), is_blank) for pos, code, is_blank in placed)
+                else:
+                    tiles = tuple((pos, line, chr(65 + code), is_blank) for pos, code, is_blank in placed)
+                if tiles in moves:
+                    return
+                main = prefix[end] - prefix[start]
+                word_multiplier = 1
+                score = 0
+                for pos, code, is_blank in placed:
+                    letter_multiplier, multiplier = row_multipliers[pos]
+                    value = 0 if is_blank else LETTER_SCORES[code] * letter_multiplier
+                    main += value
+                    word_multiplier *= multiplier
+                    if row_cross[pos] is not None:
+                        score += (row_cross[pos] + value) * multiplier
+                score += main * word_multiplier
+                if len(placed) == BINGO_TILES:
+                    score += BINGO_BONUS
+                moves[tiles] = Move(list(tiles), score, direction)
+
+            def extend(pos, index, terminal):
+                nonlocal blank_count
+                if pos < SIZE and row_cells[pos]:
+                    code = ord(row_cells[pos]) - 65
+                    while index:
+                        edge = edges[index]
+                        if (edge >> 2) & 31 == code:
+                            extend(pos + 1, edge >> 8, edge & TERMINAL)
+                            return
+                        if edge & LAST:
+                            return
+                        index += 1
+                    return
+
+                if terminal and pos > anchor:
+                    record(pos)
+                if pos >= SIZE:
+                    return
+                mask = row_masks[pos]
+                while index:
+                    edge = edges[index]
+                    code = (edge >> 2) & 31
+                    if mask >> code & 1:
+                        if counts[code]:
+                            counts[code] -= 1
+                            right.append((pos, code, False))
+                            extend(pos + 1, edge >> 8, edge & TERMINAL)
+                            right.pop()
+                            counts[code] += 1
+                        if blank_count:
+                            blank_count -= 1
+                            right.append((pos, code, True))
+                            extend(pos + 1, edge >> 8, edge & TERMINAL)
+                            right.pop()
+                            blank_count += 1
+                    if edge & LAST:
+                        break
+                    index += 1
+
+            def left_part(index, limit):
+                nonlocal blank_count
+                extend(anchor, index, False)
+                if not limit:
+                    return
+                while index:
+                    edge = edges[index]
+                    code = (edge >> 2) & 31
+                    if counts[code]:
+                        counts[code] -= 1
+                        left.append((code, False))
+                        left_part(edge >> 8, limit - 1)
+                        left.pop()
+                        counts[code] += 1
+                    if blank_count:
+                        blank_count -= 1
+                        left.append((code, True))
+                        left_part(edge >> 8, limit - 1)
+                        left.pop()
+                        blank_count += 1
+                    if edge & LAST:
+                        break
+                    index += 1
+
+            if anchor and row_cells[anchor - 1]:
+                # The left part is the tiles already on the board
+                word_start = anchor - 1
+                while word_start and row_cells[word_start - 1]:
+                    word_start -= 1
+                extend(word_start, ROOT, False)
+            else:
+                # Free squares before the anchor, up to the previous anchor or tile
+                limit = 0
+                pos = anchor - 1
+                while pos >= 0 and not row_cells[pos] and (line, pos) not in anchor_set:
+                    limit += 1
+                    pos -= 1
+                left_part(ROOT, limit)
+
+    return sorted(moves.values(), key=lambda move: (-move.score, move.tiles))
+
+
+def _cross_sums(grid, cross_values):
+    """Per square of grid, the value of the tiles across its line (None if there are none)
+
+    grid is in the play's orientation and cross_values in the other one,
+    so cross_values[pos][line] is the tile at grid[line][pos].
+    """
+    sums = [[None] * SIZE for _ in range(SIZE)]
+    for line in range(SIZE):
+        for pos in range(SIZE):
+            if grid[line][pos]:
+                continue
+            column = cross_values[pos]
+            before = line
+            while before and grid[before - 1][pos]:
+                before -= 1
+            after = line + 1
+            while after < SIZE and grid[after][pos]:
+                after += 1
+            if before < line or after > line + 1:
+                sums[line][pos] = sum(column[before:line]) + sum(column[line + 1:after])
+    return sums
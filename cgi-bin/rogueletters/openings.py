@@ -0,0 +1,161 @@
+"""
+Turn-1 opening book: every legal first play for a seed, best first
+
+On turn 1 the board is the starting word alone and, without shop
+changes, the rack is the first rack_size tiles of the day's deck, so the
+answer to "what can I play" is the same for every player. The nightly
+build_opening_books.py enumerates it once per seed for each rack size
+and writes data/openings/<seed>.book:
+
+    header   <4sHH16s  magic, version, section count, starting word
+    per rack size:
+             <BBII     rack size, reserved, move count, byte length of moves
+             rack      rack_size bytes, as dealt
+             moves     best first, each <HBB score, first tile square
+                       (row * 9 + col), flags (bit 0 down, bits 4-7 tile
+                       count), then one byte per tile: letter 0-25, +128
+                       for a blank
+
+Tile positions are not stored: they are the empty squares of the starting
+board along the play's line from its first tile. lookup() decodes only
+the moves asked for.
+"""
+
+import os
+import struct
+import tempfile
+
+from . import board, moves
+from .paths import data_path
+
+BOOK_DIR = 'openings'
+MAGIC = b'RLOB'
+VERSION = 1
+HEADER = struct.Struct('<4sHH16s')
+SECTION = struct.Struct('<BBII')
+MOVE = struct.Struct('<HBB')
+
+RACK_SIZES = (7, 8, 9, 10)  # Big Pockets and Heavy Backpack add rack slots
+DOWN_FLAG = 1
+BLANK_FLAG = 128
+
+
+def book_path(seed):
+    return data_path(BOOK_DIR, f'{seed}.book')
+
+
+def _encode(move):
+    row, col = move.tiles[0][0], move.tiles[0][1]
+    flags = (len(move.tiles) << 4) | (DOWN_FLAG if move.direction == board.DOWN else 0)
+    letters = bytes((ord(letter) - 65) | (BLANK_FLAG if is_blank else 0)
+                    for _, _, letter, is_blank in move.tiles)
+    return MOVE.pack(move.score, row * board.SIZE + col, flags) + letters
+
+
+class OpeningBook:
+    """Sorted turn-1 moves for one seed, per rack size"""
+
+    def __init__(self, starting_word, sections):
+        self.starting_word = starting_word
+        self.sections = sections  # rack size -> (rack, move count, encoded moves)
+        self.cells = board.starting_board(starting_word)
+
+    @classmethod
+    def build(cls, starting_word, deck, rack_sizes=RACK_SIZES, lexicon=None):
+        """Enumerate every first play for each rack size's opening rack"""
+        analysis = board.BoardAnalysis(board.starting_board(starting_word))
+        sections = {}
+        for size in rack_sizes:
+            rack = list(deck[:size])
+            found = moves.find_moves(analysis, rack, lexicon)
+            sections[size] = (''.join(rack), len(found), b''.join(_encode(move) for move in found))
+        return cls(starting_word, sections)
+
+    @classmethod
+    def load(cls, path):
+        """Read a saved book; raises ValueError if it is not one"""
+        with open(path, 'rb') as f:
+            data = f.read()
+        try:
+            magic, version, count, word = HEADER.unpack_from(data)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a version {VERSION} opening book")
+            offset = HEADER.size
+            sections = {}
+            for _ in range(count):
+                size, _, move_count, length = SECTION.unpack_from(data, offset)
+                offset += SECTION.size
+                rack = data[offset:offset + size].decode('ascii')
+                offset += size
+                sections[size] = (rack, move_count, data[offset:offset + length])
+                offset += length
+        except struct.error:
+            raise ValueError(f"{path} is truncated")
+        if offset != len(data):
+            raise ValueError(f"{path} is truncated")
+        return cls(word.rstrip(b'\0').decode('ascii'), sections)
+
+    def save(self, path):
+        """Write the book, replacing path atomically"""
+        directory = os.path.dirname(path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp_')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(HEADER.pack(MAGIC, VERSION, len(self.sections), self.starting_word.encode('ascii')))
+                for size, (rack, count, encoded) in sorted(self.sections.items()):
+                    f.write(SECTION.pack(size, 0, count, len(encoded)))
+                    f.write(rack.encode('ascii'))
+                    f.write(encoded)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def matches(self, cells):
+        """True if cells is this book's starting board"""
+        return board.board_key(cells) == board.board_key(self.cells)
+
+    def moves(self, rack, limit=None):
+        """Best plays for rack, or None if the book has no section for it
+
+        The rack matches when it holds the same tiles as the dealt rack, in
+        any order.
+        """
+        section = self.sections.get(len(rack))
+        if section is None or sorted(section[0]) != sorted(rack):
+            return None
+        _, count, encoded = section
+        cells = self.cells
+        result = []
+        offset = 0
+        for _ in range(count if limit is None else min(limit, count)):
+            score, square, flags = MOVE.unpack_from(encoded, offset)
+            offset += MOVE.size
+            row, col = divmod(square, board.SIZE)
+            d_row, d_col = (1, 0) if flags & DOWN_FLAG else (0, 1)
+            tiles = []
+            for code in encoded[offset:offset + (flags >> 4)]:
+                while cells[row][col]:
+                    row, col = row + d_row, col + d_col
+                tiles.append((row, col, chr(65 + (code & 31)), bool(code & BLANK_FLAG)))
+                row, col = row + d_row, col + d_col
+            offset += flags >> 4
+            result.append(moves.Move(tiles, score, board.DOWN if flags & DOWN_FLAG else board.ACROSS))
+        return result
+
+
+def load(seed):
+    """The seed's opening book, or None if it has not been built"""
+    try:
+        return OpeningBook.load(book_path(seed))
+    except (OSError, ValueError):
+        return None
+
+
+def lookup(seed, rack, limit=None):
+    """Turn-1 plays for seed and rack from the book, or None when there is no answer there"""
+    book = load(seed)
+    return book.moves(rack, limit) if book is not None else None
@@ -0,0 +1,137 @@
+"""
+Par and best-known scores for a day's game
+
+A day's game is fully determined by its seed: the starting word fixes
+the board and get_all_tiles_for_day fixes the order tiles are drawn in.
+Two searches play the five turns with that deck:
+
+    greedy  the best-scoring play every turn; its total is the day's par
+    beam    the best `width` positions after each turn, each expanded by
+            its `branching` best plays; its best total estimates the
+            highest achievable score
+
+Both play the base game (7-tile rack, no exchanges or rogues), so a
+player can beat 'best' but should rarely beat it by much.
+
+compute_par_scores.py runs the searches for a range of dates and writes
+data/par_scores.json, which lookup() reads.
+"""
+
+import json
+
+from . import board, moves
+from .paths import data_path
+
+PAR_FILE = 'par_scores.json'
+TURNS = 5
+RACK_SIZE = 7
+BEAM_WIDTH = 8
+BRANCHING = 12
+
+_table = None
+
+
+class _Line:
+    """A sequence of plays from the starting board"""
+
+    __slots__ = ('analysis', 'rack', 'drawn', 'blanks', 'scores', 'words', 'tiles')
+
+    def __init__(self, analysis, rack, drawn, blanks=(), scores=(), words=(), tiles=()):
+        self.analysis = analysis
+        self.rack = rack
+        self.drawn = drawn
+        self.blanks = blanks
+        self.scores = scores
+        self.words = words
+        self.tiles = tiles
+
+    @property
+    def total(self):
+        return sum(self.scores)
+
+    def key(self):
+        return self.analysis.key, ''.join(sorted(self.rack))
+
+    def play(self, move, deck):
+        """The line after move, with the rack refilled from the deck"""
+        rack = list(self.rack)
+        for tile in move.rack_tiles():
+            rack.remove(tile)
+        refill = deck[self.drawn:self.drawn + RACK_SIZE - len(rack)]
+        analysis = self.analysis.copy()
+        analysis.place(move.placed_tiles())
+        blanks = self.blanks + tuple((row, col) for row, col, _, is_blank in move.tiles if is_blank)
+        return _Line(analysis, rack + refill, self.drawn + len(refill), blanks,
+                     self.scores + (move.score,), self.words + (move.word(analysis.cells),),
+                     self.tiles + (len(move.tiles),))
+
+    def passed(self):
+        return _Line(self.analysis, self.rack, self.drawn, self.blanks, self.scores + (0,), self.words + ('',),
+                     self.tiles + (0,))
+
+    def summary(self):
+        return {'score': self.total, 'turns': list(self.scores), 'words': list(self.words),
+                'tiles': list(self.tiles)}
+
+
+def _opening(starting_word, deck):
+    return _Line(board.BoardAnalysis(board.starting_board(starting_word)), list(deck[:RACK_SIZE]),
+                 min(RACK_SIZE, len(deck)))
+
+
+def greedy(starting_word, deck, lexicon=None):
+    """Play the highest-scoring move every turn"""
+    line = _opening(starting_word, deck)
+    for _ in range(TURNS):
+        found = moves.find_moves(line.analysis, line.rack, lexicon, line.blanks)
+        line = line.play(found[0], deck) if found else line.passed()
+    return line.summary()
+
+
+def beam_search(starting_word, deck, width=BEAM_WIDTH, branching=BRANCHING, lexicon=None):
+    """Keep the best `width` lines after each turn, trying `branching` plays from each"""
+    beam = [_opening(starting_word, deck)]
+    for _ in range(TURNS):
+        candidates = {}
+        for line in beam:
+            found = moves.find_moves(line.analysis, line.rack, lexicon, line.blanks)[:branching]
+            for successor in ([line.play(move, deck) for move in found] or [line.passed()]):
+                # Different orders of the same plays meet on the same position
+                key = successor.key()
+                if key not in candidates or successor.total > candidates[key].total:
+                    candidates[key] = successor
+        beam = sorted(candidates.values(), key=lambda line: (-line.total, line.key()))[:width]
+    return beam[0].summary()
+
+
+def day_scores(starting_word, deck, width=BEAM_WIDTH, branching=BRANCHING, lexicon=None):
+    """Par and best-known score for one day's starting word and deck"""
+    par = greedy(starting_word, deck, lexicon)
+    best = beam_search(starting_word, deck, width, branching, lexicon)
+    if par['score'] > best['score']:
+        best = par
+    return {
+        'starting_word': starting_word,
+        'par': par['score'],
+        'best': best['score'],
+        'par_turns': par['turns'],
+        'best_turns': best['turns'],
+        'best_words': best['words'],
+    }
+
+
+def load_table(path=None):
+    """Contents of data/par_scores.json, or an empty table"""
+    try:
+        with open(path or data_path(PAR_FILE)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'dates': {}}
+
+
+def lookup(date):
+    """Par record for a YYYYMMDD date, or None (table cached per process)"""
+    global _table
+    if _table is None:
+        _table = load_table()
+    return _table.get('dates', {}).get(date)
@@ -0,0 +1,30 @@
+"""
+Data directory resolution
+
+Production serves from /usr/local/apache2/data; a checkout uses the data/
+directory next to cgi-bin. The probe runs once per process. Tools and
+tests can point everything at another tree with ROGUELETTERS_DATA_DIR.
+"""
+
+import os
+
+APACHE_DATA_DIR = '/usr/local/apache2/data'
+LOCAL_DATA_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'data'))
+
+_resolved = None
+
+
+def data_dir():
+    """Directory holding enable.txt, daily words, scores and metrics"""
+    global _resolved
+    override = os.environ.get('ROGUELETTERS_DATA_DIR')
+    if override:
+        return override
+    if _resolved is None:
+        _resolved = APACHE_DATA_DIR if os.path.exists(APACHE_DATA_DIR) else LOCAL_DATA_DIR
+    return _resolved
+
+
+def data_path(*parts):
+    """Path of a file under the data directory"""
+    return os.path.join(data_dir(), *parts)
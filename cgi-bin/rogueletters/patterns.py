@@ -0,0 +1,163 @@
+"""
+Positional pattern queries over the dictionary
+
+Words of each length are numbered, and every (position, letter) pair
+gets a bitset (a Python int) of the words with that letter there. A
+pattern such as ?A??E is the intersection of the bitsets for its fixed
+letters; a rack narrows each wildcard position to the union of its
+letters' bitsets before the exact tile count check on what is left.
+
+Buckets are built per word length on first use (a few ms each), so a
+query only pays for the length it asks about.
+"""
+
+from collections import Counter
+
+from . import dictionary
+
+ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+WILDCARDS = '?.'
+BLANK = '_'
+
+
+class LengthBucket:
+    """Words of one length with per-position letter bitsets"""
+
+    def __init__(self, words):
+        self.words = list(words)
+        self.all = (1 << len(self.words)) - 1
+        length = len(self.words[0]) if self.words else 0
+        self.bits = []
+        for position in range(length):
+            # Bit i of the column bitset is set when word i has the letter here
+            column = ''.join(word[position] for word in reversed(self.words))
+            by_letter = {}
+            for letter in set(column):
+                marked = column.translate(_marker(letter))
+                by_letter[letter] = int(marked, 2)
+            self.bits.append(by_letter)
+
+    def at(self, position, letter):
+        return self.bits[position].get(letter, 0)
+
+    def any_of(self, position, letters):
+        mask = 0
+        for letter in letters:
+            mask |= self.at(position, letter)
+        return mask
+
+    def select(self, mask):
+        """Words whose bits are set in mask, in bucket order"""
+        if not mask:
+            return []
+        if mask == self.all:
+            return list(self.words)
+        flags = bin(mask)[:1:-1]
+        words = self.words
+        result = []
+        index = flags.find('1')
+        while index >= 0:
+            result.append(words[index])
+            index = flags.find('1', index + 1)
+        return result
+
+
+_markers = {}
+
+
+def _marker(letter):
+    """Translation table mapping letter to '1' and every other letter to '0'"""
+    if letter not in _markers:
+        _markers[letter] = {ord(c): ('1' if c == letter else '0') for c in ALPHABET}
+    return _markers[letter]
+
+
+class PatternIndex:
+    """Wildcard pattern lookups, optionally limited to what a rack can fill"""
+
+    def __init__(self, words_by_length):
+        self.words_by_length = words_by_length
+        self.buckets = {}
+
+    def bucket(self, length):
+        if length not in self.buckets:
+            self.buckets[length] = LengthBucket(self.words_by_length.get(length, ()))
+        return self.buckets[length]
+
+    def match(self, pattern, rack=None):
+        """Words matching pattern ('?' or '.' for any letter)
+
+        With a rack, the wildcard squares must be filled from its tiles,
+        with blanks ('_') standing in for any letter. Raises ValueError
+        for characters that are not letters, wildcards or blanks.
+        """
+        pattern = pattern.upper()
+        fixed = []
+        open_positions = []
+        for position, char in enumerate(pattern):
+            if char in WILDCARDS:
+                open_positions.append(position)
+            elif char in ALPHABET:
+                fixed.append((position, char))
+            else:
+                raise ValueError(f"Not a pattern character: {char!r}")
+
+        rack_counts = None
+        if rack is not None:
+            rack = rack.upper()
+            if any(tile != BLANK and tile not in ALPHABET for tile in rack):
+                raise ValueError(f"Not a rack: {rack!r}")
+            if len(open_positions) > len(rack):
+                return []
+            rack_counts = Counter(rack)
+
+        bucket = self.bucket(len(pattern))
+        mask = bucket.all
+        for position, letter in fixed:
+            mask &= bucket.at(position, letter)
+            if not mask:
+                return []
+
+        if rack_counts is None:
+            return bucket.select(mask)
+
+        blanks = rack_counts.pop(BLANK, 0)
+        # Bit-sliced counters: misses[k] marks words with more than k open
+        # squares whose letter is not on the rack; blanks cover that many
+        misses = [0] * (blanks + 1)
+        for position in open_positions:
+            outside = mask & ~bucket.any_of(position, rack_counts)
+            for k in range(blanks, 0, -1):
+                misses[k] |= misses[k - 1] & outside
+            misses[0] |= outside
+        mask &= ~misses[blanks]
+
+        result = []
+        for word in bucket.select(mask):
+            available = dict(rack_counts)
+            short = 0
+            for position in open_positions:
+                letter = word[position]
+                if available.get(letter):
+                    available[letter] -= 1
+                else:
+                    short += 1
+            if short <= blanks:
+                result.append(word)
+        return result
+
+
+_index = None
+
+
+def index():
+    """Pattern index over the dictionary (cached; buckets fill on demand)"""
+    global _index
+    if _index is None:
+        _index = PatternIndex(dictionary.by_length())
+    return _index
+
+
+def match(pattern, rack=None):
+    """Dictionary words matching pattern; see PatternIndex.match"""
+    return index().match(pattern, rack)
@@ -0,0 +1,86 @@
+"""
+Minimal RGB raster and PNG encoder, enough to draw share cards
+
+Canvas holds 8-bit RGB pixels in one bytearray and draws filled
+rectangles (each row is one slice assignment) and text in a 5x7 bitmap
+font scaled by whole pixels. encode() writes a truecolour PNG: an IHDR,
+one zlib IDAT with filter type 0 on every row, and an IEND.
+"""
+
+import struct
+import zlib
+
+SIGNATURE = b'\x89PNG\r\n\x1a\n'
+GLYPH_WIDTH = 5
+GLYPH_HEIGHT = 7
+
+# 5x7 glyphs, one byte per row (bit 4 is the leftmost pixel), as hex
+FONT = {
+    'A': '0E11111F111111', 'B': '1E11111E11111E', 'C': '0E11101010110E', 'D': '1C12111111121C',
+    'E': '1F10101E10101F', 'F': '1F10101E101010', 'G': '0E11101711110F', 'H': '1111111F111111',
+    'I': '0E04040404040E', 'J': '0702020202120C', 'K': '11121418141211', 'L': '1010101010101F',
+    'M': '111B1515111111', 'N': '11111915131111', 'O': '0E11111111110E', 'P': '1E11111E101010',
+    'Q': '0E11111115120D', 'R': '1E11111E141211', 'S': '0F10100E01011E', 'T': '1F040404040404',
+    'U': '1111111111110E', 'V': '11111111110A04', 'W': '1111111515150A', 'X': '11110A040A1111',
+    'Y': '1111110A040404', 'Z': '1F01020408101F',
+    '0': '0E11131519110E', '1': '040C040404040E', '2': '0E11010204081F', '3': '1F02040201110E',
+    '4': '02060A121F0202', '5': '1F101E0101110E', '6': '0608101E11110E', '7': '1F010204080808',
+    '8': '0E11110E11110E', '9': '0E11110F01020C', '-': '0000001F000000', ':': '000C0C000C0C00',
+    ' ': '00000000000000',
+}
+_GLYPHS = {char: [int(rows[i:i + 2], 16) for i in range(0, 14, 2)] for char, rows in FONT.items()}
+
+
+def rgb(hex_color):
+    """'#rrggbb' -> 3 bytes"""
+    return bytes.fromhex(hex_color.lstrip('#'))
+
+
+class Canvas:
+    """width x height RGB pixels"""
+
+    def __init__(self, width, height, background=b'\x00\x00\x00'):
+        self.width = width
+        self.height = height
+        self.pixels = bytearray(background * (width * height))
+
+    def fill(self, x, y, width, height, color):
+        """Fill a rectangle, clipped to the canvas"""
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + width, self.width), min(y + height, self.height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        run = color * (x1 - x0)
+        for row in range(y0, y1):
+            start = (row * self.width + x0) * 3
+            self.pixels[start:start + len(run)] = run
+
+    def text_width(self, text, scale):
+        return len(text) * (GLYPH_WIDTH + 1) * scale - scale if text else 0
+
+    def text(self, x, y, text, scale, color):
+        """Draw text with its top-left corner at (x, y); unknown characters are blank"""
+        for char in text.upper():
+            for row, bits in enumerate(_GLYPHS.get(char, _GLYPHS[' '])):
+                col = 0
+                while col < GLYPH_WIDTH:
+                    if bits & (0x10 >> col):
+                        end = col
+                        while end < GLYPH_WIDTH and bits & (0x10 >> end):
+                            end += 1
+                        self.fill(x + col * scale, y + row * scale, (end - col) * scale, scale, color)
+                        col = end
+                    else:
+                        col += 1
+            x += (GLYPH_WIDTH + 1) * scale
+
+    def encode(self, level=6):
+        """PNG bytes"""
+        stride = self.width * 3
+        raw = b''.join(b'\x00' + self.pixels[row * stride:(row + 1) * stride] for row in range(self.height))
+        header = struct.pack('>IIBBBBB', self.width, self.height, 8, 2, 0, 0, 0)
+        return SIGNATURE + _chunk(b'IHDR', header) + _chunk(b'IDAT', zlib.compress(raw, level)) + _chunk(b'IEND', b'')
+
+
+def _chunk(kind, data):
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
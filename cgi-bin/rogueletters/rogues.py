@@ -0,0 +1,269 @@
+"""
+Rogues and the rogue-aware turn score, from the shared data/rogues.json
+
+data/rogues.json defines every rogue once for the browser and the
+server: what the shop shows, its rarity (the shop prices a rogue by
+rarity), additive rules (rack size, turns, salary, bonus percent, bingo
+tiles) and its scoring effects. An effect is a stage ('tile', 'word' or
+'turn'), an order within the stage, and either points or a multiplier,
+optionally per counter and when counters have given values:
+
+    {"stage": "word", "order": 4, "points": 3, "per": "double_pairs"}
+    {"stage": "turn", "order": 3, "multiplier": 2, "when": {"last_turn": 1}}
+
+Word counters are set, rogues (owned), length, shop_tiles,
+letter_squares, double_pairs and letters:<LETTERS> (how many of the
+word's letters are among LETTERS). Turn counters are set, rogues,
+new_letters (All-Round Letter) and tiles_placed, and last_turn is 1 on
+the round's last turn. A "min" condition may name a rule. Tile effects
+add points to the tiles whose letter is in "letters".
+
+breakdown() follows calculateTurnScoreBreakdown in script.js: per word,
+tile values (tile buffs, tile set upgrades, the +2 on rare tiles, tile
+effects) go through letter and word squares and pink tiles (x1.5 each),
+then the word effects apply in order; then the turn effects apply in
+order. Every multiplier rounds down, as in the browser. The result has
+the browser's shape, so the client can animate the server's breakdown.
+
+The definitions are read on first use, so importing this module (as
+validate_word.py does for every play) works without data/rogues.json.
+ROGUES, RARITY_PRICES, BASE_RULES and SCORING are module attributes
+that load them.
+"""
+
+import json
+from collections import namedtuple
+
+from .board import MULTIPLIERS, SIZE
+from .paths import data_path
+from .tiles import TILE_SCORES
+
+DEFINITIONS_FILE = 'rogues.json'
+ALL_ROUND_CYCLE = 18      # unique letters before All-Round Letter starts over
+
+CELL_TYPES = {(2, 1): 'double-letter', (3, 1): 'triple-letter', (1, 2): 'double-word', (1, 3): 'triple-word'}
+
+# A tile with its shop effect: kind is None, 'buffed' (+bonus points),
+# 'coin' ($1 when played) or 'pink' (x1.5 word)
+Tile = namedtuple('Tile', 'letter blank bonus kind', defaults=(False, 0, None))
+
+# What scoring needs from a run (runs.Run has the same attributes)
+RunState = namedtuple('RunState', 'rogues set upgrades letters_played')
+
+# effects: (stage, order, source, effect) for every effect; source is a rogue id or a SCORING effect name
+Definitions = namedtuple('Definitions', 'rogues rarity_prices base scoring effects')
+_ATTRIBUTES = {'ROGUES': 'rogues', 'RARITY_PRICES': 'rarity_prices', 'BASE_RULES': 'base', 'SCORING': 'scoring'}
+
+_definitions = None
+
+
+def load_definitions(path=None):
+    with open(path or data_path(DEFINITIONS_FILE), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def definitions():
+    """The shared rogue definitions (cached); raises OSError or ValueError if unreadable"""
+    global _definitions
+    if _definitions is None:
+        data = load_definitions()
+        rogues, scoring = data['rogues'], data['scoring']
+        effects = sorted(
+            [(effect['stage'], effect.get('order', 0), source, effect)
+             for source, effects in scoring['effects'].items() for effect in effects] +
+            [(effect['stage'], effect.get('order', 0), rogue_id, effect)
+             for rogue_id, rogue in rogues.items() for effect in rogue.get('effects', ())],
+            key=lambda item: (item[0], item[1]))
+        _definitions = Definitions(rogues, data['rarity_prices'], data['base'], scoring, effects)
+    return _definitions
+
+
+def __getattr__(name):
+    if name in _ATTRIBUTES:
+        return getattr(definitions(), _ATTRIBUTES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def price(rogue_id):
+    loaded = definitions()
+    return loaded.rarity_prices[loaded.rogues[rogue_id]['rarity']]
+
+
+def rule(name, rogues):
+    """A base rule plus what the owned rogues add to it"""
+    loaded = definitions()
+    return loaded.base[name] + sum(loaded.rogues[rogue_id].get('rules', {}).get(name, 0) for rogue_id in rogues)
+
+
+def rack_size(rogues):
+    return rule('rack_size', rogues)
+
+
+def max_turns(rogues):
+    return rule('turns', rogues)
+
+
+def active_effects(rogues, stage):
+    """(component id, effect) for a stage, in order"""
+    loaded = definitions()
+    credits = {source: rogue_id for rogue_id in rogues for source in loaded.rogues[rogue_id].get('credits', ())}
+    return [(credits.get(source, source), effect) for effect_stage, _, source, effect in loaded.effects
+            if effect_stage == stage and (source in loaded.scoring['effects'] or source in rogues)]
+
+
+def tile_value(tile, rogues, upgrades, tile_effects=None):
+    """Face value of a tile before squares"""
+    if tile.blank:
+        return 0
+    scoring = definitions().scoring
+    value = TILE_SCORES.get(tile.letter, 0) + tile.bonus + upgrades.get(tile.letter, 0)
+    if tile.letter in scoring['rare_tiles']:
+        value += scoring['rare_tile_bonus']
+    if tile_effects is None:
+        tile_effects = active_effects(rogues, 'tile')
+    for _, effect in tile_effects:
+        if tile.letter in effect['letters']:
+            value += effect['points']
+    return value
+
+
+def formed_words(cells, placed):
+    """Squares of every word of two or more letters through the placed squares"""
+    def occupied(row, col):
+        return 0 <= row < SIZE and 0 <= col < SIZE and (cells[row][col] or (row, col) in placed)
+
+    words = []
+    for row, col in placed:
+        for d_row, d_col in ((0, 1), (1, 0)):
+            start_row, start_col = row, col
+            while occupied(start_row - d_row, start_col - d_col):
+                start_row, start_col = start_row - d_row, start_col - d_col
+            squares = []
+            r, c = start_row, start_col
+            while occupied(r, c):
+                squares.append((r, c))
+                r, c = r + d_row, c + d_col
+            if len(squares) > 1 and squares not in words:
+                words.append(squares)
+    return words
+
+
+def double_pairs(letters):
+    """Non-overlapping pairs of equal adjacent letters"""
+    pairs = 0
+    i = 0
+    while i < len(letters) - 1:
+        if letters[i] == letters[i + 1]:
+            pairs += 1
+            i += 1
+        i += 1
+    return pairs
+
+
+def _count(name, counters, letters):
+    if name.startswith('letters:'):
+        wanted = name[len('letters:'):]
+        return sum(letter in wanted for letter in letters)
+    return counters.get(name, 0)
+
+
+def _apply(component_id, effect, score, counters, letters, rogues, components):
+    """Score after one effect; appends its component if it added points"""
+    for name, wanted in effect.get('when', {}).items():
+        value = _count(name, counters, letters)
+        if isinstance(wanted, dict):
+            least = wanted['min']
+            if value < (rule(least, rogues) if isinstance(least, str) else least):
+                return score
+        elif value != wanted:
+            return score
+    per = _count(effect['per'], counters, letters) if 'per' in effect else 1
+    if 'multiplier' in effect:
+        multiplier = effect['multiplier'] ** per
+        new_score = int(score * multiplier)
+    else:
+        new_score = score + effect['points'] * per
+    if new_score > score:
+        loaded = definitions()
+        source = loaded.rogues.get(component_id) or loaded.scoring['names'].get(component_id, {})
+        component = {'id': component_id, 'name': source.get('name', component_id),
+                     'icon': source.get('icon', ''), 'points': new_score - score}
+        if 'multiplier' in effect:
+            component.update(isMultiplier=True, multiplierValue=f'{multiplier:.2f}')
+        components.append(component)
+    return new_score
+
+
+def breakdown(cells, board_tiles, placed, run, last_turn=False):
+    """Score breakdown of a play, shaped like calculateTurnScoreBreakdown's
+
+    cells is the board before the play, board_tiles maps squares already
+    on it to their Tile (plain tiles may be missing), and placed maps the
+    new squares to their Tile. run supplies rogues, set, upgrades (letter
+    -> bonus) and letters_played (All-Round Letter's cycle).
+    """
+    rogues = run.rogues
+    pink_multiplier = definitions().scoring['pink_multiplier']
+    tile_effects = active_effects(rogues, 'tile')
+    word_effects = active_effects(rogues, 'word')
+    result = {'words': [], 'turnComponents': [], 'total': 0}
+    total = 0
+    turn_letters = set()
+
+    for squares in formed_words(cells, placed):
+        word = {'word': '', 'tiles': [], 'wordMultiplier': 1, 'wordMultiplierCell': None,
+                'pinkMultiplier': 1, 'subtotal': 0, 'wordTotal': 0, 'wordComponents': []}
+        word_multiplier = 1
+        pink = 1.0
+        shop_tiles = 0
+        letter_squares = 0
+        letters = []
+        subtotal = 0
+        for row, col in squares:
+            tile = placed.get((row, col)) or board_tiles.get((row, col)) or Tile(cells[row][col])
+            is_new = (row, col) in placed
+            letters.append(tile.letter)
+            shop_tiles += tile.kind is not None
+            if tile.kind == 'pink':
+                pink *= pink_multiplier
+            letter_multiplier, multiplier = MULTIPLIERS[row][col] if is_new else (1, 1)
+            if multiplier > 1:
+                word['wordMultiplierCell'] = {'row': row, 'col': col}
+            word_multiplier *= multiplier
+            letter_squares += letter_multiplier > 1
+            value = tile_value(tile, rogues, run.upgrades, tile_effects)
+            subtotal += value * letter_multiplier
+            word['tiles'].append({
+                'row': row, 'col': col, 'letter': tile.letter, 'baseScore': value,
+                'letterMultiplier': letter_multiplier, 'finalScore': value * letter_multiplier,
+                'cellType': CELL_TYPES.get((letter_multiplier, multiplier), 'normal'),
+                'isNew': is_new, 'isPinkTile': tile.kind == 'pink',
+            })
+        turn_letters.update(letters)
+
+        counters = {'set': run.set, 'rogues': len(rogues), 'length': len(letters),
+                    'shop_tiles': shop_tiles, 'letter_squares': letter_squares,
+                    'double_pairs': double_pairs(letters)}
+        score = int(subtotal * word_multiplier * pink)
+        for component_id, effect in word_effects:
+            score = _apply(component_id, effect, score, counters, letters, rogues, word['wordComponents'])
+        word.update(word=''.join(letters), wordMultiplier=word_multiplier, pinkMultiplier=pink,
+                    subtotal=subtotal, wordTotal=score)
+        result['words'].append(word)
+        total += score
+
+    counters = {'set': run.set, 'rogues': len(rogues), 'tiles_placed': len(placed),
+                'new_letters': len(turn_letters - run.letters_played), 'last_turn': int(last_turn)}
+    for component_id, effect in active_effects(rogues, 'turn'):
+        total = _apply(component_id, effect, total, counters, (), rogues, result['turnComponents'])
+    result['total'] = total
+    return result
+
+
+def score_turn(cells, board_tiles, placed, run, last_turn=False):
+    """Score of a play and the points each component added, as (score, {id: points})"""
+    result = breakdown(cells, board_tiles, placed, run, last_turn)
+    components = {}
+    for component in [c for word in result['words'] for c in word['wordComponents']] + result['turnComponents']:
+        components[component['id']] = components.get(component['id'], 0) + component['points']
+    return result['total'], components
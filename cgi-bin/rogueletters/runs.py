@@ -0,0 +1,405 @@
+"""
+Headless rogue runs: the script.js run economy played by a bot
+
+A run is up to MAX_SETS sets of three rounds. Each round is a fresh game
+on its own seed with a score target. Clearing the target pays coins
+(calculate_earnings), and the shop then offers two tiles, three rogues and
+a tile set upgrade. Missing a target ends the run. Clearing set 5, round
+3 wins it. The constants below and the order of events follow runManager
+in script.js. Shop offers and minted tiles use the run's own
+random.Random, because the browser uses Math.random.
+
+Rounds draw from letters.get_all_tiles_for_day with the run's purchased
+and removed tiles and its rack size. The purchased tiles go in as plain
+letters, which is the form the exchange request sends. Exchanges go
+through letters.exchange_tiles. Plays come from moves.find_moves and are
+scored by rogues.score_turn.
+
+A bot decides the plays, exchanges and shop purchases (see Bot);
+simulate_run() plays one run with it.
+"""
+
+import random
+
+from . import board, moves, rogues
+from .rogues import ROGUES, Tile
+from .tiles import TILE_DISTRIBUTION
+
+SET_TARGETS = [
+    [40, 60, 80],
+    [100, 150, 200],
+    [250, 375, 500],
+    [650, 975, 1300],   # and every later set
+]
+MAX_SETS = 5
+ROUNDS_PER_SET = 3
+ROUND_PAYOUTS = (3, 4, 5)
+
+MAX_ROGUE_SLOTS = 5
+SHOP_TILES = 2
+SHOP_ROGUES = 3
+SHOP_TILE_KINDS = (('buffed', 0.4), ('coin', 0.4), ('pink', 0.2))
+ADD_COSTS = {'buffed': 1, 'coin': 2, 'pink': 3}
+REPLACE_COSTS = {'buffed': 3, 'coin': 4, 'pink': 5}   # what completeReplacement charges
+UPGRADE_PRICES = (3, 4, 5, 7, 10)
+ONE_POINT_LETTERS = 'EAIONRTLSU'
+HINT_COST = 3
+MISER_COINS = 2
+MISER_MAX_TILES = 3
+
+RUN_SEED_BASE = 1_760_000_000_000   # runSeed is Date.now() in the browser
+
+_SHOP_WEIGHTS = list(TILE_DISTRIBUTION.items())
+_MINT_WEIGHTS = [(letter, count) for letter, count in _SHOP_WEIGHTS if letter != '_']
+
+
+def target_score(set_number, round_number):
+    return SET_TARGETS[min(set_number, len(SET_TARGETS)) - 1][round_number - 1]
+
+
+def calculate_earnings(score, target, round_number, owned):
+    """Coins for clearing a round, as calculateEarnings in script.js"""
+    base = ROUND_PAYOUTS[round_number - 1] if round_number <= len(ROUND_PAYOUTS) else ROUND_PAYOUTS[0]
+    salary = rogues.rule('salary', owned)
+    threshold = target * rogues.rule('bonus_percent', owned) // 100
+    bonus = max(0, score - target) // threshold if threshold > 0 else 0
+    return base + salary + bonus
+
+
+def exchange_cost(set_number):
+    return min(set_number, 5)
+
+
+def upgrade_price(count):
+    return UPGRADE_PRICES[count] if count < len(UPGRADE_PRICES) else 10 + (count - 4) * 3
+
+
+def _weighted(rng, weights):
+    return rng.choices([item for item, _ in weights], [weight for _, weight in weights])[0]
+
+
+class Run:
+    """Everything that carries over between rounds"""
+
+    def __init__(self, seed, start_rogues=()):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.rogues = list(start_rogues)
+        self.coins = 0
+        self.set = 1
+        self.round = 1
+        self.purchased = []        # (letter, kind) bought or minted, in order
+        self.removed = []          # letters replaced out of the bag
+        self.effects_drawn = {}    # (kind, letter) -> purchased tiles of that kind already drawn
+        self.upgrades = {}         # letter -> tile set bonus
+        self.letters_played = set()
+        self.total_score = 0
+        self.round_scores = []
+        self.coins_earned = 0
+        self.bingos = 0
+        self.triggers = {}
+
+    @property
+    def target(self):
+        return target_score(self.set, self.round)
+
+    def mark(self, letters):
+        """Tiles for freshly drawn letters, with purchased effects (pink, buffed, coin first)"""
+        tiles = []
+        for letter in letters:
+            tile = Tile(letter, letter == '_')
+            for kind in ('pink', 'buffed', 'coin'):
+                bought = sum(1 for entry in self.purchased if entry == (letter, kind))
+                drawn = self.effects_drawn.get((kind, letter), 0)
+                if bought > drawn:
+                    self.effects_drawn[(kind, letter)] = drawn + 1
+                    bonus = 1 if kind == 'buffed' and letter != '_' else 0
+                    tile = Tile(letter, letter == '_', bonus, kind)
+                    break
+            tiles.append(tile)
+        return tiles
+
+    def purchased_letters(self):
+        return [letter for letter, _ in self.purchased]
+
+
+class Round:
+    """One game of a run: board, rack and deck position"""
+
+    def __init__(self, run, letters_module, lexicon=None):
+        self.run = run
+        self.letters = letters_module
+        self.lexicon = lexicon
+        offset = (run.set - 1) * ROUNDS_PER_SET + run.round
+        self.seed = str(run.seed + offset)
+        self.starting_word = letters_module.get_starting_word(self.seed)
+        self.rack_size = rogues.rack_size(run.rogues)
+        self.max_turns = rogues.max_turns(run.rogues)
+        self.deck = letters_module.get_all_tiles_for_day(
+            self.seed, self.starting_word, run.purchased_letters(), run.removed, self.rack_size)
+        self.analysis = board.BoardAnalysis(board.starting_board(self.starting_word))
+        self.board_tiles = {}
+        self.blanks = ()
+        self.turn = 1
+        self.exchanges = 0
+        self.score = run.coins if 'hoarder' in run.rogues else 0
+
+        # The Minter asks for one tile fewer and mints the last one
+        minter = 'minter' in run.rogues
+        self.rack = run.mark(self.deck[:self.rack_size - minter])
+        if minter:
+            letter = _weighted(run.rng, _MINT_WEIGHTS)
+            run.purchased.append((letter, 'buffed'))
+            self.rack += run.mark([letter])
+        self.drawn = self.rack_size
+
+    @property
+    def last_turn(self):
+        return self.turn == self.max_turns
+
+    def rack_letters(self):
+        return ['_' if tile.blank else tile.letter for tile in self.rack]
+
+    def moves(self):
+        """Every legal play for the rack, best base score first"""
+        return moves.find_moves(self.analysis, self.rack_letters(), self.lexicon, self.blanks)
+
+    def tiles_for(self, move):
+        """The rack tiles a play uses, keyed by square"""
+        rack = list(self.rack)
+        placed = {}
+        for row, col, letter, is_blank in move.tiles:
+            index = next(i for i, tile in enumerate(rack) if tile.blank == is_blank and
+                         (is_blank or tile.letter == letter))
+            tile = rack.pop(index)
+            placed[(row, col)] = Tile(letter, is_blank, tile.bonus, tile.kind)
+        return placed, rack
+
+    def evaluate(self, move):
+        """Rogue-aware score of a play and the components it triggers"""
+        placed, _ = self.tiles_for(move)
+        return rogues.score_turn(self.analysis.cells, self.board_tiles, placed, self.run, self.last_turn)
+
+    def play(self, move):
+        run = self.run
+        placed, rack = self.tiles_for(move)
+        points, components = rogues.score_turn(self.analysis.cells, self.board_tiles, placed, run, self.last_turn)
+        self.score += points
+        for component in components:
+            if component in ('bingo', 'bingoWizard'):
+                run.bingos += 1
+            if component in ROGUES:
+                run.triggers[component] = run.triggers.get(component, 0) + 1
+
+        run.coins += sum(1 for tile in placed.values() if tile.kind == 'coin')
+        if 'miser' in run.rogues and len(placed) <= MISER_MAX_TILES:
+            run.coins += MISER_COINS
+        if 'allRoundLetter' in run.rogues:
+            run.letters_played.update(tile.letter for tile in placed.values())
+            if len(run.letters_played) >= rogues.ALL_ROUND_CYCLE:
+                run.letters_played = set()
+
+        self.analysis = self.analysis.copy()
+        self.analysis.place(move.placed_tiles())
+        self.board_tiles.update(placed)
+        self.blanks += tuple(square for square, tile in placed.items() if tile.blank)
+        self.rack = rack
+        self._next_turn()
+        return points
+
+    def can_exchange(self):
+        return 'noDiscard' not in self.run.rogues and self.run.coins >= exchange_cost(self.run.set)
+
+    def exchange(self, tiles):
+        """Swap rack tiles (Tile entries) for draws; no turn is used"""
+        run = self.run
+        run.coins -= exchange_cost(run.set)
+        letters = ['_' if tile.blank else tile.letter for tile in tiles]
+        result = self.letters.exchange_tiles(
+            self.seed, self.starting_word, letters, self.rack_letters(), self.drawn, self.exchanges,
+            run.purchased_letters(), run.removed)
+        for tile in tiles:
+            self.rack.remove(tile)
+        self.rack += run.mark(result['new_tiles'])
+        self.drawn = result['tiles_drawn']
+        self.exchanges += 1
+
+    def pass_turn(self):
+        self._next_turn()
+
+    def _next_turn(self):
+        self.turn += 1
+        refill = self.deck[self.drawn:self.drawn + self.rack_size - len(self.rack)]
+        self.rack += self.run.mark(refill)
+        self.drawn += len(refill)
+
+    @property
+    def over(self):
+        return self.turn > self.max_turns
+
+
+class Shop:
+    """One shop visit's offers"""
+
+    def __init__(self, run):
+        rng = run.rng
+        self.tiles = [(_weighted(rng, _SHOP_WEIGHTS), _weighted(rng, SHOP_TILE_KINDS)) for _ in range(SHOP_TILES)]
+        self.tiles_bought = [False] * SHOP_TILES
+        available = [rogue for rogue in ROGUES if rogue not in run.rogues]
+        rng.shuffle(available)
+        self.rogues = available[:SHOP_ROGUES] if len(run.rogues) < MAX_ROGUE_SLOTS else []
+        self.rogues_bought = [False] * len(self.rogues)
+
+    def buy_rogue(self, run, index):
+        rogue = self.rogues[index]
+        if self.rogues_bought[index] or len(run.rogues) >= MAX_ROGUE_SLOTS or run.coins < rogues.price(rogue):
+            return False
+        run.coins -= rogues.price(rogue)
+        run.rogues.append(rogue)
+        self.rogues_bought[index] = True
+        return True
+
+    def buy_tile(self, run, index, replace=None):
+        """Add a shop tile to the bag, or swap it for the letter replace"""
+        letter, kind = self.tiles[index]
+        cost = (REPLACE_COSTS if replace else ADD_COSTS)[kind]
+        if self.tiles_bought[index] or run.coins < cost:
+            return False
+        run.coins -= cost
+        run.purchased.append((letter, kind))
+        if replace:
+            run.removed.append(replace)
+        self.tiles_bought[index] = True
+        return True
+
+    def buy_upgrade(self, run):
+        available = [letter for letter in ONE_POINT_LETTERS if letter not in run.upgrades]
+        cost = upgrade_price(len(run.upgrades))
+        if not available or run.coins < cost:
+            return False
+        run.coins -= cost
+        run.upgrades[run.rng.choice(available)] = 1
+        return True
+
+
+class Bot:
+    """Decides a run's plays and purchases; subclass and override
+
+    turn() is called once per turn before the play and returns the move
+    to play (from round.moves()) or None to pass; it may call
+    round.exchange() first. shop() spends coins through the Shop's buy_*
+    methods.
+    """
+
+    def turn(self, game_round):
+        raise NotImplementedError
+
+    def shop(self, run, shop):
+        pass
+
+
+class GreedyBot(Bot):
+    """Best rogue-aware score among the top plays; buys rogues, then upgrades, then tiles"""
+
+    def __init__(self, branching=20):
+        self.branching = branching
+
+    def turn(self, game_round):
+        found = game_round.moves()
+        if not found and game_round.can_exchange():
+            game_round.exchange(list(game_round.rack))
+            found = game_round.moves()
+        if not found:
+            return None
+        return max(found[:self.branching], key=lambda move: game_round.evaluate(move)[0])
+
+    def shop(self, run, shop):
+        for index in range(len(shop.rogues)):
+            shop.buy_rogue(run, index)
+        while shop.buy_upgrade(run):
+            pass
+        for index in range(len(shop.tiles)):
+            shop.buy_tile(run, index)
+
+
+def simulate_run(bot, seed, letters_module, start_rogues=(), lexicon=None):
+    """Play one run; returns its outcome and statistics
+
+    letters_module is cgi-bin/letters.py, which deals the tiles.
+    """
+    run = Run(seed, start_rogues)
+    won = False
+    while True:
+        game_round = Round(run, letters_module, lexicon)
+        while not game_round.over:
+            move = bot.turn(game_round)
+            if move is None:
+                game_round.pass_turn()
+            else:
+                game_round.play(move)
+
+        run.round_scores.append(game_round.score)
+        run.total_score += game_round.score
+        if game_round.score < run.target:
+            break
+        earnings = calculate_earnings(game_round.score, run.target, run.round, run.rogues)
+        run.coins += earnings
+        run.coins_earned += earnings
+        if run.set >= MAX_SETS and run.round >= ROUNDS_PER_SET:
+            won = True
+            break
+        bot.shop(run, Shop(run))
+        if run.round >= ROUNDS_PER_SET:
+            run.set += 1
+            run.round = 1
+        else:
+            run.round += 1
+
+    return {
+        'seed': seed,
+        'won': won,
+        'set': run.set,
+        'round': run.round,
+        'rounds_won': len(run.round_scores) - (not won),
+        'total_score': run.total_score,
+        'round_scores': run.round_scores,
+        'coins': run.coins,
+        'coins_earned': run.coins_earned,
+        'bingos': run.bingos,
+        'rogues': list(run.rogues),
+        'triggers': run.triggers,
+    }
+
+
+def summarize(results, min_runs=1):
+    """Win rates overall, per rogue and per pair of rogues
+
+    A rogue counts for a run if the run ended with it. Rogues and pairs
+    seen in fewer than min_runs runs are left out.
+    """
+    def stats(group):
+        return {
+            'runs': len(group),
+            'win_rate': round(sum(result['won'] for result in group) / len(group), 3),
+            'rounds_won': round(sum(result['rounds_won'] for result in group) / len(group), 2),
+        }
+
+    by_rogue = {}
+    by_pair = {}
+    failed_sets = {}
+    for result in results:
+        owned = sorted(result['rogues'])
+        for index, rogue_id in enumerate(owned):
+            by_rogue.setdefault(rogue_id, []).append(result)
+            for other in owned[index + 1:]:
+                by_pair.setdefault(f'{rogue_id}+{other}', []).append(result)
+        if not result['won']:
+            failed_sets[result['set']] = failed_sets.get(result['set'], 0) + 1
+
+    summary = stats(results) if results else {'runs': 0}
+    summary['failed_sets'] = dict(sorted(failed_sets.items()))
+    summary['rogues'] = {rogue_id: stats(group) for rogue_id, group in sorted(by_rogue.items())
+                         if len(group) >= min_runs}
+    summary['pairs'] = {pair: stats(group) for pair, group in sorted(by_pair.items())
+                        if len(group) >= min_runs}
+    return summary
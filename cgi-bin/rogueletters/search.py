@@ -0,0 +1,219 @@
+"""
+Inverted index over the game archive: words, dates and premium squares
+
+Each month of the archive (see archive.py) gets data/archive/YYYYMM.postings,
+which maps a key to the sorted indexes of the month's games that match it:
+
+    w:QUIXOTIC   the game formed QUIXOTIC (main word or cross word)
+    d:20251005   the game is 5 October 2025's
+    s:0,0        the game put a tile on the premium square at row 0, col 0
+
+Words come from replaying each game turn by turn through
+extract_words_formed, as validate_word.py scores them. A posting list is
+delta-encoded and then written as LEB128 varints, so consecutive games
+cost about one byte. The file also keeps each list's length and last
+index. Appending to a list then needs no decoding, and a list's length
+is the key's count for the month (the rollup "most played words" reads).
+
+update() indexes only the games added since the last run. It rewrites
+the month's file atomically under the month's lock.
+"""
+
+import os
+import struct
+
+from . import archive
+from .board import MULTIPLIERS, SIZE, starting_board
+
+MAGIC = b'RLSI'
+VERSION = 1
+FILE_HEADER = struct.Struct('<4sIII')   # magic, version, games indexed, keys
+KEY_HEADER = struct.Struct('<HIII')     # key bytes, count, last game, posting bytes
+PREMIUM_SQUARES = frozenset((row, col) for row in range(SIZE) for col in range(SIZE)
+                            if MULTIPLIERS[row][col] != (1, 1))
+
+
+def encode_postings(values, previous=-1, out=None):
+    """Append ascending values to out as delta varints; previous is the last value already in out"""
+    out = bytearray() if out is None else out
+    for value in values:
+        delta = value - previous
+        if delta <= 0:
+            raise ValueError("Postings must ascend")
+        previous = value
+        while delta >= 0x80:
+            out.append((delta & 0x7F) | 0x80)
+            delta >>= 7
+        out.append(delta)
+    return out
+
+
+def decode_postings(data):
+    """Values from delta varints"""
+    values = []
+    value = -1
+    delta = shift = 0
+    for byte in data:
+        delta |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            value += delta
+            values.append(value)
+            delta = shift = 0
+    return values
+
+
+def square_key(row, col):
+    return f's:{row},{col}'
+
+
+def game_keys(game):
+    """Keys for one archived game (archive.Game or shareurl.Game)"""
+    # Lazy import: validate_word lives next to the CGI scripts, like storage for archive.py
+    from validate_word import extract_words_formed
+
+    keys = {f'd:{game.date}'}
+    cells = starting_board(game.starting_word)
+    for turn in sorted({tile[3] for tile in game.tiles}):
+        placed = [{'row': row, 'col': col, 'letter': letter.upper()}
+                  for row, col, letter, tile_turn, _ in game.tiles if tile_turn == turn]
+        keys.update(f"w:{word['word']}" for word in extract_words_formed(cells, placed))
+        for tile in placed:
+            cells[tile['row']][tile['col']] = tile['letter']
+            if (tile['row'], tile['col']) in PREMIUM_SQUARES:
+                keys.add(square_key(tile['row'], tile['col']))
+    return keys
+
+
+def postings_path(month, directory=None):
+    return os.path.splitext(archive.month_paths(month, directory)[0])[0] + '.postings'
+
+
+class MonthIndex:
+    """A month's posting lists: {key: [count, last game, bytearray]}"""
+
+    def __init__(self, month, games=0, lists=None):
+        self.month = month
+        self.games = games
+        self.lists = lists if lists is not None else {}
+
+    @classmethod
+    def load(cls, month, directory=None):
+        try:
+            with open(postings_path(month, directory), 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return cls(month)
+        magic, version, games, key_count = FILE_HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{postings_path(month, directory)} is not a version {VERSION} search index")
+        lists = {}
+        offset = FILE_HEADER.size
+        for _ in range(key_count):
+            key_size, count, last, size = KEY_HEADER.unpack_from(data, offset)
+            offset += KEY_HEADER.size
+            key = data[offset:offset + key_size].decode('utf-8')
+            offset += key_size
+            lists[key] = [count, last, bytearray(data[offset:offset + size])]
+            offset += size
+        return cls(month, games, lists)
+
+    def to_bytes(self):
+        parts = [FILE_HEADER.pack(MAGIC, VERSION, self.games, len(self.lists))]
+        for key in sorted(self.lists):
+            count, last, data = self.lists[key]
+            encoded = key.encode('utf-8')
+            parts += [KEY_HEADER.pack(len(encoded), count, last, len(data)), encoded, bytes(data)]
+        return b''.join(parts)
+
+    def add(self, index, keys):
+        """Add game index (higher than any added before) under keys"""
+        for key in keys:
+            entry = self.lists.setdefault(key, [0, -1, bytearray()])
+            encode_postings((index,), entry[1], entry[2])
+            entry[0] += 1
+            entry[1] = index
+        self.games = max(self.games, index + 1)
+
+    def postings(self, key):
+        entry = self.lists.get(key)
+        return decode_postings(entry[2]) if entry else []
+
+    def count(self, key):
+        entry = self.lists.get(key)
+        return entry[0] if entry else 0
+
+
+def update(month, directory=None):
+    """Index the month's games added since the last update; returns how many"""
+    # Lazy import: storage lives next to the CGI scripts
+    import storage
+
+    path = postings_path(month, directory)
+    with storage.locked(path):
+        index = MonthIndex.load(month, directory)
+        with archive.MonthArchive(month, directory) as games:
+            first = index.games
+            for number in range(first, len(games)):
+                index.add(number, game_keys(games[number]))
+        if index.games > first:
+            storage.write_bytes_atomic(path, index.to_bytes())
+    return index.games - first
+
+
+def update_all(directory=None):
+    """update() every archived month; returns {month: games indexed}"""
+    return {month: update(month, directory) for month in archive.months(directory)}
+
+
+def _intersect(lists):
+    lists = sorted(lists, key=len)
+    matches = set(lists[0]) if lists else set()
+    for values in lists[1:]:
+        matches.intersection_update(values)
+    return sorted(matches)
+
+
+def search(words=(), dates=(), squares=(), months=None, directory=None):
+    """(month, index) of games matching every word and any of dates and squares
+
+    dates are YYYYMMDD and squares (row, col) pairs. An empty filter
+    matches everything; at least one filter must be given.
+    """
+    if not (words or dates or squares):
+        raise ValueError("Search needs a word, date or square")
+    for month in months or archive.months(directory):
+        if dates and not any(date[:6] == month for date in dates):
+            continue
+        index = MonthIndex.load(month, directory)
+        lists = [index.postings(f'w:{word.upper()}') for word in words]
+        for keys in ([f'd:{date}' for date in dates], [square_key(*square) for square in squares]):
+            if keys:
+                lists.append(sorted({game for key in keys for game in index.postings(key)}))
+        for number in _intersect(lists):
+            yield month, number
+
+
+def top_words(start=None, end=None, limit=20, directory=None):
+    """[(word, games)] most often formed in games dated [start, end], most first
+
+    Whole months are summed from the stored counts; a partial month is
+    counted from the date postings.
+    """
+    counts = {}
+    for month in archive.months(directory):
+        if (start and month < start[:6]) or (end and month > end[:6]):
+            continue
+        index = MonthIndex.load(month, directory)
+        partial = (start and start[:6] == month) or (end and end[:6] == month)
+        if partial:
+            in_range = {game for key in index.lists if key.startswith('d:')
+                        and (not start or key[2:] >= start) and (not end or key[2:] <= end)
+                        for game in index.postings(key)}
+        for key, entry in index.lists.items():
+            if key.startswith('w:'):
+                count = sum(game in in_range for game in index.postings(key)) if partial else entry[0]
+                if count:
+                    counts[key[2:]] = counts.get(key[2:], 0) + count
+    return sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:limit]
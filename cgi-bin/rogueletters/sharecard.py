@@ -0,0 +1,146 @@
+"""
+Share-card images of finished boards, cached on disk
+
+render() draws a 1200x630 PNG (the Open Graph card size) of a decoded
+share URL: the board with its premium squares, each tile edged in the
+colour of its turn (generateShareGrid's blue, green, yellow, orange,
+red), and the date, total and turn scores beside it. Colours are the
+ones styles.css uses.
+
+card() renders a board at most once. The PNG is kept under
+data/cards/ by a hash of the board's V4 payload, so every share URL
+format of a board shares one file. Each hit touches the file, and a
+write evicts the least recently used cards until the directory is under
+MAX_CACHE_BYTES. Cards are about 20 KB each.
+"""
+
+import hashlib
+import os
+
+from . import shareurl
+from .board import MULTIPLIERS, SIZE, starting_board
+from .paths import data_path
+from .png import GLYPH_HEIGHT, Canvas, rgb
+from .tiles import TILE_SCORES
+
+CARD_DIR = 'cards'
+RENDER_VERSION = 1     # bump to re-render every cached card
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+WIDTH, HEIGHT = 1200, 630
+
+BACKGROUND = rgb('#0f0f1a')
+BOARD_BG = rgb('#1a1a2e')
+BOARD_BORDER = rgb('#3d3d5c')
+SQUARE = rgb('#252538')
+TILE = rgb('#F3E5C3')
+TILE_BORDER = rgb('#D4C4A8')
+TILE_TEXT = rgb('#1a1a1a')
+BLANK_TEXT = rgb('#8b7355')
+TEXT = rgb('#e8e8e8')
+MUTED = rgb('#9ca3af')
+TITLE = rgb('#dc2626')
+SQUARE_COLORS = {(1, 2): rgb('#9333ea'), (1, 3): rgb('#dc2626'), (2, 1): rgb('#0891b2'), (3, 1): rgb('#2563eb')}
+TURN_COLORS = [rgb(color) for color in ('#3b82f6', '#22c55e', '#eab308', '#f97316', '#ef4444')]
+
+CELL = 62
+GAP = 4
+BOARD_X = BOARD_Y = 22
+PANEL_X = 660
+
+
+def _centered(canvas, x, y, width, height, text, scale, color):
+    canvas.text(x + (width - canvas.text_width(text, scale)) // 2,
+                y + (height - GLYPH_HEIGHT * scale) // 2, text, scale, color)
+
+
+def render(game, turn_scores):
+    """PNG bytes for a shareurl.Game and its five turn scores"""
+    canvas = Canvas(WIDTH, HEIGHT, BACKGROUND)
+    span = SIZE * CELL + (SIZE - 1) * GAP
+    canvas.fill(BOARD_X - 6, BOARD_Y - 6, span + 12, span + 12, BOARD_BORDER)
+    canvas.fill(BOARD_X - 4, BOARD_Y - 4, span + 8, span + 8, BOARD_BG)
+
+    letters = {(row, col): (letter, 0, False)
+               for row, cells in enumerate(starting_board(game.starting_word))
+               for col, letter in enumerate(cells) if letter}
+    for row, col, letter, turn, is_blank in game.tiles:
+        letters[(row, col)] = (letter.upper(), turn, is_blank)
+
+    for row in range(SIZE):
+        for col in range(SIZE):
+            x, y = BOARD_X + col * (CELL + GAP), BOARD_Y + row * (CELL + GAP)
+            tile = letters.get((row, col))
+            if tile is None:
+                canvas.fill(x, y, CELL, CELL, SQUARE_COLORS.get(MULTIPLIERS[row][col], SQUARE))
+                continue
+            letter, turn, is_blank = tile
+            canvas.fill(x, y, CELL, CELL, TURN_COLORS[turn - 1] if turn else TILE_BORDER)
+            canvas.fill(x + 3, y + 3, CELL - 6, CELL - 6, TILE)
+            _centered(canvas, x - 3, y - 3, CELL, CELL, letter, 5, BLANK_TEXT if is_blank else TILE_TEXT)
+            if not is_blank:
+                points = str(TILE_SCORES.get(letter, 0))
+                canvas.text(x + CELL - 6 - canvas.text_width(points, 2), y + CELL - 6 - GLYPH_HEIGHT * 2,
+                            points, 2, TILE_TEXT)
+
+    date = f"{game.date[:4]}-{game.date[4:6]}-{game.date[6:]}"
+    canvas.text(PANEL_X, 40, 'ROGUELETTERS', 6, TITLE)
+    canvas.text(PANEL_X, 110, date, 4, MUTED)
+    canvas.text(PANEL_X, 170, str(sum(turn_scores)), 18, TEXT)
+    canvas.text(PANEL_X, 310, 'POINTS', 4, MUTED)
+    box = 84
+    for turn, score in enumerate(turn_scores):
+        x = PANEL_X + turn * (box + 14)
+        canvas.fill(x, 380, box, box, TURN_COLORS[turn])
+        _centered(canvas, x, 380, box, box, str(score), 4, TILE_TEXT)
+    canvas.text(PANEL_X, 510, 'STARTING WORD', 3, MUTED)
+    canvas.text(PANEL_X, 545, game.starting_word, 5, TEXT)
+    return canvas.encode()
+
+
+def card_key(game):
+    payload = shareurl.encode_v4(*game)
+    return hashlib.sha256(bytes([RENDER_VERSION]) + payload).hexdigest()[:32]
+
+
+def card(game, turn_scores, directory=None):
+    """(PNG bytes, True if it came from the cache) for a board"""
+    directory = directory or data_path(CARD_DIR)
+    path = os.path.join(directory, card_key(game) + '.png')
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        os.utime(path)
+        return data, True
+    except FileNotFoundError:
+        pass
+
+    data = render(game, turn_scores)
+    # Lazy import: storage lives next to the CGI scripts, like archive.py
+    import storage
+    storage.write_bytes_atomic(path, data)
+    evict(directory)
+    return data, False
+
+
+def evict(directory, max_bytes=MAX_CACHE_BYTES):
+    """Delete the least recently used cards until the directory fits in max_bytes"""
+    import storage
+    with storage.locked(os.path.join(directory, 'evict')):
+        entries = []
+        with os.scandir(directory) as scan:
+            for entry in scan:
+                if entry.name.endswith('.png'):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
@@ -0,0 +1,145 @@
+"""
+Many share URLs at once, as columns of tiles
+
+decode_columns() turns a list of share URLs (or bare payloads, or the
+V4 bytes the game archive holds) into one row per tile:
+
+    game      index of the URL in the input
+    days      the game's date, days since 2020-01-01
+    position  row * 9 + col
+    letter    0-25 for A-Z
+    turn      1-5
+    blank     True for a blank
+
+Analytics are then array operations, e.g. a placement heatmap is
+np.bincount(columns.position, minlength=81).reshape(9, 9), and letters
+played on triple-letter squares are columns.letter[np.isin(columns.position, TL)].
+
+V4 payloads are decoded together: they are padded into one byte matrix,
+unpacked to bits, and every field is gathered by index arithmetic. V3
+payloads need their racks dealt again, which happens one game at a time
+(see shareurl.resolve_v3). A payload that does not decode adds no tiles
+and its index lands in errors. Without NumPy the columns are array.array
+and every payload takes the shareurl path.
+"""
+
+from array import array
+from collections import namedtuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+from . import shareurl
+
+COLUMNS = ('game', 'days', 'position', 'letter', 'turn', 'blank')
+TYPECODES = ('i', 'h', 'B', 'B', 'B', 'B')
+HEADER_BYTES = 13   # date, word length, 15 letters and tile count fit in 98 bits
+DTYPES = ('int32', 'int16', 'uint8', 'uint8', 'uint8', 'bool')
+
+Columns = namedtuple('Columns', COLUMNS + ('games', 'errors'))
+
+
+def _payload(item):
+    """(format, payload bytes) for a URL, bare parameter or bytes"""
+    if isinstance(item, (bytes, bytearray, memoryview)):
+        return 'v4', bytes(item)
+    return shareurl.split_url(item)
+
+
+def _game_rows(game, index):
+    """Column values for one decoded shareurl.Game"""
+    days = shareurl.date_to_days(game.date)
+    for row, col, letter, turn, is_blank in game.tiles:
+        yield index, days, row * shareurl.BOARD_SIZE + col, ord(letter.upper()) - 65, turn, is_blank
+
+
+def _decode_v4_many(payloads):
+    """Column arrays for V4 payloads decoded together; returns (columns, bad indexes)"""
+    count = len(payloads)
+    lengths = np.fromiter((len(payload) for payload in payloads), dtype=np.int64, count=count)
+    # Zero bytes past the end keep every header read in bounds
+    padded = np.zeros((count, max(int(lengths.max()), HEADER_BYTES) + 2), dtype=np.uint8)
+    flat = np.frombuffer(b''.join(payloads), dtype=np.uint8)
+    starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    padded[np.repeat(np.arange(count), lengths), np.arange(len(flat)) - starts] = flat
+    bits = np.unpackbits(padded, axis=1)
+    available = lengths * 8
+
+    def field(offsets, size):
+        weights = 1 << np.arange(size - 1, -1, -1, dtype=np.int64)
+        return bits[np.arange(count)[:, None], offsets[:, None] + np.arange(size)] @ weights
+
+    zero = np.zeros(count, dtype=np.int64)
+    days = field(zero, 14)
+    word_length = field(zero + 14, 4)
+    count_offset = 18 + 5 * word_length
+    tile_count = field(count_offset, 5)
+    tiles_start = count_offset + 5
+    bad = (tiles_start > available) | (tile_count > shareurl.MAX_TILES)
+    tile_count = np.where(bad, 0, tile_count)
+
+    # One row per tile: which game, and where its 16 bits start
+    game = np.repeat(np.arange(count), tile_count)
+    first = np.repeat(np.cumsum(tile_count) - tile_count, tile_count)
+    start = np.repeat(tiles_start, tile_count) + 16 * (np.arange(len(game)) - first)
+    end_ok = start + 16 <= np.repeat(available, tile_count)
+    fields = bits[game[:, None], np.minimum(start, bits.shape[1] - 16)[:, None] + np.arange(16)]
+    value = fields @ (1 << np.arange(15, -1, -1, dtype=np.int64))
+    position, code, turn = value >> 9, (value >> 3) & 0x3F, value & 0x7
+
+    tile_ok = end_ok & (position < 81) & (turn >= 1) & (turn <= shareurl.MAX_TURNS) & (code < 52)
+    bad[game[~tile_ok]] = True
+    keep = ~bad[game]
+    game, position, code, turn = game[keep], position[keep], code[keep], turn[keep]
+    blank = code >= 26
+    columns = (game, days[game], position, np.where(blank, code - 26, code), turn, blank)
+    return columns, np.flatnonzero(bad)
+
+
+def decode_columns(items):
+    """Columns for share URLs, bare parameters or V4 payload bytes"""
+    errors = []
+    v4 = []
+    others = []
+    for index, item in enumerate(items):
+        try:
+            format_name, payload = _payload(item)
+        except ValueError:
+            errors.append(index)
+            continue
+        (v4 if format_name == 'v4' and HAS_NUMPY else others).append((index, format_name, payload))
+    games = len(items)
+
+    rows = []
+    for index, format_name, payload in others:
+        try:
+            if format_name == 'v4':
+                game = shareurl.decode_v4(payload)
+            else:
+                game = shareurl.resolve_v3(shareurl.decode_v3(payload), sorted_racks=format_name == 'v3')
+        except ValueError:
+            errors.append(index)
+            continue
+        rows.extend(_game_rows(game, index))
+
+    if not HAS_NUMPY:
+        values = [array(typecode, column) for typecode, column in zip(TYPECODES, zip(*rows))] \
+            if rows else [array(typecode) for typecode in TYPECODES]
+        return Columns(*values, games=games, errors=sorted(errors))
+
+    parts = []
+    if v4:
+        indexes = np.array([index for index, _, _ in v4], dtype=np.int64)
+        columns, bad = _decode_v4_many([payload for _, _, payload in v4])
+        parts.append((indexes[columns[0]],) + columns[1:])
+        errors.extend(indexes[bad].tolist())
+    if rows:
+        parts.append(tuple(np.array(column) for column in zip(*rows)))
+
+    values = [np.concatenate([part[i] for part in parts]).astype(dtype) if parts else np.zeros(0, dtype=dtype)
+              for i, dtype in enumerate(DTYPES)]
+    order = np.argsort(values[0], kind='stable')
+    return Columns(*(column[order] for column in values), games=games, errors=sorted(errors))
@@ -0,0 +1,285 @@
+"""
+Share-URL game payloads, bit for bit as script.js writes them
+
+A V4 payload (the ?_= parameter, base64url without padding) is a
+big-endian bit stream:
+
+    date          14  days since 2020-01-01
+    word length    4
+    word           5  per letter, A=0
+    tile count     5
+    tiles         16  each: position 7 (row * 9 + col), letter 6, turn 3
+
+Letters 0-25 are A-Z and 26-51 are blanks standing for a-z. The last byte
+is zero-padded. decode_v4() applies the same checks as decodeV4URL.
+
+A V3 payload (?w=, or ?g= before racks were sorted) stores rack indexes
+instead of letters:
+
+    date          14
+    tile count     5
+    tiles         13  each: position 7, rack index 3, turn 3
+
+The letters come from replaying the day's deck the way get_rack.py
+deals it. ?w= indexes the rack sorted A-Z, and ?g= indexes it in the
+order it was dealt. V3 cannot hold blanks. decode_url() takes a share
+URL or its bare parameter in any of these formats; sharecolumns.py
+decodes many payloads into columns at once.
+"""
+
+import base64
+import datetime
+from collections import namedtuple
+from urllib.parse import parse_qs, urlsplit
+
+EPOCH = datetime.date(2020, 1, 1)
+MAX_DAYS = (1 << 14) - 1
+MAX_TILES = 35
+MAX_TURNS = 5
+BOARD_SIZE = 9
+RACK_SIZE = 7
+
+# URL parameter -> format, in the order script.js tries them
+PARAMETERS = (('_', 'v4'), ('w', 'v3'), ('g', 'v3-legacy'))
+
+# tiles are (row, col, letter, turn, is_blank); a blank's letter is lowercase
+Game = namedtuple('Game', 'date starting_word tiles')
+
+# tiles are (row, col, rack_index, turn)
+V3Game = namedtuple('V3Game', 'date tiles')
+
+
+def date_to_days(date):
+    """YYYYMMDD -> days since 2020-01-01"""
+    return (datetime.date(int(date[:4]), int(date[4:6]), int(date[6:8])) - EPOCH).days
+
+
+def days_to_date(days):
+    return (EPOCH + datetime.timedelta(days=days)).strftime('%Y%m%d')
+
+
+def b64url_encode(data):
+    return base64.urlsafe_b64encode(bytes(data)).rstrip(b'=').decode('ascii')
+
+
+def b64url_decode(text):
+    """Bytes of unpadded base64url; ValueError on any other character"""
+    text = text.strip()
+    return base64.b64decode(text + '=' * (-len(text) % 4), altchars=b'-_', validate=True)
+
+
+def encode_letter(letter, is_blank=False):
+    code = ord(letter.upper()) - 65
+    if not 0 <= code < 26:
+        raise ValueError(f"Invalid letter: {letter!r}")
+    return code + 26 if is_blank or letter.islower() else code
+
+
+def _pack(fields):
+    """Big-endian bit stream of (value, width) fields, zero-padded to whole bytes"""
+    value = 0
+    bits = 0
+    for field, width in fields:
+        value = (value << width) | (field & ((1 << width) - 1))
+        bits += width
+    padding = -bits % 8
+    return (value << padding).to_bytes((bits + padding) // 8, 'big')
+
+
+def _reader(data, name):
+    """read(width) over a big-endian bit stream, like BitStream.readBits"""
+    data = bytes(data)
+    total = len(data) * 8
+    value = int.from_bytes(data, 'big')
+    position = 0
+
+    def read(width):
+        nonlocal position
+        position += width
+        if position > total:
+            raise ValueError(f"{name} payload ends early")
+        return (value >> (total - position)) & ((1 << width) - 1)
+    return read
+
+
+def _check_tile(name, square, turn):
+    if square >= BOARD_SIZE * BOARD_SIZE:
+        raise ValueError(f"Invalid {name} data: tile position out of range ({square})")
+    if not 1 <= turn <= MAX_TURNS:
+        raise ValueError(f"Invalid {name} data: turn out of range ({turn})")
+
+
+def encode_v4(date, starting_word, tiles):
+    """V4 payload bytes for a game; tiles are (row, col, letter, turn[, is_blank])"""
+    days = date_to_days(date)
+    if not 0 <= days <= MAX_DAYS or len(starting_word) > 15 or len(tiles) > 31:
+        raise ValueError("Game does not fit V4")
+    fields = [(days, 14), (len(starting_word), 4)]
+    fields += [(ord(letter) - 65, 5) for letter in starting_word.upper()]
+    fields.append((len(tiles), 5))
+    for row, col, letter, turn, *blank in tiles:
+        fields += [(row * BOARD_SIZE + col, 7), (encode_letter(letter, bool(blank and blank[0])), 6), (turn, 3)]
+    return _pack(fields)
+
+
+def decode_v4(data):
+    """Game from V4 payload bytes (or a memoryview); ValueError if malformed
+
+    Bytes after the last tile are ignored, so a payload can be read from
+    a larger buffer.
+    """
+    read = _reader(data, 'V4')
+    date = days_to_date(read(14))
+    starting_word = ''.join(chr(65 + read(5)) for _ in range(read(4)))
+    count = read(5)
+    if count > MAX_TILES:
+        raise ValueError(f"Invalid V4 data: tile count too high ({count})")
+
+    tiles = []
+    for _ in range(count):
+        square, code, turn = read(7), read(6), read(3)
+        _check_tile('V4', square, turn)
+        if code >= 52:
+            raise ValueError(f"Invalid V4 data: letter out of range ({code})")
+        is_blank = code >= 26
+        letter = chr(97 + code - 26) if is_blank else chr(65 + code)
+        tiles.append((square // BOARD_SIZE, square % BOARD_SIZE, letter, turn, is_blank))
+    return Game(date, starting_word, tuple(tiles))
+
+
+def encode_v3(date, tiles):
+    """V3 payload bytes; tiles are (row, col, rack_index, turn)"""
+    days = date_to_days(date)
+    if not 0 <= days <= MAX_DAYS or len(tiles) > 31:
+        raise ValueError("Game does not fit V3")
+    fields = [(days, 14), (len(tiles), 5)]
+    for row, col, rack_index, turn in tiles:
+        fields += [(row * BOARD_SIZE + col, 7), (rack_index, 3), (turn, 3)]
+    return _pack(fields)
+
+
+def decode_v3(data):
+    """V3Game from V3 payload bytes, with decodeV3URL's checks"""
+    read = _reader(data, 'V3')
+    date = days_to_date(read(14))
+    count = read(5)
+    if count > MAX_TILES:
+        raise ValueError(f"Invalid V3 data: tile count too high ({count})")
+    tiles = []
+    for _ in range(count):
+        square, rack_index, turn = read(7), read(3), read(3)
+        _check_tile('V3', square, turn)
+        tiles.append((square // BOARD_SIZE, square % BOARD_SIZE, rack_index, turn))
+    return V3Game(date, tuple(tiles))
+
+
+def _replay(date, turns, pick):
+    """Deal the racks of a game as get_rack.py deals them
+
+    pick(turn, rack) gets the rack (sorted or not, as the caller likes)
+    of every turn in turns and returns the letters played from it.
+    Returns the starting word.
+    """
+    # Lazy import: letters lives next to the CGI scripts, like storage for archive.py
+    import letters
+    starting_word = letters.get_starting_word(date)
+    deck = letters.get_all_tiles_for_day(date, starting_word)
+    rack = []
+    drawn = 0
+    for turn in range(1, MAX_TURNS + 1):
+        while len(rack) < RACK_SIZE and drawn < len(deck):
+            rack.append(deck[drawn])
+            drawn += 1
+        if turn in turns:
+            for letter in pick(turn, list(rack)):
+                rack.remove(letter)
+    return starting_word
+
+
+def _by_turn(tiles, turn_field=3):
+    by_turn = {}
+    for tile in tiles:
+        by_turn.setdefault(tile[turn_field], []).append(tile)
+    return by_turn
+
+
+def resolve_v3(game, sorted_racks=True):
+    """Game with letters for a V3Game (sorted_racks False for ?g= payloads)
+
+    Raises ValueError when a rack index is missing or repeated in a turn,
+    as decodeV3URL does.
+    """
+    by_turn = _by_turn(game.tiles)
+    tiles = []
+
+    def pick(turn, rack):
+        if sorted_racks:
+            rack.sort()
+        indexes = [rack_index for _, _, rack_index, _ in by_turn[turn]]
+        if len(set(indexes)) != len(indexes) or max(indexes) >= len(rack):
+            raise ValueError(f"Invalid rack indexes {indexes} for turn {turn}")
+        tiles.extend((row, col, rack[rack_index], turn, False) for row, col, rack_index, _ in by_turn[turn])
+        return [rack[rack_index] for rack_index in indexes]
+
+    starting_word = _replay(game.date, by_turn, pick)
+    return Game(game.date, starting_word, tuple(tiles))
+
+
+def v3_game(game, sorted_racks=True):
+    """V3Game for a Game, finding each letter in its rack like encodeV3URL"""
+    if any(len(tile) > 4 and tile[4] for tile in game.tiles):
+        raise ValueError("V3 cannot encode blank tiles")
+    by_turn = _by_turn(game.tiles)
+    tiles = []
+
+    def pick(turn, rack):
+        if sorted_racks:
+            rack.sort()
+        used = set()
+        for row, col, letter, *_ in by_turn[turn]:
+            rack_index = next((i for i, tile in enumerate(rack) if tile == letter.upper() and i not in used), None)
+            if rack_index is None:
+                raise ValueError(f"Letter '{letter}' not found in rack for turn {turn}")
+            used.add(rack_index)
+            tiles.append((row, col, rack_index, turn))
+        return [letter.upper() for _, _, letter, *_ in by_turn[turn]]
+
+    _replay(game.date, by_turn, pick)
+    return V3Game(game.date, tuple(tiles))
+
+
+def split_url(url):
+    """(format, payload bytes) of a share URL or bare parameter value
+
+    A bare value is taken as V4. Raises ValueError if there is no share
+    parameter or it is not base64url.
+    """
+    url = url.strip()
+    if '=' not in url and '?' not in url:
+        return 'v4', b64url_decode(url)
+    params = parse_qs(urlsplit(url).query)
+    for parameter, format_name in PARAMETERS:
+        if params.get(parameter):
+            try:
+                return format_name, b64url_decode(params[parameter][0])
+            except ValueError as e:
+                raise ValueError(f"Invalid {format_name} payload: {e}") from e
+    raise ValueError("No share parameter in URL")
+
+
+def decode_url(url):
+    """Game from a share URL in any format; V3 letters are dealt again from the deck"""
+    format_name, payload = split_url(url)
+    if format_name == 'v4':
+        return decode_v4(payload)
+    return resolve_v3(decode_v3(payload), sorted_racks=format_name == 'v3')
+
+
+def encode_url(game, format_name='v4', base_url='https://letters.wiki/'):
+    """Share URL for a Game: v4 (?_=), v3 (?w=) or v3-legacy (?g=)"""
+    if format_name == 'v4':
+        payload = encode_v4(*game)
+    else:
+        payload = encode_v3(*v3_game(game, sorted_racks=format_name == 'v3'))
+    parameter = next(parameter for parameter, name in PARAMETERS if name == format_name)
+    return f"{base_url}?{parameter}={b64url_encode(payload)}"
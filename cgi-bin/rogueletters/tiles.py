@@ -0,0 +1,32 @@
+"""
+Tile set shared by the deck, scoring and word generators
+"""
+
+from collections import Counter
+
+# Standard tile distribution (including 2 blank tiles)
+TILE_DISTRIBUTION = {
+    'A': 9, 'B': 2, 'C': 2, 'D': 4, 'E': 12, 'F': 2, 'G': 3, 'H': 2,
+    'I': 9, 'J': 1, 'K': 1, 'L': 4, 'M': 2, 'N': 6, 'O': 8, 'P': 2,
+    'Q': 1, 'R': 6, 'S': 4, 'T': 6, 'U': 4, 'V': 2, 'W': 2, 'X': 1,
+    'Y': 2, 'Z': 1, '_': 2  # Blank tiles
+}
+
+# Lettered tiles only (what a starting word can be spelled from)
+LETTER_DISTRIBUTION = {letter: count for letter, count in TILE_DISTRIBUTION.items() if letter != '_'}
+
+# Letter scores
+TILE_SCORES = {
+    'A': 1, 'B': 3, 'C': 3, 'D': 2, 'E': 1, 'F': 4, 'G': 2, 'H': 4,
+    'I': 1, 'J': 8, 'K': 5, 'L': 1, 'M': 3, 'N': 1, 'O': 1, 'P': 3,
+    'Q': 10, 'R': 1, 'S': 1, 'T': 1, 'U': 1, 'V': 4, 'W': 4, 'X': 8,
+    'Y': 4, 'Z': 10, '_': 0  # Blank tiles score 0 points
+}
+
+
+def is_word_possible(word, distribution=LETTER_DISTRIBUTION):
+    """Check if a word can be spelled from the tile set without blanks"""
+    for letter, count in Counter(word.upper()).items():
+        if count > distribution.get(letter, 0):
+            return False
+    return True
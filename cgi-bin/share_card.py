@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Share card for a board URL
+Takes the same ?_= (V4), ?w= or ?g= (V3) parameter as a share link and
+returns a PNG of the finished board (see rogueletters/sharecard.py),
+rendered once and then served from the card cache. With format=html
+it returns a page of Open Graph tags pointing at that image, for link
+previews; httpd.conf sends known crawlers there from share links.
+"""
+
+import html
+import json
+import sys
+import request
+import telemetry
+from calculate_scores import reconstruct_board_and_calculate_scores
+from rogueletters import sharecard, shareurl
+
+SITE_URL = 'https://letters.wiki/'
+CARD_PATH = 'cgi-bin/share_card.py'
+MAX_PARAMETER_LENGTH = 128  # base64url characters; a full 35-tile V4 game is 95
+
+
+def respond_error(message, status='400 Bad Request'):
+    print(f"Status: {status}")
+    print("Content-Type: application/json")
+    print("Access-Control-Allow-Origin: *")
+    print()
+    print(json.dumps({"error": message}))
+
+
+def og_page(game, total, share_url, image_url):
+    date = f"{game.date[:4]}-{game.date[4:6]}-{game.date[6:]}"
+    title = html.escape(f"RogueLetters {date}: {total} points")
+    description = html.escape(f"{len(game.tiles)} tiles played from {game.starting_word}. Can you beat it?")
+    share_url, image_url = html.escape(share_url), html.escape(image_url)
+    return f"""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>{title}</title>
+    <meta property="og:type" content="website">
+    <meta property="og:site_name" content="RogueLetters">
+    <meta property="og:title" content="{title}">
+    <meta property="og:description" content="{description}">
+    <meta property="og:url" content="{share_url}">
+    <meta property="og:image" content="{image_url}">
+    <meta property="og:image:type" content="image/png">
+    <meta property="og:image:width" content="{sharecard.WIDTH}">
+    <meta property="og:image:height" content="{sharecard.HEIGHT}">
+    <meta name="twitter:card" content="summary_large_image">
+    <meta name="twitter:image" content="{image_url}">
+    <meta http-equiv="refresh" content="0; url={share_url}">
+</head>
+<body>
+    <a href="{share_url}">{title}</a>
+</body>
+</html>"""
+
+
+def main():
+    req = request.Request()
+    parameter = next((name for name, _ in shareurl.PARAMETERS if req.get(name)), None)
+    if parameter is None:
+        respond_error("Missing share parameter (_, w or g)")
+        return
+    value = req.get(parameter)
+    if len(value) > MAX_PARAMETER_LENGTH:
+        respond_error("Share parameter too long")
+        return
+
+    query = f"{parameter}={value}"
+    try:
+        game = shareurl.decode_url('?' + query)
+    except ValueError as e:
+        respond_error(f"Invalid board: {str(e)}")
+        return
+    except OSError:
+        respond_error("Daily words not available", '503 Service Unavailable')
+        return
+
+    tiles = [{'row': row, 'col': col, 'letter': letter.upper(), 'turn': turn, 'isBlank': is_blank}
+             for row, col, letter, turn, is_blank in game.tiles]
+    scores = reconstruct_board_and_calculate_scores(tiles, game.date)['scores']
+
+    if req.get('format') == 'html':
+        page = og_page(game, sum(scores), f"{SITE_URL}?{query}", f"{SITE_URL}{CARD_PATH}?{query}")
+        print("Content-Type: text/html; charset=utf-8")
+        print()
+        print(page)
+        return
+
+    try:
+        data, cached = sharecard.card(game, scores)
+    except OSError:
+        # Cache not writable: still serve the image
+        data, cached = sharecard.render(game, scores), False
+    telemetry.cache_event('share_card', cached)
+
+    # telemetry.instrument buffers the response as text, so the image
+    # goes straight to the real stdout and the buffer stays empty
+    out = sys.__stdout__.buffer
+    out.write(b"Content-Type: image/png\r\n")
+    out.write(f"Content-Length: {len(data)}\r\n".encode())
+    out.write(b"Cache-Control: public, max-age=604800, immutable\r\n\r\n")
+    out.write(data)
+    out.flush()
+
+if __name__ == "__main__":
+    telemetry.instrument('share_card', main)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Safe writes for JSON files shared between CGI processes
+Read-modify-write cycles hold an exclusive flock on a sidecar .lock file,
+and new contents replace the old file with a rename, so concurrent
+writers never lose updates and readers never see a partial file.
+"""
+
+import fcntl
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+
+
+@contextmanager
+def locked(path, blocking=True):
+    """Hold an exclusive lock for path; yields True if another writer held it first
+
+    With blocking=False a held lock raises BlockingIOError instead of waiting.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    fd = os.open(path + '.lock', os.O_RDWR | os.O_CREAT, 0o666)
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            waited = False
+        except BlockingIOError:
+            if not blocking:
+                raise
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            waited = True
+        yield waited
+    finally:
+        # Closing the descriptor releases the lock
+        os.close(fd)
+
+
+def read_json(path, default=None):
+    """Load a JSON file, or return default if it does not exist"""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+
+
+def write_json_atomic(path, data, indent=None, sort_keys=False, max_size=None):
+    """Write JSON to a temp file in the same directory, then rename over path
+
+    Raises ValueError (leaving path untouched) if the encoded data is
+    larger than max_size bytes.
+    """
+    _replace(path, 'w', lambda tmp: json.dump(data, tmp, indent=indent, sort_keys=sort_keys), max_size)
+
+
+def write_bytes_atomic(path, data, max_size=None):
+    """write_json_atomic for binary data"""
+    _replace(path, 'wb', lambda tmp: tmp.write(data), max_size)
+
+
+def _replace(path, mode, write, max_size):
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp_')
+    try:
+        with os.fdopen(fd, mode) as tmp:
+            write(tmp)
+
+        if max_size is not None and os.path.getsize(tmp_path) > max_size:
+            raise ValueError("Data exceeds maximum file size")
+
+        # mkstemp creates 0600; files are read by other users (Apache, cron jobs)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
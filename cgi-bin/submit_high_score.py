@@ -7,12 +7,13 @@ Stores only the highest score for each date
 
 import json
 import os
-import sys
 import time
 import hashlib
-import tempfile
-import shutil
 import re
+import request
+import storage
+import telemetry
+from rogueletters import data_path
 
 # Security limits
 MAX_REQUEST_SIZE = 102400  # 100KB
@@ -21,8 +22,11 @@ MAX_SCORE = 999
 MAX_FILE_SIZE = 1000000  # 1MB
 MAX_SUBMISSIONS_PER_DAY = 50  # Per IP address
 
-def check_rate_limit(ip_address):
-    """Simple rate limiting: 50 submissions/day per IP with auto-cleanup"""
+def check_rate_limit(ip_address, filename='rate_limits.json', max_per_day=MAX_SUBMISSIONS_PER_DAY):
+    """Simple rate limiting: max_per_day submissions/day per IP with auto-cleanup
+
+    Other endpoints pass their own filename so each has its own allowance.
+    """
 
     # Hash IP for basic privacy (optional - could use raw IP)
     ip_key = hashlib.md5(ip_address.encode()).hexdigest()[:12]
@@ -31,46 +35,37 @@ def check_rate_limit(ip_address):
     day_ago = now - 86400  # 24 hours
 
     # Determine rate limits file location
-    rate_limit_file = '/usr/local/apache2/data/rate_limits.json'
-
-    # Fallback for local development
-    if not os.path.exists('/usr/local/apache2/data'):
-        rate_limit_file = os.path.join(os.path.dirname(__file__), '../data/rate_limits.json')
-
-    # Load or create rate limit data
-    if os.path.exists(rate_limit_file):
-        try:
-            with open(rate_limit_file, 'r') as f:
-                limits = json.load(f)
-        except:
-            limits = {}
-    else:
-        limits = {}
-
-    # Get this IP's recent submissions (auto-cleanup old ones)
-    if ip_key in limits:
-        # Filter to only last 24 hours
-        recent = [ts for ts in limits[ip_key] if ts > day_ago]
-
-        # Check if exceeded limit
-        if len(recent) >= MAX_SUBMISSIONS_PER_DAY:
-            return False  # Rate limited
-
-        # Add current timestamp
-        limits[ip_key] = recent + [now]
-    else:
-        # First submission from this IP
-        limits[ip_key] = [now]
-
-    # Clean up old IPs (haven't submitted in 24h)
-    limits = {k: v for k, v in limits.items() if any(ts > day_ago for ts in v)}
-
-    # Save updated limits (fail open if write fails)
+    rate_limit_file = data_path(filename)
+
     try:
-        with open(rate_limit_file, 'w') as f:
-            json.dump(limits, f)
-    except:
-        pass  # Fail open - if write fails, still allow submission
+        # Hold the lock across load, check and save so counts stay exact
+        with storage.locked(rate_limit_file):
+            try:
+                limits = storage.read_json(rate_limit_file, {})
+            except ValueError:
+                limits = {}
+
+            # Get this IP's recent submissions (auto-cleanup old ones)
+            if ip_key in limits:
+                # Filter to only last 24 hours
+                recent = [ts for ts in limits[ip_key] if ts > day_ago]
+
+                # Check if exceeded limit
+                if len(recent) >= max_per_day:
+                    return False  # Rate limited
+
+                # Add current timestamp
+                limits[ip_key] = recent + [now]
+            else:
+                # First submission from this IP
+                limits[ip_key] = [now]
+
+            # Clean up old IPs (haven't submitted in 24h)
+            limits = {k: v for k, v in limits.items() if any(ts > day_ago for ts in v)}
+
+            storage.write_json_atomic(rate_limit_file, limits)
+    except OSError:
+        pass  # Fail open - if the lock or write fails, still allow submission
 
     return True  # Allowed
 
@@ -109,29 +104,7 @@ def validate_date(date_str):
 
 def atomic_write(filepath, data):
     """Write file atomically to prevent corruption"""
-
-    directory = os.path.dirname(filepath)
-
-    # Ensure directory exists
-    os.makedirs(directory, exist_ok=True)
-
-    # Write to temp file first
-    with tempfile.NamedTemporaryFile(
-        mode='w',
-        delete=False,
-        dir=directory,
-        prefix='.tmp_'
-    ) as tmp:
-        json.dump(data, tmp, indent=2)
-        tmp_path = tmp.name
-
-    # Check file size before committing
-    if os.path.getsize(tmp_path) > MAX_FILE_SIZE:
-        os.remove(tmp_path)
-        raise ValueError("Data exceeds maximum file size")
-
-    # Atomic rename (overwrites existing)
-    shutil.move(tmp_path, filepath)
+    storage.write_json_atomic(filepath, data, indent=2, max_size=MAX_FILE_SIZE)
 
 
 def main():
@@ -152,7 +125,8 @@ def main():
             return
 
         # Check request size
-        content_length = int(os.environ.get('CONTENT_LENGTH', 0))
+        req = request.Request(max_body=MAX_REQUEST_SIZE)
+        content_length = req.content_length
 
         if content_length > MAX_REQUEST_SIZE:
             print("Content-Type: application/json")
@@ -177,8 +151,7 @@ def main():
             return
 
         # Read and parse POST data
-        post_data = sys.stdin.read(content_length)
-        data = json.loads(post_data)
+        data = req.json()
 
         # Extract and validate inputs
         date = data.get('date', '')
@@ -262,21 +235,21 @@ def main():
                 return
 
         # Determine high scores directory
-        scores_dir = '/usr/local/apache2/data/high_scores'
-
-        # Fallback for local development
-        if not os.path.exists('/usr/local/apache2/data'):
-            scores_dir = os.path.join(os.path.dirname(__file__), '../data/high_scores')
+        scores_dir = data_path('high_scores')
 
         score_file = os.path.join(scores_dir, f'{date}.json')
 
-        # Check if this beats the current high score
-        is_new_high_score = False
-        previous_score = None
+        # Compare and write under the file lock so a higher score is never lost
+        with storage.locked(score_file) as waited:
+            if waited:
+                telemetry.inc('rogueletters_high_score_lock_waits_total')
+
+            # Check if this beats the current high score
+            is_new_high_score = False
+            previous_score = None
 
-        if os.path.exists(score_file):
-            with open(score_file, 'r') as f:
-                current_data = json.load(f)
+            current_data = storage.read_json(score_file)
+            if current_data is not None:
                 previous_score = current_data.get('score', 0)
 
                 # Only update if new score is higher
@@ -292,19 +265,19 @@ def main():
                     }))
                     return
 
-        # New high score! Save it
-        is_new_high_score = True
-        timestamp = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+            # New high score! Save it
+            is_new_high_score = True
+            timestamp = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
 
-        high_score_data = {
-            'date': date,
-            'score': score,
-            'board_url': board_url,
-            'timestamp': timestamp
-        }
+            high_score_data = {
+                'date': date,
+                'score': score,
+                'board_url': board_url,
+                'timestamp': timestamp
+            }
 
-        # Atomic write
-        atomic_write(score_file, high_score_data)
+            # Atomic write
+            atomic_write(score_file, high_score_data)
 
         # Return success
         print("Content-Type: application/json")
@@ -337,4 +310,4 @@ def main():
         }))
 
 if __name__ == "__main__":
-    main()
+    telemetry.instrument('submit_high_score', main)
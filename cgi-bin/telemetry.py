@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Request telemetry shared across CGI processes
+Counters and latency histograms live in a memory-mapped file so every
+mod_cgid child adds to the same totals. Read back by metrics.py.
+"""
+
+import fcntl
+import io
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from contextlib import redirect_stdout
+
+import profiling
+import recorder
+from rogueletters import data_path
+
+# File layout: 16-byte header, then fixed-size slots of (series name, float64)
+MAGIC = b'RLMETRIC'
+VERSION = 1
+HEADER_SIZE = 16
+NAME_SIZE = 120
+SLOT_SIZE = NAME_SIZE + 8
+MAX_SLOTS = 2048
+FILE_SIZE = HEADER_SIZE + SLOT_SIZE * MAX_SLOTS
+
+# Latency buckets in seconds (Prometheus "le" upper bounds)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Metric families exposed on /metrics: name -> (type, help)
+METRIC_TYPES = {
+    'rogueletters_requests_total': ('counter', 'Requests handled per endpoint'),
+    'rogueletters_errors_total': ('counter', 'Requests that returned an error or raised'),
+    'rogueletters_request_duration_seconds': ('histogram', 'Time spent in endpoint main()'),
+    'rogueletters_cache_hits_total': ('counter', 'Cache lookups served from memory'),
+    'rogueletters_cache_misses_total': ('counter', 'Cache lookups that had to load or compute'),
+    'rogueletters_high_score_lock_waits_total': ('counter', 'High score submissions that waited for another writer'),
+}
+
+# Per-process state: pending increments are flushed once per request
+_pending = {}
+_warm = set()
+_slots = {}
+_fd = None
+_map = None
+
+
+def get_metrics_path():
+    """Resolve the shared metrics file location"""
+    path = os.environ.get('ROGUELETTERS_METRICS_FILE')
+    if path:
+        return path
+
+    return data_path('metrics.bin')
+
+
+def series(name, **labels):
+    """Build a Prometheus series key such as name{endpoint="letters"}"""
+    if not labels:
+        return name
+    parts = ','.join(f'{key}="{value}"' for key, value in sorted(labels.items()))
+    return f'{name}{{{parts}}}'
+
+
+def inc(name, amount=1, **labels):
+    """Queue a counter increment (written on the next flush)"""
+    key = series(name, **labels)
+    _pending[key] = _pending.get(key, 0) + amount
+
+
+def observe(name, value, **labels):
+    """Queue a histogram observation
+
+    Every bucket is written, with 0 for bounds below value, so a series
+    has its full set of buckets from its first observation.
+    """
+    for bound in LATENCY_BUCKETS:
+        inc(f'{name}_bucket', 1 if value <= bound else 0, le=bound, **labels)
+    inc(f'{name}_bucket', le='+Inf', **labels)
+    inc(f'{name}_sum', value, **labels)
+    inc(f'{name}_count', 1, **labels)
+
+
+def cache_event(cache, hit):
+    """Record a hit or miss for a named cache"""
+    if hit:
+        inc('rogueletters_cache_hits_total', cache=cache)
+    else:
+        inc('rogueletters_cache_misses_total', cache=cache)
+
+
+def cache_use(cache):
+    """Record use of a per-process cache: the first use loaded it, later ones are hits"""
+    cache_event(cache, cache in _warm)
+    _warm.add(cache)
+
+
+def _open():
+    """Open (creating if needed) and map the shared metrics file"""
+    global _fd, _map
+    if _map is not None:
+        return _map
+
+    path = get_metrics_path()
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o664)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        if os.fstat(fd).st_size < FILE_SIZE:
+            os.ftruncate(fd, FILE_SIZE)
+        mapped = mmap.mmap(fd, FILE_SIZE)
+        if mapped[:8] != MAGIC:
+            mapped[:HEADER_SIZE] = MAGIC + struct.pack('<II', VERSION, MAX_SLOTS)
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    except Exception:
+        os.close(fd)
+        raise
+
+    _fd, _map = fd, mapped
+    return _map
+
+
+def _find_slot(mapped, key, allocate):
+    """Return the byte offset of a series slot (caller holds the lock)"""
+    if key in _slots:
+        return _slots[key]
+
+    encoded = key.encode()[:NAME_SIZE]
+    for index in range(MAX_SLOTS):
+        offset = HEADER_SIZE + index * SLOT_SIZE
+        name = mapped[offset:offset + NAME_SIZE].rstrip(b'\x00')
+        if name == encoded:
+            _slots[key] = offset
+            return offset
+        if not name:
+            if not allocate:
+                return None
+            mapped[offset:offset + NAME_SIZE] = encoded.ljust(NAME_SIZE, b'\x00')
+            struct.pack_into('<d', mapped, offset + NAME_SIZE, 0.0)
+            _slots[key] = offset
+            return offset
+
+    return None  # File full - drop the series rather than fail the request
+
+
+def flush():
+    """Add all pending increments to the shared file under one lock"""
+    if not _pending:
+        return
+
+    try:
+        mapped = _open()
+        fcntl.flock(_fd, fcntl.LOCK_EX)
+        try:
+            for key, amount in _pending.items():
+                offset = _find_slot(mapped, key, allocate=True)
+                if offset is None:
+                    continue
+                value = struct.unpack_from('<d', mapped, offset + NAME_SIZE)[0]
+                struct.pack_into('<d', mapped, offset + NAME_SIZE, value + amount)
+        finally:
+            fcntl.flock(_fd, fcntl.LOCK_UN)
+    except OSError as e:
+        # Metrics must never take an endpoint down
+        print(f"Telemetry flush failed: {e}", file=sys.stderr)
+    finally:
+        _pending.clear()
+
+
+def snapshot():
+    """Read every series from the shared file as {series: value}"""
+    mapped = _open()
+    values = {}
+    fcntl.flock(_fd, fcntl.LOCK_SH)
+    try:
+        for index in range(MAX_SLOTS):
+            offset = HEADER_SIZE + index * SLOT_SIZE
+            name = mapped[offset:offset + NAME_SIZE].rstrip(b'\x00')
+            if not name:
+                break
+            values[name.decode()] = struct.unpack_from('<d', mapped, offset + NAME_SIZE)[0]
+    finally:
+        fcntl.flock(_fd, fcntl.LOCK_UN)
+    return values
+
+
+def _family(key):
+    """Metric family for a series key (histogram parts map to their base name)"""
+    name = key.split('{', 1)[0]
+    for suffix in ('_bucket', '_sum', '_count'):
+        base = name[:-len(suffix)]
+        if name.endswith(suffix) and METRIC_TYPES.get(base, ('',))[0] == 'histogram':
+            return base
+    return name
+
+
+def _sort_key(key):
+    """Order series so histogram buckets come out in ascending "le" order"""
+    le = 0.0
+    if 'le="' in key:
+        bound = key.split('le="', 1)[1].split('"', 1)[0]
+        le = float('inf') if bound == '+Inf' else float(bound)
+        key = key.replace(f'le="{bound}"', '')
+    return (_family(key), key, le)
+
+
+def render_prometheus(values):
+    """Format a snapshot in the Prometheus text exposition format"""
+    lines = []
+    current = None
+    for key in sorted(values, key=_sort_key):
+        family = _family(key)
+        if family != current:
+            current = family
+            metric_type, help_text = METRIC_TYPES.get(family, ('untyped', ''))
+            if help_text:
+                lines.append(f'# HELP {family} {help_text}')
+            lines.append(f'# TYPE {family} {metric_type}')
+        value = values[key]
+        text = str(int(value)) if value == int(value) else repr(value)
+        lines.append(f'{key} {text}')
+    return '\n'.join(lines) + '\n'
+
+
+def _is_error_response(output):
+    """True if a captured CGI response carries an error payload"""
+    body = output.split('\n\n', 1)[-1].strip()
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return False
+    return isinstance(data, dict) and ('error' in data or data.get('success') is False)
+
+
+def instrument(endpoint, main):
+    """Run an endpoint's main(), recording count, errors and latency
+
+    The response is buffered so error payloads can be counted, then written
+    to the real stdout unchanged. Sampled requests also run under cProfile
+    and, when recording is enabled, are appended to the replay corpus.
+    """
+    record = recorder.capture_request(endpoint)
+    buffer = io.StringIO()
+    start = time.perf_counter()
+    failed = True
+    completed = False
+    try:
+        with redirect_stdout(buffer):
+            profiling.run(endpoint, main)
+        completed = True
+        failed = _is_error_response(buffer.getvalue())
+    finally:
+        elapsed = time.perf_counter() - start
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+        inc('rogueletters_requests_total', endpoint=endpoint)
+        if failed:
+            inc('rogueletters_errors_total', endpoint=endpoint)
+        observe('rogueletters_request_duration_seconds', elapsed, endpoint=endpoint)
+        flush()
+        if record is not None and completed:
+            recorder.save(record, buffer.getvalue(), elapsed)
@@ -3,40 +3,12 @@
 Validate word placement and calculate score
 """
 
-import cgi
 import json
-import sys
-import os
-
-
-# Tile scores (classic word game values)
-TILE_SCORES = {
-    'A': 1, 'E': 1, 'I': 1, 'O': 1, 'U': 1, 'L': 1, 'N': 1, 'S': 1, 'T': 1, 'R': 1,
-    'D': 2, 'G': 2,
-    'B': 3, 'C': 3, 'M': 3, 'P': 3,
-    'F': 4, 'H': 4, 'V': 4, 'W': 4, 'Y': 4,
-    'K': 5,
-    'J': 8, 'X': 8,
-    'Q': 10, 'Z': 10,
-    '_': 0  # Blank tiles score 0 points
-}
-
-# Board multiplier positions (9x9 board)
-DOUBLE_LETTER = [
-    (3,3), (3,5), (5,3), (5,5)
-]
-
-TRIPLE_LETTER = [
-    (0,4), (2,2), (2,6), (4,0), (4,8), (6,2), (6,6), (8,4)
-]
-
-DOUBLE_WORD = [
-    (1,1), (1,7), (7,1), (7,7)
-]
-
-TRIPLE_WORD = [
-    (0,0), (0,8), (8,0), (8,8)
-]
+import request
+import telemetry
+from rogueletters import TILE_SCORES, dawg, rogues
+from rogueletters.board import DOUBLE_LETTER, TRIPLE_LETTER, DOUBLE_WORD, TRIPLE_WORD
+
 
 def get_multiplier(row, col):
     """Get the multiplier type for a board position"""
@@ -54,17 +26,9 @@ def get_multiplier(row, col):
     return None
 
 # Load ENABLE dictionary
-VALID_WORDS = set()
-dict_path = "/usr/local/apache2/data/enable.txt"
-
-# Fallback for local development
-if not os.path.exists(dict_path):
-    dict_path = os.path.join(os.path.dirname(__file__), "../data/enable.txt")
-
 try:
-    with open(dict_path, 'r') as f:
-        VALID_WORDS = {word.strip().upper() for word in f}
-except:
+    VALID_WORDS = dawg.lookup()
+except OSError:
     # If dictionary not found, accept all words (for testing)
     VALID_WORDS = None
 
@@ -305,14 +269,46 @@ def calculate_score(board, placed_tiles, words_formed, existing_blank_positions=
 
     return total_score
 
+def _run_tile(entry, letter, blank):
+    """rogues.Tile for a tile object from the client (bonus, buffed, coinTile, pinkTile)"""
+    kind = 'pink' if entry.get('pinkTile') else 'coin' if entry.get('coinTile') else \
+        'buffed' if entry.get('buffed') else None
+    return rogues.Tile(letter, blank, int(entry.get('bonus') or 0), kind)
+
+
+def run_breakdown(board, placed_tiles, run_data, existing_blank_positions=None):
+    """Rogue-aware score breakdown of a valid play in a rogue run
+
+    run_data carries the run's rogues, set, tile_upgrades (letter -> bonus),
+    letters_played (All-Round Letter's cycle), last_turn, and board_tiles:
+    the shop effects of tiles already on the board. Placed tiles may carry
+    the same effect fields.
+    """
+    cells = [[(cell or '').strip().upper() for cell in row] for row in board]
+    run = rogues.RunState(
+        rogues=[rogue_id for rogue_id in run_data.get('rogues') or [] if rogue_id in rogues.ROGUES],
+        set=int(run_data.get('set') or 1),
+        upgrades={str(letter).upper(): int(bonus) for letter, bonus in (run_data.get('tile_upgrades') or {}).items()},
+        letters_played={str(letter).upper() for letter in run_data.get('letters_played') or []},
+    )
+
+    board_tiles = {}
+    for blank in existing_blank_positions or []:
+        row, col = blank['row'], blank['col']
+        board_tiles[(row, col)] = rogues.Tile(cells[row][col], True)
+    for entry in run_data.get('board_tiles') or []:
+        row, col = entry['row'], entry['col']
+        board_tiles[(row, col)] = _run_tile(entry, cells[row][col], (row, col) in board_tiles)
+    placed = {(t['row'], t['col']): _run_tile(t, t['letter'].upper(), bool(t.get('isBlank')))
+              for t in placed_tiles}
+    return rogues.breakdown(cells, board_tiles, placed, run, bool(run_data.get('last_turn')))
+
+
 def main():
     # Read POST data
     try:
-        content_length = int(os.environ.get('CONTENT_LENGTH', 0))
-        if content_length > 0:
-            post_data = sys.stdin.read(content_length)
-            data = json.loads(post_data)
-        else:
+        data = request.Request().json()
+        if data is None:
             # GET request for testing
             print("Content-Type: application/json")
             print("Access-Control-Allow-Origin: *")
@@ -338,8 +334,10 @@ def main():
     placed_tiles = data.get('placed_tiles', [])
     blank_positions = data.get('blank_positions', [])  # Blanks from previous turns
     debug_mode = data.get('debug_mode', False)
+    run_data = data.get('run')  # Rogue run state; adds the server's rogue-aware breakdown
 
     # Validate placement and words
+    telemetry.cache_use('dictionary')
     is_valid, message, words_formed = validate_placement(board, placed_tiles, debug_mode)
 
     response = {
@@ -350,6 +348,17 @@ def main():
 
     if is_valid:
         response["score"] = calculate_score(board, placed_tiles, words_formed, blank_positions)
+        if run_data:
+            try:
+                rogues.definitions()
+            except (OSError, ValueError, KeyError):
+                # The play is still valid; only the rogue-aware breakdown is missing
+                response["breakdown_error"] = "Rogue definitions not available"
+            else:
+                try:
+                    response["breakdown"] = run_breakdown(board, placed_tiles, run_data, blank_positions)
+                except (KeyError, TypeError, ValueError, IndexError, AttributeError) as e:
+                    response["breakdown_error"] = f"Invalid run state: {e}"
 
     # Send response
     print("Content-Type: application/json")
@@ -358,5 +367,4 @@ def main():
     print(json.dumps(response))
 
 if __name__ == "__main__":
-    import os
-    main()
\ No newline at end of file
+    telemetry.instrument('validate_word', main)
\ No newline at end of file
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Compute par and best-known scores for a range of daily games
+
+Each date's starting word and deck come from the seed, exactly as the
+game draws them; rogueletters/par.py plays them with a greedy search
+(par) and a beam search (best). Dates are spread over a process pool
+and merged into data/par_scores.json, which detect_abuse.py and
+get_par.py read.
+
+Usage:
+    python3 compute_par_scores.py                        # the next 30 days
+    python3 compute_par_scores.py 20251001 20251231      # a date range
+    python3 compute_par_scores.py --days 365 -j 8 --beam 16 --branching 16
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cgi-bin'))
+
+import letters
+import storage
+from rogueletters import data_path, dawg, hooks, par
+
+
+def _warm_up():
+    """Load the dictionary structures once per worker"""
+    dawg.dictionary_dawg()
+    hooks.hook_index()
+
+
+def score_date(args):
+    seed, width, branching = args
+    starting_word = letters.get_starting_word(seed)
+    deck = letters.get_all_tiles_for_day(seed, starting_word)
+    return seed, par.day_scores(starting_word, deck, width, branching)
+
+
+def date_range(start, end):
+    day = datetime.strptime(start, '%Y%m%d').date()
+    last = datetime.strptime(end, '%Y%m%d').date()
+    while day <= last:
+        yield day.strftime('%Y%m%d')
+        day += timedelta(days=1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compute par scores for daily games')
+    parser.add_argument('start', nargs='?', help='first date (YYYYMMDD, default today)')
+    parser.add_argument('end', nargs='?', help='last date (YYYYMMDD, default start + --days - 1)')
+    parser.add_argument('--days', type=int, default=30, help='number of days when no end date is given')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(), help='worker processes')
+    parser.add_argument('--beam', type=int, default=par.BEAM_WIDTH, help='positions kept per turn')
+    parser.add_argument('--branching', type=int, default=par.BRANCHING, help='plays tried per position')
+    parser.add_argument('-o', '--output', default=data_path(par.PAR_FILE), help='table to update')
+    args = parser.parse_args()
+
+    start = args.start or date.today().strftime('%Y%m%d')
+    end = args.end or (datetime.strptime(start, '%Y%m%d').date() + timedelta(days=args.days - 1)).strftime('%Y%m%d')
+    seeds = list(date_range(start, end))
+
+    print(f"Scoring {len(seeds)} days ({start}-{end}) on {args.jobs} processes, "
+          f"beam {args.beam} x {args.branching}")
+    started = time.perf_counter()
+    results = {}
+    with ProcessPoolExecutor(max_workers=args.jobs, initializer=_warm_up) as pool:
+        for seed, record in pool.map(score_date, [(seed, args.beam, args.branching) for seed in seeds]):
+            results[seed] = record
+            print(f"  {seed} {record['starting_word']:<10} par {record['par']:>4}  best {record['best']:>4}  "
+                  f"{' '.join(record['best_words'])}")
+
+    with storage.locked(args.output):
+        table = par.load_table(args.output)
+        table.setdefault('dates', {}).update(results)
+        table['beam_width'] = args.beam
+        table['branching'] = args.branching
+        storage.write_json_atomic(args.output, table, indent=1, sort_keys=True)
+
+    print(f"Wrote {len(results)} days to {args.output} in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,20 +12,37 @@ import sys
 from datetime import datetime
 from collections import defaultdict
 from typing import Dict, List, Tuple
-import re
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cgi-bin'))
+
+from calculate_scores import reconstruct_board_and_calculate_scores
+from rogueletters import data_path, par, shareurl
 
 # Configuration
-HIGH_SCORES_DIR = 'data/high_scores'
+HIGH_SCORES_DIR = data_path('high_scores')
 SUSPICIOUS_SCORE_THRESHOLD = 300  # Scores above this are suspicious
 MAX_REALISTIC_SCORE = 400  # Theoretical max (very generous)
+# Dates in data/par_scores.json (compute_par_scores.py) use that day's best known score instead
+SUSPICIOUS_OVER_BEST = 1.0  # Beating the search is suspicious
+MAX_OVER_BEST = 1.5  # Beating it by half again is not realistic
 MIN_GAME_DURATION_SECONDS = 60  # Minimum realistic game completion time
 
 
 class AbuseDetector:
-    def __init__(self, scores_dir: str):
+    def __init__(self, scores_dir: str, par_scores: Dict = None):
         self.scores_dir = scores_dir
         self.scores = []
         self.abuse_findings = []
+        self.par_scores = par.load_table()['dates'] if par_scores is None else par_scores
+
+    def score_limits(self, date: str) -> Tuple[int, int, str]:
+        """Suspicious and impossible score thresholds for a date, and where they came from"""
+        record = self.par_scores.get(date)
+        if record:
+            best = record['best']
+            return (int(best * SUSPICIOUS_OVER_BEST), int(best * MAX_OVER_BEST),
+                    f"best known score for {date} is {best}")
+        return SUSPICIOUS_SCORE_THRESHOLD, MAX_REALISTIC_SCORE, "no par score for this date"
 
     def load_scores(self):
         """Load all high score files"""
@@ -96,23 +113,24 @@ class AbuseDetector:
         for score_entry in self.scores:
             score = score_entry['score']
             date = score_entry['date']
+            suspicious_threshold, max_realistic, basis = self.score_limits(date)
 
             # Impossibly high scores
-            if score > MAX_REALISTIC_SCORE:
+            if score > max_realistic:
                 findings.append({
                     'type': 'impossible_score',
                     'severity': 'critical',
-                    'evidence': f"Score {score} exceeds maximum realistic score ({MAX_REALISTIC_SCORE})",
+                    'evidence': f"Score {score} exceeds maximum realistic score ({max_realistic}; {basis})",
                     'date': date,
                     'score': score
                 })
 
             # Suspiciously high scores
-            elif score > SUSPICIOUS_SCORE_THRESHOLD:
+            elif score > suspicious_threshold:
                 findings.append({
                     'type': 'suspicious_high_score',
                     'severity': 'medium',
-                    'evidence': f"Score {score} is unusually high (>{SUSPICIOUS_SCORE_THRESHOLD})",
+                    'evidence': f"Score {score} is unusually high (>{suspicious_threshold}; {basis})",
                     'date': date,
                     'score': score
                 })
@@ -196,18 +214,49 @@ class AbuseDetector:
                     'board_url': url
                 })
 
-            # Check for invalid Base64URL characters
-            elif not re.match(r'^[A-Za-z0-9_-]+$', url) and not url.startswith('TEST_'):
-                findings.append({
-                    'type': 'invalid_board_url_format',
-                    'severity': 'medium',
-                    'evidence': f"Board URL contains invalid characters",
-                    'date': date,
-                    'board_url': url[:50] + '...' if len(url) > 50 else url
-                })
+            else:
+                findings.extend(self.check_board(score_entry))
 
         return findings
 
+    def check_board(self, score_entry: Dict) -> List[Dict]:
+        """Decode a board URL and check its date and score against the submission"""
+        url = score_entry['board_url']
+        date = score_entry['date']
+        try:
+            game = shareurl.decode_url(url)
+        except ValueError as e:
+            # LZ-String shares (the oldest ?g= links) do not decode here
+            return [{
+                'type': 'undecodable_board_url',
+                'severity': 'medium',
+                'evidence': f"Board URL does not decode as a V3/V4 share: {e}",
+                'date': date,
+                'board_url': url[:50] + '...' if len(url) > 50 else url
+            }]
+
+        if game.date != date.replace('-', ''):
+            return [{
+                'type': 'board_date_mismatch',
+                'severity': 'high',
+                'evidence': f"Board URL is a game of {game.date}, submitted for {date}",
+                'date': date,
+                'board_url': url
+            }]
+
+        tiles = [{'row': row, 'col': col, 'letter': letter.upper(), 'turn': turn, 'isBlank': is_blank}
+                 for row, col, letter, turn, is_blank in game.tiles]
+        board_score = reconstruct_board_and_calculate_scores(tiles, game.date)['total']
+        if board_score != score_entry['score']:
+            return [{
+                'type': 'board_score_mismatch',
+                'severity': 'critical' if score_entry['score'] > board_score else 'medium',
+                'evidence': f"Submitted {score_entry['score']} but the board scores {board_score}",
+                'date': date,
+                'board_url': url
+            }]
+        return []
+
     def detect_statistical_anomalies(self) -> List[Dict]:
         """Detect statistical outliers"""
         findings = []
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Memory footprint report for the CGI endpoints
+
+Each endpoint is measured in a fresh interpreter, the way Apache runs it:
+the module is imported and one typical request is served through main().
+Two runs are made per endpoint:
+  - a plain run for peak RSS (what mod_cgid children really cost)
+  - a tracemalloc run for Python heap peak/retained bytes by allocation site
+
+Usage:
+    python3 memory_report.py                    # all endpoints
+    python3 memory_report.py validate_word -n 15
+    python3 memory_report.py --json > memory.json
+
+Budgets for tests/test_memory_budget.py live in RSS_BUDGETS_MB and can be
+overridden with ROGUELETTERS_RSS_BUDGET_MB (all endpoints) or
+ROGUELETTERS_RSS_BUDGET_<ENDPOINT>_MB (e.g. ROGUELETTERS_RSS_BUDGET_LETTERS_MB).
+"""
+
+import argparse
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import tracemalloc
+from contextlib import redirect_stdout
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+CGI_DIR = os.path.join(ROOT_DIR, 'cgi-bin')
+
+# A small mid-game board: starting word on row 4 plus one earlier play
+SAMPLE_BOARD = [['' for _ in range(9)] for _ in range(9)]
+for _i, _letter in enumerate('GARDEN'):
+    SAMPLE_BOARD[4][1 + _i] = _letter
+
+# Typical request per read-only endpoint: CGI environment plus POST body
+ENDPOINT_REQUESTS = {
+    'validate_word': {
+        'body': {
+            'board': SAMPLE_BOARD,
+            'placed_tiles': [
+                {'row': 3, 'col': 2, 'letter': 'C'},
+                {'row': 5, 'col': 2, 'letter': 'T'},
+            ],
+            'blank_positions': [],
+        },
+    },
+    'check_word': {'query': 'words=%5B%22CAT%22%2C%22GARDENS%22%2C%22QZX%22%5D'},
+    'letters': {'query': 'seed=20251005&turn=1'},
+    'calculate_scores': {
+        'body': {
+            'seed': '20251005',
+            'tiles': [
+                {'row': 3, 'col': 4, 'letter': 'A', 'turn': 1},
+                {'row': 5, 'col': 4, 'letter': 'E', 'turn': 1},
+            ],
+        },
+    },
+    'get_rack': {'query': 'seed=20251005&turn=3&history=%5B%5B%22A%22%5D%2C%5B%22E%22%5D%5D'},
+    'get_high_score': {'query': 'date=20251005'},
+    'get_par': {'query': 'date=20251005'},
+    'hint': {
+        'body': {
+            'seed': '20251005',
+            'turn': 2,
+            'rack': ['A', 'E', 'R', 'S', 'T', '_', 'N'],
+            'board': SAMPLE_BOARD,
+        },
+    },
+    'exchange_advice': {
+        'body': {
+            'seed': '20251005',
+            'rack': ['Q', 'V', 'V', 'W', 'I', 'E', 'U'],
+            'board': SAMPLE_BOARD,
+            'tiles_drawn': 7,
+            'budget': 0.5,
+        },
+    },
+    'rack_words': {'query': 'rack=AERST_N'},
+    'pattern_words': {'query': 'pattern=%3F%3F%3F%3F%3F%3F%3F&rack=AERST_N'},
+}
+
+# Peak RSS budgets in MB per endpoint process
+RSS_BUDGETS_MB = {
+    'validate_word': 40,
+    'check_word': 40,
+    'letters': 56,
+    'calculate_scores': 72,
+    'get_rack': 56,
+    'get_high_score': 24,
+    'get_par': 24,
+    'hint': 72,
+    'exchange_advice': 72,
+    'rack_words': 40,
+    'pattern_words': 40,
+}
+
+
+def get_rss_budget_mb(endpoint):
+    """Budget for an endpoint, honouring environment overrides"""
+    override = os.environ.get(f'ROGUELETTERS_RSS_BUDGET_{endpoint.upper()}_MB')
+    if override is None:
+        override = os.environ.get('ROGUELETTERS_RSS_BUDGET_MB')
+    return float(override) if override else RSS_BUDGETS_MB[endpoint]
+
+
+def _proc_status_kb(field):
+    """Read a memory field from /proc/self/status (Linux), falling back to peak RSS
+
+    ru_maxrss survives exec on Linux, so a child started from a big parent
+    would report the parent's peak; VmHWM is reset for the new program.
+    """
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith(field + ':'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _current_rss_kb():
+    return _proc_status_kb('VmRSS')
+
+
+def _serve_request(module, request):
+    """Run module.main() against a CGI-style request, discarding the response"""
+    body = json.dumps(request['body']) if 'body' in request else ''
+    os.environ['REQUEST_METHOD'] = 'POST' if body else 'GET'
+    os.environ['QUERY_STRING'] = request.get('query', '')
+    os.environ['CONTENT_LENGTH'] = str(len(body))
+    os.environ['CONTENT_TYPE'] = 'application/json'
+    sys.stdin = io.StringIO(body)
+    with redirect_stdout(io.StringIO()):
+        module.main()
+
+
+def measure_in_process(endpoint, trace, top):
+    """Measure one endpoint in this (fresh) interpreter"""
+    sys.path.insert(0, CGI_DIR)
+    result = {'endpoint': endpoint, 'rss_start_kb': _current_rss_kb()}
+
+    if trace:
+        tracemalloc.start()
+
+    module = __import__(endpoint)
+    result['rss_after_import_kb'] = _current_rss_kb()
+    if trace:
+        import_snapshot = tracemalloc.take_snapshot()
+        result['import_traced_bytes'] = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    _serve_request(module, ENDPOINT_REQUESTS[endpoint])
+
+    result['rss_after_request_kb'] = _current_rss_kb()
+    result['peak_rss_kb'] = _proc_status_kb('VmHWM')
+
+    if trace:
+        retained, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        ignore = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, os.path.abspath(__file__)),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+        ]
+        snapshot = snapshot.filter_traces(ignore)
+        request_growth = snapshot.compare_to(import_snapshot.filter_traces(ignore), 'lineno')
+
+        result['retained_traced_bytes'] = retained
+        result['request_peak_traced_bytes'] = peak
+        result['top_retained'] = [
+            {'site': f'{stat.traceback[0].filename}:{stat.traceback[0].lineno}',
+             'bytes': stat.size, 'count': stat.count}
+            for stat in snapshot.statistics('lineno')[:top]
+        ]
+        result['top_request_growth'] = [
+            {'site': f'{stat.traceback[0].filename}:{stat.traceback[0].lineno}',
+             'bytes': stat.size_diff, 'count': stat.count_diff}
+            for stat in request_growth[:top] if stat.size_diff > 0
+        ]
+
+    return result
+
+
+def measure(endpoint, trace=False, top=10):
+    """Measure an endpoint in a child interpreter and return its result dict"""
+    cmd = [sys.executable, '-W', 'ignore', os.path.abspath(__file__), '--child', endpoint, '-n', str(top)]
+    if trace:
+        cmd.append('--trace')
+    output = subprocess.run(cmd, capture_output=True, text=True, check=True, cwd=CGI_DIR).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def print_report(endpoint, plain, traced):
+    budget = get_rss_budget_mb(endpoint)
+    peak_mb = plain['peak_rss_kb'] / 1024
+    status = '✅' if peak_mb <= budget else '❌'
+
+    print("=" * 70)
+    print(f"{status} {endpoint}: peak RSS {peak_mb:.1f} MB (budget {budget:.0f} MB)")
+    print(f"   RSS start {plain['rss_start_kb'] / 1024:.1f} MB → after import "
+          f"{plain['rss_after_import_kb'] / 1024:.1f} MB → after request {plain['rss_after_request_kb'] / 1024:.1f} MB")
+    print(f"   Python heap after import: {traced['import_traced_bytes'] / 1048576:.1f} MB, "
+          f"retained after request: {traced['retained_traced_bytes'] / 1048576:.1f} MB, "
+          f"request peak: {traced['request_peak_traced_bytes'] / 1048576:.1f} MB")
+
+    print("   Top retained allocation sites:")
+    for entry in traced['top_retained']:
+        print(f"     {entry['bytes'] / 1024:10.1f} KB {entry['count']:8d} blocks  {entry['site']}")
+
+    if traced['top_request_growth']:
+        print("   Allocated while serving the request:")
+        for entry in traced['top_request_growth']:
+            print(f"     {entry['bytes'] / 1024:10.1f} KB {entry['count']:8d} blocks  {entry['site']}")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Memory footprint per CGI endpoint')
+    parser.add_argument('endpoints', nargs='*', help='Endpoints to measure (default: all)')
+    parser.add_argument('-n', '--top', type=int, default=10, help='Allocation sites to show')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    parser.add_argument('--trace', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure_in_process(args.child, args.trace, args.top)))
+        return 0
+
+    endpoints = args.endpoints or list(ENDPOINT_REQUESTS)
+    results = {}
+    over_budget = False
+    for endpoint in endpoints:
+        plain = measure(endpoint, trace=False, top=args.top)
+        traced = measure(endpoint, trace=True, top=args.top)
+        results[endpoint] = {'rss': plain, 'tracemalloc': traced, 'budget_mb': get_rss_budget_mb(endpoint)}
+        over_budget |= plain['peak_rss_kb'] / 1024 > get_rss_budget_mb(endpoint)
+        if not args.json:
+            print_report(endpoint, plain, traced)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,11 +7,16 @@ All existing high scores use legacy ?g= format (before v10.27)
 import json
 import os
 import glob
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cgi-bin'))
+
+from rogueletters import data_path
 
 def migrate_high_scores():
     """Update all high score files to use full URLs"""
 
-    scores_dir = 'data/high_scores'
+    scores_dir = data_path('high_scores')
 
     if not os.path.exists(scores_dir):
         print(f"❌ Directory not found: {scores_dir}")
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Profile how hard each daily starting word makes the game
+
+Every (date key, year index) slot of daily_words.txt is played with the
+real decks of the years that use it (see cgi-bin/rogueletters/difficulty.py)
+by a greedy or beam bot. Slots are spread over a process pool. Each
+finished slot is appended to a checkpoint file, so an interrupted run
+picks up where it stopped. The difficulty table is written to
+data/difficulty.json, and generate_all_daily_words.py reports its
+hardest slots.
+
+Usage:
+    python3 profile_difficulty.py                         # every slot, 10 greedy games each
+    python3 profile_difficulty.py --games 20 -j 8
+    python3 profile_difficulty.py --bot beam 12-25 10-31  # selected date keys
+    python3 profile_difficulty.py --restart               # ignore the checkpoint
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cgi-bin'))
+
+import letters
+import storage
+from rogueletters import data_path, dawg, difficulty, hooks
+
+
+def _warm_up():
+    """Load the dictionary structures once per worker"""
+    dawg.dictionary_dawg()
+    hooks.hook_index()
+
+
+def load_daily_words():
+    path = data_path('daily_words.txt')
+    if not os.path.exists(path):
+        path = data_path('daily_words.json')
+    with open(path) as f:
+        return json.load(f)
+
+
+def profile_slot(args):
+    date_key, index, word, games, bot = args
+    results = [difficulty.play(word, letters.get_all_tiles_for_day(seed, word), bot)
+               for seed in difficulty.slot_seeds(date_key, index, games)]
+    record = difficulty.summarize(results)
+    record['word'] = word
+    return date_key, index, record
+
+
+def read_checkpoint(path, games, bot):
+    """Finished slots from an earlier run with the same settings"""
+    done = {}
+    try:
+        with open(path) as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # a line cut short when the run was interrupted
+                if entry.get('games') == games and entry.get('bot') == bot:
+                    done[(entry['date_key'], entry['index'])] = entry['record']
+    except OSError:
+        pass
+    return done
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Profile daily starting word difficulty')
+    parser.add_argument('date_keys', nargs='*', help='MM-DD keys to profile (default: all)')
+    parser.add_argument('--games', type=int, default=difficulty.GAMES, help='games per slot')
+    parser.add_argument('--bot', choices=difficulty.BOTS, default='greedy', help='player bot')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(), help='worker processes')
+    parser.add_argument('-o', '--output', default=data_path(difficulty.DIFFICULTY_FILE), help='table to write')
+    parser.add_argument('--checkpoint', help='finished-slot log (default: OUTPUT.checkpoint.ndjson)')
+    parser.add_argument('--restart', action='store_true', help='discard the checkpoint first')
+    args = parser.parse_args()
+
+    checkpoint = args.checkpoint or os.path.splitext(args.output)[0] + '.checkpoint.ndjson'
+    if args.restart and os.path.exists(checkpoint):
+        os.remove(checkpoint)
+
+    daily_words = load_daily_words()
+    date_keys = args.date_keys or sorted(daily_words)
+    done = read_checkpoint(checkpoint, args.games, args.bot)
+    slots = [(date_key, index, word) for date_key in date_keys
+             for index, word in enumerate(daily_words[date_key])]
+    todo = [(date_key, index, word, args.games, args.bot) for date_key, index, word in slots
+            if done.get((date_key, index), {}).get('word') != word]
+
+    print(f"Profiling {len(todo)} of {len(slots)} slots ({len(slots) - len(todo)} in {checkpoint}) "
+          f"with {args.games} {args.bot} games each on {args.jobs} processes")
+    started = time.perf_counter()
+    with open(checkpoint, 'a') as log, ProcessPoolExecutor(max_workers=args.jobs, initializer=_warm_up) as pool:
+        futures = [pool.submit(profile_slot, task) for task in todo]
+        for count, future in enumerate(as_completed(futures), 1):
+            date_key, index, record = future.result()
+            done[(date_key, index)] = record
+            log.write(json.dumps({'date_key': date_key, 'index': index, 'games': args.games,
+                                  'bot': args.bot, 'record': record}) + '\n')
+            log.flush()
+            if count % 100 == 0 or count == len(todo):
+                elapsed = time.perf_counter() - started
+                print(f"  {count}/{len(todo)} slots, {elapsed:.0f}s, "
+                      f"about {elapsed / count * (len(todo) - count):.0f}s left")
+
+    with storage.locked(args.output):
+        table = difficulty.load_table(args.output)
+        if table.get('games') != args.games or table.get('bot') != args.bot:
+            table = {'slots': {}}
+        for date_key, index, word in slots:
+            records = table['slots'].setdefault(date_key, [])
+            records.extend([None] * (len(daily_words[date_key]) - len(records)))
+            records[index] = done[(date_key, index)]
+        difficulty.rank(table['slots'])
+        table.update(games=args.games, bot=args.bot, first_year=difficulty.FIRST_YEAR)
+        storage.write_json_atomic(args.output, table, indent=1, sort_keys=True)
+
+    print(f"Wrote {len(slots)} slots to {args.output} in {time.perf_counter() - started:.1f}s")
+    for score, date_key, index, record in difficulty.hardest(table, 5):
+        print(f"  {date_key} #{index} {record['word']:<10} mean {record['mean']:>5}  "
+              f"bingos {record['bingo_rate']:.0%}  dead racks {record['dead_rack_rate']:.0%}")
+
+
+if __name__ == "__main__":
+    main()
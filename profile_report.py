@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Merge spooled endpoint profiles and print the top cumulative hot spots
+
+Profiles are captured by cgi-bin/profiling.py (enable with
+ROGUELETTERS_PROFILE or ROGUELETTERS_PROFILE_SAMPLE).
+
+Usage:
+    python3 profile_report.py                      # all endpoints, top 25
+    python3 profile_report.py validate_word -n 40  # one endpoint
+    python3 profile_report.py --dir /path/to/profiles --sort tottime
+    python3 profile_report.py --save merged/       # write merged .pstats per endpoint
+    python3 profile_report.py --clear              # delete spooled profiles after reporting
+"""
+
+import argparse
+import glob
+import os
+import pstats
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cgi-bin'))
+
+from profiling import get_spool_dir
+
+
+def find_profiles(spool_dir, endpoints=None):
+    """Map endpoint name -> list of .pstats files in the spool"""
+    profiles = {}
+    if not os.path.isdir(spool_dir):
+        return profiles
+
+    for endpoint in sorted(os.listdir(spool_dir)):
+        if endpoints and endpoint not in endpoints:
+            continue
+        files = sorted(glob.glob(os.path.join(spool_dir, endpoint, '*.pstats')))
+        if files:
+            profiles[endpoint] = files
+    return profiles
+
+
+def merge_profiles(files):
+    """Combine many .pstats files into one Stats object"""
+    stats = None
+    for path in files:
+        try:
+            if stats is None:
+                stats = pstats.Stats(path)
+            else:
+                stats.add(path)
+        except Exception as e:
+            print(f"⚠️  Skipping unreadable profile {path}: {e}", file=sys.stderr)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Merge and report spooled endpoint profiles')
+    parser.add_argument('endpoints', nargs='*', help='Endpoints to report (default: all)')
+    parser.add_argument('--dir', default=get_spool_dir(), help='Profile spool directory')
+    parser.add_argument('-n', '--top', type=int, default=25, help='Number of functions to show')
+    parser.add_argument('--sort', default='cumulative', help='pstats sort key (cumulative, tottime, calls)')
+    parser.add_argument('--save', metavar='DIR', help='Write the merged profile for each endpoint here')
+    parser.add_argument('--clear', action='store_true', help='Delete the spooled profiles after reporting')
+    args = parser.parse_args()
+
+    profiles = find_profiles(args.dir, set(args.endpoints))
+    if not profiles:
+        print(f"No profiles found in {args.dir}")
+        return 1
+
+    for endpoint, files in profiles.items():
+        stats = merge_profiles(files)
+        if stats is None:
+            continue
+
+        if args.save:
+            os.makedirs(args.save, exist_ok=True)
+            stats.dump_stats(os.path.join(args.save, f'{endpoint}.pstats'))
+
+        print("=" * 70)
+        print(f"{endpoint}: {len(files)} profiled requests, {stats.total_tt:.3f}s total")
+        print("=" * 70)
+        stats.strip_dirs().sort_stats(args.sort).print_stats(args.top)
+
+        if args.clear:
+            for path in files:
+                os.remove(path)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
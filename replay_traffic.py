@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Replay a recorded traffic corpus through the current code
+
+Records come from cgi-bin/recorder.py (NDJSON, optionally gzipped). Each
+request is served in-process through the endpoint's main() and the output
+is compared byte for byte with the recorded response. Any difference means
+a code change altered racks, validation or scores for a real request.
+
+Latency deltas compare main() time now with the recorded production time.
+Caches that live only for one CGI process (the deck cache) are cleared
+before every request unless --warm is given.
+
+Usage:
+    python3 replay_traffic.py                                  # default corpus
+    python3 replay_traffic.py traffic.ndjson.gz -j 4           # 4 worker processes
+    python3 replay_traffic.py --diffs mismatches.ndjson --show 20
+    python3 replay_traffic.py --rerecord golden.ndjson         # refresh the golden outputs
+"""
+
+import argparse
+import gzip
+import io
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import defaultdict
+from contextlib import redirect_stdout
+from itertools import islice
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cgi-bin'))
+
+import recorder
+
+BATCH_SIZE = 4096
+CHUNK_SIZE = 128
+
+_modules = {}
+
+
+def open_corpus(path):
+    """Open a corpus file for streaming ('-' for stdin, .gz supported)"""
+    if path == '-':
+        return sys.stdin
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8')
+    return open(path, 'r', encoding='utf-8')
+
+
+def iter_lines(paths, limit=None):
+    """Stream non-empty corpus lines from several files"""
+    count = 0
+    for path in paths:
+        with open_corpus(path) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                yield line
+                count += 1
+                if limit and count >= limit:
+                    return
+
+
+def _reset_process_caches():
+    """Drop caches a fresh CGI process would not have"""
+    letters = sys.modules.get('letters')
+    if letters is not None:
+        letters._DECK_CACHE.clear()
+
+
+def serve(record, warm=False):
+    """Run one recorded request through the endpoint; returns (output, seconds)"""
+    endpoint = record['endpoint']
+    module = _modules.get(endpoint)
+    if module is None:
+        module = _modules[endpoint] = __import__(endpoint)
+    if not warm:
+        _reset_process_caches()
+
+    body = record.get('body', '')
+    os.environ['REQUEST_METHOD'] = record.get('method', 'GET')
+    os.environ['QUERY_STRING'] = record.get('query', '')
+    os.environ['CONTENT_LENGTH'] = str(len(body))
+    os.environ['CONTENT_TYPE'] = 'application/json'
+    sys.stdin = io.StringIO(body)
+
+    buffer = io.StringIO()
+    start = time.perf_counter()
+    try:
+        with redirect_stdout(buffer):
+            module.main()
+    except Exception as e:
+        buffer.write(f"\n<replay raised {type(e).__name__}: {e}>")
+    return buffer.getvalue(), time.perf_counter() - start
+
+
+def first_difference(expected, actual):
+    """Byte offset of the first difference, or None if identical"""
+    expected, actual = expected.encode('utf-8'), actual.encode('utf-8')
+    if expected == actual:
+        return None
+    for offset, (a, b) in enumerate(zip(expected, actual)):
+        if a != b:
+            return offset
+    return min(len(expected), len(actual))
+
+
+def replay_line(line, warm=False, keep_output=False):
+    """Replay one corpus line; returns a result dict or None if skipped"""
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    if record.get('v') != recorder.RECORD_VERSION or record.get('endpoint') not in recorder.REPLAYABLE_ENDPOINTS:
+        return None
+
+    output, elapsed = serve(record, warm)
+    offset = first_difference(record['response'], output)
+    result = {
+        'endpoint': record['endpoint'],
+        'recorded_us': record.get('duration_us', 0),
+        'replay_us': int(elapsed * 1e6),
+        'offset': offset,
+    }
+    if offset is not None:
+        result['record'] = record
+        result['actual'] = output
+    elif keep_output:
+        result['record'] = record
+    return result
+
+
+def _replay_worker(args):
+    line, warm, keep_output = args
+    return replay_line(line, warm, keep_output)
+
+
+def replay(lines, jobs=1, warm=False, keep_output=False):
+    """Yield replay results in corpus order, in batches so memory stays flat"""
+    if jobs <= 1:
+        for line in lines:
+            yield replay_line(line, warm, keep_output)
+        return
+
+    with multiprocessing.Pool(jobs) as pool:
+        lines = iter(lines)
+        while True:
+            batch = [(line, warm, keep_output) for line in islice(lines, BATCH_SIZE)]
+            if not batch:
+                break
+            yield from pool.imap(_replay_worker, batch, chunksize=CHUNK_SIZE)
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def snippet(text, offset, width=40):
+    raw = text.encode('utf-8')
+    start = max(0, offset - width)
+    return raw[start:offset + width].decode('utf-8', errors='replace').replace('\n', '\\n')
+
+
+def print_mismatch(result):
+    record = result['record']
+    request = record.get('query') or record.get('body', '')
+    print(f"❌ {record['endpoint']} {record.get('method', 'GET')} {request[:100]}")
+    print(f"   first difference at byte {result['offset']}")
+    print(f"   expected: …{snippet(record['response'], result['offset'])}…")
+    print(f"   actual:   …{snippet(result['actual'], result['offset'])}…")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay recorded traffic and diff outputs')
+    parser.add_argument('corpus', nargs='*', help='NDJSON corpus files (default: the recorder corpus)')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='Worker processes')
+    parser.add_argument('--limit', type=int, help='Replay at most this many records')
+    parser.add_argument('--warm', action='store_true', help='Keep per-process caches between requests')
+    parser.add_argument('--show', type=int, default=5, help='Mismatches to print')
+    parser.add_argument('--diffs', metavar='PATH', help='Write every mismatch (expected and actual) as NDJSON')
+    parser.add_argument('--rerecord', metavar='PATH', help='Write a new corpus with the current outputs and timings')
+    args = parser.parse_args()
+
+    paths = args.corpus or [recorder.get_corpus_path()]
+    for path in paths:
+        if path != '-' and not os.path.exists(path):
+            print(f"Corpus not found: {path}")
+            return 1
+
+    diffs_file = open(args.diffs, 'w') if args.diffs else None
+    rerecord_file = open(args.rerecord, 'w') if args.rerecord else None
+
+    replayed = skipped = mismatches = 0
+    recorded_us = defaultdict(list)
+    replay_us = defaultdict(list)
+    deltas = defaultdict(list)
+    mismatch_counts = defaultdict(int)
+    started = time.perf_counter()
+
+    try:
+        results = replay(iter_lines(paths, args.limit), args.jobs, args.warm, keep_output=bool(rerecord_file))
+        for result in results:
+            if result is None:
+                skipped += 1
+                continue
+            replayed += 1
+            endpoint = result['endpoint']
+            recorded_us[endpoint].append(result['recorded_us'])
+            replay_us[endpoint].append(result['replay_us'])
+            deltas[endpoint].append(result['replay_us'] - result['recorded_us'])
+
+            if result['offset'] is not None:
+                mismatches += 1
+                mismatch_counts[endpoint] += 1
+                if mismatches <= args.show:
+                    print_mismatch(result)
+                if diffs_file:
+                    diffs_file.write(json.dumps({
+                        'endpoint': endpoint,
+                        'method': result['record'].get('method'),
+                        'query': result['record'].get('query'),
+                        'body': result['record'].get('body'),
+                        'offset': result['offset'],
+                        'expected': result['record']['response'],
+                        'actual': result['actual'],
+                    }, separators=(',', ':')) + '\n')
+
+            if rerecord_file:
+                record = dict(result['record'], duration_us=result['replay_us'],
+                              response=result.get('actual', result['record']['response']))
+                rerecord_file.write(json.dumps(record, separators=(',', ':')) + '\n')
+    finally:
+        if diffs_file:
+            diffs_file.close()
+        if rerecord_file:
+            rerecord_file.close()
+
+    elapsed = time.perf_counter() - started
+    print(f"\nReplayed {replayed} records ({skipped} skipped) in {elapsed:.1f}s with {args.jobs} job(s)")
+    print(f"{'endpoint':<18} {'records':>8} {'diffs':>6} {'recorded p50':>13} {'replay p50':>11} "
+          f"{'Δ p50':>9} {'Δ p95':>9}")
+    for endpoint in sorted(deltas):
+        recorded = sorted(recorded_us[endpoint])
+        current = sorted(replay_us[endpoint])
+        delta = sorted(deltas[endpoint])
+        print(f"{endpoint:<18} {len(delta):>8} {mismatch_counts[endpoint]:>6} "
+              f"{percentile(recorded, 0.5) / 1000:>11.2f}ms {percentile(current, 0.5) / 1000:>9.2f}ms "
+              f"{percentile(delta, 0.5) / 1000:>+7.2f}ms {percentile(delta, 0.95) / 1000:>+7.2f}ms")
+
+    if mismatches:
+        print(f"\n❌ {mismatches} response(s) differ from the recording")
+        return 1
+    print("\n✅ All responses match the recording")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
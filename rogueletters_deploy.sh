@@ -146,6 +146,17 @@ fi
 echo "Ensuring test-wordlist.json is available..."
 docker run --rm ${IMAGE_NAME}:latest cat /usr/local/apache2/data/test-wordlist.json > /mnt/user/appdata/rogueletters/data/test-wordlist.json 2>/dev/null && echo "  Copied test-wordlist.json"
 
+# Rogue definitions are part of the code: always take the image's copy
+docker run --rm ${IMAGE_NAME}:latest cat /usr/local/apache2/data/rogues.json > /mnt/user/appdata/rogueletters/data/rogues.json 2>/dev/null && echo "  Copied rogues.json"
+
+# The volume hides the lookups built into the image, and enable.txt was just synced,
+# so build them again in the volume; without them every request rebuilds in memory
+echo "Building dictionary lookups in the data volume..."
+docker run --rm -v /mnt/user/appdata/rogueletters/data:/usr/local/apache2/data -w /usr/local/apache2/cgi-bin \\
+  ${IMAGE_NAME}:latest python3 -m rogueletters.anagrams && echo "  Built anagram_index.bin"
+docker run --rm -v /mnt/user/appdata/rogueletters/data:/usr/local/apache2/data -w /usr/local/apache2/cgi-bin \\
+  ${IMAGE_NAME}:latest python3 -m rogueletters.dawg && echo "  Built dictionary.dawg"
+
 # Start new container with restart policy and persistent data
 echo "Starting new ${CONTAINER_NAME} container..."
 docker run -d --name ${CONTAINER_NAME} \\
@@ -172,194 +172,356 @@ function transferTileEffects(fromTile, toTile) {
 // Persistent modifiers (like Balatro's Jokers) that apply effects each round
 // Player can hold up to maxRogueSlots rogues, kept until discarded or run ends
 
-const ROGUES = {
-    // Original rogues
-    extraTurn: {
-        id: 'extraTurn',
-        name: 'Overtime',
-        description: '+1 turn per round',
-        detail: 'You get 6 turns instead of 5. More chances to hit your target.',
-        example: 'Miss by 10 points? That extra turn could save your run.',
-        rarity: 'uncommon',
-        icon: '⏰',
+// Rogue definitions (display text, rarity, rules and scoring effects) live in
+// data/rogues.json, shared with the server's scorer (cgi-bin/rogueletters/rogues.py).
+// loadRogueDefinitions() refreshes ROGUES from it at startup. Until then, or if
+// the fetch fails, the bundled copy below is used, so a resumed run never finds
+// ROGUES empty. tests/test_runs.py checks the copy matches data/rogues.json.
+const BUNDLED_ROGUE_DEFINITIONS = {
+    "rarity_prices": {
+        "common": 4,
+        "uncommon": 5,
+        "rare": 6
     },
-    extraRack: {
-        id: 'extraRack',
-        name: 'Big Pockets',
-        description: '+1 rack capacity',
-        detail: 'Hold 8 tiles instead of 7. More letters means more word options.',
-        example: 'Draw QZJXKBMN? With 8 tiles you might also have an A.',
-        rarity: 'uncommon',
-        icon: '🎒',
+    "base": {
+        "rack_size": 7,
+        "turns": 5,
+        "salary": 0,
+        "bonus_percent": 25,
+        "bingo_tiles": 7
     },
-    basePayout: {
-        id: 'basePayout',
-        name: 'Salary Bump',
-        description: '+$3 base payout',
-        detail: 'Earn $3 more at the end of each round, regardless of your score.',
-        example: 'Round 1 pays $3+$3=$6 instead of $3.',
-        rarity: 'common',
-        icon: '💵',
-    },
-    vowelBonus: {
-        id: 'vowelBonus',
-        name: 'Vowel Power',
-        description: '+1 to all vowels',
-        detail: 'A, E, I, O, U each score 1 extra point. Stacks with tile buffs.',
-        example: 'AUDIO scores +5 bonus (5 vowels).',
-        rarity: 'uncommon',
-        icon: '🔤',
-    },
-    // Phase 3: Simple rogues
-    goldenDiamond: {
-        id: 'goldenDiamond',
-        name: 'Golden Diamond',
-        description: 'Earn $1 per 20% above target',
-        detail: 'Better scaling for big scores. Without this, bonus is $1 per 25% over target.',
-        example: 'Target 100, score 150 → $2 bonus (vs $2 normally).',
-        rarity: 'common',
-        icon: '💎',
-    },
-    endlessPower: {
-        id: 'endlessPower',
-        name: 'Endless Power',
-        description: '+2 per word × current set',
-        detail: 'Scales with set number. Gets stronger as you progress.',
-        example: 'Set 3, play CAT → +6 bonus (3×2). Set 5 → +10 per word.',
-        rarity: 'rare',
-        icon: '⚡',
-    },
-    loneRanger: {
-        id: 'loneRanger',
-        name: 'Lone Ranger',
-        description: '+6 if word has exactly 1 vowel',
-        detail: 'Triggers on words with a single vowel. Y counts as a vowel.',
-        example: 'CART scores +6 bonus (only A). SKY scores +6 (only Y).',
-        rarity: 'common',
-        icon: '🤠',
-    },
-    highValue: {
-        id: 'highValue',
-        name: 'High Value',
-        description: '+1 per shop-bought tile in word',
-        detail: 'Counts tiles purchased from the shop: +1 tiles (green), ×1.5 tiles (pink), and $1 tiles (yellow).',
-        example: 'Play BEST with 2 shop tiles → +2 bonus.',
-        rarity: 'common',
-        icon: '💰',
-    },
-    wolfPack: {
-        id: 'wolfPack',
-        name: 'Wolf Pack',
-        description: '+3 per double letter pair',
-        detail: 'Adjacent matching letters trigger the bonus.',
-        example: 'COFFEE scores +6 (FF pair + EE pair = 2×$3).',
-        rarity: 'common',
-        icon: '🐺',
-    },
-    // Phase 4: UI-modifying rogues
-    noDiscard: {
-        id: 'noDiscard',
-        name: 'No Discard',
-        description: 'Exchange → Pass (+2 turns)',
-        detail: 'Lose tile exchange, gain 2 extra turns (7 total).',
-        example: 'Stuck with QXZJK? Can\'t swap, but more turns to work around it.',
-        rarity: 'uncommon',
-        icon: '🚫',
-    },
-    bingoWizard: {
-        id: 'bingoWizard',
-        name: 'Bingo Wizard',
-        description: 'Bingo with 6 tiles (+50)',
-        detail: 'Normally bingo requires using all 7 rack tiles. This lets 6 count.',
-        example: 'Play QUARTZ (6 tiles) → +50 bingo bonus.',
-        rarity: 'uncommon',
-        icon: '🎱',
-    },
-    // Phase 5: Complex rogues (state or UI additions)
-    worder: {
-        id: 'worder',
-        name: 'Worder',
-        description: '×1.25 per letter square used',
-        detail: 'DL and TL squares add a word multiplier. Stacks multiplicatively.',
-        example: 'Word on 2 DL squares → ×1.56 total (1.25×1.25).',
-        rarity: 'rare',
-        icon: '📝',
-    },
-    allRoundLetter: {
-        id: 'allRoundLetter',
-        name: 'All-Round Letter',
-        description: '+1 for first use of each letter',
-        detail: 'Each unique letter scores +1 bonus the first time it\'s used each round.',
-        example: 'Play CAT first → +3 (new C, A, T). Play CART later → +1 (only R is new).',
-        rarity: 'common',
-        icon: '🔄',
-    },
-    topDeck: {
-        id: 'topDeck',
-        name: 'Top Deck',
-        description: 'See next 3 tiles in bag',
-        detail: 'Preview upcoming draws at the top of your screen. No scoring bonus.',
-        example: 'See Q coming? Plan to draw a U first.',
-        rarity: 'common',
-        icon: '👁️',
-    },
-    // Trade-off rogues
-    heavyBackpack: {
-        id: 'heavyBackpack',
-        name: 'Heavy Backpack',
-        description: '+2 rack size, -1 turn per round',
-        detail: 'Trade turns for tiles. Hold 9 tiles but only get 4 turns.',
-        example: 'Bigger rack helps build longer words, but fewer chances to play.',
-        rarity: 'uncommon',
-        icon: '🏋️',
-    },
-    // Synergy rogues (Phase 3.5)
-    collector: {
-        id: 'collector',
-        name: 'The Collector',
-        description: '×1.1 per rogue owned',
-        detail: 'Multiplies your word scores based on rogue count.',
-        example: 'Own 4 rogues → ×1.4 multiplier. A 20-point word becomes 28.',
-        rarity: 'uncommon',
-        icon: '🎭',
-    },
-    minter: {
-        id: 'minter',
-        name: 'The Minter',
-        description: '7th tile each round is +1 buffed',
-        detail: 'Automatically buffs your 7th drawn tile each round.',
-        example: 'Draw 7 tiles, the last one gets +1 (like buying a buff in the shop).',
-        rarity: 'common',
-        icon: '🪙',
-    },
-    miser: {
-        id: 'miser',
-        name: 'The Miser',
-        description: '+$2 for 1-3 tile turns',
-        detail: 'Earn coins by playing short words.',
-        example: 'Play AT (2 tiles) → earn $2. Mix short plays with big scores.',
-        rarity: 'uncommon',
-        icon: '🤑',
-    },
-    closer: {
-        id: 'closer',
-        name: 'The Closer',
-        description: '×2 on last turn of each round',
-        detail: 'Your final turn each round scores double points.',
-        example: 'Last turn, play QUIZ for 22 → scores 44 instead.',
-        rarity: 'rare',
-        icon: '🎬',
-    },
-    hoarder: {
-        id: 'hoarder',
-        name: 'The Hoarder',
-        description: '+1 point per $1 at round start',
-        detail: 'Bonus points equal to your coins when the round begins.',
-        example: 'Start round with $15 → get +15 points for free.',
-        rarity: 'uncommon',
-        icon: '🐉',
+    "scoring": {
+        "rare_tiles": "JKQXZ",
+        "rare_tile_bonus": 2,
+        "pink_multiplier": 1.5,
+        "effects": {
+            "bingo": [
+                {
+                    "stage": "turn",
+                    "order": 2,
+                    "points": 50,
+                    "when": {
+                        "tiles_placed": {
+                            "min": "bingo_tiles"
+                        }
+                    }
+                }
+            ]
+        },
+        "names": {
+            "bingo": {
+                "name": "Bingo!",
+                "icon": "🎯"
+            }
+        }
     },
+    "rogues": {
+        "extraTurn": {
+            "id": "extraTurn",
+            "name": "Overtime",
+            "description": "+1 turn per round",
+            "detail": "You get 6 turns instead of 5. More chances to hit your target.",
+            "example": "Miss by 10 points? That extra turn could save your run.",
+            "rarity": "uncommon",
+            "icon": "⏰",
+            "rules": {
+                "turns": 1
+            }
+        },
+        "extraRack": {
+            "id": "extraRack",
+            "name": "Big Pockets",
+            "description": "+1 rack capacity",
+            "detail": "Hold 8 tiles instead of 7. More letters means more word options.",
+            "example": "Draw QZJXKBMN? With 8 tiles you might also have an A.",
+            "rarity": "uncommon",
+            "icon": "🎒",
+            "rules": {
+                "rack_size": 1
+            }
+        },
+        "basePayout": {
+            "id": "basePayout",
+            "name": "Salary Bump",
+            "description": "+$3 base payout",
+            "detail": "Earn $3 more at the end of each round, regardless of your score.",
+            "example": "Round 1 pays $3+$3=$6 instead of $3.",
+            "rarity": "common",
+            "icon": "💵",
+            "rules": {
+                "salary": 3
+            }
+        },
+        "vowelBonus": {
+            "id": "vowelBonus",
+            "name": "Vowel Power",
+            "description": "+1 to all vowels",
+            "detail": "A, E, I, O, U each score 1 extra point. Stacks with tile buffs.",
+            "example": "AUDIO scores +5 bonus (5 vowels).",
+            "rarity": "uncommon",
+            "icon": "🔤",
+            "effects": [
+                {
+                    "stage": "tile",
+                    "points": 1,
+                    "letters": "AEIOU"
+                }
+            ]
+        },
+        "goldenDiamond": {
+            "id": "goldenDiamond",
+            "name": "Golden Diamond",
+            "description": "Earn $1 per 20% above target",
+            "detail": "Better scaling for big scores. Without this, bonus is $1 per 25% over target.",
+            "example": "Target 100, score 150 → $2 bonus (vs $2 normally).",
+            "rarity": "common",
+            "icon": "💎",
+            "rules": {
+                "bonus_percent": -5
+            }
+        },
+        "endlessPower": {
+            "id": "endlessPower",
+            "name": "Endless Power",
+            "description": "+2 per word × current set",
+            "detail": "Scales with set number. Gets stronger as you progress.",
+            "example": "Set 3, play CAT → +6 bonus (3×2). Set 5 → +10 per word.",
+            "rarity": "rare",
+            "icon": "⚡",
+            "effects": [
+                {
+                    "stage": "word",
+                    "order": 1,
+                    "points": 2,
+                    "per": "set"
+                }
+            ]
+        },
+        "loneRanger": {
+            "id": "loneRanger",
+            "name": "Lone Ranger",
+            "description": "+6 if word has exactly 1 vowel",
+            "detail": "Triggers on words with a single vowel. Y counts as a vowel.",
+            "example": "CART scores +6 bonus (only A). SKY scores +6 (only Y).",
+            "rarity": "common",
+            "icon": "🤠",
+            "effects": [
+                {
+                    "stage": "word",
+                    "order": 2,
+                    "points": 6,
+                    "when": {
+                        "letters:AEIOUY": 1
+                    }
+                }
+            ]
+        },
+        "highValue": {
+            "id": "highValue",
+            "name": "High Value",
+            "description": "+1 per shop-bought tile in word",
+            "detail": "Counts tiles purchased from the shop: +1 tiles (green), ×1.5 tiles (pink), and $1 tiles (yellow).",
+            "example": "Play BEST with 2 shop tiles → +2 bonus.",
+            "rarity": "common",
+            "icon": "💰",
+            "effects": [
+                {
+                    "stage": "word",
+                    "order": 3,
+                    "points": 1,
+                    "per": "shop_tiles"
+                }
+            ]
+        },
+        "wolfPack": {
+            "id": "wolfPack",
+            "name": "Wolf Pack",
+            "description": "+3 per double letter pair",
+            "detail": "Adjacent matching letters trigger the bonus.",
+            "example": "COFFEE scores +6 (FF pair + EE pair = 2×$3).",
+            "rarity": "common",
+            "icon": "🐺",
+            "effects": [
+                {
+                    "stage": "word",
+                    "order": 4,
+                    "points": 3,
+                    "per": "double_pairs"
+                }
+            ]
+        },
+        "noDiscard": {
+            "id": "noDiscard",
+            "name": "No Discard",
+            "description": "Exchange → Pass (+2 turns)",
+            "detail": "Lose tile exchange, gain 2 extra turns (7 total).",
+            "example": "Stuck with QXZJK? Can't swap, but more turns to work around it.",
+            "rarity": "uncommon",
+            "icon": "🚫",
+            "rules": {
+                "turns": 2
+            }
+        },
+        "bingoWizard": {
+            "id": "bingoWizard",
+            "name": "Bingo Wizard",
+            "description": "Bingo with 6 tiles (+50)",
+            "detail": "Normally bingo requires using all 7 rack tiles. This lets 6 count.",
+            "example": "Play QUARTZ (6 tiles) → +50 bingo bonus.",
+            "rarity": "uncommon",
+            "icon": "🎱",
+            "rules": {
+                "bingo_tiles": -1
+            },
+            "credits": [
+                "bingo"
+            ]
+        },
+        "worder": {
+            "id": "worder",
+            "name": "Worder",
+            "description": "×1.25 per letter square used",
+            "detail": "DL and TL squares add a word multiplier. Stacks multiplicatively.",
+            "example": "Word on 2 DL squares → ×1.56 total (1.25×1.25).",
+            "rarity": "rare",
+            "icon": "📝",
+            "effects": [
+                {
+                    "stage": "word",
+                    "order": 5,
+                    "multiplier": 1.25,
+                    "per": "letter_squares"
+                }
+            ]
+        },
+        "allRoundLetter": {
+            "id": "allRoundLetter",
+            "name": "All-Round Letter",
+            "description": "+1 for first use of each letter",
+            "detail": "Each unique letter scores +1 bonus the first time it's used each round.",
+            "example": "Play CAT first → +3 (new C, A, T). Play CART later → +1 (only R is new).",
+            "rarity": "common",
+            "icon": "🔄",
+            "effects": [
+                {
+                    "stage": "turn",
+                    "order": 1,
+                    "points": 1,
+                    "per": "new_letters"
+                }
+            ]
+        },
+        "topDeck": {
+            "id": "topDeck",
+            "name": "Top Deck",
+            "description": "See next 3 tiles in bag",
+            "detail": "Preview upcoming draws at the top of your screen. No scoring bonus.",
+            "example": "See Q coming? Plan to draw a U first.",
+            "rarity": "common",
+            "icon": "👁️"
+        },
+        "heavyBackpack": {
+            "id": "heavyBackpack",
+            "name": "Heavy Backpack",
+            "description": "+2 rack size, -1 turn per round",
+            "detail": "Trade turns for tiles. Hold 9 tiles but only get 4 turns.",
+            "example": "Bigger rack helps build longer words, but fewer chances to play.",
+            "rarity": "uncommon",
+            "icon": "🏋️",
+            "rules": {
+                "rack_size": 2,
+                "turns": -1
+            }
+        },
+        "collector": {
+            "id": "collector",
+            "name": "The Collector",
+            "description": "×1.1 per rogue owned",
+            "detail": "Multiplies your word scores based on rogue count.",
+            "example": "Own 4 rogues → ×1.4 multiplier. A 20-point word becomes 28.",
+            "rarity": "uncommon",
+            "icon": "🎭",
+            "effects": [
+                {
+                    "stage": "turn",
+                    "order": 4,
+                    "multiplier": 1.1,
+                    "per": "rogues"
+                }
+            ]
+        },
+        "minter": {
+            "id": "minter",
+            "name": "The Minter",
+            "description": "7th tile each round is +1 buffed",
+            "detail": "Automatically buffs your 7th drawn tile each round.",
+            "example": "Draw 7 tiles, the last one gets +1 (like buying a buff in the shop).",
+            "rarity": "common",
+            "icon": "🪙"
+        },
+        "miser": {
+            "id": "miser",
+            "name": "The Miser",
+            "description": "+$2 for 1-3 tile turns",
+            "detail": "Earn coins by playing short words.",
+            "example": "Play AT (2 tiles) → earn $2. Mix short plays with big scores.",
+            "rarity": "uncommon",
+            "icon": "🤑"
+        },
+        "closer": {
+            "id": "closer",
+            "name": "The Closer",
+            "description": "×2 on last turn of each round",
+            "detail": "Your final turn each round scores double points.",
+            "example": "Last turn, play QUIZ for 22 → scores 44 instead.",
+            "rarity": "rare",
+            "icon": "🎬",
+            "effects": [
+                {
+                    "stage": "turn",
+                    "order": 3,
+                    "multiplier": 2,
+                    "when": {
+                        "last_turn": 1
+                    }
+                }
+            ]
+        },
+        "hoarder": {
+            "id": "hoarder",
+            "name": "The Hoarder",
+            "description": "+1 point per $1 at round start",
+            "detail": "Bonus points equal to your coins when the round begins.",
+            "example": "Start round with $15 → get +15 points for free.",
+            "rarity": "uncommon",
+            "icon": "🐉"
+        }
+    }
 };
+const ROGUES = { ...BUNDLED_ROGUE_DEFINITIONS.rogues };
+let ROGUE_DEFINITIONS = BUNDLED_ROGUE_DEFINITIONS;
+
+async function loadRogueDefinitions() {
+    try {
+        const response = await fetch(`${BASE_PATH}/data/rogues.json`);
+        if (!response.ok) throw new Error(`HTTP ${response.status}`);
+        const definitions = await response.json();
+        if (!definitions.rogues || !definitions.base) throw new Error('missing rogues or base');
+        ROGUE_DEFINITIONS = definitions;
+        Object.assign(ROGUES, definitions.rogues);
+    } catch (error) {
+        console.warn('[Rogues] Could not load rogue definitions, using the bundled copy:', error);
+    }
+}
+
+// Base rule plus what owned rogues add to it (rack_size, turns, salary, bonus_percent, bingo_tiles)
+function getRogueRule(name) {
+    let value = ROGUE_DEFINITIONS.base[name];
+    (runState.rogues || []).forEach(rogueId => {
+        value += (ROGUES[rogueId]?.rules?.[name]) || 0;
+    });
+    return value;
+}
 
 // Check if player has a specific rogue
 function hasRogue(rogueId) {
@@ -368,18 +530,14 @@ function hasRogue(rogueId) {
 
 // Get current rack size based on rogues
 function getRackSize() {
-    let size = 7;
-    if (hasRogue('extraRack')) size += 1;
-    if (hasRogue('heavyBackpack')) size += 2;
-    return size;
+    return getRogueRule('rack_size');
 }
 
 // Calculate rogue price based on rarity: Common $4, Uncommon $5, Rare $6
 function getRoguePrice(rogueId) {
     const rogue = ROGUES[rogueId];
     if (!rogue) return 999;
-    const rarityPrices = { common: 4, uncommon: 5, rare: 6 };
-    return rarityPrices[rogue.rarity] || 5;
+    return ROGUE_DEFINITIONS.rarity_prices[rogue.rarity] || 5;
 }
 
 // Get display score for a tile (includes vowel rogue if active)
@@ -795,13 +953,12 @@ function getTargetScore(set, round) {
 function calculateEarnings(score, target, roundInSet) {
     const baseAmount = [3, 4, 5][roundInSet - 1] || 3;
     // Apply basePayout rogue: +$3 to base payout
-    const salaryBumpBonus = hasRogue('basePayout') ? 3 : 0;
+    const salaryBumpBonus = getRogueRule('salary');
     const extra = Math.max(0, score - target);
 
     // $1 bonus for every 25% of target scored above target (20% with Golden Diamond)
     // e.g., 40 target = $1 per 10 extra (or $1 per 8 with Golden Diamond)
-    const bonusPercent = hasRogue('goldenDiamond') ? 0.20 : 0.25;
-    const bonusThreshold = Math.floor(target * bonusPercent);
+    const bonusThreshold = Math.floor(target * getRogueRule('bonus_percent') / 100);
     const extraBonus = bonusThreshold > 0 ? Math.floor(extra / bonusThreshold) : 0;
 
     return {
@@ -932,12 +1089,8 @@ const runManager = {
         gameState.exchangeCount = 0;
         gameState.exchangeHistory = [];
 
-        // Apply rogue effects
-        // extraTurn: +1 turn per round
-        // noDiscard: +2 turns (compensates for no exchange)
-        // heavyBackpack: -1 turn per round
-        gameState.maxTurns = 5 + (hasRogue('extraTurn') ? 1 : 0) + (hasRogue('noDiscard') ? 2 : 0) - (hasRogue('heavyBackpack') ? 1 : 0);
-        // Rack size: base 7 + extraRack (+1) + heavyBackpack (+2)
+        // Apply rogue rules (turns and rack size, see data/rogues.json)
+        gameState.maxTurns = getRogueRule('turns');
         gameState.totalTilesDrawn = getRackSize();
 
         // Generate new seed for this round (as string for consistency)
@@ -1004,8 +1157,7 @@ const runManager = {
                     // Target met - show points, bonus $ earned, and points to next $
                     const extra = Math.abs(remaining);
                     // Calculate bonus using same formula as calculateEarnings
-                    const bonusPercent = hasRogue('goldenDiamond') ? 0.20 : 0.25;
-                    const bonusThreshold = Math.floor(runState.targetScore * bonusPercent);
+                    const bonusThreshold = Math.floor(runState.targetScore * getRogueRule('bonus_percent') / 100);
                     const bonusEarned = bonusThreshold > 0 ? Math.floor(extra / bonusThreshold) : 0;
 
                     // Handle edge case where bonusThreshold is 0 (e.g., debug mode with target=1)
@@ -3079,6 +3231,33 @@ function highlightHintMove(move) {
     }
 }
 
+/**
+ * Turn-1 hint from the server's opening book (same board and rack for every
+ * player of a seed). Returns null when there is no book answer, e.g. the
+ * rack was changed by the shop, so the caller falls back to the word finder.
+ */
+async function fetchOpeningHint() {
+    if (gameState.currentTurn !== 1 || !gameState.seed) return null;
+    try {
+        const response = await fetch(`${API_BASE}/hint.py`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                seed: gameState.seed,
+                turn: 1,
+                rack: gameState.rackTiles.map(t => typeof t === 'object' ? t.letter : t),
+                board: gameState.board,
+                book_only: true
+            })
+        });
+        const data = await response.json();
+        return data.source === 'book' && data.moves.length > 0 ? { move: data.moves[0] } : null;
+    } catch (err) {
+        console.warn('[Hint] Opening book unavailable:', err);
+        return null;
+    }
+}
+
 /**
  * Use hint - find and display best move
  */
@@ -3101,8 +3280,9 @@ async function useHint() {
     let hintSucceeded = false;
 
     try {
-        // Use the GADDAG-based word finder (works with or without debug mode)
-        const result = await findBestMoveInternal();
+        // Turn 1 comes from the opening book; otherwise use the GADDAG-based
+        // word finder (works with or without debug mode)
+        const result = await fetchOpeningHint() || await findBestMoveInternal();
 
         if (result && result.move) {
             console.log(`[Hint] Found: ${result.move.word} for ${result.move.score} pts`);
@@ -4987,6 +5167,9 @@ async function loadV3SharedGame(encodedParam, isSortedFormat = false) {
 
 // Initialize game on page load
 document.addEventListener('DOMContentLoaded', async () => {
+    // Rogue definitions are needed before any run state is shown
+    await loadRogueDefinitions();
+
     // Set copyright year dynamically
     const copyrightYear = document.getElementById('copyright-year');
     if (copyrightYear) copyrightYear.textContent = new Date().getFullYear();
@@ -9155,7 +9338,7 @@ function calculateWordScore(positions) {
     // Add bingo bonus if all tiles used IN THIS SPECIFIC WORD (7 or 8 with Big Pockets)
     // Bingo Wizard: Bingo triggers with 1 fewer tile (6 or 7)
     // Bingo: always 7 tiles (or 6 with Bingo Wizard) - not affected by Big Pockets
-    const bingoThreshold = hasRogue('bingoWizard') ? 6 : 7;
+    const bingoThreshold = getRogueRule('bingo_tiles');
 
     if (gameState.placedTiles.length >= bingoThreshold) {
         // Check if enough placed tiles are in this word
@@ -9171,6 +9354,33 @@ function calculateWordScore(positions) {
     return score;
 }
 
+/**
+ * Run state the server needs to score a turn with rogues (see validate_word.py):
+ * owned rogues, set, tile set upgrades, All-Round Letter's cycle, whether this
+ * is the round's last turn, and the shop effects of tiles already on the board.
+ */
+function buildRunScoringState() {
+    const boardTiles = [];
+    document.querySelectorAll('.board-cell').forEach(cell => {
+        const tileEl = cell.querySelector('.tile');
+        const row = parseInt(cell.dataset.row);
+        const col = parseInt(cell.dataset.col);
+        if (!tileEl || gameState.placedTiles.some(t => t.row === row && t.col === col)) return;
+        const effects = getTileEffectsFromDom(tileEl);
+        if (effects.bonus || effects.buffed || effects.coinTile || effects.pinkTile) {
+            boardTiles.push({ row, col, ...effects });
+        }
+    });
+    return {
+        rogues: runState.rogues || [],
+        set: runState.set,
+        tile_upgrades: runState.tileSetUpgrades || {},
+        letters_played: Array.from(runState.lettersPlayedThisCycle || []),
+        last_turn: gameState.currentTurn === gameState.maxTurns,
+        board_tiles: boardTiles
+    };
+}
+
 /**
  * Calculate turn score breakdown for Balatro-style animation.
  * Processes ALL formed words and separates word-level vs turn-level bonuses.
@@ -9442,7 +9652,7 @@ function calculateTurnScoreBreakdown(formedWords) {
     }
 
     // Bingo bonus (turn-level - uses all 7 tiles)
-    const bingoThreshold = hasRogue('bingoWizard') ? 6 : 7;
+    const bingoThreshold = getRogueRule('bingo_tiles');
     if (gameState.placedTiles.length >= bingoThreshold) {
         turnTotal += 50;
         breakdown.turnComponents.push({
@@ -9729,7 +9939,7 @@ function calculateWordScoreBreakdown(positions) {
     }
 
     // Bingo bonus
-    const bingoThreshold = hasRogue('bingoWizard') ? 6 : 7;
+    const bingoThreshold = getRogueRule('bingo_tiles');
     if (gameState.placedTiles.length >= bingoThreshold) {
         const placedInThisWord = positions.filter(pos =>
             gameState.placedTiles.some(t => t.row === pos.row && t.col === pos.col)
@@ -10835,7 +11045,12 @@ function submitWord() {
         row: p.row,
         col: p.col,
         letter: p.letter,
-        isBlank: p.isBlank || false
+        isBlank: p.isBlank || false,
+        // Shop effects, for the server's rogue-aware score
+        bonus: p.bonus || 0,
+        buffed: p.buffed || false,
+        coinTile: p.coinTile || false,
+        pinkTile: p.pinkTile || false
     }));
 
     fetch(`${API_BASE}/validate_word.py`, {
@@ -10846,7 +11061,8 @@ function submitWord() {
             board: gameState.board,
             placed_tiles: placedWord,
             blank_positions: gameState.blankPositions || [],  // Blanks from previous turns
-            debug_mode: gameState.debugMode
+            debug_mode: gameState.debugMode,
+            run: runState.isRunMode ? buildRunScoringState() : undefined
         })
     })
     .then(response => {
@@ -10868,11 +11084,13 @@ function submitWord() {
             const formedWords = findFormedWords();
             let turnBreakdown = null;
             if (runState.isRunMode && formedWords.length > 0) {
-                // Calculate breakdown for ALL formed words (for Balatro-style animation)
-                turnBreakdown = calculateTurnScoreBreakdown(formedWords);
+                // Breakdown for ALL formed words (for Balatro-style animation). The
+                // server scores rogues from data/rogues.json; the local breakdown is
+                // only a fallback if its run state was rejected
+                turnBreakdown = data.breakdown || calculateTurnScoreBreakdown(formedWords);
 
-                // Use the breakdown total as the actual score - it includes turn-level
-                // multipliers like The Closer that the backend doesn't know about
+                // Use the breakdown total as the actual score - it includes rogue
+                // bonuses and turn-level multipliers like The Closer
                 turnScore = turnBreakdown.total;
             }
 
@@ -11218,6 +11436,9 @@ async function endGame() {
     // Pre-generate shareable URL
     await generateShareableBoardURL();
 
+    // Add the game to the server's archive (fire-and-forget)
+    archiveCompletedGame();
+
     // Update subtitle to show high score
     await updateSubtitleWithHighScore();
 
@@ -12087,6 +12308,25 @@ https://letters.wiki/?seed=${gameState.seed}`;
     copyToClipboardWithFeedback(shareText, shareBtn);
 }
 
+/**
+ * Send a completed game to the archive (archive_game.py) once per seed
+ * Uses the pre-generated V4 payload; other share formats are skipped
+ */
+function archiveCompletedGame() {
+    const url = gameState.preGeneratedShareURL || '';
+    const match = url.match(/[?&]_=([A-Za-z0-9_-]+)/);
+    if (!match || localStorage.getItem('letters_archived') === gameState.seed) {
+        return;
+    }
+    localStorage.setItem('letters_archived', gameState.seed);
+
+    fetch(`${API_BASE}/archive_game.py`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ game: match[1], score: gameState.score })
+    }).catch(err => console.warn('[Archive] Failed to archive game:', err.message));
+}
+
 // Pre-generate shareable board URL (called at game end for instant copying)
 async function generateShareableBoardURL() {
     const startTime = Date.now();
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Search the archive of completed games (see cgi-bin/rogueletters/search.py)
+
+The search index is brought up to date first, which only reads games
+archived since the last run.
+
+Usage:
+    python3 search_archive.py --word QUIXOTIC
+    python3 search_archive.py --date 20251005 --square TW     # triple-word squares
+    python3 search_archive.py --date 20251005 --square 0,0 --games
+    python3 search_archive.py --top 20 --start 20251006 --end 20251012
+    python3 search_archive.py --update                          # index only
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cgi-bin'))
+
+from rogueletters import archive, search
+from rogueletters.board import MULTIPLIERS, SIZE
+
+SQUARE_TYPES = {'DL': (2, 1), 'TL': (3, 1), 'DW': (1, 2), 'TW': (1, 3)}
+
+
+def parse_square(text):
+    """'row,col' or a square type (DL, TL, DW, TW) -> [(row, col), ...]"""
+    multiplier = SQUARE_TYPES.get(text.upper())
+    if multiplier:
+        return [(row, col) for row in range(SIZE) for col in range(SIZE) if MULTIPLIERS[row][col] == multiplier]
+    row, col = (int(part) for part in text.split(','))
+    if (row, col) not in search.PREMIUM_SQUARES:
+        raise argparse.ArgumentTypeError(f"{text} is not a premium square")
+    return [(row, col)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Search archived games')
+    parser.add_argument('--word', action='append', default=[], help='games that formed this word (repeatable)')
+    parser.add_argument('--date', action='append', default=[], help='games of this YYYYMMDD date (repeatable)')
+    parser.add_argument('--square', action='append', default=[], type=parse_square,
+                        help="games with a tile on 'row,col' or any DL/TL/DW/TW square")
+    parser.add_argument('--top', type=int, help='most formed words between --start and --end')
+    parser.add_argument('--start', help='first YYYYMMDD date for --top')
+    parser.add_argument('--end', help='last YYYYMMDD date for --top')
+    parser.add_argument('--games', action='store_true', help='print each matching game')
+    parser.add_argument('--update', action='store_true', help='only bring the index up to date')
+    parser.add_argument('--data-dir', help='archive directory (default data/archive)')
+    args = parser.parse_args()
+
+    if not (args.update or args.top or args.word or args.date or args.square):
+        parser.error('give --word, --date, --square, --top or --update')
+
+    indexed = search.update_all(args.data_dir)
+    if args.update or any(indexed.values()):
+        print(f"Indexed {sum(indexed.values())} new games in {len(indexed)} months", file=sys.stderr)
+    if args.update:
+        return
+
+    if args.top:
+        for word, count in search.top_words(args.start, args.end, args.top, args.data_dir):
+            print(f"{word:<16} {count:>7}")
+        return
+
+    squares = [square for group in args.square for square in group]
+    matches = list(search.search(args.word, args.date, squares, directory=args.data_dir))
+    print(f"{len(matches)} games", file=sys.stderr)
+    month_archive = None
+    for month, index in matches:
+        if not args.games:
+            print(f"{month}:{index}")
+            continue
+        if month_archive is None or month_archive.month != month:
+            if month_archive is not None:
+                month_archive.close()
+            month_archive = archive.MonthArchive(month, args.data_dir)
+        game = month_archive[index]
+        played = datetime.fromtimestamp(game.timestamp).strftime('%Y-%m-%d %H:%M')
+        print(f"{month}:{index}  {game.date}  {game.starting_word:<9} {game.score:>4}  {played}")
+    if month_archive is not None:
+        month_archive.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Simulate rogue runs headlessly to balance the economy and the rogues
+
+Each run is played by a bot (see cgi-bin/rogueletters/runs.py) from its
+own seed, RUN_SEED_BASE + 100 * index, so a batch is reproducible and a
+larger batch extends a smaller one. Runs are spread over a process pool.
+The report gives the overall win rate, where runs fail, and the win rate
+and average rounds won for every rogue and pair of rogues a run ended
+with.
+
+Usage:
+    python3 simulate_runs.py                          # 1000 runs, greedy bot
+    python3 simulate_runs.py --runs 5000 -j 16 -o data/runs.json
+    python3 simulate_runs.py --start-rogues closer,worder
+    python3 simulate_runs.py --bot mybots:CautiousBot  # any runs.Bot subclass
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cgi-bin'))
+
+import letters
+import storage
+from rogueletters import dawg, hooks, runs
+from rogueletters.rogues import ROGUES
+
+BOTS = {'greedy': runs.GreedyBot}
+CHUNK = 10
+
+
+def _warm_up():
+    """Load the dictionary structures once per worker"""
+    dawg.dictionary_dawg()
+    hooks.hook_index()
+
+
+def load_bot(name):
+    """A bot class by name, or 'module:Class' for one of your own"""
+    if name in BOTS:
+        return BOTS[name]
+    module, _, attribute = name.partition(':')
+    return getattr(importlib.import_module(module), attribute)
+
+
+def simulate_chunk(args):
+    bot_name, indexes, start_rogues = args
+    bot = load_bot(bot_name)()
+    return [runs.simulate_run(bot, runs.RUN_SEED_BASE + 100 * index, letters, start_rogues)
+            for index in indexes]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Simulate rogue runs')
+    parser.add_argument('--runs', type=int, default=1000, help='number of runs')
+    parser.add_argument('--bot', default='greedy', help=f"{', '.join(BOTS)} or module:Class")
+    parser.add_argument('--start-rogues', default='', help='comma-separated rogue ids every run starts with')
+    parser.add_argument('--min-runs', type=int, default=20, help='smallest sample to report a rogue or pair')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(), help='worker processes')
+    parser.add_argument('-o', '--output', help='write every run and the summary as JSON')
+    args = parser.parse_args()
+
+    start_rogues = [rogue_id for rogue_id in args.start_rogues.split(',') if rogue_id]
+    unknown = [rogue_id for rogue_id in start_rogues if rogue_id not in ROGUES]
+    if unknown:
+        parser.error(f"unknown rogues: {', '.join(unknown)}")
+    load_bot(args.bot)
+
+    print(f"Simulating {args.runs} runs with the {args.bot} bot on {args.jobs} processes")
+    started = time.perf_counter()
+    tasks = [(args.bot, range(first, min(first + CHUNK, args.runs)), start_rogues)
+             for first in range(0, args.runs, CHUNK)]
+    results = []
+    with ProcessPoolExecutor(max_workers=args.jobs, initializer=_warm_up) as pool:
+        for chunk in pool.map(simulate_chunk, tasks):
+            results.extend(chunk)
+    elapsed = time.perf_counter() - started
+    summary = runs.summarize(results, args.min_runs)
+
+    print(f"{len(results)} runs in {elapsed:.1f}s ({len(results) / elapsed * 60:.0f}/min)")
+    print(f"  won {summary['win_rate']:.1%}, {summary['rounds_won']} rounds won on average")
+    print("  failed in set: " + ', '.join(f"{number}: {count}" for number, count in summary['failed_sets'].items()))
+    for title, table in (('Rogue', summary['rogues']), ('Pair', summary['pairs'])):
+        ranked = sorted(table.items(), key=lambda item: (-item[1]['rounds_won'], item[0]))
+        print(f"\n{title:<32} {'runs':>6} {'won':>7} {'rounds':>7}")
+        for name, record in ranked:
+            print(f"{name:<32} {record['runs']:>6} {record['win_rate']:>7.1%} {record['rounds_won']:>7}")
+
+    if args.output:
+        storage.write_json_atomic(args.output, {'bot': args.bot, 'start_rogues': start_rogues,
+                                                'summary': summary, 'runs': results},
+                                  indent=1, sort_keys=True)
+        print(f"\nWrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the anagram index and the rack_words endpoint
+"""
+
+import sys
+import os
+import io
+import json
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add cgi-bin to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'cgi-bin'))
+
+from rogueletters import anagrams
+import rack_words
+
+WORDS = ['AT', 'TA', 'CAT', 'ACT', 'TACT', 'EAT', 'TEA', 'ATE', 'CATE', 'QI', 'ZA']
+
+
+class TestAnagramIndex(unittest.TestCase):
+    """Test rack lookups and the saved artifact"""
+
+    def setUp(self):
+        self.index = anagrams.AnagramIndex.from_words(WORDS)
+
+    def test_rack_words(self):
+        """Every word spelled from a subset of the rack, longest first"""
+        self.assertEqual([w for w, _ in self.index.rack_words('TCAX')], ['ACT', 'CAT', 'AT', 'TA'])
+        self.assertEqual([w for w, _ in self.index.rack_words('TCAX', min_length=3)], ['ACT', 'CAT'])
+        self.assertEqual([w for w, _ in self.index.rack_words('TCAEX', max_length=2)], ['AT', 'TA'])
+        self.assertEqual(self.index.anagrams('ETA'), ['ATE', 'EAT', 'TEA'])
+
+    def test_blanks(self):
+        """Blanks cover missing letters and are reported per word"""
+        matches = dict(self.index.rack_words('CA_'))
+        self.assertEqual(matches['CAT'], 'T')
+        self.assertEqual(matches['ZA'], 'Z')
+        self.assertNotIn('TACT', matches)
+        self.assertEqual(dict(self.index.rack_words('T__'))['QI'], 'IQ')
+        with self.assertRaises(ValueError):
+            self.index.rack_words('CA?')
+
+    def test_save_and_load(self):
+        """The artifact loads back into an identical index"""
+        scratch = tempfile.mkdtemp()
+        try:
+            path = os.path.join(scratch, anagrams.INDEX_FILE)
+            self.index.save(path)
+            loaded = anagrams.AnagramIndex.load(path)
+            self.assertEqual(loaded.words, self.index.words)
+            self.assertEqual(loaded.rack_words('TEAC_'), self.index.rack_words('TEAC_'))
+
+            with open(path, 'r+b') as f:
+                f.write(b'XXXX')
+            with self.assertRaises(ValueError):
+                anagrams.AnagramIndex.load(path)
+        finally:
+            shutil.rmtree(scratch)
+
+
+class TestRackWordsEndpoint(unittest.TestCase):
+    """Test the rack_words CGI endpoint"""
+
+    def _serve(self, query):
+        with patch.dict(os.environ, {'QUERY_STRING': query}), \
+                patch('sys.stdout', new_callable=io.StringIO) as out:
+            rack_words.main()
+        return json.loads(out.getvalue().split('\n\n', 1)[1])
+
+    def test_rack(self):
+        result = self._serve('rack=cat_&min_length=4')
+        self.assertEqual(result['rack'], 'CAT_')
+        self.assertIn('TACT', result['words'])
+        self.assertEqual(result['blanks']['TACT'], 'T')
+        self.assertEqual(result['count'], len(result['words']))
+        self.assertTrue(all(len(word) == 4 for word in result['words']))
+
+    def test_invalid_rack(self):
+        self.assertIn('error', self._serve(''))
+        self.assertIn('error', self._serve('rack=' + 'A' * (anagrams.MAX_RACK_SIZE + 1)))
+        self.assertIn('error', self._serve('rack=CA7'))
+        self.assertIn('error', self._serve('rack=CAT&min_length=x'))
+
+
+if __name__ == '__main__':
+    unittest.main()
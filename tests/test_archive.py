@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Unit tests for share-URL payloads, share cards and the completed-game archive
+"""
+
+import sys
+import os
+import tempfile
+import shutil
+import unittest
+
+# Add cgi-bin to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'cgi-bin'))
+
+import archive_game
+from calculate_scores import reconstruct_board_and_calculate_scores
+from rogueletters import archive, search, sharecard, sharecolumns, shareurl
+
+TILES = ((3, 4, 'A', 1, False), (5, 4, 'E', 1, False), (2, 4, 's', 2, True))
+
+
+class TestShareURL(unittest.TestCase):
+    """Test the V4 payload against script.js"""
+
+    def test_matches_browser_encoding(self):
+        # buildV4URL's output for this game
+        payload = shareurl.encode_v4('20251005', 'CAT', TILES[:2])
+        self.assertEqual(shareurl.b64url_encode(payload), 'IODECYj4BYiE')
+
+    def test_roundtrip(self):
+        payload = shareurl.encode_v4('20251005', 'CAT', TILES)
+        self.assertEqual(shareurl.decode_v4(payload), ('20251005', 'CAT', TILES))
+        self.assertEqual(shareurl.decode_v4(payload + b'\xff\xff'), shareurl.decode_v4(payload))
+
+    def test_rejects_bad_payloads(self):
+        payload = bytearray(shareurl.encode_v4('20251005', 'CAT', TILES))
+        with self.assertRaises(ValueError):
+            shareurl.decode_v4(payload[:-3])
+        payload[-1] = 0   # last tile's turn becomes 0
+        with self.assertRaises(ValueError):
+            shareurl.decode_v4(payload)
+        with self.assertRaises(ValueError):
+            shareurl.split_url('IODECYj4B!iE')
+
+    def test_v3(self):
+        # buildV3URLFromTiles's output; the sorted racks are EJLOTUV, then EJORTUY
+        v3 = shareurl.V3Game('20251005', ((3, 4, 2, 1), (5, 4, 6, 1), (2, 4, 0, 2)))
+        self.assertEqual(shareurl.b64url_encode(shareurl.encode_v3(*v3)), 'IOBn0WOJYIA')
+        game = shareurl.decode_url('https://letters.wiki/?w=IOBn0WOJYIA')
+        self.assertEqual(game.starting_word, 'RUNNELS')
+        self.assertEqual([tile[2] for tile in game.tiles], ['L', 'V', 'E'])
+        self.assertEqual(shareurl.v3_game(game), v3)
+        for format_name in ('v4', 'v3', 'v3-legacy'):
+            self.assertEqual(shareurl.decode_url(shareurl.encode_url(game, format_name)), game)
+        with self.assertRaises(ValueError):
+            shareurl.resolve_v3(shareurl.V3Game('20251005', ((3, 4, 2, 1), (5, 4, 2, 1))))
+
+    def test_columns(self):
+        urls = ['https://letters.wiki/?_=' + shareurl.b64url_encode(shareurl.encode_v4('20251005', 'CAT', TILES)),
+                'not a share', shareurl.encode_v4('20251006', 'CAT', TILES[:1]),
+                'https://letters.wiki/?w=IOBn0WOJYIA']
+        columns = sharecolumns.decode_columns(urls)
+        self.assertEqual(columns.errors, [1])
+        self.assertEqual(list(columns.game), [0, 0, 0, 2, 3, 3, 3])
+        self.assertEqual(list(columns.position), [31, 49, 22, 31, 31, 49, 22])
+        self.assertEqual(list(columns.letter), [0, 4, 18, 0, 11, 21, 4])
+        self.assertEqual(list(columns.blank), [False, False, True, False, False, False, False])
+        self.assertEqual(columns.days[3], shareurl.date_to_days('20251006'))
+
+
+class TestShareCard(unittest.TestCase):
+    """Test card rendering, the card cache and its eviction"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_render(self):
+        data = sharecard.render(shareurl.Game('20251005', 'CAT', TILES), [3, 2, 0, 0, 0])
+        self.assertTrue(data.startswith(b'\x89PNG\r\n\x1a\n'))
+        self.assertEqual(data[16:24], bytes.fromhex('000004b000000276'))   # 1200 x 630
+
+    def test_cache(self):
+        game = shareurl.Game('20251005', 'CAT', TILES)
+        data, cached = sharecard.card(game, [3, 2, 0, 0, 0], self.test_dir)
+        self.assertFalse(cached)
+        self.assertEqual(sharecard.card(game, [3, 2, 0, 0, 0], self.test_dir), (data, True))
+
+        # Room for one card: the least recently used one goes
+        other = shareurl.Game('20251006', 'CAT', TILES[:1])
+        sharecard.card(other, [1, 0, 0, 0, 0], self.test_dir)
+        old = os.path.join(self.test_dir, sharecard.card_key(game) + '.png')
+        os.utime(old, (1, 1))
+        sharecard.evict(self.test_dir, len(data) + 1)
+        self.assertFalse(os.path.exists(old))
+        self.assertTrue(os.path.exists(os.path.join(self.test_dir, sharecard.card_key(other) + '.png')))
+
+
+class TestArchive(unittest.TestCase):
+    """Test appends, random access and recovery from a torn index"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def append(self, date, score, tiles=TILES):
+        return archive.append(shareurl.encode_v4(date, 'CAT', tiles), score, 1700000000 + score,
+                              directory=self.test_dir)
+
+    def test_append_and_read(self):
+        self.assertEqual(self.append('20251005', 20), ('202510', 0))
+        self.assertEqual(self.append('20251031', 31, TILES[:1]), ('202510', 1))
+        self.assertEqual(self.append('20251101', 40), ('202511', 0))
+        self.assertEqual(archive.months(self.test_dir), ['202510', '202511'])
+
+        with archive.MonthArchive('202510', self.test_dir) as month:
+            self.assertEqual(len(month), 2)
+            game = month[1]
+            self.assertEqual((game.date, game.score, game.timestamp), ('20251031', 31, 1700000031))
+            self.assertEqual(game.tiles, TILES[:1])
+            self.assertEqual([header[1:] for header in month.headers()],
+                             [(20, 1700000020, '20251005'), (31, 1700000031, '20251031')])
+            self.assertEqual(bytes(month.record(0)[archive.RECORD_HEADER.size:]),
+                             shareurl.encode_v4('20251005', 'CAT', TILES))
+            with self.assertRaises(IndexError):
+                month[2]
+
+        self.assertEqual([game.date for game in archive.games('20251010', '20251130', self.test_dir)],
+                         ['20251031', '20251101'])
+
+    def test_torn_index(self):
+        self.append('20251005', 20)
+        games_path, index_path = archive.month_paths('202510', self.test_dir)
+        # An append that stopped after the record, or partway through its offset
+        with open(games_path, 'ab') as f:
+            f.write(b'\x00' * 9)
+        with open(index_path, 'ab') as f:
+            f.write(b'\x01\x02')
+        with archive.MonthArchive('202510', self.test_dir) as month:
+            self.assertEqual(len(month), 1)
+
+        self.assertEqual(self.append('20251006', 30), ('202510', 1))
+        with archive.MonthArchive('202510', self.test_dir) as month:
+            self.assertEqual([game.score for game in month], [20, 30])
+
+    def test_duplicate_board(self):
+        self.append('20251005', 20)
+        with self.assertRaises(archive.DuplicateGame):
+            self.append('20251005', 25)
+        # A torn hash left by an interrupted append does not hide later ones
+        with open(os.path.join(self.test_dir, '20251005.seen'), 'ab') as f:
+            f.write(b'\x01\x02\x03')
+        self.append('20251005', 30, TILES[:1])
+        with self.assertRaises(archive.DuplicateGame):
+            self.append('20251005', 30, TILES[:1])
+        self.assertEqual(self.append('20251006', 20), ('202510', 2))
+
+    def test_missing_month(self):
+        with archive.MonthArchive('202001', self.test_dir) as month:
+            self.assertEqual(len(month), 0)
+            self.assertEqual(list(month.headers()), [])
+
+
+class TestSearch(unittest.TestCase):
+    """Test posting lists and incremental indexing"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def append(self, date, tiles):
+        archive.append(shareurl.encode_v4(date, 'RUNNELS', tiles), 10, directory=self.test_dir)
+
+    def test_postings_roundtrip(self):
+        values = [0, 1, 5, 127, 128, 300, 70000]
+        data = search.encode_postings(values[:3])
+        search.encode_postings(values[3:], values[2], data)
+        self.assertEqual(search.decode_postings(data), values)
+        self.assertEqual(len(search.encode_postings(range(100))), 100)
+
+    def test_search_and_top_words(self):
+        # RUNNELS is on row 4 from column 1: NO and then NOW down from the second N,
+        # ON down into the first N from the double-letter square above it
+        self.append('20251005', ((5, 4, 'O', 1, False), (6, 4, 'W', 2, False)))
+        self.append('20251006', ((3, 3, 'O', 1, False),))
+        self.assertEqual(search.update('202510', self.test_dir), 2)
+        self.append('20251006', ((5, 4, 'O', 1, False),))
+        self.assertEqual(search.update_all(self.test_dir), {'202510': 1})
+
+        index = search.MonthIndex.load('202510', self.test_dir)
+        self.assertEqual(index.games, 3)
+        self.assertEqual(index.postings('w:NO'), [0, 2])
+        self.assertEqual(index.postings('w:NOW'), [0])
+        self.assertEqual(index.postings('w:ON'), [1])
+        self.assertEqual(index.postings('s:3,3'), [1])
+        self.assertEqual(index.count('d:20251006'), 2)
+
+        self.assertEqual(list(search.search(['no'], directory=self.test_dir)), [('202510', 0), ('202510', 2)])
+        self.assertEqual(list(search.search(['no'], ['20251006'], directory=self.test_dir)), [('202510', 2)])
+        self.assertEqual(list(search.search(squares=[(3, 3), (3, 5)], directory=self.test_dir)), [('202510', 1)])
+        self.assertEqual(list(search.search(['NO'], squares=[(3, 3)], directory=self.test_dir)), [])
+
+        self.assertEqual(search.top_words(limit=2, directory=self.test_dir), [('NO', 2), ('NOW', 1)])
+        self.assertEqual(search.top_words('20251006', '20251006', directory=self.test_dir),
+                         [('NO', 1), ('ON', 1)])
+
+
+class TestRescoring(unittest.TestCase):
+    """Test scoring a whole game from its tiles"""
+
+    def test_earlier_blanks_score_zero(self):
+        # RUNNELS is on row 4; a blank O goes under the N at column 4, then a W under it
+        tiles = [{'row': 5, 'col': 4, 'letter': 'O', 'turn': 1, 'isBlank': True},
+                 {'row': 6, 'col': 4, 'letter': 'W', 'turn': 2}]
+        result = reconstruct_board_and_calculate_scores(tiles, '20251005')
+        self.assertEqual(result['scores'][:2], [1, 5])
+
+    def test_only_playable_games_are_archived(self):
+        # RUNNELS is on row 4 and the first rack is LOVETUJ: OUT goes down through the U
+        def check(tiles):
+            game = shareurl.Game('20251005', 'RUNNELS', tuple(tiles))
+            return archive_game.check_play(game, [
+                {'row': row, 'col': col, 'letter': letter.upper(), 'turn': turn, 'isBlank': is_blank}
+                for row, col, letter, turn, is_blank in tiles])
+
+        out = [(3, 2, 'O', 1, False), (5, 2, 'T', 1, False)]
+        self.assertIsNone(check(out))
+        self.assertIn("not found in rack", check([(3, 2, 'Z', 1, False), (5, 2, 'T', 1, False)]))
+        self.assertIn("no blanks", check([(3, 2, 'o', 1, True), (5, 2, 'T', 1, False)]))
+        self.assertIn("Invalid word", check([(3, 2, 'T', 1, False), (5, 2, 'O', 1, False)]))
+        self.assertIn("connect", check([(0, 0, 'O', 1, False), (0, 1, 'T', 1, False)]))
+        self.assertIn("played square", check(out + [(3, 2, 'L', 2, False)]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Unit tests for board cross-check analysis
+"""
+
+import sys
+import os
+import unittest
+
+# Add cgi-bin to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'cgi-bin'))
+
+from rogueletters import board, hooks
+
+WORDS = frozenset(['AT', 'CAT', 'BAT', 'CATS', 'TA', 'TAB', 'AB', 'BA', 'ABA', 'SCAT', 'TAT'])
+
+
+def empty_board():
+    return [['' for _ in range(board.SIZE)] for _ in range(board.SIZE)]
+
+
+def tiles(word, row, col, d_row=0, d_col=1):
+    return [{'row': row + d_row * i, 'col': col + d_col * i, 'letter': letter} for i, letter in enumerate(word)]
+
+
+def state(analysis):
+    return analysis.cells, analysis.across, analysis.down, analysis.anchors
+
+
+class TestBoardAnalysis(unittest.TestCase):
+    """Test cross-checks, anchors and incremental updates"""
+
+    def setUp(self):
+        self.index = hooks.HookIndex(WORDS)
+
+    def test_cross_checks_and_anchors(self):
+        grid = empty_board()
+        analysis = board.BoardAnalysis(grid, self.index)
+        self.assertEqual(analysis.anchors, {board.CENTER})
+
+        for tile in tiles('CAT', 4, 3):
+            grid[tile['row']][tile['col']] = tile['letter']
+        analysis = board.BoardAnalysis(grid, self.index)
+
+        # Left and right of CAT: a vertical play there extends the row
+        self.assertEqual(hooks.letters(analysis.cross_check(4, 2, board.DOWN)), 'S')
+        self.assertEqual(hooks.letters(analysis.cross_check(4, 6, board.DOWN)), 'S')
+        self.assertEqual(analysis.cross_check(4, 2, board.ACROSS), hooks.ALL_LETTERS)
+        # Below the A: a horizontal play there makes A? downwards
+        self.assertEqual(hooks.letters(analysis.cross_check(5, 4, board.ACROSS)), 'BT')
+        self.assertTrue(analysis.allows(3, 5, 'a'))
+        self.assertFalse(analysis.allows(3, 5, 'B'))
+        self.assertEqual(analysis.cross_check(4, 4), 0)
+        self.assertEqual(len(analysis.anchors), 8)
+
+    def test_incremental_matches_full(self):
+        grid = empty_board()
+        analysis = board.BoardAnalysis(grid, self.index)
+        plays = [tiles('CAT', 4, 3), tiles('AB', 5, 4, 1, 0), tiles('AB', 7, 3), tiles('S', 4, 2)]
+        states = []
+        for play in plays:
+            states.append([[row[:] for row in part] if isinstance(part, list) else set(part)
+                           for part in state(analysis)])
+            analysis.place(play)
+            for tile in play:
+                grid[tile['row']][tile['col']] = tile['letter']
+            self.assertEqual(state(analysis), state(board.BoardAnalysis(grid, self.index)))
+
+        for expected in reversed(states):
+            analysis.undo()
+            self.assertEqual(list(state(analysis)), expected)
+        with self.assertRaises(IndexError):
+            analysis.undo()
+        with self.assertRaises(ValueError):
+            analysis.place(tiles('CAT', 4, 3) + tiles('A', 4, 3))
+
+    def test_cache(self):
+        board.clear_cache()
+        grid = empty_board()
+        play = tiles('CAT', 4, 3)
+        first = board.analyze(grid, play)
+        self.assertIs(board.analyze(grid, play), first)
+        for tile in play:
+            grid[tile['row']][tile['col']] = tile['letter']
+        self.assertIs(board.analyze(grid), first)
+        self.assertEqual(board.board_key(grid), '.' * 39 + 'CAT' + '.' * 39)
+        self.assertEqual(len(board.board_hash(grid)), 16)
+        self.assertEqual(board.cache_info()['hits'], 2)
+
+        for col in range(board.SIZE):
+            board.analyze([['' for _ in range(9)] for _ in range(8)] + [['A' if c == col else '' for c in range(9)]])
+        self.assertLessEqual(board.cache_info()['size'], board.MAX_CACHED_BOARDS)
+
+
+if __name__ == '__main__':
+    unittest.main()
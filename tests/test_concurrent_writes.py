@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Multi-process torture tests for everything that writes under data/
+
+Each writer runs against a scratch data directory (ROGUELETTERS_DATA_DIR)
+and is hammered by several processes through its real code path, while
+a reader process keeps parsing the files. Invariants:
+no lost high scores, no partial JSON, a sorted and bounded leaderboard
+and exact rate-limit counts.
+
+Sustained writes/sec are printed for comparing storage changes:
+    python -m pytest tests/test_concurrent_writes.py -s
+
+Scale with ROGUELETTERS_TORTURE_PROCS (default 6) and
+ROGUELETTERS_TORTURE_WRITES (writes per process, default 20).
+"""
+
+import sys
+import os
+import io
+import json
+import time
+import random
+import shutil
+import tempfile
+import unittest
+import importlib.util
+import multiprocessing
+from contextlib import redirect_stdout
+
+# Add cgi-bin to path
+CGI_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'cgi-bin')
+sys.path.insert(0, CGI_DIR)
+
+PROCS = int(os.environ.get('ROGUELETTERS_TORTURE_PROCS', 6))
+WRITES = int(os.environ.get('ROGUELETTERS_TORTURE_WRITES', 20))
+
+_ctx = multiprocessing.get_context('fork')
+
+
+def _load_fresh(name):
+    """Import a private copy of a CGI script, running its module-level setup"""
+    path = os.path.join(CGI_DIR, f'{name}.py')
+    spec = importlib.util.spec_from_file_location(f'scratch_{name}', path)
+    module = importlib.util.module_from_spec(spec)
+    with redirect_stdout(io.StringIO()):
+        spec.loader.exec_module(module)
+    return module
+
+
+def _call_main(module, body, ip):
+    """Serve one POST through module.main() and return the JSON response"""
+    payload = json.dumps(body)
+    os.environ['REQUEST_METHOD'] = 'POST'
+    os.environ['REMOTE_ADDR'] = ip
+    os.environ['CONTENT_LENGTH'] = str(len(payload))
+    sys.stdin = io.StringIO(payload)
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        module.main()
+    return json.loads(buffer.getvalue().split('\n\n', 1)[1])
+
+
+def _endpoint_worker(name, requests, start, results):
+    module = _load_fresh(name)
+    start.wait()
+    responses = [_call_main(module, body, ip) for body, ip in requests]
+    results.put(responses)
+
+
+def _progress_worker(words, start, results):
+    module = _load_fresh('fetch_wikipedia_words')
+    rng = random.Random(os.getpid())
+    module.fetch_words_from_wikipedia = lambda month, day: rng.sample(words, 40)
+    module.time = type('NoSleep', (), {'sleep': staticmethod(lambda seconds: None)})
+    module.print = lambda *args, **kwargs: None
+    start.wait()
+    results.put(len(module.generate_wikipedia_words()))
+
+
+def _reader(paths, stop, results):
+    """Keep parsing the files; count reads that saw partial or corrupt JSON"""
+    reads = corrupt = 0
+    while not stop.is_set():
+        for path in paths:
+            try:
+                with open(path) as f:
+                    json.load(f)
+                reads += 1
+            except FileNotFoundError:
+                pass
+            except ValueError:
+                corrupt += 1
+    results.put((reads, corrupt))
+
+
+class TestConcurrentWrites(unittest.TestCase):
+    """Hammer the data/ writers from many processes at once"""
+
+    def setUp(self):
+        self.scratch = tempfile.mkdtemp()
+        self.data_dir = os.path.join(self.scratch, 'data')
+        os.makedirs(self.data_dir)
+        os.symlink(os.path.abspath(os.path.join(CGI_DIR, '..', 'data', 'enable.txt')),
+                   os.path.join(self.data_dir, 'enable.txt'))
+        os.environ['ROGUELETTERS_DATA_DIR'] = self.data_dir
+        os.environ['ROGUELETTERS_METRICS_FILE'] = os.path.join(self.scratch, 'metrics.bin')
+
+    def tearDown(self):
+        os.environ.pop('ROGUELETTERS_DATA_DIR', None)
+        os.environ.pop('ROGUELETTERS_METRICS_FILE', None)
+        shutil.rmtree(self.scratch)
+
+    def _hammer(self, target, per_worker_args, watch):
+        """Run workers in parallel with a reader; returns (results, reader stats, seconds)"""
+        start = _ctx.Event()
+        stop = _ctx.Event()
+        results = _ctx.Queue()
+        reader_results = _ctx.Queue()
+
+        reader = _ctx.Process(target=_reader, args=(watch, stop, reader_results), daemon=True)
+        workers = [_ctx.Process(target=target, args=args + (start, results), daemon=True)
+                   for args in per_worker_args]
+        reader.start()
+        for worker in workers:
+            worker.start()
+
+        try:
+            began = time.perf_counter()
+            start.set()
+            collected = [results.get(timeout=120) for _ in workers]
+            elapsed = time.perf_counter() - began
+            for worker in workers:
+                worker.join()
+                self.assertEqual(worker.exitcode, 0)
+        finally:
+            stop.set()
+            for worker in workers:
+                if worker.is_alive():
+                    worker.terminate()
+
+        reader_stats = reader_results.get(timeout=30)
+        reader.join()
+        return collected, reader_stats, elapsed
+
+    def _report(self, label, writes, elapsed, reader_stats):
+        print(f"\n  {label}: {writes} writes from {PROCS} processes in {elapsed:.2f}s "
+              f"→ {writes / elapsed:.0f} writes/sec ({reader_stats[0]} concurrent reads)")
+
+    def test_submit_high_score_keeps_maximum(self):
+        """Concurrent submissions never lose the highest score"""
+        dates = ['20251005', '20251006']
+        rng = random.Random(1)
+        args = []
+        submitted = {date: [] for date in dates}
+        for w in range(PROCS):
+            requests = []
+            for k in range(WRITES):
+                date, score = rng.choice(dates), rng.randint(0, 999)
+                submitted[date].append(score)
+                requests.append(({'date': date, 'score': score, 'board_url': f'TEST_{date}_{score}'},
+                                 f'10.0.{w}.{k}'))
+            args.append(('submit_high_score', requests))
+
+        files = [os.path.join(self.data_dir, 'high_scores', f'{date}.json') for date in dates]
+        rate_file = os.path.join(self.data_dir, 'rate_limits.json')
+        collected, reader_stats, elapsed = self._hammer(_endpoint_worker, args, files + [rate_file])
+
+        responses = [r for worker in collected for r in worker]
+        failed = [r for r in responses if not r['success']]
+        self.assertEqual(failed, [], f"{len(failed)} submissions failed")
+        self.assertEqual(reader_stats[1], 0, "reader saw partial JSON")
+
+        for date, path in zip(dates, files):
+            with open(path) as f:
+                saved = json.load(f)
+            self.assertEqual(saved['score'], max(submitted[date]))
+            self.assertEqual(saved['board_url'], f"TEST_{date}_{saved['score']}")
+
+        with open(rate_file) as f:
+            limits = json.load(f)
+        self.assertEqual(len(limits), PROCS * WRITES)
+        self.assertTrue(all(len(stamps) == 1 for stamps in limits.values()))
+
+        self._report('submit_high_score', len(responses), elapsed, reader_stats)
+
+    def test_rate_limit_is_exact(self):
+        """Exactly MAX_SUBMISSIONS_PER_DAY requests from one IP get through"""
+        import submit_high_score
+        per_worker = max(WRITES, submit_high_score.MAX_SUBMISSIONS_PER_DAY // PROCS + 5)
+        args = [('submit_high_score',
+                 [({'date': '20251005', 'score': 10, 'board_url': 'TEST_rate'}, '192.0.2.1')] * per_worker)
+                for _ in range(PROCS)]
+
+        rate_file = os.path.join(self.data_dir, 'rate_limits.json')
+        collected, reader_stats, elapsed = self._hammer(_endpoint_worker, args, [rate_file])
+
+        responses = [r for worker in collected for r in worker]
+        allowed = [r for r in responses if 'Rate limit' not in r.get('error', '')]
+        self.assertEqual(len(allowed), submit_high_score.MAX_SUBMISSIONS_PER_DAY)
+        self.assertEqual(reader_stats[1], 0, "reader saw partial JSON")
+
+        with open(rate_file) as f:
+            limits = json.load(f)
+        self.assertEqual([len(stamps) for stamps in limits.values()],
+                         [submit_high_score.MAX_SUBMISSIONS_PER_DAY])
+
+        self._report('rate limit', len(responses), elapsed, reader_stats)
+
+    def test_submit_score_leaderboard(self):
+        """The top-10 board stays sorted, bounded and holds the best scores"""
+        rng = random.Random(2)
+        args = []
+        scores = []
+        for w in range(PROCS):
+            requests = []
+            for k in range(WRITES):
+                score = rng.randint(0, 500)
+                scores.append(score)
+                requests.append(({'name': rng.choice(['ABC', 'XYZ', 'ROG']), 'score': score,
+                                  'date': '2025-10-05'}, '10.0.0.1'))
+            args.append(('submit_score', requests))
+
+        path = os.path.join(self.data_dir, 'highscores', '2025-10-05.json')
+        collected, reader_stats, elapsed = self._hammer(_endpoint_worker, args, [path])
+
+        responses = [r for worker in collected for r in worker]
+        failed = [r for r in responses if not r['success']]
+        self.assertEqual(failed, [], f"{len(failed)} submissions failed")
+        self.assertEqual(reader_stats[1], 0, "reader saw partial JSON")
+
+        with open(path) as f:
+            board = json.load(f)
+        board_scores = [entry['score'] for entry in board]
+        self.assertEqual(len(board), 10)
+        self.assertEqual(board_scores, sorted(scores, reverse=True)[:10])
+
+        self._report('submit_score', len(responses), elapsed, reader_stats)
+
+    def test_wikipedia_progress_file(self):
+        """Concurrent generator runs never leave a truncated progress file"""
+        try:
+            import requests, bs4  # noqa: F401 - imported by fetch_wikipedia_words
+        except ImportError:
+            self.skipTest('fetch_wikipedia_words needs requests and beautifulsoup4')
+
+        with open(os.path.join(self.data_dir, 'enable.txt')) as f:
+            words = [w.strip().upper() for w in f if len(w.strip()) == 6][:2000]
+
+        path = os.path.join(self.data_dir, 'wikipedia_words_progress.json')
+        args = [(words,) for _ in range(PROCS)]
+        collected, reader_stats, elapsed = self._hammer(_progress_worker, args, [path])
+
+        self.assertEqual(collected, [366] * PROCS)
+        self.assertEqual(reader_stats[1], 0, "reader saw partial JSON")
+
+        with open(path) as f:
+            progress = json.load(f)
+        self.assertEqual(len(progress), 360)
+        self.assertTrue(all(len(day_words) == 10 for day_words in progress.values()))
+
+        self._report('wikipedia progress', PROCS * 36, elapsed, reader_stats)
+
+
+if __name__ == '__main__':
+    unittest.main()
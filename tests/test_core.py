@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared rogueletters core package
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add cgi-bin to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'cgi-bin'))
+
+import rogueletters
+from rogueletters import dictionary, paths
+
+
+class TestTiles(unittest.TestCase):
+    """Test the shared tile set"""
+
+    def test_distribution(self):
+        """100 tiles including 2 blanks; scores cover every tile"""
+        self.assertEqual(sum(rogueletters.TILE_DISTRIBUTION.values()), 100)
+        self.assertNotIn('_', rogueletters.LETTER_DISTRIBUTION)
+        self.assertEqual(set(rogueletters.TILE_SCORES), set(rogueletters.TILE_DISTRIBUTION))
+
+    def test_is_word_possible(self):
+        """Words needing more copies of a letter than the bag holds are rejected"""
+        self.assertTrue(rogueletters.is_word_possible('garden'))
+        self.assertFalse(rogueletters.is_word_possible('JAZZ'))
+        self.assertFalse(rogueletters.is_word_possible('CAT_'))
+        self.assertTrue(rogueletters.is_word_possible('CAT_', rogueletters.TILE_DISTRIBUTION))
+
+
+class TestDataDictionary(unittest.TestCase):
+    """Test data directory resolution and the cached dictionary views"""
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        with open(os.path.join(self.data_dir, 'enable.txt'), 'w') as f:
+            f.write('cat\nact\ntac\ngarden\ndanger\nzebra\n\n')
+        dictionary.reset()
+
+    def tearDown(self):
+        dictionary.reset()
+        shutil.rmtree(self.data_dir)
+
+    def test_data_dir_override(self):
+        """ROGUELETTERS_DATA_DIR wins over the probed directory"""
+        with patch.dict(os.environ, {'ROGUELETTERS_DATA_DIR': self.data_dir}):
+            self.assertEqual(rogueletters.data_path('high_scores', 'x.json'),
+                             os.path.join(self.data_dir, 'high_scores', 'x.json'))
+        self.assertIn(paths.data_dir(), (paths.APACHE_DATA_DIR, paths.LOCAL_DATA_DIR))
+
+    def test_views(self):
+        """Views are built from one load and agree with each other"""
+        with patch.dict(os.environ, {'ROGUELETTERS_DATA_DIR': self.data_dir}):
+            self.assertEqual(len(dictionary.words()), 6)
+            self.assertTrue(dictionary.is_word('Garden'))
+            self.assertEqual(dictionary.words_between(5, 6), ['DANGER', 'GARDEN', 'ZEBRA'])
+            self.assertEqual(dictionary.anagrams('CAT'), ['ACT', 'CAT', 'TAC'])
+            self.assertEqual(dictionary.anagrams('RANGED'), ['DANGER', 'GARDEN'])
+
+    def test_missing_dictionary(self):
+        """A missing word list raises OSError so callers can pick a fallback"""
+        os.remove(os.path.join(self.data_dir, 'enable.txt'))
+        with patch.dict(os.environ, {'ROGUELETTERS_DATA_DIR': self.data_dir}):
+            with self.assertRaises(OSError):
+                dictionary.words()
+
+
+if __name__ == '__main__':
+    unittest.main()
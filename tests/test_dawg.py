@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the DAWG dictionary
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Add cgi-bin to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'cgi-bin'))
+
+from rogueletters import dawg
+
+WORDS = ['CAT', 'CATS', 'CAR', 'CARS', 'CART', 'BAT', 'BATS', 'AT', 'A']
+
+
+class TestDawg(unittest.TestCase):
+    """Test queries and the saved artifact"""
+
+    def setUp(self):
+        self.dawg = dawg.Dawg.from_words(WORDS)
+
+    def test_membership(self):
+        for word in WORDS:
+            self.assertIn(word, self.dawg)
+        self.assertIn('cat', self.dawg)
+        for word in ('', 'CA', 'CATSS', 'DOG', 'B', 'CAT1'):
+            self.assertNotIn(word, self.dawg)
+        self.assertEqual(len(self.dawg), len(WORDS))
+        self.assertEqual(list(self.dawg), sorted(WORDS))
+
+    def test_minimized(self):
+        """CAT/BAT share their suffix nodes: -S and -T runs are stored once"""
+        self.assertLess(len(self.dawg.edges), sum(len(w) for w in WORDS))
+
+    def test_prefix_and_next_letters(self):
+        self.assertTrue(self.dawg.is_prefix(''))
+        self.assertTrue(self.dawg.is_prefix('CA'))
+        self.assertTrue(self.dawg.is_prefix('CARS'))
+        self.assertFalse(self.dawg.is_prefix('CB'))
+        self.assertEqual(self.dawg.next_letters(''), 'ABC')
+        self.assertEqual(self.dawg.next_letters('CA'), 'RT')
+        self.assertEqual(self.dawg.next_letters('CAR'), 'ST')
+        self.assertEqual(self.dawg.next_letters('CAR', complete=True), 'ST')
+        self.assertEqual(self.dawg.next_letters('C', complete=True), '')
+        self.assertEqual(self.dawg.next_letters('CATS'), '')
+        self.assertEqual(self.dawg.next_letters('XYZ'), '')
+
+    def test_save_and_load(self):
+        scratch = tempfile.mkdtemp()
+        try:
+            path = os.path.join(scratch, dawg.DAWG_FILE)
+            self.dawg.save(path)
+            loaded = dawg.Dawg.load(path)
+            self.assertEqual(list(loaded), sorted(WORDS))
+            self.assertEqual(len(loaded), len(WORDS))
+
+            with open(path, 'r+b') as f:
+                f.truncate(os.path.getsize(path) - 4)
+            with self.assertRaises(ValueError):
+                dawg.Dawg.load(path)
+        finally:
+            shutil.rmtree(scratch)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Unit tests for starting word difficulty profiles
+"""
+
+import sys
+import os
+import unittest
+
+# Add cgi-bin to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'cgi-bin'))
+
+import letters
+from rogueletters import difficulty
+
+
+class TestDifficulty(unittest.TestCase):
+    """Test slot seeds, game statistics and ranking"""
+
+    def test_slot_seeds_use_the_slot_word(self):
+        seeds = difficulty.slot_seeds('10-05', 5, games=3)
+        self.assertEqual(seeds, ['20251005', '20351005', '20451005'])
+        self.assertEqual(len({letters.get_starting_word(seed) for seed in seeds}), 1)
+
+    def test_summarize(self):
+        games = [
+            {'score': 100, 'tiles': [3, 7, 2, 0, 0]},
+            {'score': 200, 'tiles': [4, 4, 4, 4, 4]},
+        ]
+        record = difficulty.summarize(games)
+        self.assertEqual(record['games'], 2)
+        self.assertEqual(record['mean'], 150)
+        self.assertEqual((record['min'], record['max']), (100, 200))
+        self.assertEqual(record['bingo_rate'], 0.5)
+        self.assertEqual(record['dead_rack_rate'], 0.2)
+
+        game = difficulty.play('GARDEN', letters.get_all_tiles_for_day('20251005', 'GARDEN'))
+        self.assertEqual(len(game['tiles']), 5)
+        self.assertEqual(difficulty.summarize([game])['median'], game['score'])
+
+    def test_rank(self):
+        slots = {'01-01': [{'mean': 120}, None, {'mean': 90}], '01-02': [{'mean': 150}]}
+        difficulty.rank(slots)
+        self.assertEqual([record and record['difficulty'] for record in slots['01-01']], [0.5, None, 1.0])
+        self.assertEqual(slots['01-02'][0]['difficulty'], 0.0)
+
+        hardest = difficulty.hardest({'slots': slots}, 2)
+        self.assertEqual([(date_key, index) for _, date_key, index, _ in hardest], [('01-01', 2), ('01-01', 0)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Monte Carlo exchange advisor
+"""
+
+import sys
+import os
+import io
+import json
+import tempfile
+import shutil
+import unittest
+from contextlib import ExitStack, redirect_stdout
+from unittest.mock import patch
+
+# Add cgi-bin to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'cgi-bin'))
+
+import exchange_advice
+import storage
+from rogueletters import board, exchange, moves
+
+
+class TestExchangeAdvice(unittest.TestCase):
+    """Test candidate sets and simulated advice"""
+
+    def setUp(self):
+        self.cells = board.starting_board('GARDEN')
+        self.rack = list('QVVWU')
+        self.bag = list('AEEIORSTNL')
+
+    def test_candidates_are_distinct(self):
+        self.assertEqual(exchange.candidates(['B', 'A', 'A']),
+                         [('A',), ('B',), ('A', 'A'), ('A', 'B'), ('A', 'A', 'B')])
+        self.assertEqual(len(exchange.candidates(list('ABCDEFG'))), 127)
+
+    def test_advise(self):
+        advice = exchange.advise(self.cells, self.rack, self.bag, budget=60, workers=1, max_samples=2)
+        best = moves.find_moves(board.BoardAnalysis(self.cells), self.rack)[0].score
+        self.assertEqual(advice['keep_score'], best)
+
+        candidates = advice['candidates']
+        self.assertEqual(len(candidates), len(exchange.candidates(self.rack)))
+        self.assertTrue(all(c['samples'] == 2 for c in candidates))
+        self.assertEqual(advice['simulations'], 2 * len(candidates))
+        expected = [c['expected'] for c in candidates]
+        self.assertEqual(expected, sorted(expected, reverse=True))
+        self.assertEqual(sorted(candidates[0]['exchange'] + candidates[0]['keep']), sorted(self.rack))
+
+        # Same draws every time for the same seed
+        again = exchange.advise(self.cells, self.rack, self.bag, budget=60, workers=1, max_samples=2)
+        self.assertEqual(again['candidates'], candidates)
+
+    def test_empty_bag(self):
+        advice = exchange.advise(self.cells, self.rack, [], workers=1)
+        self.assertEqual(advice['candidates'], [])
+        self.assertEqual(advice['simulations'], 0)
+
+
+class TestExchangeEndpoint(unittest.TestCase):
+    """Test that the endpoint sets the budget and limits concurrent advisors"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.body = body = json.dumps({'seed': '20251005', 'rack': list('QVVWU'), 'budget': 30,
+                                       'board': board.starting_board('GARDEN')})
+        patches = [
+            patch.dict(os.environ, {'ROGUELETTERS_DATA_DIR': self.test_dir, 'REQUEST_METHOD': 'POST',
+                                    'CONTENT_LENGTH': str(len(body))}),
+            patch('exchange_advice.letters.get_starting_word', return_value='GARDEN'),
+            patch('exchange_advice.letters.get_all_tiles_for_day', return_value=list('QVVWUAEEIORSTNL')),
+            patch('exchange_advice.exchange.advise',
+                  return_value={'keep_score': 10, 'simulations': 0, 'candidates': []}),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.advise = exchange_advice.exchange.advise
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def run_endpoint(self):
+        output = io.StringIO()
+        with patch('sys.stdin', io.StringIO(self.body)), redirect_stdout(output):
+            exchange_advice.main()
+        return output.getvalue()
+
+    def test_budget_is_not_the_callers(self):
+        self.assertIn('"keep_score": 10', self.run_endpoint())
+        self.assertEqual(self.advise.call_args.kwargs['budget'], exchange_advice.BUDGET)
+
+    def test_busy_advisor(self):
+        with ExitStack() as stack:
+            for slot in range(exchange_advice.SLOTS - 1):
+                stack.enter_context(storage.locked(
+                    os.path.join(self.test_dir, f'{exchange_advice.LOCK_FILE}.{slot}')))
+            # One slot is still free
+            self.assertIn('"keep_score": 10', self.run_endpoint())
+            stack.enter_context(storage.locked(
+                os.path.join(self.test_dir, f'{exchange_advice.LOCK_FILE}.{exchange_advice.SLOTS - 1}')))
+            output = self.run_endpoint()
+        self.assertTrue(output.startswith('Status: 503'))
+        self.assertIn('busy', output)
+        self.assertEqual(self.advise.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
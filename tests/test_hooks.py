@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the hook and extension index
+"""
+
+import sys
+import os
+import unittest
+
+# Add cgi-bin to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'cgi-bin'))
+
+from rogueletters import hooks
+
+WORDS = frozenset(['AT', 'CAT', 'BAT', 'ATE', 'CATS', 'CART', 'SCAT', 'CHAT', 'AH', 'HA', 'AAH'])
+
+
+class TestHookIndex(unittest.TestCase):
+    """Test hooks, insertions and cross-check sets"""
+
+    def setUp(self):
+        self.index = hooks.HookIndex(WORDS)
+
+    def test_hooks(self):
+        self.assertEqual(self.index.front_hooks('AT'), 'BC')
+        self.assertEqual(self.index.back_hooks('AT'), 'E')
+        self.assertEqual(self.index.back_hooks('cat'), 'S')
+        self.assertEqual(self.index.front_hooks('CAT'), 'S')
+        self.assertEqual(self.index.front_hooks('ZZZ'), '')
+        self.assertEqual(self.index.front_mask('AH'), hooks.mask_of('A'))
+
+    def test_insertions(self):
+        self.assertEqual(self.index.insertions('CAT'), ['CART', 'CATS', 'CHAT', 'SCAT'])
+        self.assertEqual(self.index.insertions('AH'), ['AAH'])
+        self.assertEqual(self.index.playability('CAT'),
+                         {'front_hooks': 1, 'back_hooks': 1, 'insertions': 4})
+
+    def test_cross_check(self):
+        """Letters allowed in a square between runs of tiles"""
+        self.assertEqual(hooks.letters(self.index.cross_check('', 'AT')), 'BC')
+        self.assertEqual(hooks.letters(self.index.cross_check('CAT', '')), 'S')
+        self.assertEqual(hooks.letters(self.index.cross_check('C', 'AT')), 'H')
+        self.assertEqual(hooks.letters(self.index.cross_check('CA', 'T')), 'R')
+        # Runs that are not words themselves fall back to probing
+        self.assertEqual(hooks.letters(self.index.cross_check('CA', '')), 'T')
+        self.assertEqual(hooks.letters(self.index.cross_check('', 'HA')), '')
+        self.assertEqual(self.index.cross_check('', ''), hooks.ALL_LETTERS)
+
+
+if __name__ == '__main__':
+    unittest.main()
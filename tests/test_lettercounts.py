@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the vectorized letter-count matrix
+"""
+
+import sys
+import os
+import unittest
+
+# Add cgi-bin to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'cgi-bin'))
+
+from rogueletters import TILE_DISTRIBUTION, LETTER_DISTRIBUTION, is_word_possible, lettercounts
+
+
+@unittest.skipUnless(lettercounts.HAS_NUMPY, 'numpy not installed')
+class TestLetterMatrix(unittest.TestCase):
+    """Test feasibility queries against the per-word checks"""
+
+    def setUp(self):
+        self.words = ['CAT', 'ACT', 'TACT', 'ZIZZ', 'EAT', 'GARDEN', 'QUEEN']
+        self.matrix = lettercounts.LetterMatrix(self.words)
+
+    def test_counts(self):
+        """Rows hold per-letter counts with an empty blanks column"""
+        row = self.matrix.counts[self.words.index('TACT')]
+        self.assertEqual(row[lettercounts.COLUMNS.index('T')], 2)
+        self.assertEqual(row[lettercounts.BLANK_COLUMN], 0)
+        self.assertEqual(int(row.sum()), 4)
+
+    def test_tile_set(self):
+        """Matches is_word_possible over the lettered tiles; blanks stand in for the rest"""
+        fitting = self.matrix.words_fitting(lettercounts.count_vector(LETTER_DISTRIBUTION))
+        self.assertEqual(fitting, [w for w in self.words if is_word_possible(w)])
+        self.assertNotIn('ZIZZ', fitting)
+        self.assertIn('ZIZZ', self.matrix.words_fitting(lettercounts.count_vector(TILE_DISTRIBUTION)))
+
+    def test_rack_blanks_and_removed_tiles(self):
+        """Blanks cover missing letters; removed tiles shrink what is available"""
+        self.assertEqual(self.matrix.words_fitting(lettercounts.count_vector('CAT')), ['CAT', 'ACT'])
+        self.assertEqual(self.matrix.words_fitting(lettercounts.count_vector('CA_', 'T')), ['CAT', 'ACT', 'TACT', 'EAT'])
+        self.assertEqual(self.matrix.words_fitting(lettercounts.count_vector('CA_', 'T'), min_length=4), ['TACT'])
+
+        bag = lettercounts.count_vector(TILE_DISTRIBUTION) - lettercounts.count_vector('QU__')
+        self.assertNotIn('QUEEN', self.matrix.words_fitting(bag))
+        self.assertIn('QUEEN', self.matrix.words_fitting(lettercounts.count_vector(TILE_DISTRIBUTION)))
+
+    def test_invalid_tiles(self):
+        with self.assertRaises(ValueError):
+            lettercounts.count_vector('CAT!')
+        with self.assertRaises(ValueError):
+            lettercounts.LetterMatrix(['CAT', 'DON\'T'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+RSS budget tests for the CGI endpoints
+
+Each endpoint is imported in a fresh interpreter and serves one typical
+request (see memory_report.py). Budgets can be tuned with
+ROGUELETTERS_RSS_BUDGET_MB or ROGUELETTERS_RSS_BUDGET_<ENDPOINT>_MB.
+"""
+
+import sys
+import os
+import unittest
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import memory_report
+
+
+class TestEndpointMemoryBudget(unittest.TestCase):
+    """Peak RSS per endpoint process must stay within budget"""
+
+    def test_peak_rss_within_budget(self):
+        for endpoint in memory_report.ENDPOINT_REQUESTS:
+            with self.subTest(endpoint=endpoint):
+                result = memory_report.measure(endpoint)
+                peak_mb = result['peak_rss_kb'] / 1024
+                budget_mb = memory_report.get_rss_budget_mb(endpoint)
+                self.assertLessEqual(
+                    peak_mb, budget_mb,
+                    f"{endpoint} peak RSS {peak_mb:.1f} MB exceeds budget {budget_mb:.0f} MB "
+                    f"(run memory_report.py {endpoint} for a breakdown)"
+                )
+
+    def test_budget_override(self):
+        """Environment overrides take precedence over the defaults"""
+        os.environ['ROGUELETTERS_RSS_BUDGET_LETTERS_MB'] = '12.5'
+        try:
+            self.assertEqual(memory_report.get_rss_budget_mb('letters'), 12.5)
+        finally:
+            del os.environ['ROGUELETTERS_RSS_BUDGET_LETTERS_MB']
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Unit tests for move generation and scoring
+"""
+
+import sys
+import os
+import unittest
+
+# Add cgi-bin to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'cgi-bin'))
+
+import validate_word
+from rogueletters import board, dawg, hooks, moves
+
+WORDS = frozenset(['AT', 'CAT', 'CATS', 'SCAT', 'TA', 'TAB', 'AB', 'BA', 'ABS', 'TABS', 'BAT', 'BATS', 'STAB'])
+
+
+class TestFindMoves(unittest.TestCase):
+    """Test generated plays against the endpoint's validation and scoring"""
+
+    def setUp(self):
+        self.lexicon = dawg.Dawg.from_words(WORDS)
+        self.grid = board.starting_board('CAT')
+        self.analysis = board.BoardAnalysis(self.grid, hooks.HookIndex(WORDS))
+
+    def words(self, found):
+        return sorted({(move.word(self.after(move)), move.direction) for move in found})
+
+    def after(self, move):
+        cells = [row[:] for row in self.grid]
+        for row, col, letter, _ in move.tiles:
+            cells[row][col] = letter
+        return cells
+
+    def test_plays_are_legal(self):
+        found = moves.find_moves(self.analysis, ['S', 'B', 'A'], self.lexicon)
+        self.assertIn(('CATS', 'across'), self.words(found))
+        self.assertIn(('TABS', 'down'), self.words(found))
+        self.assertEqual(found, sorted(found, key=lambda move: -move.score))
+
+        placed = {tuple(sorted(move.tiles)) for move in found}
+        self.assertEqual(len(placed), len(found))
+        for move in found:
+            cells = self.after(move)
+            self.assertIn(move.word(cells), WORDS)
+            words_formed = validate_word.extract_words_formed(self.grid, move.placed_tiles())
+            self.assertTrue(all(w['word'] in WORDS for w in words_formed), move)
+            self.assertEqual(move.score, validate_word.calculate_score(self.grid, move.placed_tiles(), words_formed))
+
+    def test_blanks(self):
+        found = moves.find_moves(self.analysis, ['_'], self.lexicon)
+        self.assertEqual(sorted(move.word(self.after(move)) for move in found),
+                         ['AB', 'AT', 'AT', 'BA', 'CATS', 'SCAT', 'TA', 'TA'])
+        self.assertTrue(all(move.rack_tiles() == ['_'] for move in found))
+        # The blank scores nothing; C, A and T score as usual
+        self.assertEqual([move.score for move in found[:2]], [5, 5])
+
+        # Blanks already on the board score nothing either: CATS with a blank C
+        blanked = moves.score_tiles(self.grid, [(4, 6, 'S', False)], board.ACROSS, blanks=[(4, 3)])
+        self.assertEqual(blanked, 1 + 1 + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the turn-1 opening book
+"""
+
+import sys
+import os
+import tempfile
+import unittest
+
+# Add cgi-bin to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'cgi-bin'))
+
+import letters
+from rogueletters import board, moves, openings
+
+
+class TestOpeningBook(unittest.TestCase):
+    """Test building, saving and answering from a book"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.seed = '20251005'
+        cls.starting_word = letters.get_starting_word(cls.seed)
+        cls.deck = letters.get_all_tiles_for_day(cls.seed, cls.starting_word, rack_size=8)
+        cls.book = openings.OpeningBook.build(cls.starting_word, cls.deck, rack_sizes=(7, 8))
+
+    def test_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'book')
+            self.book.save(path)
+            loaded = openings.OpeningBook.load(path)
+
+            with open(path, 'r+b') as f:
+                f.truncate(os.path.getsize(path) - 1)
+            with self.assertRaises(ValueError):
+                openings.OpeningBook.load(path)
+
+        self.assertEqual(loaded.starting_word, self.starting_word)
+        rack = list(self.deck[:8])
+        live = moves.find_moves(board.BoardAnalysis(board.starting_board(self.starting_word)), rack)
+        self.assertEqual([(m.tiles, m.score, m.direction) for m in loaded.moves(rack)],
+                         [(m.tiles, m.score, m.direction) for m in live])
+
+    def test_rack_must_match(self):
+        rack = list(self.deck[:7])
+        best = self.book.moves(list(reversed(rack)), limit=3)
+        self.assertEqual(len(best), 3)
+        self.assertGreaterEqual(best[0].score, best[2].score)
+
+        self.assertIsNone(self.book.moves(rack[:6] + ['Q' if rack[6] != 'Q' else 'Z']))
+        self.assertIsNone(self.book.moves(rack[:6]))
+        self.assertTrue(self.book.matches(board.starting_board(self.starting_word)))
+        self.assertFalse(self.book.matches(board.starting_board('CAT')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the par score searches and the per-date table
+"""
+
+import sys
+import os
+import json
+import tempfile
+import unittest
+
+# Add cgi-bin and the repository root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'cgi-bin'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import letters
+from rogueletters import par
+from detect_abuse import AbuseDetector, MAX_REALISTIC_SCORE
+
+
+class TestParSearch(unittest.TestCase):
+    """Test the greedy and beam searches on a real day's deck"""
+
+    def test_day_scores(self):
+        seed = '20251005'
+        starting_word = letters.get_starting_word(seed)
+        deck = letters.get_all_tiles_for_day(seed, starting_word)
+        result = par.day_scores(starting_word, deck, width=4, branching=6)
+
+        self.assertEqual(result['starting_word'], starting_word)
+        self.assertEqual(len(result['par_turns']), par.TURNS)
+        self.assertEqual(sum(result['best_turns']), result['best'])
+        self.assertGreaterEqual(result['best'], result['par'])
+        self.assertGreater(result['par'], 0)
+        self.assertEqual(par.greedy(starting_word, deck)['score'], result['par'])
+
+
+class TestParTable(unittest.TestCase):
+    """Test reading the table and using it for abuse thresholds"""
+
+    def test_load_table(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, par.PAR_FILE)
+            self.assertEqual(par.load_table(path), {'dates': {}})
+            with open(path, 'w') as f:
+                json.dump({'dates': {'20251005': {'par': 150, 'best': 220}}}, f)
+            self.assertEqual(par.load_table(path)['dates']['20251005']['best'], 220)
+
+    def test_abuse_limits(self):
+        detector = AbuseDetector('/nonexistent', par_scores={'20251005': {'par': 150, 'best': 220}})
+        self.assertEqual(detector.score_limits('20251005')[:2], (220, 330))
+        self.assertEqual(detector.score_limits('20251006')[1], MAX_REALISTIC_SCORE)
+
+        detector.scores = [{'date': '20251005', 'score': 250}, {'date': '20251006', 'score': 250}]
+        types = [finding['type'] for finding in detector.detect_score_anomalies()]
+        self.assertEqual(types, ['suspicious_high_score'])
+
+    def test_abuse_board_checks(self):
+        # A blank O under the N of RUNNELS, then a W: 1 + 5 points
+        url = 'https://letters.wiki/?_=IOHjRrSLkJjQXSyA'
+        detector = AbuseDetector('/nonexistent', par_scores={})
+        self.assertEqual(detector.check_board({'date': '20251005', 'score': 6, 'board_url': url}), [])
+        finding, = detector.check_board({'date': '20251005', 'score': 60, 'board_url': url})
+        self.assertEqual((finding['type'], finding['severity']), ('board_score_mismatch', 'critical'))
+        finding, = detector.check_board({'date': '20251006', 'score': 6, 'board_url': url})
+        self.assertEqual(finding['type'], 'board_date_mismatch')
+        finding, = detector.check_board({'date': '20251005', 'score': 6, 'board_url': 'https://letters.wiki/?g=N4Ig'})
+        self.assertEqual(finding['type'], 'undecodable_board_url')
+
+
+if __name__ == '__main__':
+    unittest.main()
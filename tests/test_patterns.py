@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Unit tests for positional pattern queries and the pattern_words endpoint
+"""
+
+import sys
+import os
+import io
+import json
+import unittest
+from unittest.mock import patch
+
+# Add cgi-bin to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'cgi-bin'))
+
+from rogueletters import patterns
+import pattern_words
+
+WORDS = ['CAT', 'COT', 'CUT', 'ACT', 'TAT', 'CAB', 'TACO', 'COAT', 'CAKE']
+
+
+class TestPatternIndex(unittest.TestCase):
+    """Test wildcard matching and rack constraints"""
+
+    def setUp(self):
+        by_length = {}
+        for word in WORDS:
+            by_length.setdefault(len(word), []).append(word)
+        self.index = patterns.PatternIndex(by_length)
+
+    def test_pattern(self):
+        self.assertEqual(self.index.match('C?T'), ['CAT', 'COT', 'CUT'])
+        self.assertEqual(self.index.match('c.t'), ['CAT', 'COT', 'CUT'])
+        self.assertEqual(self.index.match('???'), WORDS[:6])
+        self.assertEqual(self.index.match('?A?E'), ['CAKE'])
+        self.assertEqual(self.index.match('Z??'), [])
+        self.assertEqual(self.index.match('?????'), [])
+
+    def test_rack(self):
+        """Wildcards are filled from the rack; blanks cover missing letters"""
+        self.assertEqual(self.index.match('C?T', 'OX'), ['COT'])
+        self.assertEqual(self.index.match('???', 'TCA'), ['CAT', 'ACT'])
+        self.assertEqual(self.index.match('???', 'TA'), [])
+        self.assertEqual(self.index.match('T??', 'AT'), ['TAT'])
+        self.assertEqual(self.index.match('???', 'TA_'), ['CAT', 'ACT', 'TAT'])
+        self.assertEqual(self.index.match('C??', '__'), ['CAT', 'COT', 'CUT', 'CAB'])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            self.index.match('C*T')
+        with self.assertRaises(ValueError):
+            self.index.match('C?T', 'A1')
+
+
+class TestPatternWordsEndpoint(unittest.TestCase):
+    """Test the pattern_words CGI endpoint"""
+
+    def _serve(self, query):
+        with patch.dict(os.environ, {'QUERY_STRING': query}), \
+                patch('sys.stdout', new_callable=io.StringIO) as out:
+            pattern_words.main()
+        return json.loads(out.getvalue().split('\n\n', 1)[1])
+
+    def test_pattern(self):
+        result = self._serve('pattern=%3FA%3F%3FE&rack=RTSL_&limit=3')
+        self.assertEqual(result['pattern'], '?A??E')
+        self.assertEqual(len(result['words']), 3)
+        self.assertTrue(result['truncated'])
+        self.assertTrue(all(word[1] == 'A' and word[4] == 'E' for word in result['words']))
+
+    def test_invalid(self):
+        self.assertIn('error', self._serve(''))
+        self.assertIn('error', self._serve('pattern=' + '%3F' * (pattern_words.MAX_PATTERN_LENGTH + 1)))
+        self.assertIn('error', self._serve('pattern=C*T'))
+        self.assertIn('error', self._serve('pattern=C%3FT&limit=many'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Unit tests for opt-in endpoint profiling and the profile report
+"""
+
+import sys
+import os
+import io
+import tempfile
+import shutil
+import unittest
+from unittest.mock import patch
+
+# Add cgi-bin and project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'cgi-bin'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import profiling
+import profile_report
+
+
+def _work():
+    return sum(i * i for i in range(1000))
+
+
+class TestProfiling(unittest.TestCase):
+    """Test the sampling decision, the spool and merging spooled profiles"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.env = patch.dict(os.environ, {'ROGUELETTERS_PROFILE_DIR': self.test_dir})
+        self.env.start()
+        for name in ('ROGUELETTERS_PROFILE', 'ROGUELETTERS_PROFILE_SAMPLE'):
+            os.environ.pop(name, None)
+
+    def tearDown(self):
+        self.env.stop()
+        shutil.rmtree(self.test_dir)
+
+    def test_off_by_default(self):
+        self.assertFalse(profiling.should_profile('letters'))
+        with patch.dict(os.environ, {'ROGUELETTERS_PROFILE_SAMPLE': '0'}):
+            self.assertFalse(any(profiling.should_profile('letters') for _ in range(100)))
+        with patch.dict(os.environ, {'ROGUELETTERS_PROFILE_SAMPLE': 'often'}):
+            self.assertFalse(profiling.should_profile('letters'))
+
+    def test_endpoint_selection(self):
+        with patch.dict(os.environ, {'ROGUELETTERS_PROFILE': 'validate_word, hint'}):
+            self.assertTrue(profiling.should_profile('validate_word'))
+            self.assertTrue(profiling.should_profile('hint'))
+            self.assertFalse(profiling.should_profile('letters'))
+        with patch.dict(os.environ, {'ROGUELETTERS_PROFILE': 'all'}):
+            self.assertTrue(profiling.should_profile('letters'))
+        with patch.dict(os.environ, {'ROGUELETTERS_PROFILE_SAMPLE': '1'}):
+            self.assertTrue(profiling.should_profile('letters'))
+
+    def test_run_spools_a_profile(self):
+        with patch.dict(os.environ, {'ROGUELETTERS_PROFILE': 'letters'}):
+            self.assertEqual(profiling.run('letters', _work), _work())
+            self.assertEqual(profiling.run('hint', _work), _work())
+
+        # Only the selected endpoint is spooled, renamed into place with no temp file left
+        self.assertEqual(os.listdir(self.test_dir), ['letters'])
+        names = os.listdir(os.path.join(self.test_dir, 'letters'))
+        self.assertEqual(len(names), 1)
+        self.assertTrue(names[0].endswith('.pstats'))
+        self.assertFalse(names[0].startswith('.tmp_'))
+
+    def test_report_merges_profiles(self):
+        with patch.dict(os.environ, {'ROGUELETTERS_PROFILE': '1'}):
+            for _ in range(3):
+                profiling.run('letters', _work)
+            profiling.run('hint', _work)
+
+        profiles = profile_report.find_profiles(self.test_dir)
+        self.assertEqual(sorted(profiles), ['hint', 'letters'])
+        self.assertEqual(len(profiles['letters']), 3)
+        self.assertEqual(list(profile_report.find_profiles(self.test_dir, {'hint'})), ['hint'])
+
+        stats = profile_report.merge_profiles(profiles['letters'])
+        calls = [count for (_, _, name), (_, count, *_) in stats.stats.items() if name == '_work']
+        self.assertEqual(calls, [3])
+
+        merged = os.path.join(self.test_dir, 'merged')
+        argv = ['profile_report.py', 'letters', '--dir', self.test_dir, '--save', merged, '--clear']
+        with patch('sys.argv', argv), patch('sys.stdout', new_callable=io.StringIO) as out:
+            self.assertEqual(profile_report.main(), 0)
+        self.assertIn('letters: 3 profiled requests', out.getvalue())
+        self.assertEqual(os.listdir(merged), ['letters.pstats'])
+        self.assertEqual(os.listdir(os.path.join(self.test_dir, 'letters')), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Unit tests for traffic recording and golden-output replay
+"""
+
+import sys
+import os
+import io
+import json
+import tempfile
+import shutil
+import unittest
+from unittest.mock import patch
+
+# Add cgi-bin and project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'cgi-bin'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import telemetry
+import replay_traffic
+
+
+class TestRecorder(unittest.TestCase):
+    """Test request capture, corpus format and replay diffs"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.corpus = os.path.join(self.test_dir, 'traffic.ndjson')
+        self.env = patch.dict(os.environ, {
+            'ROGUELETTERS_RECORD': '1',
+            'ROGUELETTERS_RECORD_FILE': self.corpus,
+            'ROGUELETTERS_METRICS_FILE': os.path.join(self.test_dir, 'metrics.bin'),
+        })
+        self.env.start()
+        telemetry._map = None
+        telemetry._slots.clear()
+
+    def tearDown(self):
+        self.env.stop()
+        telemetry._map = None
+        telemetry._slots.clear()
+        shutil.rmtree(self.test_dir)
+
+    def _serve(self, endpoint, main, query='', body=''):
+        os.environ['REQUEST_METHOD'] = 'POST' if body else 'GET'
+        os.environ['QUERY_STRING'] = query
+        os.environ['CONTENT_LENGTH'] = str(len(body))
+        with patch('sys.stdin', io.StringIO(body)), patch('sys.stdout', new_callable=io.StringIO) as out:
+            telemetry.instrument(endpoint, main)
+        return out.getvalue()
+
+    def _records(self):
+        with open(self.corpus) as f:
+            return [json.loads(line) for line in f]
+
+    def test_records_request_and_response(self):
+        """POST bodies are captured without hiding them from main()"""
+        seen = []
+
+        def main():
+            seen.append(sys.stdin.read(int(os.environ['CONTENT_LENGTH'])))
+            print("Content-Type: application/json\n")
+            print(json.dumps({'valid': True}))
+
+        output = self._serve('validate_word', main, body='{"board": []}')
+
+        self.assertEqual(seen, ['{"board": []}'])
+        records = self._records()
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]['endpoint'], 'validate_word')
+        self.assertEqual(records[0]['body'], '{"board": []}')
+        self.assertEqual(records[0]['response'], output)
+        self.assertNotIn('REMOTE_ADDR', json.dumps(records[0]))
+
+    def test_skips_write_endpoints(self):
+        """Endpoints that change server state are never recorded"""
+        self._serve('submit_high_score', lambda: print("Content-Type: application/json\n\n{}"))
+        self.assertFalse(os.path.exists(self.corpus))
+
+    def test_replay_matches_and_detects_changes(self):
+        """Replaying a real letters response matches; an altered one is reported"""
+        import letters
+        self._serve('letters', letters.main, query='seed=20251005&turn=1')
+        line = json.dumps(self._records()[0])
+
+        self.assertIsNone(replay_traffic.replay_line(line)['offset'])
+
+        record = json.loads(line)
+        record['response'] = record['response'].replace('RUNNELS', 'RUNNERS')
+        result = replay_traffic.replay_line(json.dumps(record))
+        self.assertIsNotNone(result['offset'])
+        self.assertIn('RUNNELS', result['actual'][result['offset'] - 10:])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared request parser
+"""
+
+import sys
+import os
+import io
+import unittest
+
+# Add cgi-bin to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'cgi-bin'))
+
+import request
+
+
+class TestRequest(unittest.TestCase):
+    """Test query parsing, JSON bodies and size limits"""
+
+    def test_query_parameters(self):
+        """Values are URL-decoded and blank values fall back to the default"""
+        req = request.Request({'QUERY_STRING': 'seed=20251005&turn=3&words=%5B%22CAT%22%5D&retry=&turn=4'})
+        self.assertEqual(req.get('seed'), '20251005')
+        self.assertEqual(req.get('words'), '["CAT"]')
+        self.assertEqual(req.get_int('turn', 1), 3)
+        self.assertEqual(req.get('retry', 'false'), 'false')
+        self.assertIsNone(req.get('missing'))
+
+    def test_json_body(self):
+        """The body is read only as far as CONTENT_LENGTH, and only when asked for"""
+        stdin = io.StringIO('{"score": 12}trailing')
+        req = request.Request({'REQUEST_METHOD': 'POST', 'CONTENT_LENGTH': '13'}, stdin=stdin)
+        self.assertEqual(stdin.tell(), 0)
+        self.assertEqual(req.json(), {'score': 12})
+        self.assertEqual(req.json(), {'score': 12})
+
+        self.assertIsNone(request.Request({}, stdin=io.StringIO('')).json())
+        self.assertEqual(request.Request({'CONTENT_LENGTH': 'bogus'}, stdin=io.StringIO('')).json({}), {})
+
+    def test_size_limits(self):
+        """Oversized requests are rejected before anything is read"""
+        with self.assertRaises(request.RequestTooLarge):
+            request.Request({'QUERY_STRING': 'x=' + 'A' * request.MAX_QUERY_BYTES})
+
+        stdin = io.StringIO('{}')
+        req = request.Request({'CONTENT_LENGTH': '5000'}, stdin=stdin, max_body=1000)
+        with self.assertRaises(request.RequestTooLarge):
+            req.body
+        self.assertEqual(stdin.tell(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the rogue-aware scoring and the headless run simulator
+"""
+
+import sys
+import os
+import io
+import json
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+# Add cgi-bin to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'cgi-bin'))
+
+import letters
+import validate_word
+from rogueletters import board, rogues, runs
+from rogueletters.rogues import Tile
+
+
+def coffee(run, last_turn=False):
+    """COFFEE along row 1 of an empty board, the C on the double word square"""
+    cells = [['' for _ in range(board.SIZE)] for _ in range(board.SIZE)]
+    placed = {(1, 1 + i): Tile(letter) for i, letter in enumerate('COFFEE')}
+    return rogues.score_turn(cells, {}, placed, run, last_turn)
+
+
+class TestEconomy(unittest.TestCase):
+    """Test targets, earnings and prices"""
+
+    def test_targets(self):
+        self.assertEqual(runs.target_score(1, 1), 40)
+        self.assertEqual(runs.target_score(3, 3), 500)
+        self.assertEqual(runs.target_score(5, 2), 975)
+
+    def test_earnings(self):
+        # $4 for round 2 and $1 per 25% of the target above it
+        self.assertEqual(runs.calculate_earnings(100, 60, 2, []), 6)
+        self.assertEqual(runs.calculate_earnings(100, 60, 2, ['goldenDiamond']), 7)
+        self.assertEqual(runs.calculate_earnings(60, 60, 3, ['basePayout']), 8)
+
+    def test_rack_and_turns(self):
+        self.assertEqual(rogues.rack_size(['extraRack', 'heavyBackpack']), 10)
+        self.assertEqual(rogues.max_turns(['noDiscard', 'heavyBackpack']), 6)
+        self.assertEqual(runs.upgrade_price(5), 13)
+
+
+class TestScoreTurn(unittest.TestCase):
+    """Test rogue effects on a turn's score"""
+
+    def setUp(self):
+        self.run = runs.Run(1)
+
+    def test_plain_word(self):
+        self.assertEqual(coffee(self.run), (28, {}))
+
+    def test_lone_ranger(self):
+        cells = board.starting_board('CAT')
+        self.run.rogues = ['loneRanger']
+        score, components = rogues.score_turn(cells, {}, {(4, 6): Tile('S')}, self.run)
+        self.assertEqual(score, 12)
+        self.assertEqual(components, {'loneRanger': 6})
+
+    def test_wolf_pack_closer_collector(self):
+        self.run.rogues = ['wolfPack']
+        self.assertEqual(coffee(self.run)[0], 34)
+        self.run.rogues = ['wolfPack', 'closer']
+        self.assertEqual(coffee(self.run)[0], 34)
+        self.assertEqual(coffee(self.run, last_turn=True)[0], 68)
+        self.run.rogues = ['wolfPack', 'closer', 'collector']
+        self.assertEqual(coffee(self.run, last_turn=True), (90, {'wolfPack': 6, 'closer': 34, 'collector': 22}))
+
+    def test_shop_tiles(self):
+        cells = [['' for _ in range(board.SIZE)] for _ in range(board.SIZE)]
+        placed = {(0, 1): Tile('Q', bonus=1, kind='buffed'), (0, 2): Tile('I', kind='pink')}
+        self.run.rogues = ['highValue']
+        # (10 + 2 + 1) + 1 = 14, x1.5 for the pink tile, +2 for two shop tiles
+        self.assertEqual(rogues.score_turn(cells, {}, placed, self.run)[0], 23)
+
+    def test_bingo(self):
+        cells = [['' for _ in range(board.SIZE)] for _ in range(board.SIZE)]
+        placed = {(2, i): Tile(letter) for i, letter in enumerate('RETAIN')}
+        self.assertEqual(rogues.score_turn(cells, {}, placed, self.run)[1], {})
+        self.run.rogues = ['bingoWizard']
+        self.assertEqual(rogues.score_turn(cells, {}, placed, self.run)[1], {'bingoWizard': 50})
+        placed[(2, 6)] = Tile('S')
+        self.run.rogues = []
+        self.assertEqual(rogues.score_turn(cells, {}, placed, self.run)[1], {'bingo': 50})
+
+
+class TestRunBreakdown(unittest.TestCase):
+    """Test the shared rogue definitions and validate_word's run breakdown"""
+
+    def test_definitions(self):
+        self.assertEqual(rogues.rule('bingo_tiles', ['bingoWizard']), 6)
+        self.assertEqual(rogues.rule('bonus_percent', ['goldenDiamond']), 20)
+        for rogue_id, rogue in rogues.ROGUES.items():
+            self.assertEqual(rogue['id'], rogue_id)
+            self.assertIn(rogue['rarity'], rogues.RARITY_PRICES)
+            for effect in rogue.get('effects', ()):
+                self.assertIn(effect['stage'], ('tile', 'word', 'turn'))
+
+    def test_validate_word_breakdown(self):
+        grid = board.starting_board('CAT')
+        placed = [{'row': 4, 'col': 6, 'letter': 'S', 'pinkTile': True}]
+        run = {'rogues': ['loneRanger', 'closer', 'notARogue'], 'set': 2, 'last_turn': True,
+               'board_tiles': [{'row': 4, 'col': 3, 'bonus': 1, 'buffed': True}]}
+        result = validate_word.run_breakdown(grid, placed, run)
+        (word,) = result['words']
+        self.assertEqual(word['word'], 'CATS')
+        # (4 + 1 + 1 + 1) x1.5 for the pink S, then +6 for a single vowel
+        self.assertEqual(word['wordTotal'], 16)
+        self.assertEqual([c['id'] for c in word['wordComponents']], ['loneRanger'])
+        self.assertEqual([c['id'] for c in result['turnComponents']], ['closer'])
+        self.assertEqual(result['total'], 32)
+
+    def test_bundled_definitions_match(self):
+        # script.js falls back to its bundled copy when /data/rogues.json does not load
+        root = os.path.join(os.path.dirname(__file__), '..')
+        with open(os.path.join(root, 'script.js'), encoding='utf-8') as f:
+            script = f.read()
+        marker = 'const BUNDLED_ROGUE_DEFINITIONS = '
+        bundled, _ = json.JSONDecoder().raw_decode(script, script.index(marker) + len(marker))
+        self.assertEqual(bundled, rogues.load_definitions(os.path.join(root, 'data', 'rogues.json')))
+
+    def test_missing_definitions(self):
+        # Word validation still works; only the run breakdown reports the problem
+        body = json.dumps({'board': board.starting_board('CAT'), 'run': {'rogues': []},
+                           'placed_tiles': [{'row': 4, 'col': 6, 'letter': 'S'}]})
+        output = io.StringIO()
+        with patch.object(rogues, '_definitions', None), \
+                patch.object(rogues, 'load_definitions', side_effect=FileNotFoundError('rogues.json')), \
+                patch.dict(os.environ, {'REQUEST_METHOD': 'POST', 'CONTENT_LENGTH': str(len(body))}), \
+                patch('sys.stdin', io.StringIO(body)), redirect_stdout(output):
+            validate_word.main()
+        response = json.loads(output.getvalue().split('\n\n', 1)[1])
+        self.assertTrue(response['valid'])
+        self.assertEqual(response['breakdown_error'], 'Rogue definitions not available')
+
+
+class TestSimulateRun(unittest.TestCase):
+    """Test a whole run and the summary"""
+
+    def test_run_is_reproducible(self):
+        bot = runs.GreedyBot()
+        result = runs.simulate_run(bot, runs.RUN_SEED_BASE, letters)
+        self.assertEqual(runs.simulate_run(bot, runs.RUN_SEED_BASE, letters), result)
+        self.assertEqual(result['rounds_won'], len(result['round_scores']) - (not result['won']))
+        self.assertEqual(result['total_score'], sum(result['round_scores']))
+        self.assertGreaterEqual(result['round_scores'][0], runs.target_score(1, 1))
+
+    def test_summarize(self):
+        results = [
+            {'won': True, 'set': 5, 'rounds_won': 15, 'rogues': ['worder', 'closer']},
+            {'won': False, 'set': 3, 'rounds_won': 7, 'rogues': ['closer']},
+        ]
+        summary = runs.summarize(results, min_runs=1)
+        self.assertEqual(summary['win_rate'], 0.5)
+        self.assertEqual(summary['failed_sets'], {3: 1})
+        self.assertEqual(summary['rogues']['closer'], {'runs': 2, 'win_rate': 0.5, 'rounds_won': 11.0})
+        self.assertEqual(list(summary['pairs']), ['closer+worder'])
+        self.assertNotIn('worder', runs.summarize(results, min_runs=2)['rogues'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Unit tests for shared request telemetry
+"""
+
+import sys
+import os
+import io
+import tempfile
+import shutil
+import unittest
+import multiprocessing
+from unittest.mock import patch
+
+# Add cgi-bin to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'cgi-bin'))
+
+import telemetry
+
+
+def _record_requests(path, count):
+    """Child process: record requests against the shared file"""
+    os.environ['ROGUELETTERS_METRICS_FILE'] = path
+    telemetry._map = None
+    telemetry._slots.clear()
+    for _ in range(count):
+        telemetry.inc('rogueletters_requests_total', endpoint='letters')
+        telemetry.flush()
+
+
+class TestTelemetry(unittest.TestCase):
+    """Test counters, histograms and Prometheus rendering"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.metrics_file = os.path.join(self.test_dir, 'metrics.bin')
+        self.env = patch.dict(os.environ, {'ROGUELETTERS_METRICS_FILE': self.metrics_file})
+        self.env.start()
+        telemetry._map = None
+        telemetry._slots.clear()
+        telemetry._pending.clear()
+
+    def tearDown(self):
+        self.env.stop()
+        telemetry._map = None
+        telemetry._slots.clear()
+        shutil.rmtree(self.test_dir)
+
+    def test_counts_aggregate_across_processes(self):
+        """Increments from concurrent processes are not lost"""
+        ctx = multiprocessing.get_context('fork')
+        workers = [ctx.Process(target=_record_requests, args=(self.metrics_file, 50)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        values = telemetry.snapshot()
+        self.assertEqual(values['rogueletters_requests_total{endpoint="letters"}'], 200)
+
+    def test_histogram_buckets_are_cumulative(self):
+        """An observation lands in every bucket at or above its value; lower buckets still exist"""
+        telemetry.observe('rogueletters_request_duration_seconds', 0.03, endpoint='check_word')
+        telemetry.flush()
+
+        values = telemetry.snapshot()
+        bucket = 'rogueletters_request_duration_seconds_bucket{{endpoint="check_word",le="{}"}}'
+        self.assertEqual(values[bucket.format(0.005)], 0)
+        self.assertEqual(values[bucket.format(0.025)], 0)
+        self.assertEqual(values[bucket.format(0.05)], 1)
+        self.assertEqual(values[bucket.format('+Inf')], 1)
+
+    def test_render_prometheus(self):
+        """Families get a TYPE line and buckets are ordered by bound"""
+        telemetry.observe('rogueletters_request_duration_seconds', 2.0, endpoint='letters')
+        telemetry.flush()
+
+        text = telemetry.render_prometheus(telemetry.snapshot())
+        self.assertIn('# TYPE rogueletters_request_duration_seconds histogram', text)
+        self.assertLess(text.index('le="5.0"'), text.index('le="10.0"'))
+        self.assertLess(text.index('le="10.0"'), text.index('le="+Inf"'))
+
+    def test_instrument_counts_error_responses(self):
+        """Responses with an error payload are counted as errors"""
+        def failing_main():
+            print("Content-Type: application/json")
+            print()
+            print('{"error": "Missing seed parameter"}')
+
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            telemetry.instrument('letters', failing_main)
+
+        self.assertIn('Missing seed parameter', stdout.getvalue())
+        values = telemetry.snapshot()
+        self.assertEqual(values['rogueletters_errors_total{endpoint="letters"}'], 1)
+        self.assertEqual(values['rogueletters_requests_total{endpoint="letters"}'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()